@@ -0,0 +1,160 @@
+'''
+Compiled skit configs, as stored by a build and loaded by workers
+
+A compiled config file is a header followed by two marshalled sections:
+
+    magic          5 bytes   MAGIC
+    schema         uint16    SCHEMA_VERSION
+    python magic   4 bytes   imp.get_magic() of the writer
+    source hash    40 bytes  hex digest of whatever the config was built from
+    data length    uint32    length of the data section
+    code length    uint32    length of the code section
+
+The data section is the config tree of dicts, lists, strings, numbers and
+None, with every function replaced by a (FUNCTION, index, name, source) tuple.
+Skit configs have no tuples of their own. The code section is the list of the
+functions' code objects, by index. Loading the file never constructs arbitrary
+objects like unpickling does. If the file was written by another Python
+version, the code section is skipped and the functions are compiled again
+from their source.
+'''
+
+import imp
+import marshal
+import mmap
+import os
+import struct
+import sys
+sys.path.append('..')
+from imperative_parser.parser import parse_function, function_from_code
+
+MAGIC = 'SKITC'
+
+# Bump whenever the layout of compiled configs changes
+SCHEMA_VERSION = 1
+
+HEADER = struct.Struct('<5sH4s40sII')
+
+# Tags the tuples standing for functions in the data section
+FUNCTION = '__function__'
+
+class CompiledConfigError(Exception):
+    '''
+    Raised when a file isn't a compiled config this version can load
+    '''
+    pass
+
+def encode(value, code_objects, indices):
+    '''
+    Replace every function in a config tree by a tuple referring to its code
+    object, which is appended to code_objects. indices holds the index of
+    every function already encoded, by id, so that shared functions are
+    stored once.
+    '''
+    if isinstance(value, dict):
+        return {k: encode(v, code_objects, indices)
+                for k, v in value.iteritems()}
+    if isinstance(value, list):
+        return [encode(v, code_objects, indices) for v in value]
+    if callable(value):
+        index = indices.get(id(value))
+        if index is None:
+            index = indices[id(value)] = len(code_objects)
+            code_objects.append(value.func_code)
+        return (FUNCTION, index, value.__name__,
+                getattr(value, 'skit_source', None))
+    return value
+
+def decode(value, code_objects, functions):
+    '''
+    Recreate the functions of a config tree encoded by encode(), from their
+    code objects, or from their source if code_objects is None. functions
+    holds the functions already recreated, by index.
+    '''
+    if isinstance(value, dict):
+        return {k: decode(v, code_objects, functions)
+                for k, v in value.iteritems()}
+    if isinstance(value, list):
+        return [decode(v, code_objects, functions) for v in value]
+    if isinstance(value, tuple) and value and value[0] == FUNCTION:
+        _, index, name, source = value
+        if index not in functions:
+            if code_objects is not None:
+                func = function_from_code(code_objects[index], name, source)
+            elif source is not None:
+                func = parse_function(source, name=name)
+            else:
+                raise CompiledConfigError('No source to recompile %s' % name)
+            functions[index] = func
+        return functions[index]
+    return value
+
+def dumps(config, source_hash):
+    '''
+    Serialize a config tree, built from sources with the given hash
+    '''
+    code_objects = []
+    data = marshal.dumps(encode(config, code_objects, {}))
+    code = marshal.dumps(code_objects)
+    return HEADER.pack(MAGIC, SCHEMA_VERSION, imp.get_magic(),
+                       source_hash, len(data), len(code)) + data + code
+
+def loads(buf, source_hash=None):
+    '''
+    Deserialize a config tree from a string or buffer, e.g. an mmap
+
+    Raises CompiledConfigError if buf isn't a compiled config of this schema
+    version, or wasn't built from sources with the given hash
+    '''
+    header = read_header(buf)
+    if source_hash is not None and header['source_hash'] != source_hash:
+        raise CompiledConfigError('Compiled config is out of date')
+    data_start = HEADER.size
+    code_start = data_start + header['data_length']
+    end = code_start + header['code_length']
+    if len(buf) < end:
+        raise CompiledConfigError('Compiled config is truncated')
+    code_objects = None
+    if header['python_magic'] == imp.get_magic():
+        code_objects = marshal.loads(buf[code_start:end])
+    return decode(marshal.loads(buf[data_start:code_start]), code_objects, {})
+
+def read_header(buf):
+    '''
+    Read the header of a compiled config as a dict
+    '''
+    if len(buf) < HEADER.size:
+        raise CompiledConfigError('Not a compiled config')
+    magic, schema, python_magic, source_hash, data_length, code_length =\
+        HEADER.unpack(buf[:HEADER.size])
+    if magic != MAGIC:
+        raise CompiledConfigError('Not a compiled config')
+    if schema != SCHEMA_VERSION:
+        raise CompiledConfigError('Unsupported compiled config schema %d' %
+                                  schema)
+    return {'python_magic': python_magic, 'source_hash': source_hash,
+            'data_length': data_length, 'code_length': code_length}
+
+def dump(config, source_hash, path):
+    '''
+    Write a compiled config file, atomically replacing any earlier one
+    '''
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(dumps(config, source_hash))
+    os.rename(tmp_path, path)
+
+def load(path, source_hash=None, use_mmap=False):
+    '''
+    Load a compiled config file in a single read, or memory-mapped
+    '''
+    with open(path, 'rb') as f:
+        if not use_mmap:
+            return loads(f.read(), source_hash)
+        if os.fstat(f.fileno()).st_size == 0:
+            raise CompiledConfigError('Not a compiled config')
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return loads(buf, source_hash)
+        finally:
+            buf.close()
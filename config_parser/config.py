@@ -83,7 +83,12 @@ def t_newline(t):
 def t_error(t):
     print "Illegal character '%s'" % t.value[0]
 
-lexer = lex.lex()
+# The lexer and parser are built on first use, see get_lexer() and get_parser()
+_lexer = None
+_parser = None
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables')
+TABLE_MODULE = 'skit_parsetab'
 
 # Error Handling
 SUCCEEDED = True
@@ -177,10 +182,42 @@ def p_error(p):
     print p
     print "Syntax error in input!"
 
-parser = yacc.yacc()
+def get_lexer():
+    global _lexer
+    if _lexer is None:
+        _lexer = lex.lex(module=sys.modules[__name__])
+    return _lexer
+
+def get_parser():
+    '''
+    Loads the prebuilt parse tables from tables/ on first use. If they're
+    missing or out of date, the parser is built in memory instead, without
+    writing anything.
+    '''
+    global _parser
+    if _parser is None:
+        try:
+            tables = __import__('tables.' + TABLE_MODULE, globals(), {},
+                    [TABLE_MODULE])
+        except ImportError:
+            # yacc can't import this name either, so it builds the tables
+            tables = 'tables.' + TABLE_MODULE
+        _parser = yacc.yacc(module=sys.modules[__name__], tabmodule=tables,
+                debug=0, write_tables=0)
+    return _parser
+
+def write_tables():
+    '''
+    Builds the parse tables into tables/, to be loaded by get_parser()
+    Run after changing the grammar, e.g. with make tables
+    '''
+    # The qualified name only imports the tables when they're current,
+    # otherwise they're rebuilt and written
+    yacc.yacc(module=sys.modules[__name__], tabmodule='tables.' + TABLE_MODULE,
+            debug=0, outputdir=os.path.relpath(TABLES_DIR))
 
 def parse(s):
     global SUCCEEDED
     global PARSED_STRING
     PARSED_STRING = s
-    return parser.parse(s, lexer=lexer), SUCCEEDED
+    return get_parser().parse(s, lexer=get_lexer()), SUCCEEDED
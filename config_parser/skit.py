@@ -1,13 +1,29 @@
 #!/usr/bin/env python
 import config
+import compiled_config
 import argparse
-import dill as pickle
+import hashlib
+import multiprocessing
 import os
+import re
 import shutil
 import sys
 sys.path.append('..')
 from engine.src.game import Game
 from engine.src.config.config import Config
+from imperative_parser.parser import FUNCTION_CACHE, GRAMMAR_VERSION
+
+# Keep compiled functions across runs, so only changed functions are recompiled
+FUNCTION_CACHE.directory = 'tmp/functions/'
+
+# Compiled skit files, by a key of their contents and dependencies
+BUILD_DIR = 'tmp/build/'
+
+# Bump whenever compiled outputs change, so that earlier builds aren't reused
+BUILD_VERSION = '2'
+
+# Identifiers that may refer to a top-level property, like the lexer's IDs
+REFERENCE = re.compile(r'[A-Za-z][A-Za-z-]*')
 
 properties = {}
 
@@ -126,90 +142,266 @@ def extend(skit, parent=None):
                     extension = extend_clean(skit, property, value, extension)
             extend(skit[property])
 
-def imports(full_file, file):
+def read_imports(full_file, file):
     '''
-    Compiles every skit structure that is imported in addition to
-    the top-level structure
+    Reads the @import lines at the top of a skit file, returning a list of
+    (imported file, alias, whether a directory is imported) and the rest of
+    the file, or None and the file if an @import is invalid
     '''
-    imports = file.split('\n')
+    imports = []
+    lines = file.split('\n')
     line_no = 0
     chars_read = 0
-    for line in imports:
+    for line in lines:
         line_length = len(line)
         if line:
             line = line.split()
             if line[0] == '@import':
                 if len(line) < 4:
                     print 'Error: Invalid @import on line', line_no
-                    return None
-                if line[1][-1] == '/':
-                    if line[1][0] == '.':
-                        properties[line[3]], success = compile(full_file + line[1] +\
-                                '__value__.skit', as_name=line[3])
-                    elif line[1][0] == '/':
-                        properties[line[3]], success = compile(line[1] +\
-                                '__value__.skit', as_name=line[3])
+                    return None, file
+                if line[1][0] == '.':
+                    imported = full_file + line[1]
+                elif line[1][0] == '/':
+                    imported = line[1]
                 else:
-                    if line[1][0] == '.':
-                        properties[line[3]], success = compile(full_file + line[1] +\
-                                '.skit')
-                    elif line[1][0] == '/':
-                        properties[line[3]], success = compile(line[1] + '.skit')
-
+                    imported = None
+                if imported is not None:
+                    if line[1][-1] == '/':
+                        imports.append((imported + '__value__.skit', line[3],
+                                        True))
+                    else:
+                        imports.append((imported + '.skit', line[3], False))
             else:
                 break
         line_no += 1
         chars_read += line_length
     if chars_read > 0:
         chars_read += 1
-    return file[chars_read:]
+    return imports, file[chars_read:]
+
+class Build(object):
+    '''
+    An incremental build of skit files
+
+    Every compiled file is stored under a key hashing its contents and the
+    keys of everything its output depends on: the files it imports and the
+    files defining the top-level properties it refers to, like default. A file
+    whose key is unchanged since an earlier build is loaded instead of being
+    compiled, so only changed files and their dependents are recompiled.
+
+    Parsing, including compiling functions, only depends on a file's own
+    contents, so the files that need recompiling are parsed in a process pool
+    first. They're then extended and registered in import order, as when
+    compiled one by one, giving the same output.
+    '''
+
+    def __init__(self, build_dir=BUILD_DIR, clean=False, processes=None):
+        if clean:
+            shutil.rmtree('tmp/', True)
+        self.build_dir = build_dir
+        # Number of parsing processes, all cores if None, none if 1
+        self.processes = processes
+        # Results of parse_body(), by key
+        self.parsed = {}
+        # Keys of the files compiled by this build, by path
+        self.keys = {}
+        # Keys of the files defining each top-level property
+        self.property_keys = {}
+        self.rebuilt = []
+        self.reused = []
+        self.succeeded = True
+
+    def compile(self, file, as_name=None):
+        '''
+        Compiles a skit file and every file it imports, registering their
+        top-level properties
+        '''
+        if self.processes != 1:
+            self.parse_all(self.plan(file, as_name))
+        return self.compile_file(file, as_name)
+
+    def plan(self, file, as_name=None):
+        '''
+        Lists the (key, body) of every file compile() would have to parse,
+        in import order
+        '''
+        property_keys = dict(self.property_keys)
+        pending = []
+        self.plan_file(file, as_name, pending)
+        self.property_keys = property_keys
+        return pending
+
+    def plan_file(self, file, as_name, pending):
+        full_file = os.path.dirname(file) + '/'
+        source = open(file, 'r').read()
+        imports, body = read_imports(full_file, source)
+        if imports is None:
+            return None
+        import_keys = []
+        for imported, alias, directory in imports:
+            key = self.plan_file(imported, alias if directory else None,
+                    pending)
+            self.property_keys[alias] = key
+            import_keys.append(key)
+        key = self.key(body, import_keys)
+        if key not in self.parsed and (key, body) not in pending and\
+                not os.path.isfile(self.output_file(key)):
+            pending.append((key, body))
+        main_property = as_name or\
+                os.path.splitext(os.path.basename(file))[0]
+        self.property_keys[main_property] = key
+        return key
+
+    def parse_all(self, pending):
+        '''
+        Parses the given (key, body) pairs in a process pool
+        '''
+        if len(pending) < 2:
+            return
+        pool = multiprocessing.Pool(self.processes)
+        try:
+            results = pool.map(parse_body, pending, 1)
+        finally:
+            pool.close()
+            pool.join()
+        for (key, _), result in zip(pending, results):
+            self.parsed[key] = result
+
+    def parse(self, key, body):
+        '''
+        Parses a file's body, using the result of parse_all() if there is one
+        '''
+        if key not in self.parsed:
+            return config.parse(body)
+        succeeded, skit = self.parsed.pop(key)
+        # Parse failures stick, as in config.parse()
+        if not succeeded:
+            config.SUCCEEDED = False
+        return compiled_config.loads(skit, key), config.SUCCEEDED
+
+    def output_file(self, key):
+        return os.path.join(self.build_dir, key + '.skitc')
+
+    def compile_file(self, file, as_name=None):
+        path = os.path.normpath(file)
+        full_file = os.path.dirname(file) + '/'
+        base_file = os.path.basename(file)
+        source = open(file, 'r').read()
+        imports, body = read_imports(full_file, source)
+        if imports is None:
+            self.succeeded = False
+            return None, False
+        import_keys = []
+        for imported, alias, directory in imports:
+            skit, _ = self.compile_file(imported, as_name=alias if directory
+                    else None)
+            key = self.keys.get(os.path.normpath(imported))
+            properties[alias] = skit
+            self.property_keys[alias] = key
+            import_keys.append(key)
+        key = self.key(body, import_keys)
+        skit = self.load(key)
+        succeeded = True
+        if skit is None:
+            skit, succeeded = self.parse(key, body)
+            extend(skit)
+            if succeeded:
+                self.store(key, skit)
+            self.log(self.rebuilt, path)
+        else:
+            self.log(self.reused, path)
+        self.succeeded = self.succeeded and succeeded
+        if as_name:
+            main_property = as_name
+            properties[as_name] = skit
+        else:
+            main_property = os.path.splitext(base_file)[0]
+            properties[main_property] = skit.get(main_property)
+        self.property_keys[main_property] = key
+        self.keys[path] = key
+        return skit, succeeded
+
+    def key(self, body, import_keys):
+        '''
+        Hashes a file's contents with the keys of the files its output depends
+        on
+        '''
+        digest = hashlib.sha1()
+        digest.update(BUILD_VERSION + '\0' + GRAMMAR_VERSION + '\0' + body)
+        # Extensions and aliases are looked up among the top-level properties
+        references = set(REFERENCE.findall(body)) & set(self.property_keys)
+        for name in sorted(references):
+            digest.update('\0%s=%s' % (name, self.property_keys[name]))
+        for key in import_keys:
+            digest.update('\0' + str(key))
+        return digest.hexdigest()
+
+    def load(self, key):
+        try:
+            return compiled_config.load(self.output_file(key), key)
+        except (IOError, EOFError, ValueError, TypeError,
+                compiled_config.CompiledConfigError):
+            # Missing or unreadable outputs are rebuilt
+            return None
+
+    def store(self, key, skit):
+        if not os.path.isdir(self.build_dir):
+            os.makedirs(self.build_dir)
+        compiled_config.dump(skit, key, self.output_file(key))
+
+    def log(self, paths, path):
+        if path not in self.rebuilt and path not in self.reused:
+            paths.append(path)
+
+    def report(self):
+        '''
+        Describes which files were rebuilt and which were reused
+        '''
+        lines = ['Rebuilt %d of %d files' % (len(self.rebuilt),
+                len(self.rebuilt) + len(self.reused))]
+        lines += ['  rebuilt %s' % path for path in self.rebuilt]
+        lines += ['  reused  %s' % path for path in self.reused]
+        return '\n'.join(lines)
+
+def parse_body(args):
+    '''
+    Parses the (key, body) of a skit file in a worker process, returning
+    whether it succeeded and the parsed dict as a compiled config
+    '''
+    key, body = args
+    config.SUCCEEDED = True
+    skit, succeeded = config.parse(body)
+    return succeeded, compiled_config.dumps(skit, key)
 
 def compile(file, clean=False, as_name=None):
     '''
-    Cleans tmp/ directory and reinitializes with compiled skit code
-    '''
-    full_file = os.path.dirname(file) + '/'
-    base_file = os.path.basename(file)
-    compile_file = 'tmp/' + base_file
-    if clean:
-        shutil.rmtree('tmp/', True)
-        compile('default.skit')
-    file = open(file, 'r').read()
-    file = imports(full_file, file)
-    skit, succeeded = config.parse(file)
-    main_property = os.path.splitext(base_file)[0]
-    extend(skit)
-    if as_name:
-        properties[as_name] = skit
-        main_property = as_name
-    else:
-        properties[main_property] = skit.get(main_property)
-    if not os.path.isdir('tmp/'):
-        os.makedirs('tmp/')
-    pickle.dump(skit, open(compile_file, 'wb'))
-    return skit, succeeded
+    Compiles a skit file, reusing the compiled output of every file that
+    hasn't changed since the last build
+    '''
+    return Build(clean=clean).compile(file, as_name)
+
+def build(file, clean=False, processes=None):
+    '''
+    Compiles default.skit, then the given skit file
+    '''
+    build = Build(clean=clean, processes=processes)
+    build.compile('default.skit')
+    if build.succeeded and os.path.normpath(file) != 'default.skit':
+        build.compile(file)
+    return build
 
 def run(file):
     '''
     Runs skit game
-    Recompiles skit code only if code has been changed
+    Recompiles only the skit code that has been changed
     '''
-    _, success = compile('default.skit')
-    if success:
+    if build(file).succeeded:
         base_file = os.path.basename(file)
-        compile_file = 'tmp/' + base_file
-        skit = None
-        if not os.path.isfile(compile_file) or\
-            os.path.getmtime(file) > os.path.getmtime(compile_file):
-            skit = compile(file)[0]
-        else:
-            skit = pickle.load(open(compile_file, 'rb'))
         main_property = os.path.splitext(base_file)[0]
-        properties[main_property] = skit.get(main_property)
         Config.config = properties[main_property]
         Config.init()
         game = Game()
-        skit = skit.get(os.path.splitext(base_file)[0], None)
         # TODO: restore after engine syncs config dict format
         # if skit.get('game', None):
         game.start()
@@ -218,12 +410,27 @@ def run(file):
         sys.exit(1)
 
 if __name__ == '__main__':
+    if sys.argv[1:2] == ['build']:
+        arg_parser = argparse.ArgumentParser(prog='skit build',
+            description='Incrementally compile skit code')
+        arg_parser.add_argument('file', help='Skit file')
+        arg_parser.add_argument('-c', '--clean', action='store_true',
+            help='Discard the output of earlier builds')
+        arg_parser.add_argument('-j', '--jobs', type=int, default=None,
+            help='Number of parsing processes, all cores by default')
+        args = arg_parser.parse_args(sys.argv[2:])
+        result = build(args.file, args.clean, args.jobs)
+        print result.report()
+        if not result.succeeded:
+            print "Build failed, check the log for errors"
+            sys.exit(1)
+        sys.exit(0)
     arg_parser = argparse.ArgumentParser(description='Skit compiler')
     arg_parser.add_argument('file', help='Skit file')
     arg_parser.add_argument('-c', '--compile', action='store_true',
         help='Only run compile steps')
     args = arg_parser.parse_args()
     if args.compile:
-        compile(args.file, True)
+        build(args.file, True)
     else:
         run(args.file)
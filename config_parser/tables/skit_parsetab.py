@@ -0,0 +1,48 @@
+
+# config_parser/tables/skit_parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = ')\xbc4\x8d\x11K\x81t\x9c\xb8\x8f8\xdb\x0f_\xf3'
+    
+_lr_action_items = {'PLUS':([16,],[23,]),'NONE':([4,5,11,26,],[7,7,7,7,]),'FUNC':([4,5,11,26,],[8,8,8,8,]),'EXTENSION':([0,12,28,],[3,3,3,]),'RCURLY':([6,7,8,9,10,13,14,15,16,17,18,21,22,25,27,29,30,32,],[-5,-9,-10,-1,-8,-6,-7,-17,-16,-3,-2,27,-19,-4,-11,-15,-14,-18,]),'UNIFORM':([4,5,11,26,],[10,10,10,10,]),'LBRACKET':([4,5,11,26,],[11,11,11,11,]),'LCURLY':([4,5,11,26,],[12,12,12,12,]),'NUM':([4,5,11,23,26,],[13,13,13,29,13,]),'COLON':([2,3,],[4,5,]),'STR':([4,5,11,26,],[14,14,14,14,]),'WILD':([4,5,11,24,26,],[15,15,15,15,15,]),'COMMA':([6,7,8,9,10,13,14,15,16,17,18,20,22,25,27,29,30,],[-5,-9,-10,-1,-8,-6,-7,-17,-16,-3,-2,26,28,-4,-11,-15,-14,]),'RBRACKET':([6,7,8,10,13,14,15,16,17,19,20,25,27,29,30,31,],[-5,-9,-10,-8,-6,-7,-17,-16,-3,25,-13,-4,-11,-15,-14,-12,]),'ID':([0,4,5,11,12,24,26,28,],[2,16,16,16,2,16,16,2,]),'DOT':([16,],[24,]),'$end':([1,6,7,8,9,10,13,14,15,16,17,18,25,27,29,30,],[0,-5,-9,-10,-1,-8,-6,-7,-17,-16,-3,-2,-4,-11,-15,-14,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'dots':([4,5,11,24,26,],[6,6,6,30,6,]),'list':([11,26,],[19,31,]),'value':([4,5,11,26,],[9,18,20,20,]),'property':([0,12,28,],[1,22,22,]),'properties':([12,28,],[21,32,]),'structure':([4,5,11,26,],[17,17,17,17,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> property","S'",1,None,None,None),
+  ('property -> ID COLON value','property',3,'p_property_value','config_parser/config.py',98),
+  ('property -> EXTENSION COLON value','property',3,'p_property_extension','config_parser/config.py',102),
+  ('value -> structure','value',1,'p_value_structure','config_parser/config.py',106),
+  ('value -> LBRACKET list RBRACKET','value',3,'p_value_list','config_parser/config.py',110),
+  ('value -> dots','value',1,'p_value_dots','config_parser/config.py',114),
+  ('value -> NUM','value',1,'p_value_num','config_parser/config.py',118),
+  ('value -> STR','value',1,'p_value_str','config_parser/config.py',122),
+  ('value -> UNIFORM','value',1,'p_value_uniform','config_parser/config.py',126),
+  ('value -> NONE','value',1,'p_value_none','config_parser/config.py',130),
+  ('value -> FUNC','value',1,'p_value_func','config_parser/config.py',134),
+  ('structure -> LCURLY properties RCURLY','structure',3,'p_structure_properties','config_parser/config.py',143),
+  ('list -> value COMMA list','list',3,'p_list_comma','config_parser/config.py',147),
+  ('list -> value','list',1,'p_list_value','config_parser/config.py',153),
+  ('dots -> ID DOT dots','dots',3,'p_dots_dot','config_parser/config.py',157),
+  ('dots -> ID PLUS NUM','dots',3,'p_dots_plus','config_parser/config.py',161),
+  ('dots -> ID','dots',1,'p_dots_id','config_parser/config.py',165),
+  ('dots -> WILD','dots',1,'p_dots_wild','config_parser/config.py',169),
+  ('properties -> property COMMA properties','properties',3,'p_properties_comma','config_parser/config.py',173),
+  ('properties -> property','properties',1,'p_properties_property','config_parser/config.py',178),
+]
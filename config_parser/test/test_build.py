@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import types
+import unittest
+
+from .. import skit
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class BuildTests(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.directory = tempfile.mkdtemp()
+        shutil.copy(os.path.join(TEST_DIR, '..', 'default.skit'), self.directory)
+        shutil.copytree(os.path.join(TEST_DIR, 'tile-swap'),
+                        os.path.join(self.directory, 'tile-swap'))
+        os.chdir(self.directory)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.directory)
+        skit.properties.clear()
+
+    def build(self, clean=False, processes=None):
+        skit.properties.clear()
+        build = skit.build('tile-swap/tile-swap.skit', clean, processes)
+        self.assertTrue(build.succeeded)
+        return build
+
+    def comparable(self, value):
+        if isinstance(value, dict):
+            return {k: self.comparable(v) for k, v in value.iteritems()}
+        if isinstance(value, list):
+            return [self.comparable(v) for v in value]
+        if isinstance(value, types.FunctionType):
+            return value.func_name, value.func_code.co_code, value.func_code.co_consts
+        return value
+
+    def edit(self, path, old, new):
+        with open(path) as f:
+            source = f.read()
+        with open(path, 'w') as f:
+            f.write(source.replace(old, new))
+
+    def test_unchanged(self):
+        first = self.build()
+        second = self.build()
+
+        self.assertEqual(7, len(first.rebuilt))
+        self.assertEqual([], second.rebuilt)
+        self.assertEqual(first.rebuilt, second.reused)
+        self.assertEqual(first.keys, second.keys)
+        self.assertEqual(15, skit.properties['tile-swap']['game']['points-to-win'])
+
+    def test_changed_file_and_dependents(self):
+        self.build()
+        self.edit('tile-swap/game/__value__.skit', 'points-to-win: 15', 'points-to-win: 12')
+        build = self.build()
+
+        self.assertEqual(['tile-swap/game/__value__.skit', 'tile-swap/tile-swap.skit'],
+                         build.rebuilt)
+        self.assertEqual(12, skit.properties['tile-swap']['game']['points-to-win'])
+
+    def test_changed_default(self):
+        self.build()
+        self.edit('default.skit', 'points-to-win: 10', 'points-to-win: 11')
+        build = self.build()
+
+        # The card file only refers to its own properties
+        self.assertEqual(['tile-swap/game/card/development/tile-swap-card.skit'], build.reused)
+
+    def test_parallel_matches_serial(self):
+        serial = self.build(clean=True, processes=1)
+        expected = self.comparable(skit.properties)
+
+        parallel = self.build(clean=True, processes=2)
+
+        self.assertEqual(expected, self.comparable(skit.properties))
+        self.assertEqual(serial.keys, parallel.keys)
+        self.assertEqual(serial.rebuilt, parallel.rebuilt)
+        self.assertEqual({}, parallel.parsed)
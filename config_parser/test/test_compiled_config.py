@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import compiled_config, config
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+KEY = 'a' * 40
+
+class CompiledConfigTests(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(TEST_DIR, '..', 'default.skit')) as f:
+            self.skit, succeeded = config.parse(f.read())
+        self.assertTrue(succeeded)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def functions(self, value, path=''):
+        if isinstance(value, dict):
+            for k, v in value.iteritems():
+                for item in self.functions(v, path + '.' + k):
+                    yield item
+        elif callable(value):
+            yield path, value
+
+    def assertSameConfig(self, expected, actual):
+        expected_functions = dict(self.functions(expected))
+        actual_functions = dict(self.functions(actual))
+
+        self.assertTrue(expected_functions)
+        self.assertEqual(sorted(expected_functions), sorted(actual_functions))
+        for path, func in expected_functions.iteritems():
+            self.assertEqual(func.func_code.co_code, actual_functions[path].func_code.co_code)
+            self.assertEqual(func.skit_source, actual_functions[path].skit_source)
+
+        self.assertEqual(self.strip(expected), self.strip(actual))
+
+    def strip(self, value):
+        if isinstance(value, dict):
+            return {k: self.strip(v) for k, v in value.iteritems()}
+        if isinstance(value, list):
+            return [self.strip(v) for v in value]
+        if callable(value):
+            return value.__name__, value.skit_source
+        return value
+
+    def test_round_trip(self):
+        path = os.path.join(self.directory, 'default.skitc')
+        compiled_config.dump(self.skit, KEY, path)
+
+        self.assertSameConfig(self.skit, compiled_config.load(path, KEY))
+        self.assertSameConfig(self.skit, compiled_config.load(path, use_mmap=True))
+
+    def test_shared_functions(self):
+        func = next(self.functions(self.skit))[1]
+        tree = {'a': func, 'b': [func]}
+
+        loaded = compiled_config.loads(compiled_config.dumps(tree, KEY))
+
+        self.assertTrue(loaded['a'] is loaded['b'][0])
+
+    def test_invalid(self):
+        data = compiled_config.dumps(self.skit, KEY)
+        loads = compiled_config.loads
+
+        self.assertRaises(compiled_config.CompiledConfigError, loads, data, 'b' * 40)
+        self.assertRaises(compiled_config.CompiledConfigError, loads, data[:-1])
+        self.assertRaises(compiled_config.CompiledConfigError, loads, 'X' + data[1:])
+        self.assertRaises(compiled_config.CompiledConfigError, loads, '')
+
+    def test_other_python_version(self):
+        data = compiled_config.dumps(self.skit, KEY)
+        # Replace the Python magic, which follows the magic and schema version
+        start = len(compiled_config.MAGIC) + 2
+        data = data[:start] + '\0\0\0\0' + data[start + 4:]
+
+        self.assertSameConfig(self.skit, compiled_config.loads(data))
@@ -0,0 +1,15 @@
+import unittest
+
+from .. import config
+from ..tables import skit_parsetab
+
+class TablesTests(unittest.TestCase):
+    def test_prebuilt_tables_are_current(self):
+        # Only tables matching the grammar are used as they are
+        self.assertTrue(config.get_parser().action is skit_parsetab._lr_action)
+
+    def test_parse(self):
+        skit, succeeded = config.parse('base: { game: { points-to-win: 12 } }')
+
+        self.assertTrue(succeeded)
+        self.assertEqual({'base': {'game': {'points-to-win': 12}}}, skit)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+
+class Agent(object):
+    """A programmatic player, making every decision a player's turn needs.
+
+    Agents answer the same questions the InputManager prompts a human for,
+    and play their own turns by calling into the Game directly. See
+    HeadlessInputManager, which routes the game's prompts to the agent of
+    the current player. GameBoard.legal_settlement_spots() and friends tell
+    agents where they may build.
+
+    Subclasses must implement every method raising NotImplementedError.
+
+    Attributes:
+        rng (random.Random): Source of randomness for this agent's choices.
+          Agents must not use the module level random functions, so that
+          seeded games can be replayed.
+
+    Args:
+        rng (random.Random): See above.
+    """
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def choose_vertex_placement(self, game, player):
+        """Choose where to place a vertex structure, e.g. initial settlements.
+
+        Returns:
+            tuple. (x, y, vertex_dir) of the vertex.
+        """
+        raise NotImplementedError
+
+    def choose_edge_placement(self, game, player):
+        """Choose where to place an edge structure, e.g. initial roads.
+
+        Returns:
+            tuple. (x, y, edge_dir) of the edge.
+        """
+        raise NotImplementedError
+
+    def choose_tile(self, game, player):
+        """Choose a tile, e.g. to move the robber to.
+
+        Returns:
+            tuple. (x, y) coordinates of the tile.
+        """
+        raise NotImplementedError
+
+    def choose_player(self, game, player, players):
+        """Choose one of the given players, e.g. to steal a resource from."""
+        raise NotImplementedError
+
+    def choose_resource_type(self, game, player):
+        """Choose an arable resource type, e.g. for a monopoly card."""
+        raise NotImplementedError
+
+    def choose_discards(self, game, player, resources, count):
+        """Choose which of the given resource cards to discard.
+
+        Returns:
+            list. count distinct indices into resources.
+        """
+        raise NotImplementedError
+
+    def choose_list_value(self, game, player, values):
+        """Choose one of the given values, as for a generic list prompt."""
+        raise NotImplementedError
+
+    def play_turn(self, game, player):
+        """Take the given player's actions for the turn, after the roll.
+
+        Returns:
+            None. Builds, trades and plays cards through the game.
+        """
+        raise NotImplementedError
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from engine.src.agent.random_agent import RandomAgent
+from engine.src.dice import Dice
+from engine.src.resource_type import ResourceType
+
+
+class HeuristicAgent(RandomAgent):
+    """A RandomAgent with a few cheap rules of thumb.
+
+    Plays its turns like a RandomAgent, but settles and upgrades on the
+    vertices with the most productive and varied tiles, as indexed by the
+    board's VertexYieldTracker, sends the robber to the tile that costs its
+    opponents the most production, and robs the player with the most
+    points. Cheap enough to play out games with, e.g. in an
+    MCTSAgent's search, while playing noticeably better than chance.
+
+    Attributes:
+        roll_probabilities (dict): Probability of each roll value, weighing
+          the production of each tile.
+
+    Args:
+        See RandomAgent.
+    """
+
+    def __init__(self, rng, road_probability=0.5):
+
+        super(HeuristicAgent, self).__init__(rng, road_probability)
+
+        self.roll_probabilities = Dice().get_roll_probabilities()
+
+    def choose_tile(self, game, player):
+
+        board = game.board
+        topology = board.topology
+        robber_tile = board.find_tile_with_calamity(game.robber)
+
+        tile_ids = [tile_id for tile_id, (x, y) in
+                    enumerate(topology.tile_coords)
+                    if board.tiles[x][y] is not robber_tile]
+
+        tile_id = max(tile_ids,
+                      key=lambda tile_id: self._get_robber_value(game, player,
+                                                                 tile_id))
+
+        return topology.tile_coords[tile_id]
+
+    def choose_player(self, game, player, players):
+        return max(players, key=lambda other: (other.get_visible_points(),
+                                               other.count_resources()))
+
+    def _choose_vertex(self, game, player, vertex_ids):
+        return max(sorted(vertex_ids),
+                   key=lambda vertex_id: self._get_vertex_value(game,
+                                                                vertex_id))
+
+    def _get_tile_value(self, game, tile_id):
+        """Get the expected number of resources a tile yields per structure
+        per roll.
+        """
+
+        x, y = game.board.topology.tile_coords[tile_id]
+        tile = game.board.tiles[x][y]
+
+        if tile.resource_type == ResourceType.FALLOW:
+            return 0
+
+        return self.roll_probabilities.get(tile.chit_value, 0)
+
+    def _get_vertex_value(self, game, vertex_id):
+
+        return game.board.vertex_yield_index.get_value(vertex_id)
+
+    def _get_robber_value(self, game, player, tile_id):
+        """Get how much production the robber takes from player's opponents
+        by blocking the given tile, net of what it takes from player.
+        """
+
+        tile_value = self._get_tile_value(game, tile_id)
+        value = 0
+
+        for structure in game.board.tile_index.get_tile_structures(tile_id):
+            if structure.owning_player == player:
+                value -= structure.base_yield * tile_value
+            else:
+                value += structure.base_yield * tile_value
+
+        return value
@@ -0,0 +1,584 @@
+# -*- coding: utf-8 -*-
+import math
+import multiprocessing
+import random
+import time
+
+from engine.src.agent.heuristic_agent import HeuristicAgent
+from engine.src.board.board_state import BoardStorage
+from engine.src.config.config import Config
+from engine.src.game import Game
+from engine.src.move.move import RobberMove
+from engine.src.move.undo_log import UndoLog
+from engine.src.resource_type import ResourceType
+from engine.src.simulation.headless_input_manager import \
+    HeadlessInputManager
+from engine.src.trading.trade_offer import TradeOffer
+
+
+def _search_worker(args):
+    """Run one root of a root parallel search, in a worker process.
+
+    Args:
+        args (tuple): The searching MCTSAgent, a GameSnapshot of the game,
+          the name of the searching player and a seed for this root.
+
+    Returns:
+        dict. See MCTSAgent.search().
+    """
+
+    agent, snapshot, player_name, seed = args
+
+    agent.rng = random.Random(seed)
+
+    game = Game(HeadlessInputManager(), random.Random(seed),
+                BoardStorage.ARRAYS)
+    snapshot.restore(game)
+
+    player = [player for player in game.players
+              if player.name == player_name][0]
+
+    return agent.search(game, player)
+
+
+class _Node(object):
+    """A node of the search tree: the statistics of a line of actions."""
+
+    __slots__ = ('children', 'visit_count', 'reward')
+
+    def __init__(self):
+
+        self.children = {}
+        self.visit_count = 0
+        self.reward = 0.0
+
+
+class MCTSAgent(HeuristicAgent):
+    """An agent choosing its turn's actions by Monte Carlo tree search.
+
+    Before each action of its turn, the agent searches the tree of lines of
+    actions it could take for the rest of the turn: building on any legal
+    placement, buying or playing a development card, moving the robber with
+    a knight, trading 4:1 with the bank for a resource it lacks, or ending
+    the turn. Each iteration replays
+    a line from the root on a clone of the game, chosen by UCT, adds one new
+    action to the tree, then plays out the rest of the turn and the next few
+    turns of every player with playout agents, and scores the result.
+
+    The search sees its opponents' development cards, but not the order of
+    the deck, which each iteration shuffles. A knight is searched as one
+    action per tile and victim the robber could be moved to and steal from.
+    The choices other card effects ask for are left to HeuristicAgent's
+    rules rather than searched. Rolls of 7 don't move the robber, see
+    Game.roll_dice(), so there's no other robber placement to search.
+
+    Iterations restore a snapshot of the root rather than cloning the game,
+    which is far cheaper for games stored in BoardStorage.ARRAYS. They don't
+    go back up through an UndoLog, since playouts roll the dice and let the
+    playout agents move the robber and play cards, which no Move covers.
+
+    Attributes:
+        rng (random.Random): See Agent. Seeds the playouts too, so searches
+          with an iteration budget are reproducible.
+
+        iterations (int): Number of iterations per search, if any.
+
+        time_limit (float): Number of seconds per search, if any. The search
+          stops at whichever budget runs out first.
+
+        playout_turns (int): Number of turns played out after the searching
+          player's turn, before scoring.
+
+        playout_agent_cls (type): Agent subclass playing out every player's
+          turns, e.g. RandomAgent for random playouts.
+
+        exploration (float): UCT exploration constant. Rewards range from 0
+          to 1.
+
+        processes (int): Number of processes searching independent trees,
+          whose root statistics are summed. With a single process, the
+          search runs in this process. Agents in BatchRunner workers must
+          use a single process, since those can't start processes of their
+          own.
+
+    Args:
+        See above.
+    """
+
+    END_TURN = ('end_turn',)
+
+    BANK_TRADE_RATIO = 4
+
+    DEFAULT_ITERATIONS = 100
+
+    # Longer playouts mostly add the noise of the dice, which drowns out the
+    # difference between the actions of a turn. See _evaluate().
+    DEFAULT_PLAYOUT_TURNS = 1
+
+    DEFAULT_EXPLORATION = 0.7
+
+    # Points a resource of expected income per roll is worth. See
+    # _evaluate().
+    INCOME_WEIGHT = 2.0
+
+    # Bounds a turn's actions should a search keep choosing to trade back
+    # and forth.
+    MAX_TURN_ACTIONS = 30
+
+    def __init__(self, rng, iterations=DEFAULT_ITERATIONS, time_limit=None,
+                 playout_turns=DEFAULT_PLAYOUT_TURNS,
+                 playout_agent_cls=HeuristicAgent,
+                 exploration=DEFAULT_EXPLORATION, processes=1):
+
+        super(MCTSAgent, self).__init__(rng)
+
+        if iterations is None and time_limit is None:
+            raise ValueError('MCTSAgent needs an iteration or time budget')
+
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.playout_turns = playout_turns
+        self.playout_agent_cls = playout_agent_cls
+        self.exploration = exploration
+        self.processes = processes
+
+        self.card_played = False
+        self._pool = None
+
+    def __getstate__(self):
+
+        # Sent to worker processes without the pool of workers.
+        state = self.__dict__.copy()
+        state['_pool'] = None
+
+        return state
+
+    def close(self):
+        """Stop the worker processes of a root parallel search, if any."""
+
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def play_turn(self, game, player):
+
+        self.card_played = False
+        points_to_win = Config.get('game.points_to_win')
+
+        for _ in range(MCTSAgent.MAX_TURN_ACTIONS):
+            action = self.choose_action(game, player)
+
+            if action == MCTSAgent.END_TURN:
+                break
+
+            self.apply_action(game, player, action)
+
+            if player.get_total_points() >= points_to_win:
+                break
+
+    def choose_action(self, game, player):
+        """Search for the best next action of player's turn.
+
+        Returns:
+            tuple. The most visited action at the root. See get_actions().
+        """
+
+        actions = self.get_actions(game, player)
+
+        if len(actions) == 1:
+            return actions[0]
+
+        if self.processes == 1:
+            stats = self.search(game, player)
+        else:
+            stats = self._search_in_parallel(game, player)
+
+        return max(actions, key=lambda action: stats.get(action, (0, 0))[0])
+
+    def search(self, game, player):
+        """Search the lines of actions player could take for the rest of the
+        turn, within the agent's budget.
+
+        Returns:
+            dict. For each action at the root, a (visit count, total reward)
+              tuple.
+        """
+
+        input_manager = HeadlessInputManager()
+        working_game = game.clone(input_manager)
+        input_manager.game = working_game
+
+        for working_player in working_game.players:
+            input_manager.agents[working_player] = self.playout_agent_cls(
+                random.Random(self.rng.getrandbits(32)))
+
+        working_player = working_game.players[game.players.index(player)]
+        root_snapshot = working_game.snapshot()
+
+        root = _Node()
+        deadline = None
+        if self.time_limit is not None:
+            deadline = time.time() + self.time_limit
+
+        iteration = 0
+
+        while self.iterations is None or iteration < self.iterations:
+            if deadline is not None and time.time() >= deadline:
+                break
+
+            working_game.restore(root_snapshot)
+            working_game.rng.seed(self.rng.getrandbits(32))
+            working_game.rng.shuffle(working_game.board.bank.development_cards)
+
+            self._iterate(working_game, working_player, root)
+            iteration += 1
+
+        return dict((action, (node.visit_count, node.reward))
+                    for action, node in root.children.iteritems())
+
+    def get_actions(self, game, player, card_played=None):
+        """Get the actions player may take next, in a deterministic order.
+
+        Actions are tuples, the same in any clone of the game:
+            ('end_turn',)
+            ('build', structure name, vertex or edge id)
+            ('buy_card',)
+            ('play_card', card name)
+            ('robber', tile id, victim's name or None)
+            ('trade', offered resource type, requested resource type)
+
+        Knights are played through robber actions rather than 'play_card'.
+        See _get_robber_actions().
+
+        Args:
+            card_played (bool): Whether player already played a development
+              card this turn. Defaults to whether this agent did.
+
+        Returns:
+            list. Of actions, starting with MCTSAgent.END_TURN.
+        """
+
+        if card_played is None:
+            card_played = self.card_played
+
+        board = game.board
+        actions = [MCTSAgent.END_TURN]
+
+        placements = [
+            ('City', board.legal_city_upgrades),
+            ('Settlement', board.legal_settlement_spots),
+            ('Road', board.legal_road_edges),
+        ]
+
+        for structure_name, get_position_ids in placements:
+            if self._can_build(player, structure_name):
+                actions.extend(
+                    ('build', structure_name, position_id)
+                    for position_id in sorted(get_position_ids(player)))
+
+        if self._can_buy_development_card(game, player):
+            actions.append(('buy_card',))
+
+        if not card_played:
+            knight_name = Config.get('game.card.development.knight.name')
+
+            for name in self._get_playable_card_names(game, player):
+                if name == knight_name:
+                    actions.extend(self._get_robber_actions(game, player))
+                else:
+                    actions.append(('play_card', name))
+
+        requested_types = [resource_type for resource_type in
+                           self._get_missing_types(player)
+                           if board.bank.resources[resource_type]]
+
+        for offered_type in ResourceType.get_arable_types():
+            if player.resources[offered_type] < MCTSAgent.BANK_TRADE_RATIO:
+                continue
+
+            actions.extend(('trade', offered_type, requested_type)
+                           for requested_type in requested_types
+                           if requested_type != offered_type)
+
+        return actions
+
+    def apply_action(self, game, player, action):
+        """Take one of the actions of get_actions() in the given game.
+
+        Returns:
+            bool. Whether the action succeeded. Only development card effects
+              may fail, by breaking a game rule. See RandomAgent._play_card().
+        """
+
+        kind = action[0]
+
+        if kind == 'build':
+            _, structure_name, position_id = action
+            topology = game.board.topology
+
+            if structure_name == 'Road':
+                placement = topology.edge_coords[position_id]
+            else:
+                placement = topology.vertex_coords[position_id]
+
+            self._place(game, player, structure_name, placement)
+
+        elif kind == 'buy_card':
+            dev_card = game.board.bank.buy_development_card(player)
+            dev_card.draw_card(game, player)
+
+        elif kind == 'play_card':
+            self.card_played = True
+
+            dev_card = [dev_card for dev_card in
+                        player.get_unplayed_development_cards()
+                        if dev_card.name == action[1]][0]
+
+            return self._play_card(game, player, dev_card)
+
+        elif kind == 'robber':
+            _, tile_id, victim_name = action
+            self.card_played = True
+
+            knight_name = Config.get('game.card.development.knight.name')
+            dev_card = [dev_card for dev_card in
+                        player.get_unplayed_development_cards()
+                        if dev_card.name == knight_name][0]
+
+            victim = None
+            if victim_name is not None:
+                victim = [game_player for game_player in game.players
+                          if game_player.name == victim_name][0]
+
+            # As the knight's play_card(), with the robber's tile and victim
+            # taken from the action rather than asked for.
+            game.input_manager.announce_development_card_played(player,
+                                                                dev_card)
+            UndoLog(game).apply(RobberMove(player, tile_id, victim))
+
+            player.knights += 1
+            dev_card.played = True
+            game.update_point_counts()
+
+        elif kind == 'trade':
+            _, offered_type, requested_type = action
+
+            game.board.bank.trade(player, TradeOffer(
+                {offered_type: MCTSAgent.BANK_TRADE_RATIO},
+                {requested_type: 1}))
+
+        return True
+
+    def _iterate(self, game, player, root):
+        """Run one iteration of the search, from the root state."""
+
+        points_to_win = Config.get('game.points_to_win')
+
+        node = root
+        path = [root]
+        card_played = self.card_played
+        turn_ended = False
+
+        for _ in range(MCTSAgent.MAX_TURN_ACTIONS):
+            actions = self.get_actions(game, player, card_played)
+            action = self._select(node, actions)
+
+            is_new = action not in node.children
+            if is_new:
+                node.children[action] = _Node()
+
+            node = node.children[action]
+            path.append(node)
+
+            if action == MCTSAgent.END_TURN:
+                turn_ended = True
+                break
+
+            if action[0] in ('play_card', 'robber'):
+                card_played = True
+
+            if not self._apply_in_search(game, player, action) or is_new or \
+                    player.get_total_points() >= points_to_win:
+                break
+
+        reward = self._play_out(game, player, turn_ended)
+
+        for node in path:
+            node.visit_count += 1
+            node.reward += reward
+
+    def _apply_in_search(self, game, player, action):
+
+        # apply_action() records played and failed cards on the agent
+        # itself, which the search must leave alone.
+        card_played = self.card_played
+        failed_card_count = self.failed_card_count
+
+        try:
+            return self.apply_action(game, player, action)
+        finally:
+            self.card_played = card_played
+            self.failed_card_count = failed_card_count
+
+    def _select(self, node, actions):
+        """Choose an untried action at random, else the best by UCT."""
+
+        untried_actions = [action for action in actions
+                           if action not in node.children]
+
+        if untried_actions:
+            return self.rng.choice(untried_actions)
+
+        log_visit_count = math.log(sum(node.children[action].visit_count
+                                       for action in actions))
+
+        def get_uct_value(action):
+            child = node.children[action]
+
+            return child.reward / child.visit_count + self.exploration * \
+                math.sqrt(log_visit_count / child.visit_count)
+
+        return max(actions, key=get_uct_value)
+
+    def _play_out(self, game, player, turn_ended):
+        """Play out the rest of player's turn and the next few turns.
+
+        Returns:
+            float. The reward for player, from 0 to 1. See _evaluate().
+        """
+
+        points_to_win = Config.get('game.points_to_win')
+        agents = game.input_manager.agents
+
+        if not turn_ended and player.get_total_points() < points_to_win:
+            agents[player].play_turn(game, player)
+            game.update_point_counts()
+
+        player_index = game.players.index(player)
+
+        for turn in range(1, self.playout_turns + 1):
+            if game.get_winning_player().get_total_points() >= \
+                    points_to_win:
+                break
+
+            next_player = game.players[
+                (player_index + turn) % len(game.players)]
+
+            game.begin_turn(next_player)
+            game.roll_dice()
+            agents[next_player].play_turn(game, next_player)
+            game.update_point_counts()
+
+        return self._evaluate(game, player)
+
+    def _evaluate(self, game, player):
+        """Score the state of a playout for player.
+
+        A win scores 1 and a loss 0. Otherwise, player's lead in value over
+        the best of its opponents, relative to the points needed to win, is
+        mapped between the two. A player's value is its points plus its
+        expected income, since a few turns of playout rarely turn income
+        into points.
+        """
+
+        points_to_win = Config.get('game.points_to_win')
+        values = {}
+
+        for game_player in game.players:
+            points = game_player.get_total_points()
+
+            if points >= points_to_win:
+                return 1.0 if game_player == player else 0.0
+
+            income = game.board.production_tracker.get_expected_income(
+                game_player, game.dice)
+            values[game_player] = \
+                points + MCTSAgent.INCOME_WEIGHT * sum(income.values())
+
+        best_other_value = max(value for game_player, value in
+                               values.iteritems() if game_player != player)
+        lead = (values[player] - best_other_value) / points_to_win
+
+        return min(max(0.5 + 0.5 * lead, 0.0), 1.0)
+
+    def _search_in_parallel(self, game, player):
+        """Search independent trees from the same root, one per process, and
+        sum their root statistics.
+        """
+
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.processes)
+
+        snapshot = game.snapshot()
+        args = [(self, snapshot, player.name, self.rng.getrandbits(32))
+                for _ in range(self.processes)]
+
+        stats = {}
+
+        for root_stats in self._pool.map(_search_worker, args):
+            for action, (visit_count, reward) in root_stats.iteritems():
+                total_visit_count, total_reward = stats.get(action, (0, 0.0))
+                stats[action] = (total_visit_count + visit_count,
+                                 total_reward + reward)
+
+        return stats
+
+    def _get_missing_types(self, player):
+        """Get the resource types player lacks for something it could build
+        or buy, in a deterministic order, the only ones worth trading for.
+        """
+
+        costs = [self._get_cost(structure_name) for structure_name in
+                 ('City', 'Settlement', 'Road')
+                 if player.remaining_structure_counts[structure_name]]
+        costs.append(Config.get('game.card.development.default.cost'))
+
+        return [resource_type for resource_type in
+                ResourceType.get_arable_types()
+                if any(player.resources[resource_type] <
+                       cost.get(resource_type, 0) for cost in costs)]
+
+    def _get_robber_actions(self, game, player):
+        """Get the robber actions of a knight player could play, in a
+        deterministic order.
+
+        The robber may move to any tile but its own. On a tile next to
+        opponents with resources, there's one action per such opponent to
+        steal from, else a single action stealing from nobody.
+        """
+
+        board = game.board
+        robber_tile = board.find_tile_with_calamity(game.robber)
+        actions = []
+
+        for tile_id, (x, y) in enumerate(board.topology.tile_coords):
+            tile = board.tiles[x][y]
+
+            if tile is robber_tile:
+                continue
+
+            victim_names = sorted(set(
+                structure.owning_player.name for structure in
+                tile.get_adjacent_vertex_structures()
+                if structure.owning_player != player and
+                structure.owning_player.count_resources()))
+
+            if victim_names:
+                actions.extend(('robber', tile_id, victim_name)
+                               for victim_name in victim_names)
+            else:
+                actions.append(('robber', tile_id, None))
+
+        return actions
+
+    def _get_playable_card_names(self, game, player):
+
+        excluded_names = (
+            # Has no effect when played.
+            Config.get('game.card.development.victory_point.name'),
+        )
+
+        return sorted(set(dev_card.name for dev_card in
+                          self._get_playable_cards(game, player)
+                          if dev_card.name not in excluded_names))
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+from engine.src.agent.agent import Agent
+from engine.src.config.config import Config
+from engine.src.exceptions import *
+from engine.src.resource_type import ResourceType
+from engine.src.trading.trade_offer import TradeOffer
+
+
+class RandomAgent(Agent):
+    """An agent making random legal moves.
+
+    Each turn it plays at most one development card, then keeps building
+    whatever it can afford, preferring cities, then settlements, then
+    development cards and roads, and trades 4:1 with the bank towards the
+    structure it lacks the fewest resources for. Its choices among legal
+    placements are uniformly random.
+
+    Attributes:
+        rng (random.Random): See Agent.
+
+        road_probability (float): Chance of building an affordable road even
+          though a settlement spot is still available.
+
+        initial_vertex_id (int): Id of the vertex of the settlement last
+          placed during the initial placement stage, which the next road
+          must touch.
+
+        failed_card_count (int): Number of development cards whose effect
+          failed when played. See _play_card().
+
+    Args:
+        rng (random.Random): See above.
+
+        road_probability (float): See above.
+    """
+
+    BANK_TRADE_RATIO = 4
+
+    def __init__(self, rng, road_probability=0.5):
+
+        super(RandomAgent, self).__init__(rng)
+
+        self.road_probability = road_probability
+        self.initial_vertex_id = None
+        self.failed_card_count = 0
+
+    def choose_vertex_placement(self, game, player):
+
+        initial = game.turn_count == 0
+        vertex_id = self._choose_vertex(
+            game, player, game.board.legal_settlement_spots(player, initial))
+
+        if initial:
+            self.initial_vertex_id = vertex_id
+
+        return game.board.topology.vertex_coords[vertex_id]
+
+    def choose_edge_placement(self, game, player):
+
+        vertex_id = self.initial_vertex_id if game.turn_count == 0 else None
+        edge_id = self._choose(game.board.legal_road_edges(player, vertex_id))
+
+        return game.board.topology.edge_coords[edge_id]
+
+    def choose_tile(self, game, player):
+        return self.rng.choice(game.board.topology.tile_coords)
+
+    def choose_player(self, game, player, players):
+        return self.rng.choice(players)
+
+    def choose_resource_type(self, game, player):
+        return self.rng.choice(ResourceType.get_arable_types())
+
+    def choose_discards(self, game, player, resources, count):
+        return self.rng.sample(range(len(resources)), count)
+
+    def choose_list_value(self, game, player, values):
+        return self.rng.choice(values)
+
+    def play_turn(self, game, player):
+
+        self.play_development_card(game, player)
+
+        while self.build(game, player) or self.trade_with_bank(game, player):
+            pass
+
+    def play_development_card(self, game, player):
+        """Play one of player's unplayed development cards, if any."""
+
+        dev_cards = self._get_playable_cards(game, player)
+
+        if dev_cards:
+            self._play_card(game, player, self.rng.choice(dev_cards))
+
+    def _get_playable_cards(self, game, player):
+        """Get player's unplayed development cards whose effect can apply."""
+
+        road_building_name = \
+            Config.get('game.card.development.road_building.name')
+
+        dev_cards = []
+
+        for dev_card in player.get_unplayed_development_cards():
+            # Road building fails part way through without room for 2 roads.
+            if dev_card.name == road_building_name and (
+                    player.remaining_structure_counts['Road'] < 2 or
+                    len(game.board.legal_road_edges(player)) < 2):
+                continue
+
+            dev_cards.append(dev_card)
+
+        return dev_cards
+
+    def _play_card(self, game, player, dev_card):
+        """Play the given development card of player's.
+
+        As in InputManager.do_play_card(), a card whose effect breaks a game
+        rule, e.g. taking resources the bank ran out of, is reported rather
+        than ending the game. It's also counted in failed_card_count, so that
+        headless runs can tell. Any other exception is a bug, and raised.
+
+        Returns:
+            bool. Whether the card's effect applied.
+        """
+
+        try:
+            dev_card.play_card(game, player)
+        except UserMessageException as e:
+            self.failed_card_count += 1
+            game.input_manager.output(e)
+            return False
+
+        game.update_point_counts()
+
+        return True
+
+    def build(self, game, player):
+        """Build one affordable structure or buy a development card.
+
+        Returns:
+            bool. Whether anything was built or bought.
+        """
+
+        board = game.board
+        topology = board.topology
+
+        if self._can_build(player, 'City'):
+            vertex_ids = board.legal_city_upgrades(player)
+
+            if vertex_ids:
+                vertex_id = self._choose_vertex(game, player, vertex_ids)
+                self._place(game, player, 'City',
+                            topology.vertex_coords[vertex_id])
+                return True
+
+        settlement_ids = board.legal_settlement_spots(player)
+
+        if self._can_build(player, 'Settlement') and settlement_ids:
+            vertex_id = self._choose_vertex(game, player, settlement_ids)
+            self._place(game, player, 'Settlement',
+                        topology.vertex_coords[vertex_id])
+            return True
+
+        if self._can_buy_development_card(game, player):
+            try:
+                dev_card = game.board.bank.buy_development_card(player)
+                dev_card.draw_card(game, player)
+                return True
+            except (NotEnoughDevelopmentCardsException,
+                    NotEnoughResourcesException):
+                pass
+
+        if self._can_build(player, 'Road') and (
+                not settlement_ids or
+                self.rng.random() < self.road_probability):
+            edge_ids = board.legal_road_edges(player)
+
+            if edge_ids:
+                self._place(game, player, 'Road',
+                            topology.edge_coords[self._choose(edge_ids)])
+                return True
+
+        return False
+
+    def trade_with_bank(self, game, player):
+        """Trade towards the buildable structure lacking the fewest resources.
+
+        Returns:
+            bool. Whether a trade was made.
+        """
+
+        if max(player.resources.values()) < RandomAgent.BANK_TRADE_RATIO:
+            return False
+
+        placements = [
+            ('City', game.board.legal_city_upgrades(player)),
+            ('Settlement', game.board.legal_settlement_spots(player)),
+            ('Road', game.board.legal_road_edges(player)),
+        ]
+
+        missing_costs = []
+
+        for structure_name, ids in placements:
+            if not ids or \
+                    not player.remaining_structure_counts[structure_name]:
+                continue
+
+            cost = self._get_cost(structure_name)
+            missing = dict(
+                (resource_type, count - player.resources[resource_type])
+                for resource_type, count in cost.items()
+                if count > player.resources[resource_type]
+            )
+            missing_costs.append((sum(missing.values()), missing, cost))
+
+        if not missing_costs:
+            return False
+
+        missing_count, missing, cost = min(missing_costs, key=lambda m: m[0])
+
+        if not missing_count:
+            return False
+
+        offered_types = [
+            resource_type for resource_type in ResourceType.get_arable_types()
+            if player.resources[resource_type] - cost.get(resource_type, 0) >=
+            RandomAgent.BANK_TRADE_RATIO
+        ]
+
+        requested_types = [resource_type for resource_type in missing
+                           if game.board.bank.resources[resource_type]]
+
+        if not offered_types or not requested_types:
+            return False
+
+        trade_offer = TradeOffer(
+            {self.rng.choice(offered_types): RandomAgent.BANK_TRADE_RATIO},
+            {self.rng.choice(requested_types): 1})
+
+        try:
+            game.board.bank.trade(player, trade_offer)
+            return True
+        except NotEnoughResourcesException:
+            return False
+
+    def _choose(self, ids):
+        # Sets have no order to choose by, so sort for reproducibility.
+        return self.rng.choice(sorted(ids))
+
+    def _choose_vertex(self, game, player, vertex_ids):
+        """Choose which of the given vertices to build a settlement or city on.
+
+        Returns:
+            int. One of vertex_ids.
+        """
+
+        return self._choose(vertex_ids)
+
+    def _place(self, game, player, structure_name, placement):
+
+        game.place_structure(player, structure_name, placement=placement)
+        game.update_point_counts()
+
+    def _can_build(self, player, structure_name):
+
+        if not player.remaining_structure_counts[structure_name]:
+            return False
+
+        return self._can_afford(player, self._get_cost(structure_name))
+
+    def _can_buy_development_card(self, game, player):
+
+        return bool(game.board.bank.development_cards) and self._can_afford(
+            player, Config.get('game.card.development.default.cost'))
+
+    @staticmethod
+    def _get_cost(structure_name):
+
+        cost = Config.get('game.structure.player_built.{0}.cost'.format(
+            structure_name.lower()))
+
+        return dict((resource_type, count)
+                    for resource_type, count in cost.items() if count)
+
+    @staticmethod
+    def _can_afford(player, cost):
+
+        return all(player.resources[resource_type] >= count
+                   for resource_type, count in cost.items())
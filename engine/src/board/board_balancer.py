@@ -0,0 +1,569 @@
+# -*- coding: utf-8 -*-
+import random
+
+from engine.src.dice import Dice
+from engine.src.resource_type import ResourceType
+
+
+class BoardScorer(object):
+    """Scores how balanced a layout of resources and chits is.
+
+    A layout gives the (resource type, chit value) of each tile, by tile id.
+    Its score is a weighted sum of the following components, each of which
+    is 0 for a perfectly balanced layout:
+
+        resource_pips: How unevenly the pips, i.e. the number of dice
+          combinations rolling a tile's chit, are spread over the resource
+          types, per tile of each type.
+
+        high_chit_adjacency: Number of neighboring tiles both bearing one of
+          the high_chit_values, e.g. a 6 next to an 8.
+
+        resource_adjacency: Number of neighboring tiles of the same arable
+          resource type.
+
+        vertex_variance: Variance of the pips of the tiles around each vertex,
+          i.e. of how much a settlement on each vertex produces.
+
+    Attributes:
+        topology (HexTopology): Topology of the boards to score.
+
+        weights (dict): Weight of each component.
+
+        high_chit_values (tuple): Chit values that shouldn't neighbor each
+          other.
+
+        pips (dict): Number of dice combinations rolling each value.
+
+        tile_pairs (list): (tile id, tile id) of each pair of neighboring
+          tiles.
+
+        tile_neighbor_sets (list): Ids of the neighbors of each tile, as a
+          frozenset, by tile id.
+
+    Args:
+        topology (HexTopology): See above.
+
+        dice (Dice): Dice whose roll probabilities give the pips. Defaults to
+          a standard pair of dice.
+
+        weights (dict): Weights overriding some of DEFAULT_WEIGHTS.
+
+        high_chit_values (tuple): See above.
+    """
+
+    COMPONENTS = ('resource_pips', 'high_chit_adjacency',
+                  'resource_adjacency', 'vertex_variance')
+
+    DEFAULT_WEIGHTS = {
+        'resource_pips': 1.0,
+        # Next to a hard constraint. See BalancedBoardGenerator.
+        'high_chit_adjacency': 10.0,
+        'resource_adjacency': 1.0,
+        'vertex_variance': 1.0,
+    }
+
+    DEFAULT_HIGH_CHIT_VALUES = (6, 8)
+
+    def __init__(self, topology, dice=None, weights=None,
+                 high_chit_values=DEFAULT_HIGH_CHIT_VALUES):
+
+        if dice is None:
+            dice = Dice()
+
+        self.topology = topology
+
+        self.weights = dict(BoardScorer.DEFAULT_WEIGHTS)
+        self.weights.update(weights or {})
+
+        self.high_chit_values = tuple(high_chit_values)
+
+        combination_count = len(dice.values) ** dice.dice_count
+        self.pips = dict(
+            (roll_value, int(round(probability * combination_count)))
+            for roll_value, probability in
+            dice.get_roll_probabilities().iteritems())
+
+        self.tile_pairs = [(tile_id, neighbor_id) for tile_id, neighbor_ids
+                           in enumerate(topology.tile_tiles)
+                           for neighbor_id in neighbor_ids
+                           if tile_id < neighbor_id]
+
+        self.tile_neighbor_sets = [frozenset(neighbor_ids) for neighbor_ids
+                                   in topology.tile_tiles]
+
+        # What swapping the contents of each pair of tiles can change: the
+        # neighbors of either tile but the other, whose pairs with it change,
+        # and the vertices of either tile but not both, whose pips change.
+        # Unlike the score, this only depends on the topology. See
+        # _LayoutState.swap().
+        self.swap_neighborhoods = {}
+
+        for tile_id in range(topology.tile_count):
+            for other_tile_id in range(topology.tile_count):
+                vertex_ids = set(topology.tile_vertices[tile_id])
+                other_vertex_ids = set(topology.tile_vertices[other_tile_id])
+
+                self.swap_neighborhoods[(tile_id, other_tile_id)] = (
+                    tuple(neighbor_id for neighbor_id in
+                          topology.tile_tiles[tile_id]
+                          if neighbor_id != other_tile_id),
+                    tuple(neighbor_id for neighbor_id in
+                          topology.tile_tiles[other_tile_id]
+                          if neighbor_id != tile_id),
+                    tuple(sorted(vertex_ids - other_vertex_ids)),
+                    tuple(sorted(other_vertex_ids - vertex_ids)),
+                )
+
+    def score(self, layout):
+        """Get the weighted score of the given layout. Lower is fairer."""
+
+        return _LayoutState.from_layout(self, layout).get_score()
+
+    def score_components(self, layout):
+        """Get the unweighted score of each component of the given layout.
+
+        Returns:
+            dict. Score of each of COMPONENTS.
+        """
+
+        return _LayoutState.from_layout(self, layout).get_components()
+
+    def get_weighted_score(self, components):
+
+        return sum(self.weights[component] * components[component]
+                   for component in BoardScorer.COMPONENTS)
+
+
+class _LayoutState(object):
+    """A layout, and the running totals its score is computed from.
+
+    Resources are held as indices into the arable types, -1 for fallow, so
+    that nothing compares ResourceTypes. Swapping two tiles only revisits the
+    neighbors and vertices around them, and gives the change in score
+    without recomputing it. See swap().
+
+    Args:
+        scorer (BoardScorer): Scorer of the layout.
+
+        resources (list): Index of each tile's resource type, by tile id.
+
+        chit_values (list): Chit value of each tile, by tile id.
+    """
+
+    def __init__(self, scorer, resources, chit_values):
+
+        self.scorer = scorer
+        self.resources = resources
+        self.chit_values = chit_values
+
+        weights = scorer.weights
+        self._resource_pips_weight = weights['resource_pips']
+        self._high_chit_weight = weights['high_chit_adjacency']
+        self._resource_weight = weights['resource_adjacency']
+        self._vertex_weight = weights['vertex_variance']
+
+        pips = scorer.pips
+        high_chit_values = scorer.high_chit_values
+
+        self.tile_pips = [pips.get(chit_value, 0)
+                          for chit_value in chit_values]
+        self.high_chits = [chit_value in high_chit_values
+                           for chit_value in chit_values]
+
+        resource_count = len(ResourceType.get_arable_types())
+        self.resource_tile_counts = [0] * resource_count
+        self.resource_pips = [0] * resource_count
+
+        for resource, tile_pips in zip(resources, self.tile_pips):
+            if resource >= 0:
+                self.resource_tile_counts[resource] += 1
+                self.resource_pips[resource] += tile_pips
+
+        arable_count = sum(self.resource_tile_counts)
+        self.mean_pips = float(sum(self.resource_pips)) / arable_count \
+            if arable_count else 0.0
+
+        self.high_pair_count = 0
+        self.same_pair_count = 0
+
+        for tile_id, other_tile_id in scorer.tile_pairs:
+            self.high_pair_count += \
+                self.high_chits[tile_id] and self.high_chits[other_tile_id]
+            self.same_pair_count += resources[tile_id] >= 0 and \
+                resources[tile_id] == resources[other_tile_id]
+
+        self.vertex_values = [sum(self.tile_pips[tile_id] for tile_id in
+                                  tile_ids)
+                              for tile_ids in scorer.topology.vertex_tiles]
+
+        # Every tile has as many vertices, so swaps never change the mean.
+        self.vertex_count = float(len(self.vertex_values))
+        self.vertex_mean = sum(self.vertex_values) / self.vertex_count
+        self.vertex_square_sum = sum(value * value
+                                     for value in self.vertex_values)
+
+    @classmethod
+    def from_layout(cls, scorer, layout):
+
+        arable_types = ResourceType.get_arable_types()
+
+        resources = [-1 if resource_type == ResourceType.FALLOW else
+                     arable_types.index(resource_type)
+                     for resource_type, _ in layout]
+
+        return cls(scorer, resources, [chit_value for _, chit_value in layout])
+
+    def get_layout(self):
+        """Get the layout, as (resource type, chit value) by tile id."""
+
+        arable_types = ResourceType.get_arable_types()
+
+        return [(ResourceType.FALLOW if resource < 0 else
+                 arable_types[resource], chit_value)
+                for resource, chit_value in zip(self.resources,
+                                                self.chit_values)]
+
+    def get_components(self):
+
+        resource_pips = 0.0
+        mean_pips = self.mean_pips
+
+        for tile_count, pips in zip(self.resource_tile_counts,
+                                    self.resource_pips):
+            if tile_count:
+                deviation = float(pips) / tile_count - mean_pips
+                resource_pips += tile_count * deviation * deviation
+
+        return {
+            'resource_pips': resource_pips,
+            'high_chit_adjacency': self.high_pair_count,
+            'resource_adjacency': self.same_pair_count,
+            'vertex_variance': self.vertex_square_sum / self.vertex_count -
+            self.vertex_mean * self.vertex_mean,
+        }
+
+    def get_score(self):
+
+        return self.scorer.get_weighted_score(self.get_components())
+
+    def swap(self, tile_id, other_tile_id, swap_resources):
+        """Swap the chits of two tiles, and their resources too if
+        swap_resources. Undone by the same swap.
+
+        Fallow tiles must keep their 0 chit, i.e. only swap the chits of
+        arable tiles.
+
+        Returns:
+            float. Change in the weighted score.
+        """
+
+        neighbor_ids, other_neighbor_ids, vertex_ids, other_vertex_ids = \
+            self.scorer.swap_neighborhoods[(tile_id, other_tile_id)]
+
+        resources = self.resources
+        tile_pips = self.tile_pips
+        high_chits = self.high_chits
+
+        change = 0.0
+
+        high_chit = high_chits[tile_id]
+        if high_chit != high_chits[other_tile_id]:
+            # The high chit leaves one tile's neighbors for the other's.
+            pair_change = 0
+
+            for neighbor_id in other_neighbor_ids:
+                pair_change += high_chits[neighbor_id]
+
+            for neighbor_id in neighbor_ids:
+                pair_change -= high_chits[neighbor_id]
+
+            if not high_chit:
+                pair_change = -pair_change
+
+            self.high_pair_count += pair_change
+            change += self._high_chit_weight * pair_change
+
+        resource = resources[tile_id]
+        other_resource = resources[other_tile_id]
+
+        if swap_resources and resource != other_resource:
+            pair_change = 0
+
+            for neighbor_id in neighbor_ids:
+                neighbor_resource = resources[neighbor_id]
+                pair_change += \
+                    (other_resource >= 0 and
+                     neighbor_resource == other_resource) - \
+                    (resource >= 0 and neighbor_resource == resource)
+
+            for neighbor_id in other_neighbor_ids:
+                neighbor_resource = resources[neighbor_id]
+                pair_change += \
+                    (resource >= 0 and neighbor_resource == resource) - \
+                    (other_resource >= 0 and
+                     neighbor_resource == other_resource)
+
+            self.same_pair_count += pair_change
+            change += self._resource_weight * pair_change
+
+        pip_change = tile_pips[other_tile_id] - tile_pips[tile_id]
+
+        if pip_change:
+            # Swapping whole tiles moves their pips along with their
+            # resources, leaving each resource type's pips alone. With the
+            # tile counts and total pips fixed, the resource_pips component
+            # only changes by the sum of pips ** 2 / tile count.
+            if not swap_resources and resource != other_resource:
+                resource_pips = self.resource_pips
+                tile_count = self.resource_tile_counts[resource]
+                other_tile_count = self.resource_tile_counts[other_resource]
+
+                pips = resource_pips[resource]
+                other_pips = resource_pips[other_resource]
+                new_pips = pips + pip_change
+                new_other_pips = other_pips - pip_change
+
+                resource_pips[resource] = new_pips
+                resource_pips[other_resource] = new_other_pips
+
+                change += self._resource_pips_weight * (
+                    float(new_pips * new_pips - pips * pips) / tile_count +
+                    float(new_other_pips * new_other_pips -
+                          other_pips * other_pips) / other_tile_count)
+
+            vertex_values = self.vertex_values
+            square_change = 0
+
+            for vertex_id in vertex_ids:
+                value = vertex_values[vertex_id]
+                vertex_values[vertex_id] = value + pip_change
+                square_change += pip_change * (2 * value + pip_change)
+
+            for vertex_id in other_vertex_ids:
+                value = vertex_values[vertex_id]
+                vertex_values[vertex_id] = value - pip_change
+                square_change += pip_change * (pip_change - 2 * value)
+
+            self.vertex_square_sum += square_change
+            change += self._vertex_weight * square_change / self.vertex_count
+
+        chit_values = self.chit_values
+        chit_values[tile_id], chit_values[other_tile_id] = \
+            chit_values[other_tile_id], chit_values[tile_id]
+        tile_pips[tile_id], tile_pips[other_tile_id] = \
+            tile_pips[other_tile_id], tile_pips[tile_id]
+        high_chits[tile_id], high_chits[other_tile_id] = \
+            high_chits[other_tile_id], high_chit
+
+        if swap_resources:
+            resources[tile_id], resources[other_tile_id] = \
+                other_resource, resource
+
+        return change
+
+
+class BalancedBoardGenerator(object):
+    """Generates balanced layouts of a fixed set of resources and chits.
+
+    Each layout starts from random layouts, the first without neighboring
+    high chits being kept (rejection sampling), then improves it by trying
+    random swaps of two tiles' chits, or of two whole tiles, keeping those
+    that lower its BoardScorer score (local search). A swap only revisits
+    the neighbor pairs and vertices of the two tiles, precomputed by the
+    scorer.
+
+    Attributes:
+        scorer (BoardScorer): Scorer of the layouts.
+
+        resource_types (list): Resource type of each tile, in any order.
+
+        chit_values (list): Chit value of each arable tile, in any order.
+          Fallow tiles get a chit value of 0.
+
+        rng (random.Random): Source of randomness for the layouts.
+
+        max_attempts (int): Number of random layouts to draw at most, before
+          settling for the last one and leaving the rest to the swaps.
+
+        swap_count (int): Number of swaps to try per layout. 0 leaves just
+          the rejection sampling, several times faster, for fairer but less
+          balanced layouts.
+
+    Args:
+        See above.
+    """
+
+    DEFAULT_MAX_ATTEMPTS = 50
+
+    DEFAULT_SWAP_COUNT = 60
+
+    def __init__(self, scorer, resource_types, chit_values, rng=None,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS,
+                 swap_count=DEFAULT_SWAP_COUNT):
+
+        arable_types = ResourceType.get_arable_types()
+
+        self._resources = [-1 if resource_type == ResourceType.FALLOW else
+                           arable_types.index(resource_type)
+                           for resource_type in resource_types]
+
+        if len(resource_types) != scorer.topology.tile_count or \
+                len(chit_values) != len([resource for resource in
+                                         self._resources if resource >= 0]):
+            raise ValueError('Resources and chits to lay out don\'t fit the '
+                             'board')
+
+        self.scorer = scorer
+        self.resource_types = list(resource_types)
+        self.chit_values = list(chit_values)
+        self.rng = rng if rng is not None else random
+        self.max_attempts = max_attempts
+        self.swap_count = swap_count
+
+    @classmethod
+    def from_board(cls, board, **kwargs):
+        """Get a generator of layouts of the resources and chits currently on
+        the given board, e.g. as dealt by its default assignment.
+
+        Args:
+            board (GameBoard): Board whose tiles to lay out. Its rng is used
+              unless another is given.
+
+            kwargs: See BalancedBoardGenerator.
+        """
+
+        kwargs.setdefault('rng', board.rng)
+
+        resource_types = []
+        chit_values = []
+
+        for x, y in board.topology.tile_coords:
+            tile = board.tiles[x][y]
+            resource_types.append(tile.resource_type)
+
+            if tile.resource_type != ResourceType.FALLOW:
+                chit_values.append(tile.chit_value)
+
+        scorer = BoardScorer(board.topology)
+
+        return cls(scorer, resource_types, chit_values, **kwargs)
+
+    def generate(self):
+        """Generate a balanced layout.
+
+        Returns:
+            list. (resource type, chit value) of each tile, by tile id.
+        """
+
+        resources, chit_values = self._draw()
+
+        for _ in range(self.max_attempts - 1):
+            if not self._has_high_chit_neighbors(chit_values):
+                break
+
+            resources, chit_values = self._draw()
+
+        state = _LayoutState(self.scorer, resources, chit_values)
+        self._improve(state)
+
+        return state.get_layout()
+
+    def generate_many(self, count):
+        """Generate count balanced layouts. See generate()."""
+
+        return [self.generate() for _ in range(count)]
+
+    def assign(self, board, layout=None):
+        """Lay out the given board's tiles, e.g. to seed a tournament game.
+
+        Only meant for boards without structures yet. Calamities on fallow
+        tiles, e.g. the robber a Game starts on the desert, move along to
+        the new fallow tiles, in tile id order. The board's trackers follow
+        each tile's change.
+
+        Args:
+            board (GameBoard): Board to lay out.
+
+            layout (list): Layout to use. Defaults to a newly generated one.
+        """
+
+        if layout is None:
+            layout = self.generate()
+
+        tiles = [board.tiles[x][y] for x, y in board.topology.tile_coords]
+
+        fallow_calamities = []
+
+        for tile in tiles:
+            if tile.resource_type == ResourceType.FALLOW:
+                fallow_calamities.append(list(tile.calamities))
+
+                for calamity in tile.calamities[:]:
+                    tile.remove_calamity(calamity)
+
+        for tile, (resource_type, chit_value) in zip(tiles, layout):
+            if tile.resource_type != resource_type:
+                tile.resource_type = resource_type
+
+            if tile.chit_value != chit_value:
+                tile.chit_value = chit_value
+
+        fallow_tiles = [tile for tile in tiles
+                        if tile.resource_type == ResourceType.FALLOW]
+
+        for tile, calamities in zip(fallow_tiles, fallow_calamities):
+            for calamity in calamities:
+                tile.add_calamity(calamity)
+
+    def _draw(self):
+        """Draw a random layout.
+
+        Returns:
+            tuple. Lists of the resource index and chit value of each tile.
+        """
+
+        resources = list(self._resources)
+        chit_values = list(self.chit_values)
+
+        self.rng.shuffle(resources)
+        self.rng.shuffle(chit_values)
+
+        return resources, [chit_values.pop() if resource >= 0 else 0
+                           for resource in resources]
+
+    def _has_high_chit_neighbors(self, chit_values):
+
+        high_chit_values = self.scorer.high_chit_values
+        tile_neighbor_sets = self.scorer.tile_neighbor_sets
+
+        high_tile_ids = [tile_id for tile_id, chit_value in
+                         enumerate(chit_values)
+                         if chit_value in high_chit_values]
+
+        return any(not tile_neighbor_sets[tile_id].isdisjoint(high_tile_ids)
+                   for tile_id in high_tile_ids)
+
+    def _improve(self, state):
+        """Keep the random swaps that lower the state's score."""
+
+        random = self.rng.random
+        resources = state.resources
+        tile_count = len(resources)
+
+        for _ in range(self.swap_count):
+            # Two distinct tile ids, drawn without Random.sample()'s overhead.
+            tile_id = int(random() * tile_count)
+            other_tile_id = int(random() * (tile_count - 1))
+            if other_tile_id >= tile_id:
+                other_tile_id += 1
+
+            swap_resources = random() < 0.5
+
+            # Fallow tiles keep their 0 chit.
+            if not swap_resources and (resources[tile_id] < 0 or
+                                       resources[other_tile_id] < 0):
+                continue
+
+            if state.swap(tile_id, other_tile_id, swap_resources) >= 0:
+                state.swap(tile_id, other_tile_id, swap_resources)
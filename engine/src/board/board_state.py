@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+from array import array
+from enum import Enum
+
+from engine.src.vertex import Vertex
+from engine.src.edge import Edge
+from engine.src.structure.structure import Structure
+from engine.src.direction.vertex_direction import VertexDirection
+from engine.src.direction.edge_direction import EdgeDirection
+from engine.src.direction.edge_vertex_mapping import EdgeVertexMapping
+
+
+class BoardStorage(Enum):
+    """How a board stores what occupies its vertices and edges.
+
+    TILES: Every tile holds dicts of shared Vertex/Edge/Structure objects.
+    ARRAYS: A single BoardState holds compact arrays indexed by canonical
+      vertex and edge id, and tiles hold views onto it.
+    """
+
+    TILES = 'tiles'
+    ARRAYS = 'arrays'
+
+    def __str__(self):
+        return '{0}'.format(self.value)
+
+
+class BoardState(object):
+    """Array-backed occupancy of the vertices and edges of a hextile board.
+
+    Each vertex and edge slot, indexed by its id in the board's HexTopology,
+    stores the index of its owning player and the kind (i.e. name) of the
+    structure built on it, as signed bytes. Unoccupied slots store EMPTY.
+
+    Since a slot does not store a structure object, reading a slot returns a
+    shared structure for the slot's (owner, kind) pair; namely, the first
+    structure of that kind the owner placed. Structures of the same kind and
+    owner are thus indistinguishable once placed. Reading an unoccupied slot
+    returns a shared, empty Vertex or Edge.
+
+    Attributes:
+        topology (HexTopology): Topology of the board whose state this is.
+
+        vertex_owners (array): Owner index per vertex id.
+
+        vertex_kinds (array): Structure kind index per vertex id.
+
+        edge_owners (array): Owner index per edge id.
+
+        edge_kinds (array): Structure kind index per edge id.
+
+        players (list): Players indexed by owner index.
+
+        kinds (list): Structure names indexed by kind index.
+
+        structures (dict): Shared structure per (owner index, kind index).
+
+    Args:
+        topology (HexTopology): See above.
+    """
+
+    EMPTY = -1
+
+    EMPTY_VERTEX = Vertex()
+    EMPTY_EDGE = Edge()
+
+    def __init__(self, topology):
+
+        self.topology = topology
+
+        self.vertex_owners = array('b', [BoardState.EMPTY]) * \
+            topology.vertex_count
+        self.vertex_kinds = array('b', [BoardState.EMPTY]) * \
+            topology.vertex_count
+
+        self.edge_owners = array('b', [BoardState.EMPTY]) * topology.edge_count
+        self.edge_kinds = array('b', [BoardState.EMPTY]) * topology.edge_count
+
+        self.players = []
+        self.kinds = []
+        self.structures = {}
+
+    def copy(self):
+        """Get an independent copy of this state, sharing its topology."""
+
+        state = BoardState.__new__(BoardState)
+
+        state.topology = self.topology
+
+        state.vertex_owners = self.vertex_owners[:]
+        state.vertex_kinds = self.vertex_kinds[:]
+        state.edge_owners = self.edge_owners[:]
+        state.edge_kinds = self.edge_kinds[:]
+
+        state.players = list(self.players)
+        state.kinds = list(self.kinds)
+        state.structures = dict(self.structures)
+
+        return state
+
+    def get_player_index(self, player):
+        """Get the owner index of the given player, registering it if new."""
+
+        try:
+            return self.players.index(player)
+        except ValueError:
+            self.players.append(player)
+            return len(self.players) - 1
+
+    def get_kind_index(self, structure_name):
+        """Get the kind index of the given structure name, registering it."""
+
+        try:
+            return self.kinds.index(structure_name)
+        except ValueError:
+            self.kinds.append(structure_name)
+            return len(self.kinds) - 1
+
+    def _encode(self, value):
+        """Get the (owner index, kind index) pair storing the given value."""
+
+        if not isinstance(value, Structure):
+            return BoardState.EMPTY, BoardState.EMPTY
+
+        owner = self.get_player_index(value.owning_player)
+        kind = self.get_kind_index(value.name)
+
+        if (owner, kind) not in self.structures:
+            self.structures[(owner, kind)] = value
+
+        return owner, kind
+
+    def get_vertex(self, vertex_id):
+        """Get the structure at the given vertex, or an empty Vertex."""
+
+        owner = self.vertex_owners[vertex_id]
+
+        if owner == BoardState.EMPTY:
+            return BoardState.EMPTY_VERTEX
+
+        return self.structures[(owner, self.vertex_kinds[vertex_id])]
+
+    def set_vertex(self, vertex_id, vertex_val):
+        """Store the given structure (or empty vertex) at the given vertex."""
+
+        self.vertex_owners[vertex_id], self.vertex_kinds[vertex_id] = \
+            self._encode(vertex_val)
+
+    def get_edge(self, edge_id):
+        """Get the structure at the given edge, or an empty Edge."""
+
+        owner = self.edge_owners[edge_id]
+
+        if owner == BoardState.EMPTY:
+            return BoardState.EMPTY_EDGE
+
+        return self.structures[(owner, self.edge_kinds[edge_id])]
+
+    def set_edge(self, edge_id, edge_val):
+        """Store the given structure (or empty edge) at the given edge."""
+
+        self.edge_owners[edge_id], self.edge_kinds[edge_id] = \
+            self._encode(edge_val)
+
+
+def _get_vertex_dir_pair_indices():
+    """Map ordered pairs of vertex directions to the index of their edge.
+
+    Indices are positions in EdgeDirection order, as in
+    HexTopology.tile_edges entries.
+    """
+
+    indices = {}
+
+    for index, edge_dir in enumerate(EdgeDirection):
+        start_dir, end_dir = \
+            EdgeVertexMapping.get_vertex_dirs_for_edge_dir(edge_dir)
+
+        indices[(start_dir, end_dir)] = index
+        indices[(end_dir, start_dir)] = index
+
+    return indices
+
+
+class TileVertexView(object):
+    """Dict-like view of a tile's vertices, backed by a BoardState.
+
+    Stands in for HexTile.vertices when a board uses BoardStorage.ARRAYS.
+    Keys are VertexDirections.
+    """
+
+    # Position of each direction within HexTopology.tile_vertices entries.
+    VERTEX_DIR_INDICES = {vertex_dir: index for index, vertex_dir in
+                          enumerate(VertexDirection)}
+
+    __slots__ = ('state', 'vertex_ids')
+
+    def __init__(self, state, vertex_ids):
+        self.state = state
+        self.vertex_ids = vertex_ids
+
+    def __getitem__(self, vertex_dir):
+        return self.state.get_vertex(
+            self.vertex_ids[TileVertexView.VERTEX_DIR_INDICES[vertex_dir]])
+
+    def __setitem__(self, vertex_dir, vertex_val):
+        self.state.set_vertex(
+            self.vertex_ids[TileVertexView.VERTEX_DIR_INDICES[vertex_dir]],
+            vertex_val)
+
+    def __contains__(self, vertex_dir):
+        return vertex_dir in TileVertexView.VERTEX_DIR_INDICES
+
+    def __iter__(self):
+        return iter(VertexDirection)
+
+    def __len__(self):
+        return len(self.vertex_ids)
+
+    def values(self):
+        return [self[vertex_dir] for vertex_dir in VertexDirection]
+
+
+class TileEdgeView(object):
+    """Nested dict-like view of a tile's edges, backed by a BoardState.
+
+    Stands in for HexTile.edges when a board uses BoardStorage.ARRAYS, so
+    that edges[start_vertex_dir][end_vertex_dir] still resolves to the edge
+    between the two vertex directions.
+    """
+
+    VERTEX_DIR_PAIR_INDICES = _get_vertex_dir_pair_indices()
+
+    __slots__ = ('state', 'edge_ids')
+
+    def __init__(self, state, edge_ids):
+        self.state = state
+        self.edge_ids = edge_ids
+
+    def __getitem__(self, start_vertex_dir):
+        return _TileEdgeEndpointView(self, start_vertex_dir)
+
+    def __contains__(self, start_vertex_dir):
+        return start_vertex_dir in TileVertexView.VERTEX_DIR_INDICES
+
+    def __iter__(self):
+        return iter(VertexDirection)
+
+    def get_edge_id(self, start_vertex_dir, end_vertex_dir):
+        """Get the id of the edge between the given vertex directions."""
+
+        return self.edge_ids[TileEdgeView.VERTEX_DIR_PAIR_INDICES[
+            (start_vertex_dir, end_vertex_dir)]]
+
+
+class _TileEdgeEndpointView(object):
+    """The edges of a TileEdgeView that start at a given vertex direction."""
+
+    __slots__ = ('edge_view', 'start_vertex_dir')
+
+    def __init__(self, edge_view, start_vertex_dir):
+        self.edge_view = edge_view
+        self.start_vertex_dir = start_vertex_dir
+
+    def __getitem__(self, end_vertex_dir):
+        edge_id = self.edge_view.get_edge_id(self.start_vertex_dir,
+                                             end_vertex_dir)
+        return self.edge_view.state.get_edge(edge_id)
+
+    def __setitem__(self, end_vertex_dir, edge_val):
+        edge_id = self.edge_view.get_edge_id(self.start_vertex_dir,
+                                             end_vertex_dir)
+        self.edge_view.state.set_edge(edge_id, edge_val)
+
+    def __contains__(self, end_vertex_dir):
+        return (self.start_vertex_dir, end_vertex_dir) in \
+            TileEdgeView.VERTEX_DIR_PAIR_INDICES
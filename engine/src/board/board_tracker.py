@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+
+class BoardTracker(object):
+    """Maintains some derived view of a GameBoard as the board changes.
+
+    Trackers are registered with GameBoard.add_tracker(), after which the
+    board notifies them of every change to its vertices, edges and tiles.
+    Changes may add structures as well as remove them e.g. when a move is
+    undone, so trackers should handle both.
+
+    Subclasses override whichever of the hooks below they care about.
+
+    Attributes:
+        board (GameBoard): The board being tracked.
+
+    Args:
+        board (GameBoard): See above.
+    """
+
+    def __init__(self, board):
+        self.board = board
+
+    def rebuild(self):
+        """Recompute the tracked view from the current state of the board."""
+        pass
+
+    def on_vertex_changed(self, vertex_id, old_value, new_value):
+        """Called after the vertex with the given id changes value.
+
+        Args:
+            vertex_id (int): Canonical id of the vertex. See HexTopology.
+
+            old_value (Vertex|Structure): Value of the vertex before the
+              change.
+
+            new_value (Vertex|Structure): Value of the vertex after the
+              change.
+        """
+        pass
+
+    def on_edge_changed(self, edge_id, old_value, new_value):
+        """Called after the edge with the given id changes value.
+
+        Args:
+            edge_id (int): Canonical id of the edge. See HexTopology.
+
+            old_value (Edge|Structure): Value of the edge before the change.
+
+            new_value (Edge|Structure): Value of the edge after the change.
+        """
+        pass
+
+    def on_tile_changed(self, tile_id, tile):
+        """Called after a tile's resource type, chit value or calamities change.
+
+        Args:
+            tile_id (int): Id of the tile. See HexTopology.
+
+            tile (GameTile): The changed tile.
+        """
+        pass
@@ -4,11 +4,11 @@ import pdb
 
 from engine.src.lib.utils import Utils
 from engine.src.board.hex_board import HexBoard
+from engine.src.board.board_state import BoardStorage
 from engine.src.tile.game_tile import GameTile
 from engine.src.resource_type import ResourceType
 from engine.src.position_type import PositionType
 from engine.src.calamity.calamity import Calamity
-from engine.src.calamity.calamity import CalamityTilePlacementEffect
 from engine.src.calamity.robber import Robber
 from engine.src.trading.bank import Bank
 from engine.src.direction.edge_vertex_mapping import EdgeVertexMapping
@@ -16,6 +16,12 @@ from engine.src.direction.edge_direction import EdgeDirection
 from engine.src.direction.vertex_direction import VertexDirection
 from engine.src.exceptions import *
 from engine.src.structure.structure import Structure
+from engine.src.longest_road_tracker import LongestRoadTracker
+from engine.src.board.tile_index_tracker import TileIndexTracker
+from engine.src.board.production_tracker import ProductionTracker
+from engine.src.board.legal_move_tracker import LegalMoveTracker
+from engine.src.board.vertex_yield_tracker import VertexYieldTracker
+from engine.src.config.config import Config
 
 
 class GameBoard(HexBoard):
@@ -30,13 +36,48 @@ class GameBoard(HexBoard):
 
         bank (Bank): Bank of resources the board will interact with.
 
+        storage (BoardStorage): See HexBoard.
+
+        state (BoardState): See HexBoard.
+
+        trackers (list): BoardTrackers notified of every vertex and edge
+          change. See add_tracker().
+
+        longest_road_tracker (LongestRoadTracker): Per-player longest road
+          lengths, kept up to date as structures are placed.
+
+        tile_index (TileIndexTracker): Tiles by chit value and structures by
+          tile.
+
+        production_tracker (ProductionTracker): Resources each player
+          receives on each roll value, used to resolve dice rolls.
+
+        legal_move_tracker (LegalMoveTracker): Where each player may build.
+
+        vertex_yield_index (VertexYieldTracker): What a settlement on each
+          vertex would yield, and the open vertices ranked by it.
+
+        rng (random.Random): Source of randomness for the tile layout and,
+          through the bank, the development card deck.
+
     Args:
         radius (int): See HexBoard.
+
+        storage (BoardStorage): See HexBoard.
+
+        rng (random.Random): See above. Defaults to the random module itself.
     """
 
-    def __init__(self, radius):
+    def __init__(self, radius, storage=BoardStorage.TILES, rng=None):
 
-        super(GameBoard, self).__init__(radius, GameTile)
+        # Must exist before HexBoard initializes vertices and edges.
+        self.trackers = []
+        self.rng = rng if rng is not None else random
+
+        super(GameBoard, self).__init__(radius, GameTile, storage)
+
+        for tile in self.iter_tiles():
+            tile.listeners.append(self)
 
         # We have tiles, but they currently have no value and are all FALLOW.
         # Here we assign resource types and chit values.
@@ -44,7 +85,117 @@ class GameBoard(HexBoard):
         self.assign_tile_chit_values()
         self.assign_tile_harbors()
 
-        self.bank = Bank(len(list(self.iter_tiles())))
+        self.bank = Bank(len(list(self.iter_tiles())), self.rng)
+
+        self.create_trackers()
+
+    def create_trackers(self):
+        """Create the board's own trackers, from its current state.
+
+        Only called once per board, by the constructor, or after
+        copy_layout().
+        """
+
+        self.longest_road_tracker = LongestRoadTracker(self)
+        self.add_tracker(self.longest_road_tracker)
+
+        self.tile_index = TileIndexTracker(self)
+        self.add_tracker(self.tile_index)
+
+        self.production_tracker = ProductionTracker(self)
+        self.add_tracker(self.production_tracker)
+
+        self.legal_move_tracker = LegalMoveTracker(self)
+        self.add_tracker(self.legal_move_tracker)
+
+        self.vertex_yield_index = VertexYieldTracker(self)
+        self.add_tracker(self.vertex_yield_index)
+
+    def copy_layout(self, rng=None, create_trackers=True):
+        """Get an empty board with the same tiles as this one.
+
+        The new board has this board's radius, storage, and each tile's
+        resource type, chit value and calamities, which are shared, as is the
+        topology. Its bank has the same resources and a deck of new cards of
+        the same kinds, in the same order. Nothing is drawn from an rng, so
+        this is much cheaper than creating a board. See Game.clone().
+
+        Args:
+            rng (random.Random): rng of the new board. Defaults to this
+              board's.
+
+            create_trackers (bool): Whether to create the new board's own
+              trackers. If not, call create_trackers() once the new board is
+              filled in, which is cheaper than keeping them up to date
+              meanwhile.
+
+        Returns:
+            GameBoard. Without any structures, nor trackers besides its own.
+        """
+
+        board = GameBoard.__new__(GameBoard)
+
+        board.trackers = []
+        board.rng = rng if rng is not None else self.rng
+
+        HexBoard.__init__(board, self.radius, self.tile_cls, self.storage)
+
+        for tile in board.iter_tiles():
+            layout_tile = self.tiles[tile.x][tile.y]
+
+            # Set directly, since nothing listens to the new tiles yet.
+            tile._resource_type = layout_tile.resource_type
+            tile._chit_value = layout_tile.chit_value
+            tile.calamities = list(layout_tile.calamities)
+
+            tile.listeners.append(board)
+
+        board.bank = self.bank.copy(board.rng)
+
+        if create_trackers:
+            board.create_trackers()
+
+        return board
+
+    def add_tracker(self, tracker):
+        """Notify the given BoardTracker of all future board changes.
+
+        The tracker is expected to already reflect the current board.
+        """
+
+        self.trackers.append(tracker)
+
+    def remove_tracker(self, tracker):
+        """Stop notifying the given BoardTracker of board changes."""
+
+        self.trackers.remove(tracker)
+
+    def on_tile_changed(self, tile):
+        """Pass changes to a tile of this board on to the trackers."""
+
+        tile_id = self.topology.tile_ids[(tile.x, tile.y)]
+
+        for tracker in self.trackers:
+            tracker.on_tile_changed(tile_id, tile)
+
+    def update_vertex_by_id(self, vertex_id, vertex_val):
+
+        old_vertex_val = self.get_vertex_by_id(vertex_id) \
+            if self.trackers else None
+
+        super(GameBoard, self).update_vertex_by_id(vertex_id, vertex_val)
+
+        for tracker in self.trackers:
+            tracker.on_vertex_changed(vertex_id, old_vertex_val, vertex_val)
+
+    def update_edge_by_id(self, edge_id, edge_val):
+
+        old_edge_val = self.get_edge_by_id(edge_id) if self.trackers else None
+
+        super(GameBoard, self).update_edge_by_id(edge_id, edge_val)
+
+        for tracker in self.trackers:
+            tracker.on_edge_changed(edge_id, old_edge_val, edge_val)
 
     def assign_tile_resources(self, assignment_func=None):
         """Assign resource types to this board's tiles.
@@ -78,7 +229,7 @@ class GameBoard(HexBoard):
 
         # Get a randomized list of the tiles of this board.
         tiles = list(self.iter_tiles())
-        random.shuffle(tiles)
+        self.rng.shuffle(tiles)
 
         resource_type_count = len(ResourceType.get_arable_types())
 
@@ -170,7 +321,7 @@ class GameBoard(HexBoard):
         chit_values = frozenset(range(start, end + 1)).intersection(exclude)
 
         for tile in self.iter_tiles():
-            tile.chit_value = random.choice(chit_values)
+            tile.chit_value = self.rng.choice(chit_values)
 
     def _default_assign_tile_chit_values(self, start=2, end=12,
                                          exclude=Calamity.DEFAULT_ROLL_VALUES):
@@ -250,6 +401,48 @@ class GameBoard(HexBoard):
             if tile.resource_type != ResourceType.FALLOW:
                 yield tile
 
+    def legal_settlement_spots(self, player, initial=False):
+        """Get the ids of the vertices the player may build a settlement on.
+
+        Args:
+            player (Player): Player who would build.
+
+            initial (bool): Whether this is the initial placement stage, in
+              which settlements need not border one of the player's roads.
+
+        Returns:
+            set. Vertex ids. Must not be modified.
+        """
+
+        return self.legal_move_tracker.get_settlement_vertex_ids(player,
+                                                                 initial)
+
+    def legal_road_edges(self, player, vertex_id=None):
+        """Get the ids of the edges the player may build a road on.
+
+        Args:
+            player (Player): Player who would build.
+
+            vertex_id (int): If given, the road must end at this vertex
+              instead of bordering one of the player's roads, as during the
+              initial placement stage.
+
+        Returns:
+            set. Edge ids. Must not be modified.
+        """
+
+        return self.legal_move_tracker.get_road_edge_ids(player, vertex_id)
+
+    def legal_city_upgrades(self, player):
+        """Get the ids of the vertices the player may build a city on.
+
+        Returns:
+            set. Vertex ids. Must not be modified.
+        """
+
+        return self.legal_move_tracker.get_structure_vertex_ids(
+            player, Config.get('game.structure.player_built.city.upgrades'))
+
     def place_vertex_structure(self, x, y, vertex_dir, structure,
                                must_border_claimed_edge=True, struct_x=None,
                                struct_y=None, struct_vertex_dir=None):
@@ -270,27 +463,26 @@ class GameBoard(HexBoard):
               placed at the defined vertex.
         """
 
-        tile = self.tiles[x][y]
-        old_vertex_val = tile.vertices[vertex_dir]
+        vertex_id = self.topology.vertex_ids[(x, y, vertex_dir)]
+        old_vertex_val = self.get_vertex_by_id(vertex_id)
 
         self.validate_structure_placement(x, y, old_vertex_val, structure,
                                           vertex_dir, must_border_claimed_edge,
                                           struct_x, struct_y, struct_vertex_dir)
 
-        self.update_vertex(x, y, vertex_dir, structure)
+        self.update_vertex_by_id(vertex_id, structure)
 
     def place_edge_structure(self, x, y, edge_dir, structure,
                              must_border_claimed_edge=True, struct_x=None,
                              struct_y=None, struct_vertex_dir=None):
-        tile = self.tiles[x][y]
-        vertex_dirs = EdgeVertexMapping.get_vertex_dirs_for_edge_dir(edge_dir)
-        old_edge_val = tile.edges[vertex_dirs[0]][vertex_dirs[1]]
+        edge_id = self.topology.edge_ids[(x, y, edge_dir)]
+        old_edge_val = self.get_edge_by_id(edge_id)
 
         self.validate_structure_placement(x, y, old_edge_val, structure,
                                           edge_dir, must_border_claimed_edge,
                                           struct_x, struct_y, struct_vertex_dir)
 
-        self.update_edge(x, y, edge_dir, structure)
+        self.update_edge_by_id(edge_id, structure)
 
     def validate_structure_placement(self, x, y, old_value, new_value,
                                      placement_dir, must_border_claimed_edge,
@@ -313,12 +505,16 @@ class GameBoard(HexBoard):
 
         # If the struct_x etc. are provided, they specify a vertex the new
         # edge to place must border e.g. as in initial placement stage.
+        # Compare ids rather than edge values, since with array storage all
+        # empty edges are the same object.
         if new_value.position_type == PositionType.EDGE and \
                         struct_x is not None:
-            allowable_edges = self.get_adjacent_edges(struct_x, struct_y, struct_vertex_dir)
-            target_edge = self.get_tile_with_coords(x, y).get_edge(placement_dir)
+            struct_vertex_id = self.topology.vertex_ids[
+                (struct_x, struct_y, struct_vertex_dir)]
+            target_edge_id = self.topology.edge_ids[(x, y, placement_dir)]
 
-            if target_edge not in allowable_edges:
+            if target_edge_id not in \
+                    self.topology.vertex_edges[struct_vertex_id]:
                 raise InvalidStructurePlacementException()
 
         # If the player is replacing an existing structure...
@@ -372,34 +568,9 @@ class GameBoard(HexBoard):
               distributed to the player.
         """
 
-        # Find those tiles whose chit value matches the roll value,
-        # and whose yield isn't blocked by a calamity.
-        resource_tiles = filter(
-            lambda tile:
-                tile.chit_value == roll_value and
-                (CalamityTilePlacementEffect.BLOCK_YIELD not in
-                    tile.get_calamity_tile_placement_effects()),
-            list(self.iter_tiles())
-        )
-
-        distributions = Utils.nested_dict()
-
-        # Create a dictionary that stores per-player resource distributions.
-        # i.e. distributions => player => resource_type => (int)
-        for resource_tile in resource_tiles:
-
-            # Find any structures built on the vertices of the found tiles.
-            adjacent_structures = resource_tile.get_adjacent_vertex_structures()
-
-            for structure in adjacent_structures:
-                player = structure.owning_player
-                resource_type = resource_tile.resource_type
-                resource_yield = structure.base_yield
-
-                if not distributions[player][resource_type]:
-                    distributions[player][resource_type] = 0
-
-                distributions[player][resource_type] += resource_yield
+        # Production is kept up to date as the board changes, so a roll only
+        # needs to look up its row. See ProductionTracker.
+        distributions = self.production_tracker.get_production(roll_value)
 
         self.distribute_resources(distributions)
 
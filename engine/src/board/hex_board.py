@@ -4,6 +4,11 @@ import pdb
 from engine.src.lib.utils import Utils
 from engine.src.board.board import Board
 from engine.src.tile.hex_tile import HexTile
+from engine.src.board.hex_topology import HexTopology
+from engine.src.board.board_state import BoardStorage
+from engine.src.board.board_state import BoardState
+from engine.src.board.board_state import TileVertexView
+from engine.src.board.board_state import TileEdgeView
 from engine.src.vertex import Vertex
 from engine.src.edge import Edge
 from engine.src.direction.edge_direction import EdgeDirection
@@ -27,15 +32,30 @@ class HexBoard(Board):
 
         tile_cls (class): Class of the tiles to be generated during board
           initialization.
-        
+
+        topology (HexTopology): Canonical ids and adjacency tables for the
+          vertices and edges of this board. Shared by boards of equal radius.
+
+        storage (BoardStorage): How vertex and edge values are stored.
+
+        state (BoardState): Array-backed vertex and edge values when storage
+          is BoardStorage.ARRAYS, None otherwise.
+
     Args:
         radius (int): The number of tiles between the center tile and the edge
           of the board, including the center tile itself. Should be >= 1.
+
+        tile_cls (class): See above.
+
+        storage (BoardStorage): See above. With BoardStorage.TILES, each tile
+          holds dicts of vertex and edge objects shared with its neighbors.
+          With BoardStorage.ARRAYS, tiles hold views onto self.state, which
+          is far cheaper to store and copy.
     """
 
     MIN_BOARD_RADIUS = 1
 
-    def __init__(self, radius, tile_cls=HexTile):
+    def __init__(self, radius, tile_cls=HexTile, storage=BoardStorage.TILES):
 
         if radius < HexBoard.MIN_BOARD_RADIUS:
             message = ("Specified radius does not meet the minimum board "
@@ -46,6 +66,16 @@ class HexBoard(Board):
 
         self.tile_cls = tile_cls
 
+        # Canonical vertex/edge ids and adjacencies, shared by all boards of
+        # the same radius.
+        self.topology = HexTopology.for_radius(radius)
+
+        self.storage = storage
+        self.state = None
+
+        if self.storage == BoardStorage.ARRAYS:
+            self.state = BoardState(self.topology)
+
         self.tiles = {}
         self._create_tiles()
 
@@ -61,16 +91,32 @@ class HexBoard(Board):
         for x, y in self.iter_tile_coords():
             self._add_new_tile_with_coords(x, y)
 
-        self._sync_tile_vertices_and_edges()
+        if self.state is None:
+            self._sync_tile_vertices_and_edges()
 
 
     def _add_new_tile_with_coords(self, x, y):
-        """Add a brand new tile to the board at the given axial coordinates."""
+        """Add a brand new tile to the board at the given axial coordinates.
+
+        With BoardStorage.ARRAYS, the tile's vertices and edges are views onto
+        self.state, rather than dicts of its own.
+        """
 
         if x not in self.tiles:
             self.tiles[x] = {}
 
-        tile = self.tile_cls(x, y)
+        if self.state is None:
+            tile = self.tile_cls(x, y)
+        else:
+            tile_id = self.topology.tile_ids[(x, y)]
+
+            tile = self.tile_cls(
+                x, y,
+                vertices=TileVertexView(self.state,
+                                        self.topology.tile_vertices[tile_id]),
+                edges=TileEdgeView(self.state,
+                                   self.topology.tile_edges[tile_id]))
+
         self.tiles[x][y] = tile
 
     def _sync_tile_vertices_and_edges(self):
@@ -79,20 +125,15 @@ class HexBoard(Board):
         New tile objects will create their own vertices and edges. When tiles
         share edges and vertices with existing tiles on the board, however,
         we want them to point to the same shared vertex or edge objects,
-        instead of each having their own. This method enforces this for the
-        given tile.
+        instead of each having their own. This method enforces this for every
+        tile, creating one object per canonical vertex and edge id.
         """
 
-        for x, y in self.iter_tile_coords():
-            tile = self.get_tile_with_coords(x, y)
+        for vertex_id in range(self.topology.vertex_count):
+            self.update_vertex_by_id(vertex_id, Vertex())
 
-            for vertex_dir in VertexDirection:
-                new_vertex = Vertex()
-                self.update_vertex(x, y, vertex_dir, new_vertex)
-
-            for edge_dir in EdgeDirection:
-                new_edge = Edge()
-                self.update_edge(x, y, edge_dir, new_edge)
+        for edge_id in range(self.topology.edge_count):
+            self.update_edge_by_id(edge_id, Edge())
 
     def get_tile_with_coords(self, x, y):
         """Get the tile at the given coordinates, or None if no tile exists."""
@@ -111,6 +152,38 @@ class HexBoard(Board):
         else:
             return None
 
+    def get_edge(self, x, y, edge_dir):
+        """Get the edge defined by the given params."""
+        tile = self.get_tile_with_coords(x, y)
+
+        if tile:
+            return tile.get_edge(edge_dir)
+        else:
+            return None
+
+    def iter_vertices(self):
+        """Iterate over each vertex of this board exactly once.
+
+        Yields:
+            tuple. The canonical (x, y, vertex_dir) of the vertex, followed by
+              its value.
+        """
+
+        for vertex_id, (x, y, vertex_dir) in \
+                enumerate(self.topology.vertex_coords):
+            yield x, y, vertex_dir, self.get_vertex_by_id(vertex_id)
+
+    def iter_edges(self):
+        """Iterate over each edge of this board exactly once.
+
+        Yields:
+            tuple. The canonical (x, y, edge_dir) of the edge, followed by
+              its value.
+        """
+
+        for edge_id, (x, y, edge_dir) in enumerate(self.topology.edge_coords):
+            yield x, y, edge_dir, self.get_edge_by_id(edge_id)
+
     def valid_tile_coords(self, x, y):
         """Return whether or not these params specify a valid tile."""
 
@@ -283,18 +356,22 @@ class HexBoard(Board):
         Returns:
             None
         """
-        tile = self.get_tile_with_coords(x, y)
-        vertex_dirs = EdgeVertexMapping.get_vertex_dirs_for_edge_dir(edge_dir)
 
-        neighbor_tile = self.get_neighboring_tile(tile, edge_dir)
+        self.update_edge_by_id(
+            self.topology.edge_ids[(x, y, edge_dir)], edge_val)
+
+    def update_edge_by_id(self, edge_id, edge_val):
+        """Update the edge with the given id for every tile sharing it."""
 
-        tile.add_edge(vertex_dirs[0], vertex_dirs[1], edge_val)
+        if self.state is not None:
+            self.state.set_edge(edge_id, edge_val)
+            return
 
-        # Perimeter tiles will not have neighbors along certain edges.
-        if neighbor_tile:
-            nv_dir_1 = HexTile.get_equivalent_vertex_dir(vertex_dirs[0], edge_dir)
-            nv_dir_2 = HexTile.get_equivalent_vertex_dir(vertex_dirs[1], edge_dir)
-            neighbor_tile.add_edge(nv_dir_1, nv_dir_2, edge_val)
+        for x, y, edge_dir in self.topology.edge_slots[edge_id]:
+            vertex_dirs = \
+                EdgeVertexMapping.get_vertex_dirs_for_edge_dir(edge_dir)
+
+            self.tiles[x][y].add_edge(vertex_dirs[0], vertex_dirs[1], edge_val)
 
     def update_vertex(self, x, y, vertex_dir, vertex_val):
         """Update the value at the specified vertex location.
@@ -318,28 +395,49 @@ class HexBoard(Board):
             None.
         """
 
-        tile = self.get_tile_with_coords(x, y)
-        old_vertex_val = self.get_vertex(x, y, vertex_dir)
+        self.update_vertex_by_id(
+            self.topology.vertex_ids[(x, y, vertex_dir)], vertex_val)
 
-        tile.vertices[vertex_dir] = vertex_val
+    def update_vertex_by_id(self, vertex_id, vertex_val):
+        """Update the vertex with the given id for every tile sharing it."""
 
-        # Get the two edges of the found tile that have as an endpoint
-        # a vertex of the given vertex direction.
-        vertex_adj_edge_dirs = EdgeVertexMapping.get_edge_dirs_for_vertex_dir(
-            vertex_dir)
+        if self.state is not None:
+            self.state.set_vertex(vertex_id, vertex_val)
+            return
 
-        for vertex_adj_edge_dir in vertex_adj_edge_dirs:
-            neighbor_tile = self.get_neighboring_tile(tile, vertex_adj_edge_dir)
+        for x, y, vertex_dir in self.topology.vertex_slots[vertex_id]:
+            self.tiles[x][y].vertices[vertex_dir] = vertex_val
 
-            # Edge tiles may not have neighboring tiles in the given direction.
-            if neighbor_tile:
-                neighbor_vertex_dir = HexTile.get_equivalent_vertex_dir(
-                    vertex_dir, vertex_adj_edge_dir)
+    def get_vertex_id(self, x, y, vertex_dir):
+        """Get the canonical id of the specified vertex. See HexTopology."""
+
+        return self.topology.get_vertex_id(x, y, vertex_dir)
 
-                neighbor_tile.update_vertex(neighbor_vertex_dir, vertex_val)
+    def get_edge_id(self, x, y, edge_dir):
+        """Get the canonical id of the specified edge. See HexTopology."""
+
+        return self.topology.get_edge_id(x, y, edge_dir)
+
+    def get_vertex_by_id(self, vertex_id):
+        """Get the value of the vertex with the given canonical id."""
+
+        if self.state is not None:
+            return self.state.get_vertex(vertex_id)
+
+        x, y, vertex_dir = self.topology.vertex_coords[vertex_id]
+        return self.tiles[x][y].vertices[vertex_dir]
+
+    def get_edge_by_id(self, edge_id):
+        """Get the value of the edge with the given canonical id."""
+
+        if self.state is not None:
+            return self.state.get_edge(edge_id)
+
+        x, y, edge_dir = self.topology.edge_coords[edge_id]
+        return self.tiles[x][y].get_edge(edge_dir)
 
     def get_adjacent_tiles_to_vertex(self, x, y, vertex_dir):
-        """Get the three tiles that converge at the specified vertex.
+        """Get the tiles that converge at the specified vertex.
 
         Args:
             x (int): Axial x-coordinate of the tile, one of whose vertices
@@ -354,18 +452,14 @@ class HexBoard(Board):
 
         Returns:
             list of Tiles. The tiles that converge at the specified vertex.
+              Vertices along the perimeter of the board will have fewer than
+              three.
         """
 
-        tile = self.get_tile_with_coords(x, y)
-
-        adjacent_tiles = map(
-            lambda edge_dir: self.get_neighboring_tile(tile, edge_dir),
-            EdgeVertexMapping.get_edge_dirs_for_vertex_dir(vertex_dir)
-        )
-
-        adjacent_tiles.append(tile)
+        vertex_id = self.topology.vertex_ids[(x, y, vertex_dir)]
 
-        return adjacent_tiles
+        return [self.tiles[tx][ty] for tx, ty, _ in
+                self.topology.vertex_slots[vertex_id]]
 
     def get_adjacent_edges(self, x, y, vert_or_edge_dir, return_values=True):
         if vert_or_edge_dir in EdgeDirection:
@@ -382,131 +476,45 @@ class HexBoard(Board):
 
     def _get_adjacent_edges_to_vertex(self, x, y, vertex_dir):
 
-        tile = self.get_tile_with_coords(x, y)
-
-        edge_vals = []
-
-        # Get the directions of edges that both have vertex_dir as an endpoint.
-        edge_dirs = EdgeVertexMapping.get_edge_dirs_for_vertex_dir(vertex_dir)
-
-        edge_vals.append( (x, y, edge_dirs[0]) )
-        edge_vals.append( (x, y, edge_dirs[1]) )
-
-        # The last edge value won't be available via the current tile's edges,
-        # but must be found on its neighbor.
-        neighbor_x = tile.x + edge_dirs[0][0]
-        neighbor_y = tile.y + edge_dirs[0][1]
-        neighboring_tile = self.get_neighboring_tile(tile, edge_dirs[0])
-        opp_vert_dir = HexTile.get_equivalent_vertex_dir(vertex_dir, edge_dirs[0])
+        topology = self.topology
+        vertex_id = topology.vertex_ids[(x, y, vertex_dir)]
 
-        neighbor_edge_dirs = EdgeVertexMapping.get_edge_dirs_for_vertex_dir(opp_vert_dir)
-        neighbor_edge_dir = next(d for d in neighbor_edge_dirs if d not in \
-            map(lambda edge_val: edge_val[2].get_opposite_direction(), edge_vals))
-
-        edge_vals.append( (neighbor_x, neighbor_y, neighbor_edge_dir) )
-
-        return edge_vals
+        return [topology.edge_coords[edge_id] for edge_id in
+                topology.vertex_edges[vertex_id]]
 
     def get_adjacent_edges_to_vertex(self, x, y, vertex_dir):
 
-        edge_tuples = self._get_adjacent_edges_to_vertex(x, y, vertex_dir)
-        edge_vals = []
-
-        msg = "Edges adjacent to ({}, {}) {}:\n".format(x, y, vertex_dir)
-
-        for x, y, edge_dir in edge_tuples:
-            tile = self.get_tile_with_coords(x, y)
-            edge_val = tile.get_edge(edge_dir)
+        vertex_id = self.topology.vertex_ids[(x, y, vertex_dir)]
 
-            edge_vals.append(edge_val)
-            msg += '\t\t ({}, {}) {}\n'.format(x, y, edge_dir)
-
-        return edge_vals
+        return [self.get_edge_by_id(edge_id) for edge_id in
+                self.topology.vertex_edges[vertex_id]]
 
     def _get_adjacent_edges_for_edge(self, x, y, edge_dir):
 
-        vertex_dirs = EdgeVertexMapping.get_vertex_dirs_for_edge_dir(edge_dir)
-
-        edge_tuples = []
-        edge_tuples.extend(self._get_adjacent_edges_to_vertex(x, y, vertex_dirs[0]) + \
-                           self._get_adjacent_edges_to_vertex(x, y, vertex_dirs[1]))
-
-        edge_tuples = filter(
-            lambda edge_tuple: edge_tuple[2] != edge_dir,
-            edge_tuples
-        )
+        topology = self.topology
+        edge_id = topology.edge_ids[(x, y, edge_dir)]
 
-        return edge_tuples
+        return [topology.edge_coords[adjacent_edge_id] for adjacent_edge_id in
+                topology.edge_edges[edge_id]]
 
     def get_adjacent_edges_for_edge(self, x, y, edge_dir):
 
-        edge_tuples = self._get_adjacent_edges_for_edge(x, y, edge_dir)
-        edge_vals = []
-
-        for ex, ey, e_dir in edge_tuples:
-            tile = self.get_tile_with_coords(ex, ey)
-
-            if tile:
-                edge_vals.append(tile.get_edge(e_dir))
+        edge_id = self.topology.edge_ids[(x, y, edge_dir)]
 
-        return edge_vals
+        return [self.get_edge_by_id(adjacent_edge_id) for adjacent_edge_id in
+                self.topology.edge_edges[edge_id]]
 
     def _get_adjacent_vertices_for_vertex(self, x, y, vertex_dir):
 
-        vertex_tuples = []
-
-        tile = self.get_tile_with_coords(x, y)
-
-        vertex_dirs = VertexDirection.get_neighboring_vertex_dirs(vertex_dir)
-
-        # Two of the closest vertices will lie on this tile
-        for adjacent_vertex_dir in vertex_dirs:
-            vertex_tuple = (x, y, adjacent_vertex_dir)
-            vertex_tuples.append(vertex_tuple)
+        topology = self.topology
+        vertex_id = topology.vertex_ids[(x, y, vertex_dir)]
 
-        # The last vertex value won't be available via the current tile's
-        # vertices, but must be found on its neighbor.
-
-        edge_dirs = EdgeVertexMapping.get_edge_dirs_for_vertex_dir(vertex_dir)
-
-        # Pick one edge, arbitrarily, to find the neighbor tile relative to that edge.
-        neighbor_edge_dir = edge_dirs[0]
-        neighboring_tile = self.get_neighboring_tile(tile, neighbor_edge_dir)
-        neighbor_x = tile.x + neighbor_edge_dir[0]
-        neighbor_y = tile.y + neighbor_edge_dir[1]
-
-        # Find the neighbor equivalent of vertex_dir
-        opp_vert_dir = HexTile.get_equivalent_vertex_dir(vertex_dir, neighbor_edge_dir)
-
-        # Vertex and edge direction should be relative to same tile
-        def vertex_already_found(v_dir, neighbor_edge):
-            neighbor_equivalent_v_dir = \
-                HexTile.get_equivalent_vertex_dir(v_dir, neighbor_edge_dir.get_opposite_direction())
-            return neighbor_equivalent_v_dir not in map(lambda v_tup: v_tup[2], vertex_tuples)
-
-        # Find the vertices adjacent to neighbors equivalent of vertex_dir.
-        # One will duplicate a vertex we already have, one will be new.
-        # Filter out the duplicate.
-        last_vertex_dir = filter(
-            lambda v_dir: not vertex_already_found(v_dir, neighbor_edge_dir.get_opposite_direction()),
-            VertexDirection.get_neighboring_vertex_dirs(opp_vert_dir)
-        )
-
-        if len(last_vertex_dir):
-            last_vertex_dir = last_vertex_dir[0]
-            vertex_tuples.append( (neighbor_x, neighbor_y, last_vertex_dir) )
-
-        return vertex_tuples
+        return [topology.vertex_coords[adjacent_vertex_id] for
+                adjacent_vertex_id in topology.vertex_vertices[vertex_id]]
 
     def get_adjacent_vertices_for_vertex(self, x, y, vertex_dir):
 
-        vertex_tuples = self._get_adjacent_vertices_for_vertex(x, y, vertex_dir)
-        vertex_vals = []
-
-        for vx, vy, v_dir in vertex_tuples:
-            tile = self.get_tile_with_coords(vx, vy)
-
-            if tile:
-                vertex_vals.append(tile.get_vertex(v_dir))
+        vertex_id = self.topology.vertex_ids[(x, y, vertex_dir)]
 
-        return vertex_vals
+        return [self.get_vertex_by_id(adjacent_vertex_id) for
+                adjacent_vertex_id in self.topology.vertex_vertices[vertex_id]]
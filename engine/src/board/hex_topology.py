@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+from engine.src.direction.edge_direction import EdgeDirection
+from engine.src.direction.vertex_direction import VertexDirection
+from engine.src.direction.edge_vertex_mapping import EdgeVertexMapping
+
+
+class HexTopology(object):
+    """Canonical integer ids and adjacency tables for a hextile board.
+
+    Every vertex and edge of a board is shared by up to three and two tiles
+    respectively, and so can be named by several (x, y, direction) triples.
+    Here we resolve each vertex and edge once, give it a single integer id,
+    and store its adjacencies as flat tables indexed by that id, so that
+    adjacency queries become simple lookups.
+
+    Topologies only depend on the tile layout, so they are shared between all
+    boards of the same radius. See HexTopology.for_radius().
+
+    Attributes:
+        tile_coords (list): Axial (x, y) coordinates of each tile, indexed by
+          tile id. Ordered as in HexBoard.iter_tile_coords().
+
+        tile_ids (dict): Tile id for each (x, y) coordinate pair.
+
+        vertex_ids (dict): Vertex id for each (x, y, VertexDirection) triple
+          that names a vertex of a tile on the board.
+
+        edge_ids (dict): Edge id for each (x, y, EdgeDirection) triple that
+          names an edge of a tile on the board.
+
+        vertex_slots (tuple): For each vertex id, every (x, y, VertexDirection)
+          triple naming that vertex.
+
+        edge_slots (tuple): For each edge id, every (x, y, EdgeDirection)
+          triple naming that edge.
+
+        vertex_coords (tuple): For each vertex id, its canonical
+          (x, y, VertexDirection) triple, i.e. its first slot.
+
+        edge_coords (tuple): For each edge id, its canonical
+          (x, y, EdgeDirection) triple, i.e. its first slot.
+
+        vertex_edges (tuple): Ids of the edges that end at each vertex.
+
+        edge_vertices (tuple): Ids of the two endpoint vertices of each edge.
+
+        vertex_vertices (tuple): Ids of the vertices one edge away from each
+          vertex.
+
+        edge_edges (tuple): Ids of the edges sharing an endpoint with each
+          edge.
+
+        vertex_tiles (tuple): Ids of the tiles that converge at each vertex.
+
+        tile_vertices (tuple): Ids of the 6 vertices of each tile, in
+          VertexDirection order.
+
+        tile_edges (tuple): Ids of the 6 edges of each tile, in EdgeDirection
+          order.
+
+        tile_tiles (tuple): Ids of the on-board neighbors of each tile.
+
+    Args:
+        tile_coords (iterable): Axial (x, y) coordinates of the board's tiles.
+    """
+
+    # Topologies already built, keyed by board radius.
+    _cache = {}
+
+    def __init__(self, tile_coords):
+
+        self.tile_coords = list(tile_coords)
+        self.tile_ids = {coords: tile_id for tile_id, coords in
+                         enumerate(self.tile_coords)}
+
+        self.vertex_ids = {}
+        self.edge_ids = {}
+
+        self._create_vertices()
+        self._create_edges()
+        self._create_adjacencies()
+
+    @classmethod
+    def for_radius(cls, radius):
+        """Get the topology of a HexBoard of the given radius.
+
+        Topologies are built once per radius and cached afterwards.
+        """
+
+        topology = cls._cache.get(radius)
+
+        if topology is None:
+            # Imported here since HexBoard itself depends on this module.
+            from engine.src.board.hex_board import HexBoard
+
+            tile_coords = []
+
+            for ring_index in range(radius):
+                tile_coords.extend(HexBoard.iter_tile_ring_coords(ring_index))
+
+            topology = cls(tile_coords)
+            cls._cache[radius] = topology
+
+        return topology
+
+    @property
+    def tile_count(self):
+        return len(self.tile_coords)
+
+    @property
+    def vertex_count(self):
+        return len(self.vertex_slots)
+
+    @property
+    def edge_count(self):
+        return len(self.edge_slots)
+
+    @staticmethod
+    def _get_neighbor_coords(x, y, edge_dir):
+        return x + edge_dir[0], y + edge_dir[1]
+
+    def _create_vertices(self):
+        """Assign an id to each vertex, and find every tile that names it.
+
+        A vertex is uniquely identified by the (on or off-board) tiles that
+        converge at it, i.e. the tile it was named from and that tile's
+        neighbors across the two edges ending at the vertex.
+        """
+
+        ids_by_key = {}
+        vertex_slots = []
+        tile_vertices = []
+
+        for x, y in self.tile_coords:
+            vertices = []
+
+            for vertex_dir in VertexDirection:
+                edge_dirs = \
+                    EdgeVertexMapping.get_edge_dirs_for_vertex_dir(vertex_dir)
+
+                key = frozenset([(x, y)] + [
+                    HexTopology._get_neighbor_coords(x, y, edge_dir)
+                    for edge_dir in edge_dirs
+                ])
+
+                if key not in ids_by_key:
+                    ids_by_key[key] = len(vertex_slots)
+                    vertex_slots.append([])
+
+                vertex_id = ids_by_key[key]
+
+                vertex_slots[vertex_id].append((x, y, vertex_dir))
+                self.vertex_ids[(x, y, vertex_dir)] = vertex_id
+                vertices.append(vertex_id)
+
+            tile_vertices.append(tuple(vertices))
+
+        self.vertex_slots = tuple(tuple(slots) for slots in vertex_slots)
+        self.vertex_coords = tuple(slots[0] for slots in self.vertex_slots)
+        self.tile_vertices = tuple(tile_vertices)
+
+    def _create_edges(self):
+        """Assign an id to each edge, and find every tile that names it.
+
+        An edge is uniquely identified by the two tiles it separates.
+        """
+
+        ids_by_key = {}
+        edge_slots = []
+        edge_vertices = []
+        tile_edges = []
+
+        for x, y in self.tile_coords:
+            edges = []
+
+            for edge_dir in EdgeDirection:
+                key = frozenset([
+                    (x, y), HexTopology._get_neighbor_coords(x, y, edge_dir)
+                ])
+
+                if key not in ids_by_key:
+                    ids_by_key[key] = len(edge_slots)
+                    edge_slots.append([])
+
+                    vertex_dirs = \
+                        EdgeVertexMapping.get_vertex_dirs_for_edge_dir(edge_dir)
+
+                    edge_vertices.append(tuple(
+                        self.vertex_ids[(x, y, vertex_dir)]
+                        for vertex_dir in vertex_dirs
+                    ))
+
+                edge_id = ids_by_key[key]
+
+                edge_slots[edge_id].append((x, y, edge_dir))
+                self.edge_ids[(x, y, edge_dir)] = edge_id
+                edges.append(edge_id)
+
+            tile_edges.append(tuple(edges))
+
+        self.edge_slots = tuple(tuple(slots) for slots in edge_slots)
+        self.edge_coords = tuple(slots[0] for slots in self.edge_slots)
+        self.edge_vertices = tuple(edge_vertices)
+        self.tile_edges = tuple(tile_edges)
+
+    def _create_adjacencies(self):
+        """Derive the remaining adjacency tables from vertices and edges."""
+
+        vertex_edges = [[] for _ in range(self.vertex_count)]
+        vertex_vertices = [[] for _ in range(self.vertex_count)]
+
+        for edge_id, (start_id, end_id) in enumerate(self.edge_vertices):
+            vertex_edges[start_id].append(edge_id)
+            vertex_edges[end_id].append(edge_id)
+
+            vertex_vertices[start_id].append(end_id)
+            vertex_vertices[end_id].append(start_id)
+
+        self.vertex_edges = tuple(tuple(edges) for edges in vertex_edges)
+        self.vertex_vertices = tuple(tuple(sorted(vertices))
+                                     for vertices in vertex_vertices)
+
+        self.edge_edges = tuple(
+            tuple(sorted(
+                set(self.vertex_edges[start_id] + self.vertex_edges[end_id]) -
+                set([edge_id])
+            ))
+            for edge_id, (start_id, end_id) in enumerate(self.edge_vertices)
+        )
+
+        self.vertex_tiles = tuple(
+            tuple(self.tile_ids[(x, y)] for x, y, _ in slots)
+            for slots in self.vertex_slots
+        )
+
+        self.tile_tiles = tuple(
+            tuple(
+                self.tile_ids[HexTopology._get_neighbor_coords(x, y, edge_dir)]
+                for edge_dir in EdgeDirection
+                if HexTopology._get_neighbor_coords(x, y, edge_dir) in
+                self.tile_ids
+            )
+            for x, y in self.tile_coords
+        )
+
+    def get_vertex_id(self, x, y, vertex_dir):
+        """Get the id of the vertex named by the given params, or None."""
+
+        return self.vertex_ids.get((x, y, vertex_dir))
+
+    def get_edge_id(self, x, y, edge_dir):
+        """Get the id of the edge named by the given params, or None."""
+
+        return self.edge_ids.get((x, y, edge_dir))
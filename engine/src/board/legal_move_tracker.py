@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+from engine.src.board.board_tracker import BoardTracker
+from engine.src.structure.structure import Structure
+
+
+class LegalMoveTracker(BoardTracker):
+    """Maintains where each player may legally build.
+
+    Follows the same rules as GameBoard.validate_structure_placement(), but
+    keeps the legal placements as sets updated on every change to the
+    board, rather than checking candidates one at a time:
+        - A settlement needs an empty vertex whose neighbors are all empty
+          i.e. the Distance Rule, bordering one of the player's roads.
+        - A road needs an empty edge next to one of the player's roads.
+        - An upgrade, e.g. a city, needs one of the player's structures it
+          upgrades.
+
+    The sets returned by the getters below are live and must not be
+    modified.
+
+    Attributes:
+        board (GameBoard): See BoardTracker.
+
+        open_vertex_ids (set): Ids of the vertices satisfying the Distance
+          Rule, i.e. where anybody could settle, roads aside.
+
+        vertex_road_counts (dict): For each player, a dict from vertex ids to
+          the number of the player's roads ending at that vertex.
+
+        settlement_vertex_ids (dict): For each player, the ids of the open
+          vertices bordering one of their roads.
+
+        edge_road_counts (dict): For each player, a dict from edge ids to the
+          number of the player's roads adjacent to that edge.
+
+        road_edge_ids (dict): For each player, the ids of the empty edges
+          adjacent to one of their roads.
+
+        structure_vertex_ids (dict): For each player, a dict from structure
+          names to the ids of the vertices the player has built that
+          structure on.
+
+    Args:
+        board (GameBoard): See above.
+    """
+
+    def __init__(self, board):
+
+        super(LegalMoveTracker, self).__init__(board)
+
+        self.open_vertex_ids = set()
+        self.vertex_road_counts = {}
+        self.settlement_vertex_ids = {}
+        self.edge_road_counts = {}
+        self.road_edge_ids = {}
+        self.structure_vertex_ids = {}
+
+        self.rebuild()
+
+    def rebuild(self):
+
+        topology = self.board.topology
+
+        self.open_vertex_ids = set()
+        self.vertex_road_counts = {}
+        self.settlement_vertex_ids = {}
+        self.edge_road_counts = {}
+        self.road_edge_ids = {}
+        self.structure_vertex_ids = {}
+
+        for vertex_id in range(topology.vertex_count):
+            vertex_val = self.board.get_vertex_by_id(vertex_id)
+
+            if isinstance(vertex_val, Structure):
+                self._get_structure_vertex_ids(
+                    vertex_val.owning_player, vertex_val.name).add(vertex_id)
+
+            if self._is_open(vertex_id):
+                self.open_vertex_ids.add(vertex_id)
+
+        for edge_id in range(topology.edge_count):
+            edge_val = self.board.get_edge_by_id(edge_id)
+
+            if isinstance(edge_val, Structure):
+                self.on_edge_changed(edge_id, None, edge_val)
+
+    def get_settlement_vertex_ids(self, player, initial=False):
+        """Get the ids of the vertices player may build a settlement on.
+
+        Args:
+            player (Player): Player who would build.
+
+            initial (bool): Whether this is the initial placement stage, in
+              which settlements need not border a road.
+        """
+
+        if initial:
+            return self.open_vertex_ids
+
+        return self.settlement_vertex_ids.get(player, frozenset())
+
+    def get_road_edge_ids(self, player, vertex_id=None):
+        """Get the ids of the edges player may build a road on.
+
+        Args:
+            player (Player): Player who would build.
+
+            vertex_id (int): If given, only edges ending at this vertex are
+              legal, regardless of the player's roads, as when placing the
+              road of an initial settlement.
+        """
+
+        if vertex_id is not None:
+            return set(edge_id for edge_id in
+                       self.board.topology.vertex_edges[vertex_id]
+                       if not isinstance(self.board.get_edge_by_id(edge_id),
+                                         Structure))
+
+        return self.road_edge_ids.get(player, frozenset())
+
+    def get_structure_vertex_ids(self, player, structure_name):
+        """Get the ids of the vertices where player built the given structure.
+
+        These are where the player may build structures upgrading it.
+        """
+
+        return self.structure_vertex_ids.get(player, {}).get(
+            structure_name, frozenset())
+
+    def on_vertex_changed(self, vertex_id, old_value, new_value):
+
+        if isinstance(old_value, Structure):
+            self._get_structure_vertex_ids(
+                old_value.owning_player, old_value.name).discard(vertex_id)
+
+        if isinstance(new_value, Structure):
+            self._get_structure_vertex_ids(
+                new_value.owning_player, new_value.name).add(vertex_id)
+
+        # The Distance Rule only involves a vertex and its neighbors.
+        for changed_id in \
+                (vertex_id,) + self.board.topology.vertex_vertices[vertex_id]:
+            is_open = self._is_open(changed_id)
+
+            if is_open == (changed_id in self.open_vertex_ids):
+                continue
+
+            if is_open:
+                self.open_vertex_ids.add(changed_id)
+            else:
+                self.open_vertex_ids.discard(changed_id)
+
+            for player, road_counts in self.vertex_road_counts.items():
+                if changed_id not in road_counts:
+                    continue
+
+                if is_open:
+                    self.settlement_vertex_ids[player].add(changed_id)
+                else:
+                    self.settlement_vertex_ids[player].discard(changed_id)
+
+    def on_edge_changed(self, edge_id, old_value, new_value):
+
+        topology = self.board.topology
+
+        if isinstance(old_value, Structure):
+            player = old_value.owning_player
+            vertex_road_counts = self.vertex_road_counts[player]
+            edge_road_counts = self.edge_road_counts[player]
+
+            for vertex_id in topology.edge_vertices[edge_id]:
+                vertex_road_counts[vertex_id] -= 1
+
+                if not vertex_road_counts[vertex_id]:
+                    del vertex_road_counts[vertex_id]
+                    self.settlement_vertex_ids[player].discard(vertex_id)
+
+            for adjacent_id in topology.edge_edges[edge_id]:
+                edge_road_counts[adjacent_id] -= 1
+
+                if not edge_road_counts[adjacent_id]:
+                    del edge_road_counts[adjacent_id]
+                    self.road_edge_ids[player].discard(adjacent_id)
+
+        if isinstance(new_value, Structure):
+            player = new_value.owning_player
+            vertex_road_counts = self.vertex_road_counts.setdefault(player, {})
+            edge_road_counts = self.edge_road_counts.setdefault(player, {})
+            settlement_vertex_ids = \
+                self.settlement_vertex_ids.setdefault(player, set())
+            road_edge_ids = self.road_edge_ids.setdefault(player, set())
+
+            for vertex_id in topology.edge_vertices[edge_id]:
+                vertex_road_counts[vertex_id] = \
+                    vertex_road_counts.get(vertex_id, 0) + 1
+
+                if vertex_id in self.open_vertex_ids:
+                    settlement_vertex_ids.add(vertex_id)
+
+            for adjacent_id in topology.edge_edges[edge_id]:
+                edge_road_counts[adjacent_id] = \
+                    edge_road_counts.get(adjacent_id, 0) + 1
+
+                if not isinstance(self.board.get_edge_by_id(adjacent_id),
+                                  Structure):
+                    road_edge_ids.add(adjacent_id)
+
+            # The edge itself is no longer free for anybody.
+            for road_edge_ids in self.road_edge_ids.values():
+                road_edge_ids.discard(edge_id)
+
+        else:
+            for player, edge_road_counts in self.edge_road_counts.items():
+                if edge_id in edge_road_counts:
+                    self.road_edge_ids[player].add(edge_id)
+
+    def _is_open(self, vertex_id):
+
+        board = self.board
+
+        if isinstance(board.get_vertex_by_id(vertex_id), Structure):
+            return False
+
+        return not any(
+            isinstance(board.get_vertex_by_id(neighbor_id), Structure)
+            for neighbor_id in board.topology.vertex_vertices[vertex_id])
+
+    def _get_structure_vertex_ids(self, player, structure_name):
+
+        return self.structure_vertex_ids.setdefault(player, {}) \
+            .setdefault(structure_name, set())
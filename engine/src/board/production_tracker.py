@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+from engine.src.lib.utils import Utils
+from engine.src.board.board_tracker import BoardTracker
+from engine.src.calamity.calamity import CalamityTilePlacementEffect
+from engine.src.dice import Dice
+from engine.src.resource_type import ResourceType
+from engine.src.structure.structure import Structure
+
+
+class ProductionTracker(BoardTracker):
+    """Maintains what every player produces on every dice roll.
+
+    For each roll value, keeps a players x resource types matrix of the
+    resources that roll yields, according to the structures on the board,
+    the tiles' chit values and resource types, and any calamities blocking
+    tile yield. Each change to the board only adjusts the entries of the
+    tiles involved. Reads the structures of each tile from the board's
+    TileIndexTracker, which must be registered before this one.
+
+    Attributes:
+        board (GameBoard): See BoardTracker.
+
+        production (dict): For each roll value, a dict from players to a dict
+          from resource types to the number of that resource the player
+          receives on that roll. Entries that drop to zero are removed.
+
+        tile_yields (list): For each tile id, the (chit value, resource type)
+          the tile currently contributes to production under, or None if the
+          tile is fallow or its yield is blocked.
+
+    Args:
+        board (GameBoard): See above.
+    """
+
+    def __init__(self, board):
+
+        super(ProductionTracker, self).__init__(board)
+
+        self.production = {}
+        self.tile_yields = []
+
+        self.rebuild()
+
+    def rebuild(self):
+
+        topology = self.board.topology
+
+        self.production = {}
+        self.tile_yields = [None] * topology.tile_count
+
+        for tile_id, (x, y) in enumerate(topology.tile_coords):
+            self.on_tile_changed(tile_id,
+                                 self.board.get_tile_with_coords(x, y))
+
+    def get_production(self, roll_value):
+        """Get the resources each player receives on the given roll.
+
+        Returns:
+            dict. Primary keys are players and secondary keys are resource
+              types, as in GameBoard.distribute_resources_for_roll(). A nested
+              default dict, so missing entries read as empty.
+        """
+
+        production = Utils.nested_dict()
+
+        for player, resources in self.production.get(roll_value, {}).items():
+            for resource_type, count in resources.items():
+                production[player][resource_type] = count
+
+        return production
+
+    def get_player_production(self, player, roll_value):
+        """Get the resources the given player receives on the given roll.
+
+        Returns:
+            dict. Keys are resource types, values are counts.
+        """
+
+        return dict(self.production.get(roll_value, {}).get(player, {}))
+
+    def get_expected_income(self, player, dice=None):
+        """Get the resources the given player receives per roll, on average.
+
+        Args:
+            player (Player): Player whose income we want.
+
+            dice (Dice): Dice whose roll probabilities weigh each roll's
+              production. Defaults to a standard pair of dice.
+
+        Returns:
+            dict. Keys are resource types, values are expected counts.
+        """
+
+        if dice is None:
+            dice = Dice()
+
+        income = {}
+
+        for roll_value, probability in dice.get_roll_probabilities().items():
+            resources = self.production.get(roll_value, {}).get(player, {})
+
+            for resource_type, count in resources.items():
+                income[resource_type] = \
+                    income.get(resource_type, 0) + probability * count
+
+        return income
+
+    def on_vertex_changed(self, vertex_id, old_value, new_value):
+
+        for tile_id in self.board.topology.vertex_tiles[vertex_id]:
+            tile_yield = self.tile_yields[tile_id]
+
+            if tile_yield is None:
+                continue
+
+            chit_value, resource_type = tile_yield
+
+            if isinstance(old_value, Structure):
+                self._add(chit_value, old_value.owning_player, resource_type,
+                          -old_value.base_yield)
+
+            if isinstance(new_value, Structure):
+                self._add(chit_value, new_value.owning_player, resource_type,
+                          new_value.base_yield)
+
+    def on_tile_changed(self, tile_id, tile):
+
+        blocked = CalamityTilePlacementEffect.BLOCK_YIELD in \
+            tile.get_calamity_tile_placement_effects()
+
+        if blocked or tile.resource_type == ResourceType.FALLOW:
+            new_yield = None
+        else:
+            new_yield = (tile.chit_value, tile.resource_type)
+
+        old_yield = self.tile_yields[tile_id]
+
+        if new_yield == old_yield:
+            return
+
+        structures = self.board.tile_index.get_tile_structures(tile_id)
+
+        if old_yield is not None:
+            for structure in structures:
+                self._add(old_yield[0], structure.owning_player, old_yield[1],
+                          -structure.base_yield)
+
+        if new_yield is not None:
+            for structure in structures:
+                self._add(new_yield[0], structure.owning_player, new_yield[1],
+                          structure.base_yield)
+
+        self.tile_yields[tile_id] = new_yield
+
+    def _add(self, roll_value, player, resource_type, count):
+
+        if not count:
+            return
+
+        players = self.production.setdefault(roll_value, {})
+        resources = players.setdefault(player, {})
+
+        resources[resource_type] = resources.get(resource_type, 0) + count
+
+        if not resources[resource_type]:
+            del resources[resource_type]
+
+            if not resources:
+                del players[player]
+
+                if not players:
+                    del self.production[roll_value]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from engine.src.board.board_tracker import BoardTracker
+from engine.src.calamity.calamity import CalamityTilePlacementEffect
+from engine.src.structure.structure import Structure
+
+
+class TileIndexTracker(BoardTracker):
+    """Indexes a board's tiles by chit value, and their structures by tile.
+
+    Lets a dice roll be resolved by visiting only the tiles that produce on
+    it, and only the occupied vertices of those tiles.
+
+    Attributes:
+        board (GameBoard): See BoardTracker.
+
+        chit_tile_ids (dict): Ids of the tiles with each chit value, in
+          tile id order.
+
+        tile_chit_values (list): Chit value each tile is indexed under, by
+          tile id.
+
+        blocked_tile_ids (set): Ids of the tiles whose yield is blocked by a
+          calamity e.g. the robber.
+
+        tile_structures (list): For each tile id, a dict of the structures
+          built on that tile's vertices, keyed by vertex id.
+
+    Args:
+        board (GameBoard): See above.
+    """
+
+    def __init__(self, board):
+
+        super(TileIndexTracker, self).__init__(board)
+
+        self.chit_tile_ids = {}
+        self.tile_chit_values = []
+        self.blocked_tile_ids = set()
+        self.tile_structures = []
+
+        self.rebuild()
+
+    def rebuild(self):
+
+        topology = self.board.topology
+
+        self.chit_tile_ids = {}
+        self.tile_chit_values = [None] * topology.tile_count
+        self.blocked_tile_ids = set()
+        self.tile_structures = [{} for _ in range(topology.tile_count)]
+
+        for tile_id, (x, y) in enumerate(topology.tile_coords):
+            self.on_tile_changed(tile_id,
+                                 self.board.get_tile_with_coords(x, y))
+
+        for vertex_id in range(topology.vertex_count):
+            self.on_vertex_changed(vertex_id, None,
+                                   self.board.get_vertex_by_id(vertex_id))
+
+    def get_tile_ids_with_chit_value(self, chit_value):
+        """Get the ids of the tiles with the given chit value."""
+
+        return self.chit_tile_ids.get(chit_value, [])
+
+    def get_producing_tile_ids(self, roll_value):
+        """Get the ids of the tiles that yield resources on the given roll."""
+
+        return [tile_id for tile_id in
+                self.get_tile_ids_with_chit_value(roll_value)
+                if tile_id not in self.blocked_tile_ids]
+
+    def get_tile_structures(self, tile_id):
+        """Get the structures built on the vertices of the given tile."""
+
+        return self.tile_structures[tile_id].values()
+
+    def on_vertex_changed(self, vertex_id, old_value, new_value):
+
+        for tile_id in self.board.topology.vertex_tiles[vertex_id]:
+            if isinstance(new_value, Structure):
+                self.tile_structures[tile_id][vertex_id] = new_value
+            else:
+                self.tile_structures[tile_id].pop(vertex_id, None)
+
+    def on_tile_changed(self, tile_id, tile):
+
+        old_chit_value = self.tile_chit_values[tile_id]
+
+        if old_chit_value != tile.chit_value:
+            if old_chit_value is not None:
+                self.chit_tile_ids[old_chit_value].remove(tile_id)
+
+                if not self.chit_tile_ids[old_chit_value]:
+                    del self.chit_tile_ids[old_chit_value]
+
+            tile_ids = self.chit_tile_ids.setdefault(tile.chit_value, [])
+            tile_ids.append(tile_id)
+            tile_ids.sort()
+
+            self.tile_chit_values[tile_id] = tile.chit_value
+
+        if CalamityTilePlacementEffect.BLOCK_YIELD in \
+                tile.get_calamity_tile_placement_effects():
+            self.blocked_tile_ids.add(tile_id)
+        else:
+            self.blocked_tile_ids.discard(tile_id)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+import bisect
+
+from engine.src.board.board_tracker import BoardTracker
+from engine.src.calamity.calamity import CalamityTilePlacementEffect
+from engine.src.dice import Dice
+from engine.src.resource_type import ResourceType
+
+
+class VertexYieldTracker(BoardTracker):
+    """Indexes what a settlement on each vertex would yield.
+
+    For each vertex, keeps the resource types of its tiles and the pips, i.e.
+    the number of dice combinations out of 36 that make each of its tiles
+    produce, so that placements can be valued without walking the tiles.
+    Tiles whose yield is blocked, e.g. by the robber, count for no pips.
+    Also keeps the vertices where anybody could settle, i.e. the board's
+    LegalMoveTracker's open vertices, ranked by value. That tracker must be
+    registered before this one, so that it's current when this one is
+    notified.
+
+    Harbors aren't indexed, since the board doesn't place any yet. See
+    GameBoard.assign_tile_harbors().
+
+    Attributes:
+        board (GameBoard): See BoardTracker.
+
+        dice (Dice): Dice whose roll probabilities give the pips.
+
+        resource_types (list): For each vertex id, a tuple of the resource
+          types of its arable tiles, blocked or not, in tile id order.
+
+        resource_pips (list): For each vertex id, a dict from resource types
+          to the pips of the vertex's producing tiles of that type.
+
+        pips (list): Total pips of each vertex, by vertex id.
+
+        diversity (list): Number of resource types each vertex produces, by
+          vertex id.
+
+        values (list): Value of each vertex, by vertex id. See get_value().
+
+        ranking (list): (-value, vertex id) of each open vertex, sorted.
+          Follows LegalMoveTracker.open_vertex_ids, which decides which
+          vertices are open.
+
+    Args:
+        board (GameBoard): See above.
+
+        dice (Dice): See above. Defaults to a standard pair of dice.
+    """
+
+    # Pips a resource type is worth, on top of its own pips, for being one
+    # more type the vertex produces.
+    DIVERSITY_WEIGHT = 1
+
+    def __init__(self, board, dice=None):
+
+        super(VertexYieldTracker, self).__init__(board)
+
+        if dice is None:
+            dice = Dice()
+
+        self.dice = dice
+
+        combination_count = len(dice.values) ** dice.dice_count
+        self._roll_pips = dict(
+            (roll_value, int(round(probability * combination_count)))
+            for roll_value, probability in
+            dice.get_roll_probabilities().iteritems())
+
+        self.resource_types = []
+        self.resource_pips = []
+        self.pips = []
+        self.diversity = []
+        self.values = []
+        self.ranking = []
+        self._tile_yields = []
+        self._ranked_vertex_ids = set()
+
+        self.rebuild()
+
+    def rebuild(self):
+
+        topology = self.board.topology
+
+        self._tile_yields = [
+            self._get_tile_yield(self.board.get_tile_with_coords(x, y))
+            for x, y in topology.tile_coords]
+
+        self.resource_types = [None] * topology.vertex_count
+        self.resource_pips = [None] * topology.vertex_count
+        self.pips = [0] * topology.vertex_count
+        self.diversity = [0] * topology.vertex_count
+        self.values = [0] * topology.vertex_count
+
+        for vertex_id in range(topology.vertex_count):
+            self._index_vertex(vertex_id)
+
+        self._ranked_vertex_ids = \
+            set(self.board.legal_move_tracker.open_vertex_ids)
+
+        self.ranking = sorted((-self.values[vertex_id], vertex_id)
+                              for vertex_id in self._ranked_vertex_ids)
+
+    def get_value(self, vertex_id):
+        """Get how much a settlement on the given vertex is worth.
+
+        Returns:
+            int. The vertex's pips, plus DIVERSITY_WEIGHT per resource type it
+              produces.
+        """
+
+        return self.values[vertex_id]
+
+    def get_best_vertex_ids(self, count=None):
+        """Get the ids of the open vertices, the most valuable first.
+
+        Ties go to the lowest vertex id.
+
+        Args:
+            count (int): Number of vertex ids to get at most. Defaults to all.
+        """
+
+        ranking = self.ranking if count is None else self.ranking[:count]
+
+        return [vertex_id for _, vertex_id in ranking]
+
+    def on_vertex_changed(self, vertex_id, old_value, new_value):
+
+        open_vertex_ids = self.board.legal_move_tracker.open_vertex_ids
+
+        # The Distance Rule only involves a vertex and its neighbors.
+        for changed_id in \
+                (vertex_id,) + self.board.topology.vertex_vertices[vertex_id]:
+            is_open = changed_id in open_vertex_ids
+
+            if is_open == (changed_id in self._ranked_vertex_ids):
+                continue
+
+            entry = (-self.values[changed_id], changed_id)
+
+            if is_open:
+                self._ranked_vertex_ids.add(changed_id)
+                bisect.insort(self.ranking, entry)
+            else:
+                self._ranked_vertex_ids.discard(changed_id)
+                del self.ranking[bisect.bisect_left(self.ranking, entry)]
+
+    def on_tile_changed(self, tile_id, tile):
+
+        tile_yield = self._get_tile_yield(tile)
+
+        if tile_yield == self._tile_yields[tile_id]:
+            return
+
+        self._tile_yields[tile_id] = tile_yield
+
+        for vertex_id in self.board.topology.tile_vertices[tile_id]:
+            old_entry = (-self.values[vertex_id], vertex_id)
+
+            self._index_vertex(vertex_id)
+
+            if vertex_id in self._ranked_vertex_ids:
+                del self.ranking[bisect.bisect_left(self.ranking, old_entry)]
+                bisect.insort(self.ranking,
+                              (-self.values[vertex_id], vertex_id))
+
+    def _get_tile_yield(self, tile):
+        """Get the (resource type, pips) a tile contributes to its vertices.
+
+        Resource type is None for fallow tiles, and pips are 0 for blocked
+        ones.
+        """
+
+        if tile.resource_type == ResourceType.FALLOW:
+            return None, 0
+
+        if CalamityTilePlacementEffect.BLOCK_YIELD in \
+                tile.get_calamity_tile_placement_effects():
+            return tile.resource_type, 0
+
+        return tile.resource_type, self._roll_pips.get(tile.chit_value, 0)
+
+    def _index_vertex(self, vertex_id):
+
+        resource_types = []
+        resource_pips = {}
+
+        for tile_id in self.board.topology.vertex_tiles[vertex_id]:
+            resource_type, pips = self._tile_yields[tile_id]
+
+            if resource_type is None:
+                continue
+
+            resource_types.append(resource_type)
+
+            if pips:
+                resource_pips[resource_type] = \
+                    resource_pips.get(resource_type, 0) + pips
+
+        pips = sum(resource_pips.values())
+
+        self.resource_types[vertex_id] = tuple(resource_types)
+        self.resource_pips[vertex_id] = resource_pips
+        self.pips[vertex_id] = pips
+        self.diversity[vertex_id] = len(resource_pips)
+        self.values[vertex_id] = \
+            pips + VertexYieldTracker.DIVERSITY_WEIGHT * len(resource_pips)
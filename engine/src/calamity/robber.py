@@ -39,7 +39,7 @@ class Robber(Calamity):
                 resources = game_player.get_resource_list()
 
                 resource_indices = game.input_manager.prompt_discard_resources(
-                    game, player, resources, cards_to_discard)
+                    game, game_player, resources, cards_to_discard)
 
                 for index in resource_indices:
                     game_player.withdraw_resources(resources[index], 1)
@@ -57,7 +57,6 @@ class Robber(Calamity):
 
         robber_successfully_moved = False
         previous_tile = game.board.find_tile_with_calamity(self)
-        previous_tile.remove_calamity(self)
 
         tile = None
 
@@ -72,7 +71,10 @@ class Robber(Calamity):
             # Move robber to new tile.
             tile = game.board.get_tile_with_coords(x, y)
 
+            # Only lift the robber once a new tile is chosen, so that whoever
+            # chooses can still see where it is.
             if tile != previous_tile:
+                previous_tile.remove_calamity(self)
                 tile.add_calamity(self)
                 robber_successfully_moved = True
 
@@ -92,7 +94,7 @@ class Robber(Calamity):
             chosen_player = game.input_manager.prompt_select_player(
                 game, eligible_players)
 
-            resource_type = chosen_player.withdraw_random_resource()
+            resource_type = chosen_player.withdraw_random_resource(game.rng)
             player.deposit_resources(resource_type, 1)
 
             # Announce received resource.
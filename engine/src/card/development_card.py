@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from engine.src.config.config import Config
+from engine.src.config.prototype_registry import PrototypeRegistry
 from engine.src.lib.utils import Utils
 
 
@@ -26,6 +27,25 @@ class DevelopmentCard(object):
         # Overwrite default values with custom values.
         Utils.init_from_dict(self, kwargs)
 
+        self.init_instance()
+
+    @classmethod
+    def from_config(cls, card_key):
+        """Create a development card of a kind defined in the config.
+
+        Cheaper than passing the config values to the constructor: they're
+        shared by every card of the kind. See PrototypeRegistry.
+
+        Args:
+            card_key (str): Key of the card's config, e.g. 'monopoly'.
+
+        Returns:
+            DevelopmentCard.
+        """
+
+        return DevelopmentCard.prototypes.new(card_key)
+
+    def init_instance(self):
         self.played = False
         self.is_playable = True
 
@@ -62,3 +82,7 @@ class DevelopmentCard(object):
         """
 
         self.played = True
+
+
+DevelopmentCard.prototypes = PrototypeRegistry(DevelopmentCard,
+                                               'game.card.development')
@@ -10,7 +10,7 @@ def play_card(self, game, player):
 
     for game_player in game.players:
         if player != game_player:
-            count = player.resources[resource_type]
+            count = game_player.resources[resource_type]
 
             game_player.transfer_resources(player, resource_type, count)
 
@@ -1,22 +1,123 @@
 from types import *
 from engine.src.lib.utils import Utils
+from engine.src.lib.frozen_dict import FrozenDict
 from engine.src.config.game_config import game_config
 from engine.src.config.type_config import type_config
 from engine.src.config.type_mapping import type_mapping
+from engine.src.config.type_schema import TypeSchema
 from engine.src.exceptions import *
 import pdb
 
+# Marks a path missing from the compiled table.
+_MISSING = object()
+
 
 class Config(object):
+    """Global access to the game config.
+
+    Plain lookups, i.e. Config.get(path), are served from a table compiled
+    from Config.config the first time it's needed. It maps every dot
+    notation path in the config to its value, with dict values already
+    stripped of their 'default' entry and frozen, so a lookup is a single
+    dict access. The table is recompiled after Config.set() or Config.init(),
+    or when Config.config is replaced. Changes made to the config dict
+    directly must be followed by Config.invalidate().
+    """
 
     is_coerced = False
 
+    # Compiled lookup table, the config it was compiled from, and a counter
+    # bumped every time the table is invalidated. See Config._get_table().
+    _table = None
+    _table_config = None
+    generation = 0
+
+    # Property dicts for init_from_config(), by config path.
+    _property_dicts = {}
+
+    # Compiled type_config, and statistics of the last coerce_all().
+    _schema = None
+    coerce_stats = {}
+
     @classmethod
     def init_from_config(cls, obj, config_path):
-        property_dict = Config.get(config_path)
-        dct = { Utils.convert_format(k): v for (k, v) in property_dict.iteritems()}
+
+        Config._get_table()
+        dct = Config._property_dicts.get(config_path)
+
+        if dct is None:
+            property_dict = Config.get(config_path)
+            dct = { Utils.convert_format(k): v for (k, v) in property_dict.iteritems()}
+            Config._property_dicts[config_path] = dct
+
         Utils.init_from_dict(obj, dct)
 
+    @classmethod
+    def accessor(cls, dot_notation_str):
+        """Get a handle on the config value at the given path.
+
+        See ConfigAccessor.
+        """
+
+        return ConfigAccessor(dot_notation_str)
+
+    @classmethod
+    def invalidate(cls):
+        """Discard the compiled lookup table, e.g. after editing the config."""
+
+        Config._table = None
+        Config._table_config = None
+        Config._property_dicts = {}
+        Config.generation += 1
+
+    @classmethod
+    def _get_table(cls):
+        """Get the compiled lookup table, compiling it if out of date."""
+
+        if Config._table is None or Config._table_config is not Config.config:
+            Config.invalidate()
+            Config._table = Config._compile(Config.config)
+            Config._table_config = Config.config
+
+        return Config._table
+
+    @classmethod
+    def _compile(cls, config):
+        """Map each dot notation path in config to the value Config.get gives.
+
+        Returns:
+            dict. Keys are dot notation strings.
+        """
+
+        table = {}
+        memo = {}
+
+        def compile_recursive(dct, prefix):
+            for key, value in dct.iteritems():
+                if type(key) is not StringType:
+                    continue
+
+                path = prefix + key
+                table[path] = Config._view(value, memo)
+
+                if type(value) is dict and value:
+                    compile_recursive(value, path + '.')
+
+        compile_recursive(config, '')
+
+        return table
+
+    @classmethod
+    def _view(cls, value, memo=None):
+        """Get the frozen value Config.get returns for the given raw value."""
+
+        if type(value) is not dict:
+            return value
+
+        # Only the top level 'default' is removed, as in Config.get().
+        return FrozenDict((k, FrozenDict.freeze(v, memo))
+                          for k, v in value.iteritems() if k != 'default')
+
     @classmethod
     def pluck(cls, config_path, prop):
         target_dict = Config.get(config_path)
@@ -28,6 +129,8 @@ class Config(object):
         if dct is None:
             dct = Config.config
 
+        Config.invalidate()
+
         keys = dot_notation_str.split('.')
 
         def set_recursive(dct, keys):
@@ -69,6 +172,14 @@ class Config(object):
         if not Config.is_coerced:
             Config.coerce_all()
 
+        is_main_lookup = dct is None and remove_default
+
+        if is_main_lookup and dot_notation_str:
+            value = Config._get_table().get(dot_notation_str, _MISSING)
+
+            if value is not _MISSING:
+                return value
+
         if dct is None:
             dct = Config.config
 
@@ -104,6 +215,13 @@ class Config(object):
 
         value = get_recursive(dct, keys)
 
+        # Paths the table doesn't list, e.g. ones spelt with '_' in place of
+        # '-', are remembered once found.
+        if is_main_lookup:
+            value = Config._view(value)
+            Config._get_table()[dot_notation_str] = value
+            return value
+
         if remove_default:
             # Remove default value from dictionary type return value.
             if type(value) is dict:
@@ -113,6 +231,7 @@ class Config(object):
 
     @classmethod
     def init(cls):
+        Config.invalidate()
         Config.convert_keys()
         Config.coerce_all()
 
@@ -133,11 +252,31 @@ class Config(object):
 
     @classmethod
     def coerce_all(cls):
+        """Coerce the whole config to the types given by type_config.
+
+        Uses the type config compiled into a TypeSchema, so the config is
+        traversed once. Timing and counts of the last run are kept in
+        Config.coerce_stats.
+        """
+
         Config.is_coerced = True
-        Config.coerce_recursive('')
+
+        schema = Config._schema
+
+        if schema is None or schema.type_config is not Config.type_config:
+            schema = TypeSchema(Config.type_config, Config.type_mapping)
+            Config._schema = schema
+
+        Config.invalidate()
+        Config.coerce_stats = schema.coerce(Config.config)
 
     @classmethod
     def coerce_recursive(cls, path_so_far):
+        """Coerce the config at the given path, one path at a time.
+
+        Gives the same result as coerce_all(), but looks up the type of every
+        path afresh.
+        """
         curr_value = Config.get(path_so_far, Config.config, False)
 
         try:
@@ -231,3 +370,43 @@ class Config(object):
     type_config = type_config
 
     type_mapping = type_mapping
+
+
+class ConfigAccessor(object):
+    """A handle on the config value at a fixed dot notation path.
+
+    Resolves its path once, then returns the same frozen value until the
+    config changes, so repeated reads cost no lookup at all.
+
+    Attributes:
+        dot_notation_str (str): Path of the value, as given to Config.get().
+
+    Args:
+        dot_notation_str (str): See above.
+    """
+
+    def __init__(self, dot_notation_str):
+
+        self.dot_notation_str = dot_notation_str
+
+        self._value = None
+        self._generation = None
+
+    def get(self, dot_notation_str=None):
+        """Get the value at this accessor's path, or at a path below it.
+
+        Args:
+            dot_notation_str (str): Optional path relative to this accessor's
+              path e.g. 'road.cost' for an accessor on
+              'game.structure.player_built'.
+        """
+
+        if dot_notation_str:
+            return Config.get(self.dot_notation_str + '.' + dot_notation_str)
+
+        if self._generation != Config.generation or \
+                Config._table_config is not Config.config:
+            self._value = Config.get(self.dot_notation_str)
+            self._generation = Config.generation
+
+        return self._value
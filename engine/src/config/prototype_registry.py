@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+from types import FunctionType
+
+from engine.src.config.config import Config
+from engine.src.lib.utils import Utils
+
+
+class PrototypeRegistry(object):
+    """Prototype classes of the kinds of an object defined in the config.
+
+    Objects like structures and development cards are defined by a config
+    dict per kind, e.g. 'game.structure.player_built.road', over the defaults
+    at '<path>.default'. Rather than copying those values onto every
+    instance, a prototype class is built once per kind: a subclass of
+    base_cls holding the resolved values as class attributes, with config
+    functions as its methods. Its instances share that spec and only hold
+    their own state, set by base_cls.init_instance().
+
+    Prototypes are rebuilt when the config changes.
+
+    Attributes:
+        base_cls (class): Class the prototypes subclass. Must define an
+          init_instance() method taking the arguments of new(), and keep its
+          registry as its 'prototypes' class attribute.
+
+        config_path (str): Path of the config dict of every kind, by key.
+
+        prototypes (dict): Prototype classes by kind key.
+
+    Args:
+        base_cls (class): See above.
+
+        config_path (str): See above.
+    """
+
+    def __init__(self, base_cls, config_path):
+
+        self.base_cls = base_cls
+        self.config_path = config_path
+        self.prototypes = {}
+
+        self._accessor = Config.accessor(config_path)
+        self._kinds = None
+
+    def get(self, key):
+        """Get the prototype class of the kind with the given config key."""
+
+        kinds = self._accessor.get()
+
+        # Config views are replaced whenever the config changes.
+        if kinds is not self._kinds:
+            self.prototypes = {}
+            self._kinds = kinds
+
+        prototype = self.prototypes.get(key)
+
+        if prototype is None:
+            prototype = self._create(key)
+            self.prototypes[key] = prototype
+
+        return prototype
+
+    def new(self, key, *args, **kwargs):
+        """Create an instance of the kind with the given config key."""
+
+        prototype = self.get(key)
+        obj = prototype.__new__(prototype)
+        obj.init_instance(*args, **kwargs)
+
+        return obj
+
+    def _create(self, key):
+        attrs = {}
+
+        for path in (self.config_path + '.default',
+                     self.config_path + '.' + key):
+            for name, value in Config.get(path).iteritems():
+                if Utils.is_function(value):
+                    value = PrototypeRegistry._as_method(value)
+
+                attrs[Utils.convert_format(name)] = value
+
+        attrs['prototype_base'] = self.base_cls
+        attrs['prototype_key'] = key
+        attrs['__reduce__'] = _reduce_prototype_instance
+
+        name = '{0}_{1}'.format(self.base_cls.__name__,
+                                Utils.convert_format(key))
+
+        return type(str(name), (self.base_cls,), attrs)
+
+    @staticmethod
+    def _as_method(func):
+        """Make func a method of a class as Utils.init_from_dict() would."""
+
+        # Plain functions become methods by themselves; other callables, e.g.
+        # bound methods, would not be passed the instance.
+        if isinstance(func, FunctionType):
+            return func
+
+        def method(self, *args, **kwargs):
+            return func(self, *args, **kwargs)
+
+        return method
+
+
+def _reduce_prototype_instance(self):
+    """Pickle and copy a prototype instance by its kind, since prototypes are
+    built at runtime and can't be found by name."""
+
+    return (_new_prototype_instance, (self.prototype_base, self.prototype_key),
+            self.__dict__)
+
+
+def _new_prototype_instance(base_cls, key):
+    prototype = base_cls.prototypes.get(key)
+
+    return prototype.__new__(prototype)
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+import time
+from types import *
+
+# Marks a path with no type in the type config.
+_MISSING = object()
+
+
+class TypeSchemaNode(object):
+    """The types a type config gives to one config node and its children.
+
+    Config.get_default_path() finds a config path's type by trying, from the
+    last key to the first, the path with that one key replaced by 'default',
+    then the path as is. A node holds every such candidate type config value
+    for its path, in that order of priority, so that the types of its
+    children follow from its candidates alone. Paths with the same
+    candidates share a node.
+
+    Attributes:
+        schema (TypeSchema): Schema this node belongs to.
+
+        candidates (tuple): Type config values of this node's path with each
+          key in turn replaced by 'default', from the last key to the first,
+          then of the path itself. _MISSING where a path has no value.
+
+        target_type: Type config value of this node's path, i.e. the first
+          candidate found, or _MISSING.
+
+        is_struct (bool): Whether target_type describes a struct, i.e. is a
+          dict with string keys, whose children are typed separately.
+
+        coercer (func): Coerces a value to target_type. None for structs and
+          untyped paths.
+
+        children (dict): Child nodes, by key.
+
+    Args:
+        schema (TypeSchema): See above.
+
+        candidates (tuple): See above.
+    """
+
+    def __init__(self, schema, candidates):
+
+        self.schema = schema
+        self.candidates = candidates
+
+        self.target_type = next(
+            (candidate for candidate in candidates
+             if candidate is not _MISSING), _MISSING)
+
+        self.is_struct = type(self.target_type) is dict and any(
+            type(key) == StringType for key in self.target_type)
+
+        self.coercer = None
+
+        if self.target_type is not _MISSING and not self.is_struct:
+            self.coercer = schema.compile_coercer(self.target_type)
+
+        self.children = {}
+
+    def get_child(self, key):
+        """Get the node of the child of this node's path with the given key."""
+
+        child = self.children.get(key)
+
+        if child is None:
+            exact = self.candidates[-1]
+
+            candidates = (TypeSchemaNode._get(exact, 'default'),) + tuple(
+                TypeSchemaNode._get(candidate, key)
+                for candidate in self.candidates)
+
+            child = self.schema.get_node(candidates)
+            self.children[key] = child
+
+        return child
+
+    @staticmethod
+    def _get(value, key):
+        """Look key up in a type config value the way Config.get() does."""
+
+        if type(value) is not dict or not value:
+            return _MISSING
+
+        if key in value:
+            return value[key]
+
+        if type(key) is StringType and key.replace('_', '-') in value:
+            return value[key.replace('_', '-')]
+
+        return _MISSING
+
+
+class TypeSchema(object):
+    """A type config compiled into nodes and coercion functions.
+
+    Coerces a whole config in a single traversal, giving the same result as
+    coercing each of its paths with Config.coerce() against the type found
+    by Config.get_default_path().
+
+    Attributes:
+        type_config (dict): See Config.type_config.
+
+        type_mapping (dict): See type_mapping.
+
+        root (TypeSchemaNode): Node of the empty path, i.e. the whole config.
+
+        nodes (dict): Nodes by the ids of their candidates.
+
+        coercers (dict): Coercion functions by the id of their target type.
+
+        stats (dict): Statistics of the last coerce() call:
+            node_count (int): Number of config values visited.
+            coerced_count (int): Number of values coerced.
+            seconds (float): Time taken.
+
+    Args:
+        type_config (dict): See above.
+
+        type_mapping (dict): See above.
+    """
+
+    def __init__(self, type_config, type_mapping):
+
+        self.type_config = type_config
+        self.type_mapping = type_mapping
+
+        self.nodes = {}
+        self.coercers = {}
+        self.stats = {}
+
+        self.root = self.get_node((type_config,))
+
+    def get_node(self, candidates):
+        """Get the node with the given candidates, creating it if needed."""
+
+        node_key = tuple(id(candidate) for candidate in candidates)
+        node = self.nodes.get(node_key)
+
+        if node is None:
+            node = TypeSchemaNode(self, candidates)
+            self.nodes[node_key] = node
+
+        return node
+
+    def compile_coercer(self, to_type):
+        """Get a function coercing values to the given type config type.
+
+        Mirrors Config.coerce(): values of the target type are returned as
+        is, dicts are coerced key by key and value by value against a
+        {key type: value type} target, and anything else is converted by
+        type_mapping.
+        """
+
+        coercer = self.coercers.get(id(to_type))
+
+        if coercer is not None:
+            return coercer
+
+        type_mapping = self.type_mapping
+
+        if type(to_type) is dict:
+            key_coercer = self.compile_coercer(to_type.keys()[0])
+            value_coercer = self.compile_coercer(to_type.values()[0])
+
+            def coercer(value):
+                if type(value) is not dict:
+                    return type_mapping[type(value)][to_type](value)
+
+                return dict((key_coercer(k), value_coercer(v))
+                            for k, v in value.iteritems())
+
+        else:
+            conversions = dict(
+                (from_type, conversion[to_type])
+                for from_type, conversion in type_mapping.iteritems()
+                if to_type in conversion
+            )
+
+            def coercer(value):
+                from_type = type(value)
+
+                if from_type == to_type:
+                    return value
+
+                conversion = conversions.get(from_type)
+
+                if conversion is None:
+                    # No conversion defined; fails as Config.coerce() would.
+                    return type_mapping[from_type][to_type](value)
+
+                return conversion(value)
+
+        self.coercers[id(to_type)] = coercer
+
+        return coercer
+
+    def coerce(self, config):
+        """Coerce every typed value of config, in place.
+
+        Returns:
+            dict. See self.stats.
+        """
+
+        start_time = time.time()
+        counts = [0, 0]
+
+        def coerce_recursive(dct, node):
+            for key, value in dct.items():
+                child = node.get_child(key)
+                counts[0] += 1
+
+                if child.target_type is _MISSING:
+                    continue
+
+                if child.is_struct and type(value) is dict:
+                    coerce_recursive(value, child)
+                else:
+                    dct[key] = child.coercer(value)
+                    counts[1] += 1
+
+        if self.root.is_struct:
+            coerce_recursive(config, self.root)
+
+        self.stats = {
+            'node_count': counts[0],
+            'coerced_count': counts[1],
+            'seconds': time.time() - start_time,
+        }
+
+        return self.stats
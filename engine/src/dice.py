@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 import random
 
+try:
+    import numpy
+except ImportError:
+    # Only batch rolls need numpy. See Dice.roll_batch().
+    numpy = None
+
 
 class Dice(object):
     """ Represents a set of game dice.
@@ -9,11 +15,15 @@ class Dice(object):
         dice_count (int): Number of dice in the game.
         
         range (list): List of possible dice values.
+
+        rng (random.Random): Source of randomness for rolls. Defaults to the
+          random module itself.
     """
 
-    def __init__(self, dice_count=2, values=range(1, 7)):
+    def __init__(self, dice_count=2, values=range(1, 7), rng=None):
         self.dice_count = dice_count
         self.values = values
+        self.rng = rng if rng is not None else random
 
     def roll(self):
         """ Rolls dice.
@@ -22,4 +32,61 @@ class Dice(object):
             int. Sum of dice face values after a random throw.
         """
 
-        return sum(random.choice(self.values) for _ in range(self.dice_count))
+        return sum(self.rng.choice(self.values)
+                   for _ in range(self.dice_count))
+
+    def roll_batch(self, size):
+        """Roll the dice many times at once.
+
+        Draws from a numpy generator seeded from this dice's rng, so seeded
+        games still give the same batches. Needs numpy.
+
+        Args:
+            size (int or tuple): Number of rolls, or shape of the array of
+              rolls, e.g. (trial count, turn count).
+
+        Returns:
+            numpy.ndarray. Of the given shape, sums of dice face values.
+        """
+
+        if numpy is None:
+            raise ImportError('Batch dice rolls need numpy')
+
+        if isinstance(size, int):
+            size = (size,)
+
+        random_state = numpy.random.RandomState(self.rng.getrandbits(32))
+        values = numpy.array(self.values)
+
+        rolls = numpy.zeros(size, dtype=values.dtype)
+
+        # A die at a time, so a batch never takes more memory than its sums.
+        for _ in range(self.dice_count):
+            rolls += values[random_state.randint(0, len(values), size)]
+
+        return rolls
+
+    def get_roll_probabilities(self):
+        """Get the probability of rolling each possible sum of the dice.
+
+        Returns:
+            dict. Keys are roll values and values are their probabilities.
+        """
+
+        # Number of ways to reach each sum, adding one die at a time.
+        sum_counts = {0: 1}
+
+        for _ in range(self.dice_count):
+            next_sum_counts = {}
+
+            for partial_sum, count in sum_counts.iteritems():
+                for value in self.values:
+                    next_sum_counts[partial_sum + value] = \
+                        next_sum_counts.get(partial_sum + value, 0) + count
+
+            sum_counts = next_sum_counts
+
+        total_count = float(len(self.values) ** self.dice_count)
+
+        return dict((roll_value, count / total_count)
+                    for roll_value, count in sum_counts.iteritems())
@@ -128,3 +128,10 @@ class InvalidStructurePlacementException(UserMessageException):
 
     def __init__(self):
         self.msg = 'Not a valid position to place the structure.'
+
+
+class InvalidRobberPlacementException(UserMessageException):
+    """Raise when the robber is moved to the tile it is already on."""
+
+    def __init__(self):
+        self.msg = 'The robber must be moved to another tile.'
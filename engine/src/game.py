@@ -1,5 +1,5 @@
 import pdb
-import re
+import random
 from engine.src.config.config import Config
 from engine.src.lib.utils import Utils
 from engine.src.exceptions import *
@@ -8,24 +8,54 @@ from engine.src.dice import Dice
 from engine.src.trading.trade_offer import TradeOffer
 from engine.src.input_manager import InputManager
 from engine.src.board.game_board import GameBoard
+from engine.src.board.board_state import BoardStorage
 from engine.src.resource_type import ResourceType
 from engine.src.position_type import PositionType
 from engine.src.structure.structure import Structure
 from engine.src.calamity.robber import Robber
-from engine.src.longest_road_search import LongestRoadSearch
+from engine.src.game_snapshot import GameSnapshot
 
 from imperative_parser.oracle import ORACLE
 
 class Game(object):
-    """A game of Settlers of Catan."""
+    """A game of Settlers of Catan.
 
-    def __init__(self):
+    Attributes:
+        input_manager: Source of player decisions and sink of game messages.
+          Either the InputManager class, for interactive games, or any object
+          with the same prompt, announce and output methods, e.g. a
+          HeadlessInputManager.
+
+        turn_count (int): Number of player turns begun so far, not counting
+          the initial placement stage.
+
+        current_player (Player): Player whose turn it is, if any.
+
+        rng (random.Random): Source of all of the game's randomness: dice
+          rolls, the board layout, the development card deck and resources
+          stolen by the robber.
+
+    Args:
+        input_manager: See above. Defaults to the interactive InputManager.
+
+        rng (random.Random): See above. Defaults to the random module itself.
+
+        board_storage (BoardStorage): How the board stores its vertices and
+          edges. BoardStorage.ARRAYS makes snapshots and clones of the game
+          much cheaper. See HexBoard.
+    """
+
+    def __init__(self, input_manager=InputManager, rng=None,
+                 board_storage=BoardStorage.TILES):
 
         Config.init()
         ORACLE.set('game', self)
 
-        self.dice = Dice()
-        self.board = GameBoard(Config.get('game.board.radius'))
+        self.rng = rng if rng is not None else random
+
+        self.dice = Dice(rng=self.rng)
+        self.board = GameBoard(Config.get('game.board.radius'),
+                               board_storage, self.rng)
         ORACLE.set('board', self.board)
 
         # Place the robber on a fallow tile.
@@ -34,7 +64,71 @@ class Game(object):
         tile.add_calamity(self.robber)
 
         self.players = []
-        self.input_manager = InputManager
+        self.input_manager = input_manager
+
+        self.turn_count = 0
+        self.current_player = None
+
+    def snapshot(self, include_rng=False):
+        """Record the current state of this game. See GameSnapshot.
+
+        Args:
+            include_rng (bool): Whether to record the state of the rng too,
+              e.g. to recover from a crash, rather than to search ahead.
+
+        Returns:
+            GameSnapshot.
+        """
+
+        return GameSnapshot.from_game(self, include_rng)
+
+    def restore(self, snapshot):
+        """Bring this game back to the state recorded in the given snapshot.
+
+        Only what changed since is undone, so restoring a recent snapshot is
+        cheap. See GameSnapshot.restore().
+        """
+
+        snapshot.restore(self)
+
+    def clone(self, input_manager=None):
+        """Get an independent copy of this game, e.g. to search ahead in.
+
+        Much cheaper than deepcopying the game. Everything that never changes
+        during a game is shared with the copy: the board topology, the tiles'
+        layout, the structure and card prototypes and the robber. Only the
+        game's own state is built anew, by restoring a snapshot of this game
+        into a copy of its board's layout. Unlike a new Game, the copy isn't
+        registered with the ORACLE.
+
+        Args:
+            input_manager: Input manager of the copy. Defaults to this game's.
+
+        Returns:
+            Game. Its rng starts in the state this game's rng is in.
+        """
+
+        game = Game.__new__(Game)
+
+        # Seeded, since seeding from the OS would cost more than the rest.
+        game.rng = random.Random(0)
+        game.rng.setstate(self.rng.getstate())
+
+        game.dice = Dice(self.dice.dice_count, self.dice.values, game.rng)
+        game.board = self.board.copy_layout(game.rng, create_trackers=False)
+        game.robber = self.robber
+
+        game.players = []
+        game.input_manager = input_manager if input_manager is not None \
+            else self.input_manager
+
+        game.turn_count = 0
+        game.current_player = None
+
+        self.snapshot().restore(game)
+        game.board.create_trackers()
+
+        return game
 
     def start(self):
         self.create_players()
@@ -47,21 +141,36 @@ class Game(object):
 
         while max_point_count < Config.get('game.points_to_win'):
             for player in self.players:
-                ORACLE.set('player', player)
+                self.begin_turn(player)
                 InputManager(self, player).cmdloop()
                 self.update_point_counts()
                 max_point_count = self.get_winning_player().get_total_points()
 
         # Print out game over message.
         winner = self.get_winning_player()
-        print 'Game over. {0} wins with {1} points!\n'\
-            .format(winner.name, winner.get_total_points())
+        self.input_manager.output('Game over. {0} wins with {1} points!\n'
+                                  .format(winner.name,
+                                          winner.get_total_points()))
 
-    def create_players(self):
-        """Create a new batch of players."""
+    def begin_turn(self, player):
+        """Make it the given player's turn."""
+
+        self.turn_count += 1
+        self.current_player = player
+        ORACLE.set('player', player)
+
+    def create_players(self, player_names=None):
+        """Create a new batch of players.
+
+        Args:
+            player_names (list): Names of the players. Prompted for if not
+              given.
+        """
 
         self.players = []
-        player_names = InputManager.get_player_names()
+
+        if player_names is None:
+            player_names = self.input_manager.get_player_names()
 
         for player_name in player_names:
             self.players.append(Player(player_name))
@@ -69,11 +178,13 @@ class Game(object):
         ORACLE.set('players', self.players)
 
     def place_structure(self, player, structure_name, must_border_claimed_edge=True,
-                        struct_x=None, struct_y=None, struct_vertex_dir=None, free_to_build=False):
+                        struct_x=None, struct_y=None, struct_vertex_dir=None, free_to_build=False,
+                        placement=None):
         """Place an edge or vertex structure.
 
-        Prompts for placement information and attempts to place on board. Does
-        not do any exception handling.
+        Prompts for placement information, unless an (x, y, direction)
+        placement is given, and attempts to place on board. Does not do any
+        exception handling.
         """
 
         try:
@@ -92,13 +203,16 @@ class Game(object):
                     raise NotEnoughResourcesException(obstructing_entity, obstructing_resource_type)
 
             if structure.position_type == PositionType.EDGE:
-                prompt_func = InputManager.prompt_edge_placement
+                prompt_func = self.input_manager.prompt_edge_placement
                 placement_func = self.board.place_edge_structure
             elif structure.position_type == PositionType.VERTEX:
-                prompt_func = InputManager.prompt_vertex_placement
+                prompt_func = self.input_manager.prompt_vertex_placement
                 placement_func = self.board.place_vertex_structure
 
-            x, y, struct_dir = prompt_func(self)
+            if placement is None:
+                placement = prompt_func(self)
+
+            x, y, struct_dir = placement
 
             params = [x, y, struct_dir, structure, must_border_claimed_edge]
 
@@ -110,15 +224,7 @@ class Game(object):
             player = structure.owning_player
 
             # Allocate points
-            if structure.augments():
-                # TODO: conversions from camelcase to underscore
-                structure_name = re.sub(r'\s', '_', structure_name).lower()
-                augments = re.sub(r'\s', '_', structure.augments()).lower()
-                points = structure.point_value - Config.get('game.structure.player_built.' + augments + '.point_value')
-            else:
-                points = structure.point_value
-
-            player.points += points
+            player.points += structure.get_point_gain()
 
             return x, y, struct_dir, structure
 
@@ -157,51 +263,49 @@ class Game(object):
             except (BoardPositionOccupiedException,
                     InvalidBaseStructureException,
                     InvalidStructurePlacementException), e:
-                player.restore_structure(structure_name)
-                InputManager.output(e)
+                # place_structure() already returned the structure to the
+                # player's stock.
+                self.input_manager.output(e)
 
         return x, y, struct_dir
 
     def initial_settlement_and_road_placement(self):
 
-        InputManager.announce_initial_structure_placement_stage()
+        self.input_manager.announce_initial_structure_placement_stage()
 
         for player in self.players:
 
-            InputManager.announce_player_turn(player)
+            self.current_player = player
+            self.input_manager.announce_player_turn(player)
 
             # Place settlement
-            InputManager.announce_structure_placement(player, 'Settlement')
+            self.input_manager.announce_structure_placement(player, 'Settlement')
             x, y, vertex_dir = self.place_init_structure(player, 'Settlement')
 
             # Place road
-            InputManager.announce_structure_placement(player, 'Road')
+            self.input_manager.announce_structure_placement(player, 'Road')
             self.place_init_structure(player, 'Road', False, x, y, vertex_dir)
 
         distributions = Utils.nested_dict()
 
         for player in list(reversed(self.players)):
 
-            InputManager.announce_player_turn(player)
+            self.current_player = player
+            self.input_manager.announce_player_turn(player)
 
             # Place settlement
-            InputManager.announce_structure_placement(player, 'Settlement')
+            self.input_manager.announce_structure_placement(player, 'Settlement')
             x, y, vertex_dir = self.place_init_structure(player, 'Settlement')
 
             # Place road
-            InputManager.announce_structure_placement(player, 'Road')
+            self.input_manager.announce_structure_placement(player, 'Road')
             self.place_init_structure(player, 'Road', False, x, y, vertex_dir)
 
-            neighboring_tiles = filter(
-                bool, self.board.get_adjacent_tiles_to_vertex(x, y, vertex_dir))
+            vertex_id = self.board.topology.vertex_ids[(x, y, vertex_dir)]
 
             # Give initial resource cards
-            resource_types = filter(
-                lambda resource_type: resource_type != ResourceType.FALLOW,
-                map(lambda tile: tile.resource_type, neighboring_tiles)
-            )
-
-            for resource_type in resource_types:
+            for resource_type in \
+                    self.board.vertex_yield_index.resource_types[vertex_id]:
 
                 if not distributions[player][resource_type]:
                     distributions[player][resource_type] = 0
@@ -210,18 +314,18 @@ class Game(object):
                     Config.get('game.structure.player_built.settlement.base_yield')
 
         self.board.distribute_resources(distributions)
-        InputManager.announce_resource_distributions(distributions)
+        self.input_manager.announce_resource_distributions(distributions)
 
     def roll_dice(self, value=None):
 
         roll_value = self.dice.roll()
-        InputManager.announce_roll_value(roll_value)
+        self.input_manager.announce_roll_value(roll_value)
         ORACLE.set('dice_value', roll_value)
 
         # If a calamity value, handle calamity
         distributions = self.board.distribute_resources_for_roll(roll_value)
 
-        InputManager.announce_resource_distributions(distributions)
+        self.input_manager.announce_resource_distributions(distributions)
 
     def get_winning_player(self):
         """Get the player who is winning this game of Settlers of Catan."""
@@ -237,16 +341,20 @@ class Game(object):
 
         # TODO: Move thresholds to config
         if player_with_largest_army.knights >= 3:
-            print 'Largest army given to: {}'.format(player_with_largest_army)
+            self.input_manager.output('Largest army given to: {}'.format(
+                player_with_largest_army))
             player_with_largest_army.special_points += 2
 
-        player_road_len_dict = LongestRoadSearch(self.board).execute()
+        longest_road_tracker = self.board.longest_road_tracker
 
-        for player, road_len in player_road_len_dict.iteritems():
-            player.longest_road_length = road_len
+        for player in self.players:
+            player.longest_road_length = \
+                longest_road_tracker.get_length(player)
 
-        player_with_longest_road = max(player_road_len_dict)
+        player_with_longest_road = max(
+            self.players, key=lambda player: player.longest_road_length)
 
         if player_with_longest_road.longest_road_length >= 5:
-            print 'Longest road given to: {}'.format(player_with_longest_road)
+            self.input_manager.output('Longest road given to: {}'.format(
+                player_with_longest_road))
             player_with_longest_road.special_points += 2
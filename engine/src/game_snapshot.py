@@ -0,0 +1,559 @@
+# -*- coding: utf-8 -*-
+import re
+from array import array
+
+from engine.src.board.board_state import BoardState
+from engine.src.board.game_board import GameBoard
+from engine.src.card.development_card import DevelopmentCard
+from engine.src.player import Player
+from engine.src.resource_type import ResourceType
+from engine.src.structure.structure import Structure
+from engine.src.vertex import Vertex
+from engine.src.edge import Edge
+
+
+class GameSnapshot(object):
+    """Compact, versioned record of the full state of a game.
+
+    Only holds plain values, so snapshots can be pickled, e.g. for crash
+    recovery, and are never changed once taken, so any number of games may
+    be restored from the same snapshot. Players are referred to by their
+    index in Game.players, structures and development cards by their config
+    key, and resource types by their value.
+
+    Restoring a snapshot only changes what differs between it and the game,
+    through the same board methods moves go through, so the board's trackers
+    stay up to date without being rebuilt. This makes snapshot() and
+    restore() cheap enough to call once per move in a search. Game.clone()
+    builds on it.
+
+    Attributes:
+        version (int): VERSION of the code that took the snapshot.
+
+        tiles (tuple): (resource type value, chit value) of each tile, by
+          tile id. See HexTopology.
+
+        robber_tile_id (int): Id of the tile the game's robber is on, if any.
+
+        kinds (tuple): Config keys of the structures on the board, e.g.
+          'road', indexed by kind index.
+
+        vertex_owners (str): Packed signed bytes, as in BoardState: the
+          index of the player owning each vertex, by vertex id, or
+          BoardState.EMPTY.
+
+        vertex_kinds (str): Packed kind index of the structure on each
+          vertex, or BoardState.EMPTY.
+
+        edge_owners (str): As vertex_owners, by edge id.
+
+        edge_kinds (str): As vertex_kinds, by edge id.
+
+        players (tuple): For each player, a tuple of their name, resource
+          counts in ARABLE_TYPES order, development cards as (key, played,
+          is_playable) tuples, points, hidden points, special points,
+          knights, longest road length and remaining structure counts as
+          sorted (name, count) pairs.
+
+        bank_resources (tuple): Resource counts of the bank, in ARABLE_TYPES
+          order.
+
+        deck (tuple): Config keys of the bank's development cards, in the
+          order they will be bought from the end of the deck.
+
+        turn_count (int): See Game.
+
+        current_player_index (int): Index of the game's current player, or
+          None.
+
+        rng_state (tuple): State of the game's rng, if asked for. Searches
+          restoring a position many times usually want a different future
+          every time, so leave it out; crash recovery wants it in.
+    """
+
+    VERSION = 1
+
+    # Beyond this many vertex and edge changes, restore() rebuilds the
+    # board's trackers rather than updating them change by change.
+    MAX_TRACKED_CHANGES = 16
+
+    ARABLE_TYPES = tuple(ResourceType.get_arable_types())
+
+    FIELDS = ('version', 'tiles', 'robber_tile_id', 'kinds', 'vertex_owners',
+              'vertex_kinds', 'edge_owners', 'edge_kinds', 'players',
+              'bank_resources', 'deck', 'turn_count', 'current_player_index',
+              'rng_state')
+
+    def __init__(self, **kwargs):
+
+        for field in GameSnapshot.FIELDS:
+            setattr(self, field, kwargs.get(field))
+
+        if self.version != GameSnapshot.VERSION:
+            raise ValueError('Unsupported game snapshot version {0}'.format(
+                self.version))
+
+    def __eq__(self, other):
+        return isinstance(other, GameSnapshot) and \
+            self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'GameSnapshot(version={0}, turn_count={1})'.format(
+            self.version, self.turn_count)
+
+    @classmethod
+    def from_game(cls, game, include_rng=False):
+        """Record the current state of the given game.
+
+        Args:
+            game (Game): Game to record. Its players must already be created.
+
+            include_rng (bool): Whether to record the state of the game's rng.
+              See rng_state.
+
+        Returns:
+            GameSnapshot.
+        """
+
+        board = game.board
+        topology = board.topology
+
+        player_indices = dict((player, index) for index, player in
+                              enumerate(game.players))
+
+        kinds, vertex_owners, vertex_kinds, edge_owners, edge_kinds = \
+            GameSnapshot._encode_board(board, player_indices)
+
+        # Number the kinds in use in key order, so that equal games give equal
+        # snapshots whatever order their structures were built, or removed,
+        # in.
+        used_kinds = sorted(kinds[kind] for kind in
+                            set(vertex_kinds) | set(edge_kinds)
+                            if kind != BoardState.EMPTY)
+
+        if kinds != used_kinds:
+            kind_indices = [used_kinds.index(key) if key in used_kinds else
+                            BoardState.EMPTY for key in kinds]
+            kind_indices.append(BoardState.EMPTY)
+
+            vertex_kinds = array('b', [kind_indices[kind] for kind in
+                                       vertex_kinds])
+            edge_kinds = array('b', [kind_indices[kind] for kind in
+                                     edge_kinds])
+            kinds = used_kinds
+
+        tiles = []
+        robber_tile_id = None
+
+        for tile_id, (x, y) in enumerate(topology.tile_coords):
+            tile = board.tiles[x][y]
+            tiles.append((tile.resource_type.value, tile.chit_value))
+
+            if game.robber in tile.calamities:
+                robber_tile_id = tile_id
+
+        current_player_index = None
+        if game.current_player is not None:
+            current_player_index = player_indices[game.current_player]
+
+        return cls(
+            version=GameSnapshot.VERSION,
+            tiles=tuple(tiles),
+            robber_tile_id=robber_tile_id,
+            kinds=tuple(kinds),
+            vertex_owners=vertex_owners.tostring(),
+            vertex_kinds=vertex_kinds.tostring(),
+            edge_owners=edge_owners.tostring(),
+            edge_kinds=edge_kinds.tostring(),
+            players=tuple(GameSnapshot._encode_player(player)
+                          for player in game.players),
+            bank_resources=GameSnapshot._encode_resources(board.bank),
+            deck=GameSnapshot._encode_deck(board.bank.development_cards),
+            turn_count=game.turn_count,
+            current_player_index=current_player_index,
+            rng_state=game.rng.getstate() if include_rng else None
+        )
+
+    @classmethod
+    def from_dict(cls, dct):
+        """Rebuild a snapshot from the output of to_dict().
+
+        Raises:
+            ValueError. If the snapshot was taken by another VERSION.
+        """
+
+        return cls(**dct)
+
+    def to_dict(self):
+        return dict((field, getattr(self, field))
+                    for field in GameSnapshot.FIELDS)
+
+    def restore(self, game):
+        """Bring the given game to the recorded state.
+
+        The game must have a board of the same radius. Players are kept if
+        their names match the recorded ones, and replaced otherwise, e.g.
+        when restoring into a freshly created game, along with any structures
+        of theirs. Unlike Game.create_players(), this doesn't register them
+        with the ORACLE.
+
+        The game is checked and its board encoded before anything changes,
+        so a game that can't be restored is left as it was.
+
+        Raises:
+            ValueError. If the game's board doesn't match the snapshot.
+
+            KeyError. If the game's board has structures of players not in
+              the game.
+        """
+
+        board = game.board
+        topology = board.topology
+
+        if len(self.tiles) != topology.tile_count or \
+                len(self.vertex_owners) != topology.vertex_count or \
+                len(self.edge_owners) != topology.edge_count:
+            raise ValueError('Game snapshot is of a board of another size')
+
+        # Before anything changes, and before the players may be replaced,
+        # since the current structures belong to the current players.
+        current_board = GameSnapshot._encode_board(
+            board, self._get_player_indices(game))
+
+        self._restore_tiles(game)
+        self._restore_players(game)
+
+        self._restore_board(game, current_board)
+
+        GameSnapshot._restore_resources(board.bank, self.bank_resources)
+
+        if GameSnapshot._encode_deck(board.bank.development_cards) != \
+                self.deck:
+            board.bank.development_cards = [
+                DevelopmentCard.from_config(key) for key in self.deck]
+
+        game.turn_count = self.turn_count
+        game.current_player = None
+        if self.current_player_index is not None:
+            game.current_player = game.players[self.current_player_index]
+
+        if self.rng_state is not None:
+            game.rng.setstate(self.rng_state)
+
+    def _restore_tiles(self, game):
+
+        board = game.board
+        robber_tile = board.find_tile_with_calamity(game.robber)
+
+        for tile_id, (x, y) in enumerate(board.topology.tile_coords):
+            tile = board.tiles[x][y]
+            resource_value, chit_value = self.tiles[tile_id]
+
+            # Setting either notifies the trackers, so only set changes.
+            if tile.resource_type.value != resource_value:
+                tile.resource_type = ResourceType(resource_value)
+
+            if tile.chit_value != chit_value:
+                tile.chit_value = chit_value
+
+            if tile_id == self.robber_tile_id and tile is not robber_tile:
+                if robber_tile is not None:
+                    robber_tile.remove_calamity(game.robber)
+                tile.add_calamity(game.robber)
+
+        if self.robber_tile_id is None and robber_tile is not None:
+            robber_tile.remove_calamity(game.robber)
+
+    def _get_player_indices(self, game):
+        """Get the index of each of the game's players, as recorded.
+
+        Players about to be replaced get indices past the recorded ones, so
+        that none of their structures is mistaken for a recorded one.
+        """
+
+        offset = 0 if self._has_players(game) else len(self.players)
+
+        return dict((player, offset + index) for index, player in
+                    enumerate(game.players))
+
+    def _has_players(self, game):
+        """Whether the game's players are the recorded ones, by name."""
+
+        return [player.name for player in game.players] == \
+            [player_state[0] for player_state in self.players]
+
+    def _restore_players(self, game):
+
+        if not self._has_players(game):
+            game.players = [Player(player_state[0])
+                            for player_state in self.players]
+
+        for player, player_state in zip(game.players, self.players):
+            (_, resources, development_cards, player.points,
+             player.hidden_points, player.special_points, player.knights,
+             player.longest_road_length, structure_counts) = player_state
+
+            GameSnapshot._restore_resources(player, resources)
+
+            if GameSnapshot._encode_cards(player.development_cards) != \
+                    development_cards:
+                player.development_cards = [
+                    GameSnapshot._decode_card(card_state)
+                    for card_state in development_cards]
+
+            player.remaining_structure_counts = dict(structure_counts)
+
+    def _restore_board(self, game, current_board):
+        """Update the vertices and edges whose value differs from the record.
+
+        A few changes, e.g. since the last move, are passed on to the board's
+        trackers one by one. Many changes, e.g. when restoring into an empty
+        board, are made quietly instead, and the trackers rebuilt once.
+
+        Args:
+            game (Game): Game to restore.
+
+            current_board (tuple): The board as it was before the restore,
+              encoded by _encode_board() with _get_player_indices().
+        """
+
+        board = game.board
+
+        kinds, vertex_owners, vertex_kinds, edge_owners, edge_kinds = \
+            current_board
+
+        vertex_changes = self._diff_slots(
+            kinds, vertex_owners, vertex_kinds,
+            array('b', self.vertex_owners), array('b', self.vertex_kinds))
+        edge_changes = self._diff_slots(
+            kinds, edge_owners, edge_kinds,
+            array('b', self.edge_owners), array('b', self.edge_kinds))
+
+        quietly = len(vertex_changes) + len(edge_changes) > \
+            GameSnapshot.MAX_TRACKED_CHANGES
+
+        if quietly:
+            update_vertex = super(GameBoard, board).update_vertex_by_id
+            update_edge = super(GameBoard, board).update_edge_by_id
+        else:
+            update_vertex = board.update_vertex_by_id
+            update_edge = board.update_edge_by_id
+
+        for vertex_id, owner, kind in vertex_changes:
+            update_vertex(vertex_id, self._decode_slot(game, owner, kind,
+                                                       Vertex))
+
+        for edge_id, owner, kind in edge_changes:
+            update_edge(edge_id, self._decode_slot(game, owner, kind, Edge))
+
+        if quietly:
+            for tracker in board.trackers:
+                tracker.rebuild()
+
+    def _diff_slots(self, kinds, owners, kind_indices, recorded_owners,
+                    recorded_kind_indices):
+        """Find the vertices or edges that differ from the record.
+
+        Args:
+            kinds (list): Structure keys of the current kind indices.
+
+            owners (array): Current owner index of each vertex or edge.
+
+            kind_indices (array): Current kind index of each vertex or edge.
+
+            recorded_owners (array): Recorded owner indices.
+
+            recorded_kind_indices (array): Recorded kind indices.
+
+        Returns:
+            list. (id, owner index, kind index) of each vertex or edge to
+              change, as recorded.
+        """
+
+        # Arrays compare in C, and most of the time nothing differs.
+        if owners == recorded_owners and kinds == list(self.kinds) and \
+                kind_indices == recorded_kind_indices:
+            return []
+
+        changes = []
+
+        for slot_id, owner in enumerate(recorded_owners):
+            kind = recorded_kind_indices[slot_id]
+
+            if owners[slot_id] == owner and (
+                    owner == BoardState.EMPTY or
+                    kinds[kind_indices[slot_id]] == self.kinds[kind]):
+                continue
+
+            changes.append((slot_id, owner, kind))
+
+        return changes
+
+    def _decode_slot(self, game, owner, kind, empty_cls):
+
+        if owner == BoardState.EMPTY:
+            return empty_cls()
+
+        return Structure.from_config(game.players[owner], self.kinds[kind])
+
+    @staticmethod
+    def _encode_board(board, player_indices):
+        """Pack the owner and kind indices of the board's vertices and edges.
+
+        Args:
+            board (GameBoard): Board to encode.
+
+            player_indices (dict): Index of each player.
+
+        Returns:
+            tuple. The structure keys of the kind indices, then arrays of the
+              owner and kind indices of the vertices and of the edges.
+        """
+
+        state = board.state
+
+        if state is None:
+            topology = board.topology
+            kind_indices = {}
+
+            vertex_owners, vertex_kinds = GameSnapshot._encode_slots(
+                map(board.get_vertex_by_id, range(topology.vertex_count)),
+                player_indices, kind_indices)
+            edge_owners, edge_kinds = GameSnapshot._encode_slots(
+                map(board.get_edge_by_id, range(topology.edge_count)),
+                player_indices, kind_indices)
+
+            kinds = [None] * len(kind_indices)
+            for key, index in kind_indices.iteritems():
+                kinds[index] = key
+
+            return kinds, vertex_owners, vertex_kinds, edge_owners, edge_kinds
+
+        # A BoardState is packed the same way already, bar the indices of its
+        # players and the names, rather than keys, of its kinds.
+        kinds = [None] * len(state.kinds)
+        for (_, kind), structure in state.structures.iteritems():
+            kinds[kind] = GameSnapshot._get_structure_key(structure)
+
+        # Players replaced by restore() linger in the state, owning nothing.
+        owner_indices = [player_indices.get(player)
+                         for player in state.players]
+
+        if owner_indices == range(len(owner_indices)):
+            vertex_owners = state.vertex_owners[:]
+            edge_owners = state.edge_owners[:]
+        else:
+            # So that owner_indices[BoardState.EMPTY], i.e. the last one, is
+            # BoardState.EMPTY too.
+            owner_indices.append(BoardState.EMPTY)
+            vertex_owners = [owner_indices[owner] for owner in
+                             state.vertex_owners]
+            edge_owners = [owner_indices[owner] for owner in
+                           state.edge_owners]
+
+            if None in vertex_owners or None in edge_owners:
+                raise KeyError('Board has structures of players not in the '
+                               'game')
+
+            vertex_owners = array('b', vertex_owners)
+            edge_owners = array('b', edge_owners)
+
+        return (kinds, vertex_owners, state.vertex_kinds[:], edge_owners,
+                state.edge_kinds[:])
+
+    @staticmethod
+    def _encode_slots(values, player_indices, kind_indices):
+        """Pack the owner and kind indices of the given vertex or edge values.
+
+        Args:
+            values (list): Value of each vertex or edge, by id.
+
+            player_indices (dict): Index of each player.
+
+            kind_indices (dict): Index of each structure key seen so far.
+              Updated with the keys of the given structures.
+
+        Returns:
+            tuple. Arrays of the owner indices and kind indices.
+        """
+
+        owners = array('b', [BoardState.EMPTY]) * len(values)
+        kinds = array('b', [BoardState.EMPTY]) * len(values)
+
+        for slot_id, value in enumerate(values):
+            if not isinstance(value, Structure):
+                continue
+
+            key = GameSnapshot._get_structure_key(value)
+
+            if key not in kind_indices:
+                kind_indices[key] = len(kind_indices)
+
+            owners[slot_id] = player_indices[value.owning_player]
+            kinds[slot_id] = kind_indices[key]
+
+        return owners, kinds
+
+    @staticmethod
+    def _get_structure_key(structure):
+        """Get the config key of a structure's kind, e.g. 'road'."""
+
+        key = getattr(structure, 'prototype_key', None)
+
+        if key is None:
+            # Built from its config values rather than Structure.from_config.
+            key = re.sub(r'\s', '_', structure.name).lower()
+
+        return key
+
+    @staticmethod
+    def _encode_player(player):
+
+        return (
+            player.name,
+            GameSnapshot._encode_resources(player),
+            GameSnapshot._encode_cards(player.development_cards),
+            player.points,
+            player.hidden_points,
+            player.special_points,
+            player.knights,
+            player.longest_road_length,
+            tuple(sorted(player.remaining_structure_counts.items()))
+        )
+
+    @staticmethod
+    def _encode_resources(trading_entity):
+
+        return tuple(trading_entity.resources[resource_type]
+                     for resource_type in GameSnapshot.ARABLE_TYPES)
+
+    @staticmethod
+    def _restore_resources(trading_entity, counts):
+
+        for resource_type, count in zip(GameSnapshot.ARABLE_TYPES, counts):
+            trading_entity.resources[resource_type] = count
+
+    @staticmethod
+    def _encode_deck(cards):
+
+        return tuple(card.prototype_key for card in cards)
+
+    @staticmethod
+    def _encode_cards(cards):
+
+        return tuple((card.prototype_key, card.played, card.is_playable)
+                     for card in cards)
+
+    @staticmethod
+    def _decode_card(card_state):
+
+        key, played, is_playable = card_state
+
+        card = DevelopmentCard.from_config(key)
+        card.played = played
+        card.is_playable = is_playable
+
+        return card
@@ -209,7 +209,7 @@ class InputManager(cmd.Cmd):
 
             try:
                 dev_card = self.game.board.bank.buy_development_card(self.player)
-                dev_card.draw_card()
+                dev_card.draw_card(self.game, self.player)
 
                 success_msg = 'You received a {0}!'.format(str(dev_card))
 
@@ -242,7 +242,7 @@ class InputManager(cmd.Cmd):
                 return
 
             try:
-                dev_card.play_card()
+                dev_card.play_card(self.game, self.player)
                 self.game.update_point_counts()
 
             # TODO: Make clear which exceptions can be caught.
@@ -281,42 +281,21 @@ class InputManager(cmd.Cmd):
     def do_view_structures(self, line):
         """View your vertex and edge structures."""
 
-        edge_structures = []
-        vertex_structures = []
-
-        for x, y in self.game.board.iter_tile_coords():
-            tile = self.game.board.get_tile_with_coords(x, y)
-
-            if not tile:
-                continue
-
-            for edge_dir in EdgeDirection:
-                edge_val = tile.get_edge(edge_dir)
-
-                if isinstance(edge_val, Structure) and \
-                              edge_val.owning_player == self.player:
-
-                    edge_structures.append( (tile, edge_dir, edge_val) )
-
-            for vertex_dir in VertexDirection:
-                vertex_val = tile.get_vertex(vertex_dir)
-
-                if isinstance(vertex_val, Structure) and \
-                              vertex_val.owning_player == self.player:
-                    vertex_structures.append( (tile, vertex_dir, vertex_val) )
-
-        structures = []
+        board = self.game.board
         tups_to_print = []
 
-        for s in edge_structures:
-            if s[2] not in structures:
-                structures.append(s[2])
-                tups_to_print.append(s)
+        # Each edge and vertex is visited once, under its canonical tile.
+        for x, y, edge_dir, edge_val in board.iter_edges():
+            if isinstance(edge_val, Structure) and \
+                          edge_val.owning_player == self.player:
+                tile = board.get_tile_with_coords(x, y)
+                tups_to_print.append( (tile, edge_dir, edge_val) )
 
-        for s in vertex_structures:
-            if s[2] not in structures:
-                structures.append(s[2])
-                tups_to_print.append(s)
+        for x, y, vertex_dir, vertex_val in board.iter_vertices():
+            if isinstance(vertex_val, Structure) and \
+                          vertex_val.owning_player == self.player:
+                tile = board.get_tile_with_coords(x, y)
+                tups_to_print.append( (tile, vertex_dir, vertex_val) )
 
         msg = '\n' + '\n'.join(map(lambda tup: 'Tile: {}\tDirection: {}\tStructure: {}'.format(
             tup[0], tup[1], tup[2].name), tups_to_print))
@@ -534,6 +513,50 @@ class InputManager(cmd.Cmd):
 
         return resource_count_dict
 
+    @staticmethod
+    def prompt_discard_resources(game, player, resources, count):
+        """Prompt the given player to pick resource cards to discard.
+
+        Args:
+            resources (list): The player's resource cards, one entry per card.
+
+            count (int): Number of cards to discard.
+
+        Returns:
+            list. Distinct indices into resources of the cards to discard.
+        """
+
+        msg = "{0}, please enter a comma separated list of the {1} " \
+              "number(s) of the resource card(s) you would like to " \
+              "discard.".format(player.name, count)
+
+        indices = []
+
+        while len(indices) != count:
+
+            for index, resource_type in enumerate(resources):
+                print '({0}) {1}'.format(index + 1, resource_type)
+
+            try:
+                indices = set(
+                    int(index) - 1 for index in
+                    InputManager.input_default(msg).replace(' ', '').split(',')
+                )
+
+                if any(index < 0 or index >= len(resources)
+                       for index in indices):
+                    raise ValueError
+
+            except (ValueError, AttributeError):
+                indices = []
+
+            if len(indices) != count:
+                error_msg = "You must give {0} different numbers between 1 " \
+                            "and {1}.".format(count, len(resources))
+                InputManager.output(error_msg)
+
+        return list(indices)
+
     @staticmethod
     def prompt_select_resource_type():
 
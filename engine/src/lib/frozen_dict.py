@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+
+class FrozenDict(dict):
+    """A dict that can't be modified after creation.
+
+    Used to hand out shared values, e.g. from the compiled Config, which
+    callers could otherwise modify for everybody else.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('{0} is immutable.'.format(self.__class__.__name__))
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @classmethod
+    def freeze(cls, value, memo=None):
+        """Get an immutable copy of value, freezing any nested dicts.
+
+        Values other than dicts are returned as is.
+        """
+
+        if type(value) is not dict:
+            return value
+
+        if memo is None:
+            memo = {}
+
+        frozen = memo.get(id(value))
+
+        if frozen is None:
+            frozen = cls((key, cls.freeze(val, memo))
+                         for key, val in value.iteritems())
+            memo[id(value)] = frozen
+
+        return frozen
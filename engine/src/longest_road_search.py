@@ -1,66 +1,99 @@
 import pdb
+import threading
+from enum import Enum
+
 from engine.src.lib.utils import Utils
 from engine.src.direction.edge_direction import EdgeDirection
+from engine.src.direction.vertex_direction import VertexDirection
 from engine.src.direction.edge_vertex_mapping import EdgeVertexMapping
 from engine.src.structure.structure import Structure
 from engine.src.tile.hex_tile import HexTile
 
 
-global vertices
-global edges
+class LongestRoadSearchContext(object):
+    """EdgeMeta and VertexMeta caches for searches on boards of a topology.
 
+    Metas only describe board geometry, not what is built on the board, so
+    a context is built once per HexTopology, shared by every board with that
+    topology, and never modified afterwards. Contexts can thus be used by
+    several searches at once e.g. from a thread pool. State specific to a
+    single search lives in the LongestRoadSearch itself.
 
-def reset_metas():
-    global vertices
-    global edges
-    vertices = Utils.nested_dict()
-    edges = Utils.nested_dict()
+    Attributes:
+        topology (HexTopology): Topology of the boards this context serves.
 
+        vertices (dict): VertexMeta for each (x, y, VertexDirection) triple.
 
-def find_edge_meta(board, x, y, edge_dir):
-    edge = edges[x][y][edge_dir]
+        edges (dict): EdgeMeta for each (x, y, EdgeDirection) triple. The two
+          triples naming the same edge share a single EdgeMeta.
 
-    if not edge:
-        tile = board.get_tile_with_coords(x, y)
-        if tile:
-            edge = EdgeMeta(board, x, y, edge_dir)
-        else:
-            edge = None
+    Args:
+        topology (HexTopology): See above.
+    """
 
-    return edge
+    # Contexts already built, keyed by topology.
+    _cache = {}
+    _cache_lock = threading.Lock()
 
+    def __init__(self, topology):
 
-def find_vertex_meta(board, x, y, vertex_dir):
-    vertex = vertices[x][y][vertex_dir]
+        self.topology = topology
 
-    if not vertex:
-        tile = board.get_tile_with_coords(x, y)
-        if tile:
-            vertex = VertexMeta(board, x, y, vertex_dir)
-        else:
-            vertex = None
+        self.vertices = {}
+        self.edges = {}
+
+        # Build every meta up front, so that lookups never modify the context.
+        for x, y in topology.tile_coords:
+            for edge_dir in EdgeDirection:
+                if not self.find_edge_meta(x, y, edge_dir):
+                    EdgeMeta(self, x, y, edge_dir)
+
+            for vertex_dir in VertexDirection:
+                VertexMeta(self, x, y, vertex_dir)
+
+        # Vertices can only be linked once all of them exist.
+        for vertex in self.vertices.values():
+            vertex.neighbors = vertex.find_neighbor_equivalents()
+
+    @classmethod
+    def for_topology(cls, topology):
+        """Get the shared context of the given topology, building it once."""
+
+        with cls._cache_lock:
+            context = cls._cache.get(topology)
+
+            if context is None:
+                context = cls(topology)
+                cls._cache[topology] = context
 
-    return vertex
+        return context
+
+    def has_tile(self, x, y):
+        return (x, y) in self.topology.tile_ids
+
+    def find_edge_meta(self, x, y, edge_dir):
+        return self.edges.get((x, y, edge_dir))
+
+    def find_vertex_meta(self, x, y, vertex_dir):
+        return self.vertices.get((x, y, vertex_dir))
 
 
 class VertexMeta(object):
 
-    def __init__(self, board, x, y, vertex_dir):
+    def __init__(self, context, x, y, vertex_dir):
 
-        vertices[x][y][vertex_dir] = self
+        context.vertices[(x, y, vertex_dir)] = self
 
-        self.board = board
+        self.context = context
 
         self.x = x
         self.y = y
-        self.tile = self.board.get_tile_with_coords(self.x, self.y)
 
         self.vertex_dir = vertex_dir
 
+        # Set by the context once every VertexMeta exists.
         self.neighbors = []
 
-        self.neighbors = self.find_neighbor_equivalents()
-
     def find_neighbor_equivalents(self):
 
         neighbors = []
@@ -71,16 +104,16 @@ class VertexMeta(object):
             self.vertex_dir)
 
         for vertex_adj_edge_dir in vertex_adj_edge_dirs:
-            neighbor_x = self.tile.x + vertex_adj_edge_dir[0]
-            neighbor_y = self.tile.y + vertex_adj_edge_dir[1]
-            neighbor_tile = self.board.get_neighboring_tile(self.tile, vertex_adj_edge_dir)
+            neighbor_x = self.x + vertex_adj_edge_dir[0]
+            neighbor_y = self.y + vertex_adj_edge_dir[1]
 
             # Edge tiles may not have neighboring tiles in the given direction.
-            if neighbor_tile:
+            if self.context.has_tile(neighbor_x, neighbor_y):
                 neighbor_vertex_dir = HexTile.get_equivalent_vertex_dir(
                     self.vertex_dir, vertex_adj_edge_dir)
 
-                neighbor = find_vertex_meta(self.board, neighbor_x, neighbor_y, neighbor_vertex_dir)
+                neighbor = self.context.find_vertex_meta(
+                    neighbor_x, neighbor_y, neighbor_vertex_dir)
 
                 neighbors.append(neighbor)
 
@@ -106,25 +139,22 @@ class VertexMeta(object):
 
 class EdgeMeta(object):
 
-    def __init__(self, board, x, y, edge_dir):
+    def __init__(self, context, x, y, edge_dir):
 
-        edges[x][y][edge_dir] = self
-
-        self.board = board
+        context.edges[(x, y, edge_dir)] = self
 
         self.x = x
         self.y = y
-        self.tile = self.board.get_tile_with_coords(self.x, self.y)
 
         self.edge_dir = edge_dir
-        self.edge_val = self.tile.get_edge(self.edge_dir)
 
         # Neighbor equivalent edge meta of same edge.
-        self.neighbor_x = self.tile.x + self.edge_dir[0]
-        self.neighbor_y = self.tile.y + self.edge_dir[1]
+        self.neighbor_x = self.x + self.edge_dir[0]
+        self.neighbor_y = self.y + self.edge_dir[1]
         self.neighbor_edge_dir = self.edge_dir.get_opposite_direction()
 
-        edges[self.neighbor_x][self.neighbor_y][self.neighbor_edge_dir] = self
+        context.edges[(self.neighbor_x, self.neighbor_y,
+                       self.neighbor_edge_dir)] = self
 
     def __str__(self):
         return '({}, {}) {}'.format(self.x, self.y, self.edge_dir)
@@ -148,19 +178,195 @@ class EdgeMeta(object):
         return matches_this or matches_neighbor
 
 
+class LongestRoadSolver(Enum):
+    """Algorithms LongestRoadSearch can use to measure roads.
+
+    META: The original search over EdgeMeta/VertexMeta objects. Ignores
+      opponents' structures blocking a road.
+    BITMASK: find_longest_road_length() over canonical edge ids.
+    """
+
+    META = 'meta'
+    BITMASK = 'bitmask'
+
+    def __str__(self):
+        return '{0}'.format(self.value)
+
+
+def find_longest_road_length(topology, edge_ids, blocked_vertex_ids=()):
+    """Find the length of the longest road made of the given edges.
+
+    A road may revisit vertices but not edges, and may end at, but not pass
+    through, a blocked vertex e.g. one occupied by an opponent's settlement.
+
+    Edges used along a road are tracked in an integer bitmask. Roads are only
+    started from vertices where the road network ends, branches or is
+    blocked, since a longest road starting anywhere else can always be
+    extended or rotated to start at one of those. Only networks made up
+    purely of loops are started from an arbitrary vertex. The search of a
+    network stops early once a road using all of its edges is found.
+
+    Args:
+        topology (HexTopology): Topology of the board the edges belong to.
+
+        edge_ids (iterable): Canonical ids of the edges making up the road
+          network, typically those claimed by a single player.
+
+        blocked_vertex_ids (iterable): Canonical ids of the vertices roads
+          cannot pass through.
+
+    Returns:
+        int. The length of the longest road, 0 if there are no edges.
+    """
+
+    blocked_vertex_ids = frozenset(blocked_vertex_ids)
+
+    # For each vertex, the bit and far endpoint of each edge ending there.
+    adjacencies = {}
+
+    for bit_index, edge_id in enumerate(edge_ids):
+        bit = 1 << bit_index
+        start_id, end_id = topology.edge_vertices[edge_id]
+
+        adjacencies.setdefault(start_id, []).append((bit, end_id))
+        adjacencies.setdefault(end_id, []).append((bit, start_id))
+
+    def extend(vertex_id, used_bits):
+        longest = 0
+
+        for bit, next_vertex_id in adjacencies[vertex_id]:
+            if used_bits & bit:
+                continue
+
+            if next_vertex_id in blocked_vertex_ids:
+                length = 1
+            else:
+                length = 1 + extend(next_vertex_id, used_bits | bit)
+
+            if length > longest:
+                longest = length
+
+        return longest
+
+    longest = 0
+    unvisited_vertex_ids = set(adjacencies)
+
+    while unvisited_vertex_ids:
+        network_vertex_ids = _find_road_network(
+            adjacencies, blocked_vertex_ids, unvisited_vertex_ids.pop())
+        unvisited_vertex_ids.difference_update(network_vertex_ids)
+
+        start_vertex_ids = [
+            vertex_id for vertex_id in network_vertex_ids
+            if len(adjacencies[vertex_id]) != 2 or
+            vertex_id in blocked_vertex_ids
+        ] or [min(network_vertex_ids)]
+
+        edge_count = len(set(
+            bit for vertex_id in network_vertex_ids
+            for bit, _ in adjacencies[vertex_id]
+        ))
+
+        for vertex_id in start_vertex_ids:
+            longest = max(longest, extend(vertex_id, 0))
+
+            if longest >= edge_count:
+                break
+
+    return longest
+
+
+def _find_road_network(adjacencies, blocked_vertex_ids, vertex_id):
+    """Find the vertices connected to the given one by unblocked roads.
+
+    Blocked vertices are included, but not passed through.
+    """
+
+    network_vertex_ids = set([vertex_id])
+    pending = [vertex_id]
+
+    while pending:
+        current_vertex_id = pending.pop()
+
+        if current_vertex_id in blocked_vertex_ids and \
+                current_vertex_id != vertex_id:
+            continue
+
+        for _, next_vertex_id in adjacencies[current_vertex_id]:
+            if next_vertex_id not in network_vertex_ids:
+                network_vertex_ids.add(next_vertex_id)
+                pending.append(next_vertex_id)
+
+    return network_vertex_ids
+
+
 class LongestRoadSearch(object):
+    """Finds the longest road length of every player on a board.
+
+    A search only reads the board and its shared LongestRoadSearchContext,
+    so separate searches may run concurrently.
 
-    def __init__(self, board):
+    Args:
+        board (GameBoard): Board to search.
+
+        solver (LongestRoadSolver): Algorithm to use. Defaults to
+          LongestRoadSolver.BITMASK.
+    """
+
+    def __init__(self, board, solver=LongestRoadSolver.BITMASK):
         self.board = board
+        self.solver = solver
+        self.context = None
 
     def execute(self):
-        reset_metas()
+
+        if self.solver == LongestRoadSolver.BITMASK:
+            return self.find_per_player_road_lengths()
+
+        self.context = LongestRoadSearchContext.for_topology(
+            self.board.topology)
 
         player_claimed_edges_dict = self.find_per_player_claimed_edges()
         player_road_len_dict = self.find_per_player_max_road_lengths(player_claimed_edges_dict)
 
         return player_road_len_dict
 
+    def find_per_player_road_lengths(self):
+        """Find each player's longest road with find_longest_road_length().
+
+        Returns:
+            dict. Keys are players with at least one road, values are the
+              lengths of their longest roads.
+        """
+
+        topology = self.board.topology
+        player_edge_ids = {}
+
+        for edge_id in range(topology.edge_count):
+            edge_val = self.board.get_edge_by_id(edge_id)
+
+            if isinstance(edge_val, Structure):
+                player_edge_ids.setdefault(
+                    edge_val.owning_player, []).append(edge_id)
+
+        player_road_len_dict = {}
+
+        for player, edge_ids in player_edge_ids.iteritems():
+            blocked_vertex_ids = set()
+
+            for edge_id in edge_ids:
+                for vertex_id in topology.edge_vertices[edge_id]:
+                    vertex_val = self.board.get_vertex_by_id(vertex_id)
+
+                    if isinstance(vertex_val, Structure) and \
+                            not vertex_val.owning_player == player:
+                        blocked_vertex_ids.add(vertex_id)
+
+            player_road_len_dict[player] = find_longest_road_length(
+                topology, edge_ids, blocked_vertex_ids)
+
+        return player_road_len_dict
+
     def find_per_player_claimed_edges(self):
 
         player_claimed_edges_dict = Utils.nested_dict()
@@ -180,7 +386,7 @@ class LongestRoadSearch(object):
 
     def add_edge_to_dicts(self, x, y, edge_dir, player_claimed_edges_dict, checked_edges):
 
-        edge_meta = find_edge_meta(self.board, x, y, edge_dir)
+        edge_meta = self.context.find_edge_meta(x, y, edge_dir)
 
         if not edge_meta:
             checked_edges[x][y][edge_dir] = True
@@ -189,8 +395,10 @@ class LongestRoadSearch(object):
         checked_edges[edge_meta.x][edge_meta.y][edge_meta.edge_dir] = True
         checked_edges[edge_meta.neighbor_x][edge_meta.neighbor_y][edge_meta.neighbor_edge_dir] = True
 
-        if isinstance(edge_meta.edge_val, Structure):
-            player = edge_meta.edge_val.owning_player
+        edge_val = self.board.get_edge(x, y, edge_dir)
+
+        if isinstance(edge_val, Structure):
+            player = edge_val.owning_player
 
             if not player_claimed_edges_dict[player]:
                 player_claimed_edges_dict[player] = []
@@ -221,8 +429,8 @@ class LongestRoadSearch(object):
 
             remaining_edges = [e for e in player_claimed_edges if e != edge_meta]
 
-            start_vertex = find_vertex_meta(self.board, edge_meta.x, edge_meta.y, vertex_dirs[0])
-            end_vertex = find_vertex_meta(self.board, edge_meta.x, edge_meta.y, vertex_dirs[1])
+            start_vertex = self.context.find_vertex_meta(edge_meta.x, edge_meta.y, vertex_dirs[0])
+            end_vertex = self.context.find_vertex_meta(edge_meta.x, edge_meta.y, vertex_dirs[1])
 
             road_len = 1 + self.find_max_path_len(remaining_edges, end_vertex, edge_meta) \
                          + self.find_max_path_len(remaining_edges, start_vertex, edge_meta)
@@ -235,7 +443,7 @@ class LongestRoadSearch(object):
     def find_max_path_len(self, remaining_edges, end_vertex, edge_meta):
 
         neighbor_edge_metas = map(
-            lambda edge_tuple: find_edge_meta(self.board, *edge_tuple),
+            lambda edge_tuple: self.context.find_edge_meta(*edge_tuple),
             self.board.get_adjacent_edges(edge_meta.x, edge_meta.y, end_vertex.vertex_dir, False)
         )
 
@@ -250,7 +458,7 @@ class LongestRoadSearch(object):
                 vertices = EdgeVertexMapping.get_vertex_dirs_for_edge_dir(claimed_neighbor.edge_dir)
 
                 vertex_metas = map(
-                    lambda vertex_dir: find_vertex_meta(self.board, claimed_neighbor.x, claimed_neighbor.y, vertex_dir),
+                    lambda vertex_dir: self.context.find_vertex_meta(claimed_neighbor.x, claimed_neighbor.y, vertex_dir),
                     vertices
                 )
 
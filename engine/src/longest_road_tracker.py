@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+from engine.src.board.board_tracker import BoardTracker
+from engine.src.structure.structure import Structure
+from engine.src.longest_road_search import find_longest_road_length
+
+
+class LongestRoadTracker(BoardTracker):
+    """Incrementally maintains the longest road length of every player.
+
+    A player's roads are split into connected components, where two roads
+    are connected if they share a vertex that isn't occupied by an opponent's
+    structure. Whenever a road is placed or removed, or a vertex changes
+    hands, only the components of the affected player around that edge or
+    vertex are rebuilt and re-measured with find_longest_road_length().
+    Per-player lengths are then read in constant time with get_length().
+
+    Attributes:
+        board (GameBoard): See BoardTracker.
+
+        road_owners (dict): Owning player of each claimed edge id.
+
+        components (dict): Connected component (a frozenset of edge ids)
+          containing each claimed edge id.
+
+        component_lengths (dict): Length of the longest road within each
+          component.
+
+        player_components (dict): Set of components of each player.
+
+        lengths (dict): Longest road length of each player that has roads.
+
+    Args:
+        board (GameBoard): See above.
+    """
+
+    def __init__(self, board):
+
+        super(LongestRoadTracker, self).__init__(board)
+
+        self.road_owners = {}
+        self.components = {}
+        self.component_lengths = {}
+        self.player_components = {}
+        self.lengths = {}
+
+        self.rebuild()
+
+    def rebuild(self):
+
+        self.road_owners = {}
+        self.components = {}
+        self.component_lengths = {}
+        self.player_components = {}
+        self.lengths = {}
+
+        for edge_id in range(self.board.topology.edge_count):
+            edge_val = self.board.get_edge_by_id(edge_id)
+
+            if isinstance(edge_val, Structure):
+                self.road_owners[edge_id] = edge_val.owning_player
+
+        for edge_id, player in self.road_owners.items():
+            if edge_id not in self.components:
+                self._update_player(player, [edge_id])
+
+    def get_length(self, player):
+        """Get the length of the given player's longest road."""
+
+        return self.lengths.get(player, 0)
+
+    def get_lengths(self):
+        """Get the longest road length of every player that has roads.
+
+        Returns:
+            dict. Keys are players and values are road lengths.
+        """
+
+        return dict(self.lengths)
+
+    def on_edge_changed(self, edge_id, old_value, new_value):
+
+        old_owner = self.road_owners.pop(edge_id, None)
+
+        if old_owner is not None:
+            component = self.components[edge_id]
+            self._drop_component(old_owner, component)
+            self._update_player(old_owner, component - frozenset([edge_id]))
+
+        if isinstance(new_value, Structure):
+            self.road_owners[edge_id] = new_value.owning_player
+            self._update_player(new_value.owning_player, [edge_id])
+
+    def on_vertex_changed(self, vertex_id, old_value, new_value):
+
+        old_owner = self._get_vertex_owner(old_value)
+        new_owner = self._get_vertex_owner(new_value)
+
+        # Upgrades e.g. settlement to city block the same players as before.
+        if old_owner is not None and new_owner is not None and \
+                old_owner == new_owner:
+            return
+
+        player_edges = {}
+
+        for edge_id in self.board.topology.vertex_edges[vertex_id]:
+            player = self.road_owners.get(edge_id)
+
+            if player is not None:
+                player_edges.setdefault(player, []).append(edge_id)
+
+        for player, edge_ids in player_edges.items():
+            self._update_player(player, edge_ids)
+
+    @staticmethod
+    def _get_vertex_owner(vertex_val):
+
+        if isinstance(vertex_val, Structure):
+            return vertex_val.owning_player
+
+        return None
+
+    def _is_road_of(self, player, edge_id):
+        """Whether the given edge is claimed by player."""
+
+        return edge_id in self.road_owners and \
+            self.road_owners[edge_id] == player
+
+    def _is_blocked(self, player, vertex_id):
+        """Whether the given vertex is occupied by an opponent of player."""
+
+        owner = self._get_vertex_owner(self.board.get_vertex_by_id(vertex_id))
+
+        return owner is not None and not owner == player
+
+    def _update_player(self, player, seed_edge_ids):
+        """Rebuild the components of player reachable from the given edges.
+
+        Any existing component touched along the way is dropped, and its
+        edges are rebuilt as well, since it may have been split or merged.
+        """
+
+        pending = list(seed_edge_ids)
+        seen = set()
+
+        while pending:
+            edge_id = pending.pop()
+
+            if edge_id in seen or not self._is_road_of(player, edge_id):
+                continue
+
+            component = self._find_component(player, edge_id)
+            seen.update(component)
+
+            for component_edge_id in component:
+                old_component = self.components.get(component_edge_id)
+
+                if old_component is not None:
+                    self._drop_component(player, old_component)
+                    pending.extend(old_component)
+
+            self._add_component(player, component)
+
+        self._update_length(player)
+
+    def _find_component(self, player, edge_id):
+        """Find the edges of player connected to the given edge."""
+
+        topology = self.board.topology
+
+        component = set([edge_id])
+        pending = [edge_id]
+
+        while pending:
+            current_edge_id = pending.pop()
+
+            for vertex_id in topology.edge_vertices[current_edge_id]:
+                if self._is_blocked(player, vertex_id):
+                    continue
+
+                for adjacent_edge_id in topology.vertex_edges[vertex_id]:
+                    if adjacent_edge_id not in component and \
+                            self._is_road_of(player, adjacent_edge_id):
+                        component.add(adjacent_edge_id)
+                        pending.append(adjacent_edge_id)
+
+        return frozenset(component)
+
+    def _add_component(self, player, component):
+
+        for edge_id in component:
+            self.components[edge_id] = component
+
+        self.component_lengths[component] = \
+            self._find_longest_path(player, component)
+        self.player_components.setdefault(player, set()).add(component)
+
+    def _drop_component(self, player, component):
+
+        for edge_id in component:
+            if self.components.get(edge_id) is component:
+                del self.components[edge_id]
+
+        self.component_lengths.pop(component, None)
+        self.player_components.get(player, set()).discard(component)
+
+    def _update_length(self, player):
+
+        components = self.player_components.get(player)
+
+        if components:
+            self.lengths[player] = max(self.component_lengths[component]
+                                       for component in components)
+        else:
+            self.player_components.pop(player, None)
+            self.lengths.pop(player, None)
+
+    def _find_longest_path(self, player, component):
+        """Find the length of the longest road within the given component."""
+
+        topology = self.board.topology
+
+        blocked_vertex_ids = set(
+            vertex_id for edge_id in component
+            for vertex_id in topology.edge_vertices[edge_id]
+            if self._is_blocked(player, vertex_id)
+        )
+
+        return find_longest_road_length(topology, component,
+                                        blocked_vertex_ids)
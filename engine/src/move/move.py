@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+import re
+
+from engine.src.exceptions import *
+from engine.src.position_type import PositionType
+from engine.src.structure.structure import Structure
+from engine.src.trading.trade_offer import TradeOffer
+
+
+class Move(object):
+    """A change to a game that an UndoLog can apply and take back.
+
+    Subclasses implement apply(), making every change through the given
+    UndoLog's methods, and raising the same exceptions the corresponding Game
+    or InputManager action would if the move is illegal. The log undoes any
+    changes made before the exception.
+    """
+
+    def apply(self, game, log):
+        """Apply this move to the given game, through the given UndoLog."""
+        raise NotImplementedError
+
+
+class BuildMove(Move):
+    """Build a structure, as Game.place_structure() does.
+
+    Takes the structure from the player's stock, pays for it unless free,
+    places it, and awards its points.
+
+    Attributes:
+        player (Player): Player building.
+
+        structure_name (str): Name of the structure to build, e.g. 'Road'.
+
+        position_id (int): Id of the vertex or edge to build on, depending on
+          the structure's position type. See HexTopology.
+
+        free_to_build (bool): Whether the structure costs nothing, e.g.
+          during the initial placement stage.
+
+        must_border_claimed_edge (bool): See Game.place_structure().
+
+    Args:
+        See above.
+    """
+
+    def __init__(self, player, structure_name, position_id,
+                 free_to_build=False, must_border_claimed_edge=True):
+
+        self.player = player
+        self.structure_name = structure_name
+        self.position_id = position_id
+        self.free_to_build = free_to_build
+        self.must_border_claimed_edge = must_border_claimed_edge
+
+    def __repr__(self):
+        return 'BuildMove({0}, {1}, {2})'.format(
+            self.player, self.structure_name, self.position_id)
+
+    def apply(self, game, log):
+
+        player = self.player
+        board = game.board
+        topology = board.topology
+
+        structure_count = player.remaining_structure_counts[
+            self.structure_name]
+
+        if not structure_count:
+            raise NotEnoughStructuresException(player, self.structure_name)
+
+        log.set_item(player.remaining_structure_counts, self.structure_name,
+                     structure_count - 1)
+
+        structure = Structure.from_config(
+            player, re.sub(r'\s', '_', self.structure_name).lower())
+
+        if not self.free_to_build:
+            trade_offer = TradeOffer(structure.cost, {})
+            obstructing_entity, obstructing_resource_type = \
+                trade_offer.validate(player, board.bank)
+
+            if obstructing_entity:
+                raise NotEnoughResourcesException(obstructing_entity,
+                                                  obstructing_resource_type)
+
+            log.transfer_resources(player, board.bank, structure.cost)
+
+        if structure.position_type == PositionType.VERTEX:
+            x, y, position_dir = topology.vertex_coords[self.position_id]
+            old_value = board.get_vertex_by_id(self.position_id)
+        else:
+            x, y, position_dir = topology.edge_coords[self.position_id]
+            old_value = board.get_edge_by_id(self.position_id)
+
+        board.validate_structure_placement(
+            x, y, old_value, structure, position_dir,
+            self.must_border_claimed_edge, None, None, None)
+
+        if structure.position_type == PositionType.VERTEX:
+            log.update_vertex(self.position_id, structure)
+        else:
+            log.update_edge(self.position_id, structure)
+
+        log.set_attr(player, 'points',
+                     player.points + structure.get_point_gain())
+
+
+class TradeMove(Move):
+    """Trade resources with the bank or another player.
+
+    Attributes:
+        player (Player): Player proposing the trade.
+
+        offered_resources (dict): Counts by resource type the player gives.
+
+        requested_resources (dict): Counts by resource type the player gets.
+
+        partner (TradingEntity): Who the player trades with. Defaults to the
+          game's bank.
+
+    Args:
+        See above.
+    """
+
+    def __init__(self, player, offered_resources, requested_resources,
+                 partner=None):
+
+        self.player = player
+        self.offered_resources = offered_resources
+        self.requested_resources = requested_resources
+        self.partner = partner
+
+    def __repr__(self):
+        return 'TradeMove({0}, {1}, {2})'.format(
+            self.player, self.offered_resources, self.requested_resources)
+
+    def apply(self, game, log):
+
+        partner = self.partner if self.partner is not None else \
+            game.board.bank
+
+        trade_offer = TradeOffer(self.offered_resources,
+                                 self.requested_resources)
+        obstructing_entity, obstructing_resource_type = \
+            trade_offer.validate(self.player, partner)
+
+        if obstructing_entity is not None:
+            raise NotEnoughResourcesException(obstructing_entity,
+                                              obstructing_resource_type)
+
+        log.transfer_resources(self.player, partner,
+                               trade_offer.offered_resources)
+        log.transfer_resources(partner, self.player,
+                               trade_offer.requested_resources)
+
+
+class RobberMove(Move):
+    """Move the robber and steal a resource, as Robber.outside_trigger_effect().
+
+    Attributes:
+        player (Player): Player moving the robber.
+
+        tile_id (int): Id of the tile to move the robber to. See HexTopology.
+
+        victim (Player): Player to steal a resource from, if any.
+
+        resource_type (ResourceType): Resource to steal. Drawn at random
+          from the victim's resources with the game's rng if not given, as
+          the robber does.
+
+    Args:
+        See above.
+    """
+
+    def __init__(self, player, tile_id, victim=None, resource_type=None):
+
+        self.player = player
+        self.tile_id = tile_id
+        self.victim = victim
+        self.resource_type = resource_type
+
+    def __repr__(self):
+        return 'RobberMove({0}, {1}, {2})'.format(self.player, self.tile_id,
+                                                  self.victim)
+
+    def apply(self, game, log):
+
+        board = game.board
+        x, y = board.topology.tile_coords[self.tile_id]
+        tile = board.tiles[x][y]
+
+        if game.robber in tile.calamities:
+            raise InvalidRobberPlacementException()
+
+        log.move_calamity(game.robber, tile)
+
+        if self.victim is None:
+            return
+
+        resource_type = self.resource_type
+
+        if resource_type is None:
+            resources = self.victim.get_resource_list()
+
+            if not resources:
+                raise NotEnoughResourcesException(self.victim, [])
+
+            resource_type = game.rng.choice(resources)
+
+        log.withdraw_resources(self.victim, resource_type, 1)
+        log.deposit_resources(self.player, resource_type, 1)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+
+class UndoLog(object):
+    """Applies moves to a game, recording how to undo each of their changes.
+
+    Moves only change the game through the methods below, each of which
+    makes one change and logs the call undoing it. apply() returns a token
+    marking the log's position before the move, and undo() unwinds the log
+    back to a token, newest change first. Both cost O(changes), so a search
+    can go down and back up a line of moves without snapshotting the whole
+    game. Board changes go through GameBoard.update_vertex_by_id() and
+    friends, so the board's trackers follow along in both directions.
+
+    Tokens must be undone in the reverse order they were given out, as a
+    depth first search naturally does.
+
+    Attributes:
+        game (Game): The game moves are applied to.
+
+        entries (list): (func, args) call undoing each change, oldest first.
+
+    Args:
+        game (Game): See above.
+    """
+
+    def __init__(self, game):
+
+        self.game = game
+        self.entries = []
+
+    def apply(self, move):
+        """Apply the given move, or none of it.
+
+        Args:
+            move (Move): Move to apply.
+
+        Returns:
+            int. Token to pass undo() to take the move back.
+
+        Raises:
+            Whatever the move raises if it is illegal, e.g.
+              NotEnoughResourcesException, after undoing any changes it made
+              up to that point.
+        """
+
+        token = len(self.entries)
+
+        try:
+            move.apply(self.game, self)
+        except Exception:
+            self.undo(token)
+            raise
+
+        return token
+
+    def undo(self, token):
+        """Undo every change made since apply() returned the given token.
+
+        Raises:
+            ValueError. If the changes since the token were already undone.
+        """
+
+        if token > len(self.entries):
+            raise ValueError('Undo log token {0} was already undone'.format(
+                token))
+
+        entries = self.entries
+
+        while len(entries) > token:
+            func, args = entries.pop()
+            func(*args)
+
+    def update_vertex(self, vertex_id, vertex_val):
+        """Replace the value of the vertex with the given id."""
+
+        board = self.game.board
+
+        self.entries.append((board.update_vertex_by_id,
+                             (vertex_id, board.get_vertex_by_id(vertex_id))))
+        board.update_vertex_by_id(vertex_id, vertex_val)
+
+    def update_edge(self, edge_id, edge_val):
+        """Replace the value of the edge with the given id."""
+
+        board = self.game.board
+
+        self.entries.append((board.update_edge_by_id,
+                             (edge_id, board.get_edge_by_id(edge_id))))
+        board.update_edge_by_id(edge_id, edge_val)
+
+    def withdraw_resources(self, trading_entity, resource_type,
+                           resource_count):
+        """See TradingEntity.withdraw_resources()."""
+
+        trading_entity.withdraw_resources(resource_type, resource_count)
+        self.entries.append((trading_entity.deposit_resources,
+                             (resource_type, resource_count)))
+
+    def deposit_resources(self, trading_entity, resource_type,
+                          resource_count):
+        """See TradingEntity.deposit_resources()."""
+
+        trading_entity.deposit_resources(resource_type, resource_count)
+        self.entries.append((trading_entity.withdraw_resources,
+                             (resource_type, resource_count)))
+
+    def transfer_resources(self, from_entity, to_entity, resources):
+        """Move the given resources from one entity to another.
+
+        Args:
+            resources (dict): Counts by resource type.
+        """
+
+        for resource_type, count in resources.iteritems():
+            if count:
+                self.withdraw_resources(from_entity, resource_type, count)
+                self.deposit_resources(to_entity, resource_type, count)
+
+    def set_attr(self, obj, name, value):
+        """Set an attribute of an object, e.g. a player's points."""
+
+        self.entries.append((setattr, (obj, name, getattr(obj, name))))
+        setattr(obj, name, value)
+
+    def set_item(self, dct, key, value):
+        """Set an existing entry of a dict, e.g. a player's structure count."""
+
+        self.entries.append((dct.__setitem__, (key, dct[key])))
+        dct[key] = value
+
+    def move_calamity(self, calamity, tile):
+        """Move a calamity, e.g. the robber, from whichever tile it's on."""
+
+        old_tile = self.game.board.find_tile_with_calamity(calamity)
+
+        self.entries.append((UndoLog._place_calamity,
+                             (calamity, tile, old_tile)))
+        UndoLog._place_calamity(calamity, old_tile, tile)
+
+    @staticmethod
+    def _place_calamity(calamity, old_tile, new_tile):
+
+        if old_tile is not None:
+            old_tile.remove_calamity(calamity)
+
+        if new_tile is not None:
+            new_tile.add_calamity(calamity)
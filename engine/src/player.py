@@ -6,6 +6,8 @@ from engine.src.structure.structure import Structure
 from engine.src.trading.trading_entity import TradingEntity
 from engine.src.exceptions import NotEnoughStructuresException
 
+PLAYER_BUILT_STRUCTURES = Config.accessor('game.structure.player_built')
+
 
 class Player(TradingEntity):
     """A player in a game of Settlers of Catan.
@@ -50,7 +52,7 @@ class Player(TradingEntity):
 
         self.remaining_structure_counts = {}
 
-        for structure in Config.get('game.structure.player_built').values():
+        for structure in PLAYER_BUILT_STRUCTURES.get().values():
             self.remaining_structure_counts[structure['name']] = structure['count']
 
     def get_total_points(self):
@@ -83,11 +85,9 @@ class Player(TradingEntity):
         if structure_count > 0:
             self.remaining_structure_counts[structure_name] -= 1
 
-            structure_name = re.sub(r'\s', '_', structure_name).lower()
-            config_path = 'game.structure.player_built.' + structure_name
-            structure_dict = Config.get(config_path)
+            structure_key = re.sub(r'\s', '_', structure_name).lower()
 
-            return Structure(self, **structure_dict)
+            return Structure.from_config(self, structure_key)
         else:
             raise NotEnoughStructuresException(self, structure_name)
 
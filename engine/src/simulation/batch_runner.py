@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import multiprocessing
+
+from engine.src.simulation.headless_driver import HeadlessDriver
+
+# Driver of the current worker process. See _init_worker().
+_worker_driver = None
+
+
+def _init_worker(driver):
+    global _worker_driver
+    _worker_driver = driver
+
+
+def _play(seed):
+    return _worker_driver.play(seed)
+
+
+class BatchRunner(object):
+    """Plays batches of headless games across a pool of processes.
+
+    Every game is played by the same HeadlessDriver, once per seed. Since a
+    game is fully determined by its seed, results do not depend on how games
+    are spread across processes, and any one game can be replayed on its own
+    with driver.play(seed).
+
+    Attributes:
+        driver (HeadlessDriver): Driver playing each game.
+
+        processes (int): Number of worker processes. Defaults to the number of
+          cores. With a single process, games are played in this process.
+
+        chunksize (int): Number of seeds handed to a worker at a time.
+
+    Args:
+        See above.
+    """
+
+    def __init__(self, driver=None, processes=None, chunksize=1):
+
+        self.driver = driver if driver is not None else HeadlessDriver()
+        self.processes = processes if processes is not None else \
+            multiprocessing.cpu_count()
+        self.chunksize = chunksize
+
+    def run(self, seeds):
+        """Play one game per seed, yielding results as games complete.
+
+        Args:
+            seeds (iterable): Seed of each game to play.
+
+        Returns:
+            generator. Of GameResults, in order of completion rather than in
+              order of seeds.
+        """
+
+        if self.processes == 1:
+            for seed in seeds:
+                yield self.driver.play(seed)
+            return
+
+        # Each worker receives the driver once, rather than with every seed.
+        pool = multiprocessing.Pool(self.processes, _init_worker,
+                                    (self.driver,))
+
+        try:
+            for result in pool.imap_unordered(_play, seeds, self.chunksize):
+                yield result
+
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    def run_games(self, game_count, first_seed=0):
+        """Play game_count games, seeded with consecutive integers.
+
+        Returns:
+            generator. See run().
+        """
+
+        return self.run(xrange(first_seed, first_seed + game_count))
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+
+class GameResult(object):
+    """Outcome of a game played to completion, or to its turn limit.
+
+    Only holds plain values keyed by player name, so results can be pickled,
+    e.g. to send them between processes, and compared across replays.
+
+    Attributes:
+        seed (int): Seed the game was played with.
+
+        winner (str): Name of the winning player, or None if the game hit its
+          turn limit before anybody won.
+
+        turn_count (int): Number of player turns played.
+
+        points (dict): Total points of each player, by name.
+
+        resources (dict): Resource cards held by each player at the end of
+          the game, by name. Values are dicts from resource type values e.g.
+          'ore' to counts.
+    """
+
+    def __init__(self, seed, winner, turn_count, points, resources):
+
+        self.seed = seed
+        self.winner = winner
+        self.turn_count = turn_count
+        self.points = points
+        self.resources = resources
+
+    def __eq__(self, other):
+        return isinstance(other, GameResult) and \
+            self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'GameResult(seed={0}, winner={1}, turn_count={2})'.format(
+            self.seed, self.winner, self.turn_count)
+
+    @classmethod
+    def from_game(cls, game, seed, winner):
+        """Record the current state of the given game.
+
+        Args:
+            game (Game): Game to record.
+
+            seed (int): See above.
+
+            winner (Player): Winning player, if any.
+        """
+
+        points = {}
+        resources = {}
+
+        for player in game.players:
+            points[player.name] = player.get_total_points()
+            resources[player.name] = dict(
+                (resource_type.value, count)
+                for resource_type, count in player.resources.items())
+
+        return cls(seed, winner.name if winner is not None else None,
+                   game.turn_count, points, resources)
+
+    def to_dict(self):
+        return {
+            'seed': self.seed,
+            'winner': self.winner,
+            'turn_count': self.turn_count,
+            'points': self.points,
+            'resources': self.resources,
+        }
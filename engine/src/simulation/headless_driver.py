@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+import random
+
+from engine.src.agent.random_agent import RandomAgent
+from engine.src.board.board_state import BoardStorage
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.game import Game
+from engine.src.simulation.game_result import GameResult
+from engine.src.simulation.headless_input_manager import \
+    HeadlessInputManager
+
+
+class HeadlessDriver(object):
+    """Plays complete games between agents, without any user interaction.
+
+    Each game follows the same stages as Game.start(): initial placement,
+    then turns of rolling the dice and letting the current player's agent
+    act, until somebody reaches the configured number of points.
+
+    Attributes:
+        config (dict): Game config to play with. See game_config.
+
+        agent_cls (type): Agent subclass playing each seat. Called with a
+          random.Random seeded from the game's seed.
+
+        player_count (int): Number of players. Defaults to the config's
+          player count.
+
+        max_turns (int): Number of player turns after which a game is
+          abandoned without a winner.
+
+    Args:
+        See above.
+    """
+
+    DEFAULT_MAX_TURNS = 1000
+
+    def __init__(self, config=None, agent_cls=RandomAgent, player_count=None,
+                 max_turns=DEFAULT_MAX_TURNS):
+
+        self.config = config if config is not None else game_config
+        self.agent_cls = agent_cls
+        self.player_count = player_count
+        self.max_turns = max_turns
+
+    def play(self, seed):
+        """Play a game from start to finish.
+
+        The game is fully determined by its seed, config and agents, so the
+        same seed always gives the same result.
+
+        Args:
+            seed (int): Seed for the board layout, dice, development card deck
+              and agents' choices.
+
+        Returns:
+            GameResult. Outcome of the game.
+        """
+
+        game = self.create_game(seed)
+        winner = self.play_game(game, game.input_manager.agents)
+
+        return GameResult.from_game(game, seed, winner)
+
+    def create_game(self, seed, storage=BoardStorage.TILES,
+                    player_names=None):
+        """Create a game whose players are created but not placed, each
+        played by an agent of agent_cls.
+
+        Args:
+            seed (int): See play().
+
+            storage (BoardStorage): How the game's board stores structures.
+
+            player_names (list): Names of the players. Defaults to 'p1',
+              'p2', etc., player_count of them.
+
+        Returns:
+            Game. Its input manager is a HeadlessInputManager holding the
+              agents.
+        """
+
+        Config.config = self.config
+
+        # The game and each agent get their own stream, all derived from the
+        # seed, so no state is shared with other games in the same process.
+        rng = random.Random(seed)
+
+        input_manager = HeadlessInputManager()
+        game = Game(input_manager, random.Random(rng.getrandbits(32)),
+                    storage)
+        input_manager.game = game
+
+        if player_names is None:
+            player_count = self.player_count
+            if player_count is None:
+                player_count = Config.get('game.player_count')
+
+            player_names = ['p{0}'.format(index + 1)
+                            for index in range(player_count)]
+
+        game.create_players(list(player_names))
+
+        for player in game.players:
+            input_manager.agents[player] = \
+                self.agent_cls(random.Random(rng.getrandbits(32)))
+
+        return game
+
+    def play_game(self, game, agents):
+        """Play the given game, whose players are created but not placed.
+
+        Args:
+            game (Game): Game to play.
+
+            agents (dict): Agent of each of the game's players.
+
+        Returns:
+            Player. The winner, or None if the game hit the turn limit.
+        """
+
+        points_to_win = Config.get('game.points_to_win')
+
+        game.initial_settlement_and_road_placement()
+
+        while game.turn_count < self.max_turns:
+            for player in game.players:
+                self._play_turn(game, agents[player], player)
+
+                if player.get_total_points() >= points_to_win:
+                    return player
+
+                if game.turn_count >= self.max_turns:
+                    break
+
+        return None
+
+    def play_turns(self, game, turn_count):
+        """Play the next turn_count turns of the given game, regardless of
+        who reaches the points to win, e.g. to set up a position.
+
+        Args:
+            game (Game): Game whose players are placed, and whose input
+              manager holds their agents.
+
+            turn_count (int): Number of player turns to play.
+        """
+
+        for _ in range(turn_count):
+            player = game.players[game.turn_count % len(game.players)]
+            self._play_turn(game, game.input_manager.agents[player], player)
+
+    def _play_turn(self, game, agent, player):
+
+        game.begin_turn(player)
+        game.roll_dice()
+
+        agent.play_turn(game, player)
+        game.update_point_counts()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+
+class HeadlessInputManager(object):
+    """Stands in for InputManager in games played by agents.
+
+    Every prompt the game, its cards or its calamities would give a human is
+    instead answered by the agent of the game's current player, and every
+    announcement is dropped, so games never touch stdin or stdout.
+
+    Attributes:
+        game (Game): The game being played. Set once the game is created.
+
+        agents (dict): Agent making the decisions of each player.
+
+    Args:
+        agents (dict): See above.
+    """
+
+    def __init__(self, agents=None):
+
+        self.game = None
+        self.agents = agents if agents is not None else {}
+
+    def get_agent(self):
+        """Get the agent of the game's current player."""
+
+        return self.agents[self.game.current_player]
+
+    def output(self, msg):
+        pass
+
+    def input_default(self, msg, default=None, read_result=True):
+        return default
+
+    def prompt_select_player(self, game, players=None):
+
+        if players is None:
+            players = game.players
+
+        return self.get_agent().choose_player(game, game.current_player,
+                                              players)
+
+    def prompt_tile_coordinates(self, game):
+        return self.get_agent().choose_tile(game, game.current_player)
+
+    def prompt_select_list_value(self, prompt_msg, display_list,
+                                 value_list=None):
+
+        if len(display_list) == 0:
+            return None
+
+        if value_list is None:
+            value_list = display_list
+
+        return self.get_agent().choose_list_value(
+            self.game, self.game.current_player, value_list)
+
+    def prompt_discard_resources(self, game, player, resources, count):
+        return self.agents[player].choose_discards(game, player, resources,
+                                                   count)
+
+    def prompt_select_resource_type(self):
+        return self.get_agent().choose_resource_type(
+            self.game, self.game.current_player)
+
+    def prompt_vertex_placement(self, game):
+        return self.get_agent().choose_vertex_placement(
+            game, game.current_player)
+
+    def prompt_edge_placement(self, game):
+        return self.get_agent().choose_edge_placement(
+            game, game.current_player)
+
+    def announce_roll_value(self, roll_value):
+        pass
+
+    def announce_initial_structure_placement_stage(self):
+        pass
+
+    def announce_player_turn(self, player):
+        pass
+
+    def announce_structure_placement(self, player, structure_name):
+        pass
+
+    def announce_development_card_played(self, player, development_card):
+        pass
+
+    def announce_resource_distributions(self, distributions):
+        pass
+
+    def announce_trade_completed(self, trade_offer):
+        pass
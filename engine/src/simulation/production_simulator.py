@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from engine.src.dice import Dice
+from engine.src.resource_type import ResourceType
+
+
+class ProductionDistribution(object):
+    """Resource income of every player of a batch of games over some turns.
+
+    Arrays are indexed by game, then player, in the order of each game's
+    players, then resource type, in resource_types order.
+
+    Attributes:
+        turn_count (int): Number of turns income was accumulated over.
+
+        trial_count (int): Number of simulated sequences of rolls.
+
+        threshold (int): Income of a resource type turns_to_threshold counts
+          the turns to.
+
+        resource_types (list): Resource type of each index of the last axis.
+
+        expected_income (numpy.ndarray): Expected total income over
+          turn_count turns. Exact, from the roll probabilities.
+
+        income_variance (numpy.ndarray): Variance of the total income over
+          turn_count turns. Exact, from the roll probabilities.
+
+        turns_to_threshold (numpy.ndarray): Mean number of turns until the
+          total income reaches threshold, over the trials. Trials that don't
+          get there within turn_count turns count as turn_count + 1, so this
+          is a lower bound wherever threshold_probability is below 1.
+
+        threshold_probability (numpy.ndarray): Fraction of the trials in
+          which the total income reaches threshold within turn_count turns.
+    """
+
+    def __init__(self, turn_count, trial_count, threshold, resource_types,
+                 expected_income, income_variance, turns_to_threshold,
+                 threshold_probability):
+
+        self.turn_count = turn_count
+        self.trial_count = trial_count
+        self.threshold = threshold
+        self.resource_types = resource_types
+        self.expected_income = expected_income
+        self.income_variance = income_variance
+        self.turns_to_threshold = turns_to_threshold
+        self.threshold_probability = threshold_probability
+
+
+class ProductionSimulator(object):
+    """Simulates the resource income of the players of many games at once.
+
+    Each game's board is reduced to a table of what every player receives on
+    every roll value, taken from its ProductionTracker, so a batch of rolls
+    becomes a single lookup into the table rather than a dice roll and a
+    resource distribution per turn. Every game is played against the same
+    rolls, so differences between boards aren't drowned out by the dice.
+
+    Only the board's production counts: the robber stays put, 7s yield
+    nothing, and the bank never runs out. Needs numpy.
+
+    Attributes:
+        dice (Dice): Dice rolled every turn. Its rng seeds the batches.
+
+    Args:
+        dice (Dice): See above. Defaults to a standard pair of dice.
+    """
+
+    DEFAULT_TRIAL_COUNT = 1000
+
+    def __init__(self, dice=None):
+
+        if numpy is None:
+            raise ImportError('ProductionSimulator needs numpy')
+
+        self.dice = dice if dice is not None else Dice()
+
+    def get_production_table(self, game):
+        """Get what each of a game's players receives on each roll value.
+
+        Returns:
+            numpy.ndarray. Indexed by roll value, player and resource type,
+              as in ProductionDistribution.
+        """
+
+        resource_types = ResourceType.get_arable_types()
+        max_roll_value = self.dice.dice_count * max(self.dice.values)
+
+        # Per roll production is small. simulate() widens totals as needed.
+        table = numpy.zeros((max_roll_value + 1, len(game.players),
+                             len(resource_types)), dtype=numpy.int16)
+
+        production = game.board.production_tracker.production
+
+        for roll_value, players in production.iteritems():
+            if roll_value > max_roll_value:
+                continue
+
+            for player_index, player in enumerate(game.players):
+                resources = players.get(player, {})
+
+                for type_index, resource_type in enumerate(resource_types):
+                    table[roll_value, player_index, type_index] = \
+                        resources.get(resource_type, 0)
+
+        return table
+
+    def simulate(self, games, turn_count, trial_count=DEFAULT_TRIAL_COUNT,
+                 threshold=1):
+        """Simulate the income of every player of the given games.
+
+        Args:
+            games (list): Games whose boards to simulate, with the same number
+              of players each.
+
+            turn_count (int): Number of turns to accumulate income over.
+
+            trial_count (int): Number of sequences of turn_count rolls to
+              simulate, shared by every game.
+
+            threshold (int): Income of a resource type to count the turns to.
+
+        Returns:
+            ProductionDistribution.
+
+        Raises:
+            ValueError. If the games have different numbers of players.
+        """
+
+        if len(set(len(game.players) for game in games)) > 1:
+            raise ValueError('Games to simulate have different numbers of '
+                             'players')
+
+        tables = numpy.array([self.get_production_table(game)
+                              for game in games])
+
+        roll_probabilities = self.dice.get_roll_probabilities()
+        probabilities = numpy.zeros(tables.shape[1])
+        for roll_value, probability in roll_probabilities.iteritems():
+            probabilities[roll_value] = probability
+
+        # Turns are independent, so per turn moments scale with turn_count.
+        mean = numpy.tensordot(probabilities, tables, axes=([0], [1]))
+        second_moment = numpy.tensordot(probabilities, tables ** 2,
+                                        axes=([0], [1]))
+
+        expected_income = turn_count * mean
+        income_variance = turn_count * (second_moment - mean ** 2)
+
+        rolls = self.dice.roll_batch((trial_count, turn_count))
+
+        turns_to_threshold = numpy.zeros(mean.shape)
+        threshold_probability = numpy.zeros(mean.shape)
+
+        # The smallest type that fits the largest possible total and the
+        # threshold, since the totals of every trial and turn take the most
+        # memory by far.
+        max_income = max(turn_count * int(tables.max()) if tables.size else 0,
+                         abs(threshold))
+        income_dtype = numpy.promote_types(
+            tables.dtype, numpy.min_scalar_type(max_income))
+
+        # A game at a time, since a trial x turn x player x resource type
+        # array for every game at once rarely fits in memory.
+        for game_index, table in enumerate(tables):
+            income = table[rolls].cumsum(axis=1, dtype=income_dtype)
+            reached = income >= threshold
+
+            reached_any = reached.any(axis=1)
+            turns = numpy.where(reached_any, reached.argmax(axis=1) + 1,
+                                turn_count + 1)
+
+            turns_to_threshold[game_index] = turns.mean(axis=0)
+            threshold_probability[game_index] = reached_any.mean(axis=0)
+
+        return ProductionDistribution(
+            turn_count, trial_count, threshold,
+            ResourceType.get_arable_types(), expected_income, income_variance,
+            turns_to_threshold, threshold_probability)
@@ -1,9 +1,19 @@
 # -*- coding: utf-8 -*-
+import re
+
 from engine.src.config.config import Config
+from engine.src.config.prototype_registry import PrototypeRegistry
 from engine.src.lib.utils import Utils
 
 class Structure(object):
-    """
+    """A structure a player builds on a vertex or edge, e.g. a road.
+
+    Structures of the same kind and owner must be interchangeable: besides
+    its owner, a structure shouldn't hold any state of its own, e.g. set
+    after placement. Boards using BoardStorage.ARRAYS only store the owner
+    and kind of each placed structure, and read every slot holding that pair
+    back as the first such structure placed. See BoardState.
+
     Attributes:
         owning_player
         name
@@ -23,13 +33,54 @@ class Structure(object):
 
         self.owning_player = owning_player
 
+    @classmethod
+    def from_config(cls, owning_player, structure_key):
+        """Create a structure of a kind defined in the config.
+
+        Cheaper than passing the config values to the constructor: they're
+        shared by every structure of the kind. See PrototypeRegistry.
+
+        Args:
+            owning_player (Player): Player owning the new structure.
+
+            structure_key (str): Key of the structure's config, e.g. 'road'.
+
+        Returns:
+            Structure.
+        """
+
+        return Structure.prototypes.new(structure_key, owning_player)
+
+    def init_instance(self, owning_player):
+        self.owning_player = owning_player
+
     def augments(self):
         if self.is_augmenting_structure():
             return self.upgrades if self.upgrades else self.extends
         return None
 
+    def get_point_gain(self):
+        """Get the points the owner gains by building this structure.
+
+        An augmenting structure, e.g. a city, replaces the structure it
+        augments, whose points its owner loses.
+        """
+
+        if not self.augments():
+            return self.point_value
+
+        # TODO: conversions from camelcase to underscore
+        augments = re.sub(r'\s', '_', self.augments()).lower()
+
+        return self.point_value - Config.get(
+            'game.structure.player_built.' + augments + '.point_value')
+
     def is_augmenting_structure(self):
         return bool(self.extends or self.upgrades)
 
     def __str__(self):
         return '{} owned by {}'.format(self.name, self.owning_player)
+
+
+Structure.prototypes = PrototypeRegistry(Structure,
+                                         'game.structure.player_built')
@@ -7,6 +7,11 @@ from engine.src.structure.structure import Structure
 class GameTile(HexTile):
     """A hex tile as used in a game of Settlers of Catan.
 
+    Attributes:
+        listeners (list): Objects notified, through their on_tile_changed()
+          method, whenever this tile's resource type, chit value or
+          calamities change. The method is given this tile.
+
     Args:
         resource (ResourceType): The resource/terrain of this hex.
 
@@ -15,17 +20,48 @@ class GameTile(HexTile):
 
         calamities (list): A list of calamity objects placed on this tile i.e.
           whose passive effects currently affect this tile.
+
+        vertices (dict): See HexTile.
+
+        edges (dict): See HexTile.
     """
 
     def __init__(self, x, y,
-                 resource_type=ResourceType.FALLOW, chit_value=0):
+                 resource_type=ResourceType.FALLOW, chit_value=0,
+                 vertices=None, edges=None):
 
-        super(GameTile, self).__init__(x, y)
+        super(GameTile, self).__init__(x, y, vertices, edges)
 
-        self.resource_type = resource_type
-        self.chit_value = chit_value
+        self.listeners = []
+
+        self._resource_type = resource_type
+        self._chit_value = chit_value
         self.calamities = []
 
+    @property
+    def resource_type(self):
+        return self._resource_type
+
+    @resource_type.setter
+    def resource_type(self, resource_type):
+        self._resource_type = resource_type
+        self.notify_listeners()
+
+    @property
+    def chit_value(self):
+        return self._chit_value
+
+    @chit_value.setter
+    def chit_value(self, chit_value):
+        self._chit_value = chit_value
+        self.notify_listeners()
+
+    def notify_listeners(self):
+        """Let every listener know that this tile has changed."""
+
+        for listener in self.listeners:
+            listener.on_tile_changed(self)
+
     def __str__(self):
         return '({0}, {1}) {2} {3}'.format(self.x, self.y,
                                            self.resource_type, self.chit_value)
@@ -54,6 +90,8 @@ class GameTile(HexTile):
             self.calamities
         )
 
+        self.notify_listeners()
+
     def add_calamity(self, calamity):
         """Add a calamity to this tile.
 
@@ -71,6 +109,7 @@ class GameTile(HexTile):
             return False
         else:
             self.calamities.append(calamity)
+            self.notify_listeners()
             return True
 
     def get_calamity_tile_placement_effects(self):
@@ -27,16 +27,25 @@ class HexTile(Tile):
         y (int): The y-coordinate of this tile in the axial coordinate system
           used by the board to which this tile belongs.
 
+        vertices (dict): Stands in for the vertices of this tile, e.g. a view
+          onto a BoardState. Brand new vertices are created if not given.
+
+        edges (dict): Stands in for the edges of this tile, as vertices does.
+
     TODO: x and y are mostly here for testing purposes. Removable.
     """
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, vertices=None, edges=None):
         self.x = x
         self.y = y
 
-        self.vertices = {}
-        self.edges = {}
-        self._create_vertices_and_edges()
+        if vertices is None or edges is None:
+            self.vertices = {}
+            self.edges = {}
+            self._create_vertices_and_edges()
+        else:
+            self.vertices = vertices
+            self.edges = edges
 
     def __repr__(self):
         return '({0}, {1})'.format(self.x, self.y)
@@ -126,7 +135,7 @@ class HexTile(Tile):
         """Iterate over the edges of this tile."""
 
         for (start_vertex_dir, end_vertex_dir) in VertexDirection.pairs():
-            yield self.vertices[start_vertex_dir][end_vertex_dir]
+            yield self.edges[start_vertex_dir][end_vertex_dir]
 
     def iter_vertices(self):
         """Iterate over the vertices of this tile."""
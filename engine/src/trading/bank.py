@@ -19,19 +19,42 @@ class Bank(TradingEntity):
     Args:
         tile_count (int): Number of tiles for the board this bank will be used
           with.
+
+        rng (random.Random): Source of randomness for shuffling the
+          development cards. Defaults to the random module itself.
     """
 
-    def __init__(self, tile_count=None):
+    def __init__(self, tile_count=None, rng=None):
         if tile_count is None:
             tile_count = Config.get('game.board.tile_count')
 
         super(Bank, self).__init__()
 
+        self.rng = rng if rng is not None else random
+
         self.development_cards = []
 
         self._default_init_development_cards()
         self._default_init_resources(tile_count)
 
+    def copy(self, rng=None):
+        """Get a bank with the same resources and a deck of new, unplayed
+        cards of the same kinds, in the same order.
+
+        Args:
+            rng (random.Random): rng of the new bank. Defaults to this bank's.
+        """
+
+        bank = Bank.__new__(Bank)
+
+        bank.rng = rng if rng is not None else self.rng
+        bank.resources = dict(self.resources)
+        bank.development_cards = [
+            DevelopmentCard.from_config(card.prototype_key)
+            for card in self.development_cards]
+
+        return bank
+
     def _default_init_resources(self, tile_count):
         """Determine the initial resources for the bank.
 
@@ -57,10 +80,10 @@ class Bank(TradingEntity):
 
         for name, card in dev_card_dict.iteritems():
             for _ in range(card['count']):
-                dev_card = DevelopmentCard(**card)
+                dev_card = DevelopmentCard.from_config(name)
                 self.development_cards.append(dev_card)
 
-        random.shuffle(self.development_cards)
+        self.rng.shuffle(self.development_cards)
 
     def buy_development_card(self, player):
         """Let the given player purchase a development card from the bank."""
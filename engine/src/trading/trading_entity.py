@@ -100,17 +100,21 @@ class TradingEntity(object):
         else:
             raise NotEnoughResourcesException(self, resource_type)
 
-    def withdraw_random_resource(self):
+    def withdraw_random_resource(self, rng=random):
         """Remove a random resource from this trading entity.
 
         Note that this method only withdraws a single random resource.
         Callers of this method should check to make sure that this entity
         still has resources using self.count_resources().
+
+        Args:
+            rng (random.Random): Source of randomness for the choice. Defaults
+              to the random module itself.
         """
 
         resources = self.get_resource_list()
 
-        resource_type = random.choice(resources)
+        resource_type = rng.choice(resources)
 
         self.resources[resource_type] -= 1
 
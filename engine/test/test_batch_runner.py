@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.game import Game
+from engine.src.simulation.batch_runner import BatchRunner
+from engine.src.simulation.headless_driver import HeadlessDriver
+from engine.src.simulation.headless_input_manager import \
+    HeadlessInputManager
+
+
+class SeededGameTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+    def create_game(self, seed):
+        return Game(HeadlessInputManager(), random.Random(seed))
+
+    def describe(self, game):
+        """Get the parts of a game drawn from its random number generator."""
+
+        return (
+            [(tile.x, tile.y, tile.resource_type.value, tile.chit_value)
+             for tile in game.board.iter_tiles()],
+            [dev_card.name for dev_card in game.board.bank.development_cards],
+            [game.dice.roll() for _ in range(20)],
+        )
+
+    def test_same_seed_same_game(self):
+        self.assertEqual(self.describe(self.create_game(3)),
+                         self.describe(self.create_game(3)))
+        self.assertNotEqual(self.describe(self.create_game(3)),
+                            self.describe(self.create_game(4)))
+
+    def test_module_random_untouched(self):
+        state = random.getstate()
+
+        HeadlessDriver().play(6)
+
+        self.assertEqual(state, random.getstate())
+
+
+class BatchRunnerTests(unittest.TestCase):
+    def test_parallel_matches_serial(self):
+        driver = HeadlessDriver(max_turns=150)
+        seeds = range(6)
+
+        parallel = BatchRunner(driver, processes=2).run(seeds)
+        results = dict((result.seed, result) for result in parallel)
+
+        self.assertEqual(sorted(seeds), sorted(results))
+
+        for seed in seeds:
+            self.assertEqual(driver.play(seed), results[seed])
+
+    def test_serial_run_games(self):
+        results = list(BatchRunner(HeadlessDriver(max_turns=20),
+                                   processes=1).run_games(3, first_seed=10))
+
+        self.assertEqual([10, 11, 12], [result.seed for result in results])
+
+
+if __name__ == '__main__':
+    unittest.main()
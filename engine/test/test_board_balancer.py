@@ -0,0 +1,130 @@
+import random
+import unittest
+
+from engine.src.board.board_balancer import BalancedBoardGenerator, \
+    BoardScorer, _LayoutState
+from engine.src.board.game_board import GameBoard
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.resource_type import ResourceType
+from engine.src.simulation.headless_driver import HeadlessDriver
+
+
+class BoardBalancerTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.board = GameBoard(3, rng=random.Random(1))
+        self.generator = BalancedBoardGenerator.from_board(
+            self.board, rng=random.Random(2))
+        self.scorer = self.generator.scorer
+
+    def get_layout(self, board):
+        return [(board.tiles[x][y].resource_type, board.tiles[x][y].chit_value)
+                for x, y in board.topology.tile_coords]
+
+    def test_generate(self):
+        layout = self.get_layout(self.board)
+        layouts = self.generator.generate_many(20)
+
+        for generated_layout in layouts:
+            # The same tiles and chits, laid out differently.
+            for index in range(2):
+                self.assertEqual(
+                    sorted((tile[index] for tile in layout), key=str),
+                    sorted((tile[index] for tile in generated_layout),
+                           key=str))
+
+            self.assertEqual(0, self.scorer.score_components(
+                generated_layout)['high_chit_adjacency'])
+
+            for resource_type, chit_value in generated_layout:
+                if resource_type == ResourceType.FALLOW:
+                    self.assertEqual(0, chit_value)
+
+        random_layouts = [_LayoutState(
+            self.scorer, *self.generator._draw()).get_layout()
+            for _ in range(20)]
+
+        self.assertLess(sum(map(self.scorer.score, layouts)),
+                        sum(map(self.scorer.score, random_layouts)))
+
+    def test_swap(self):
+        rng = random.Random(3)
+        state = _LayoutState(self.scorer, *self.generator._draw())
+        tile_count = self.board.topology.tile_count
+
+        for _ in range(200):
+            tile_id, other_tile_id = rng.sample(range(tile_count), 2)
+            swap_resources = rng.random() < 0.5
+
+            if not swap_resources and min(state.resources[tile_id],
+                                          state.resources[other_tile_id]) < 0:
+                continue
+
+            score = state.get_score()
+            change = state.swap(tile_id, other_tile_id, swap_resources)
+
+            self.assertAlmostEqual(state.get_score() - score, change)
+
+            components = state.get_components()
+            expected_components = self.scorer.score_components(
+                state.get_layout())
+
+            for component in BoardScorer.COMPONENTS:
+                self.assertAlmostEqual(expected_components[component],
+                                       components[component])
+
+    def test_assign(self):
+        layout = self.generator.generate()
+        self.generator.assign(self.board, layout)
+
+        self.assertEqual(layout, self.get_layout(self.board))
+
+        # The trackers followed the tiles.
+        production = self.board.production_tracker.production
+        self.board.production_tracker.rebuild()
+        self.assertEqual(production,
+                         self.board.production_tracker.production)
+
+        for roll_value in (6, 8):
+            self.assertEqual(
+                sorted(tile_id for tile_id, (_, chit_value) in
+                       enumerate(layout) if chit_value == roll_value),
+                sorted(self.board.tile_index.get_producing_tile_ids(
+                    roll_value)))
+
+    def test_assign_game_board(self):
+        driver = HeadlessDriver()
+
+        for seed in range(5):
+            game = driver.create_game(seed)
+            board = game.board
+
+            BalancedBoardGenerator.from_board(board).assign(board)
+
+            robber_tile = board.find_tile_with_calamity(game.robber)
+
+            self.assertEqual(ResourceType.FALLOW, robber_tile.resource_type)
+            self.assertEqual(
+                [robber_tile],
+                [tile for tile in board.iter_tiles() if tile.calamities])
+
+            # No arable tile is blocked from the start.
+            self.assertEqual(
+                set([board.topology.tile_ids[(robber_tile.x,
+                                              robber_tile.y)]]),
+                board.tile_index.blocked_tile_ids)
+
+    def test_size_mismatch(self):
+        resource_types = [self.board.tiles[x][y].resource_type for x, y in
+                          self.board.topology.tile_coords]
+
+        self.assertRaises(ValueError, BalancedBoardGenerator, self.scorer,
+                          resource_types[1:], self.generator.chit_values)
+        self.assertRaises(ValueError, BalancedBoardGenerator, self.scorer,
+                          resource_types, self.generator.chit_values[1:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.board.game_board import GameBoard
+from engine.src.board.board_state import BoardStorage
+from engine.src.board.board_state import TileVertexView
+from engine.src.player import Player
+from engine.src.structure.structure import Structure
+from engine.src.direction.vertex_direction import VertexDirection
+from engine.src.exceptions import InvalidStructurePlacementException
+
+
+class BoardStateTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.player = Player('Alice')
+        self.opponent = Player('Bob')
+
+    def place_initial_structures(self, board):
+        topology = board.topology
+
+        settlement_id = topology.vertex_ids[(0, 0, VertexDirection.TOP)]
+        x, y, vertex_dir = topology.vertex_coords[settlement_id]
+
+        board.place_vertex_structure(
+            x, y, vertex_dir, self.player.get_structure('Settlement'),
+            must_border_claimed_edge=False)
+
+        road_id = topology.vertex_edges[settlement_id][0]
+        road_x, road_y, edge_dir = topology.edge_coords[road_id]
+
+        board.place_edge_structure(
+            road_x, road_y, edge_dir, self.player.get_structure('Road'),
+            must_border_claimed_edge=False, struct_x=x, struct_y=y,
+            struct_vertex_dir=vertex_dir)
+
+        return settlement_id, road_id
+
+    def test_array_sizes(self):
+        board = GameBoard(3, BoardStorage.ARRAYS)
+
+        self.assertEqual(board.topology.vertex_count,
+                         len(board.state.vertex_owners))
+        self.assertEqual(board.topology.edge_count,
+                         len(board.state.edge_owners))
+        self.assertIsInstance(board.tiles[0][0].vertices, TileVertexView)
+
+    def test_storage_modes_agree(self):
+        tiles_board = GameBoard(3, BoardStorage.TILES)
+        arrays_board = GameBoard(3, BoardStorage.ARRAYS)
+
+        self.assertEqual(self.place_initial_structures(tiles_board),
+                         self.place_initial_structures(arrays_board))
+
+        for board in (tiles_board, arrays_board):
+            placed = [(x, y, d, val.name) for x, y, d, val in
+                      board.iter_vertices() if isinstance(val, Structure)]
+            placed += [(x, y, d, val.name) for x, y, d, val in
+                       board.iter_edges() if isinstance(val, Structure)]
+
+            self.assertEqual(2, len(placed))
+
+    def test_tile_views_share_state(self):
+        board = GameBoard(3, BoardStorage.ARRAYS)
+        settlement_id, road_id = self.place_initial_structures(board)
+
+        for x, y, vertex_dir in board.topology.vertex_slots[settlement_id]:
+            vertex_val = board.tiles[x][y].vertices[vertex_dir]
+
+            self.assertEqual('Settlement', vertex_val.name)
+            self.assertEqual(self.player, vertex_val.owning_player)
+
+        for x, y, edge_dir in board.topology.edge_slots[road_id]:
+            self.assertEqual('Road', board.get_edge(x, y, edge_dir).name)
+
+    def test_distance_rule(self):
+        board = GameBoard(3, BoardStorage.ARRAYS)
+        settlement_id, _ = self.place_initial_structures(board)
+
+        neighbor_id = board.topology.vertex_vertices[settlement_id][0]
+        x, y, vertex_dir = board.topology.vertex_coords[neighbor_id]
+
+        with self.assertRaises(InvalidStructurePlacementException):
+            board.place_vertex_structure(
+                x, y, vertex_dir, self.opponent.get_structure('Settlement'),
+                must_border_claimed_edge=False)
+
+    def test_copy_is_independent(self):
+        board = GameBoard(3, BoardStorage.ARRAYS)
+        settlement_id, road_id = self.place_initial_structures(board)
+
+        state = board.state.copy()
+        board.update_edge_by_id(road_id, board.state.EMPTY_EDGE)
+
+        self.assertNotIsInstance(board.get_edge_by_id(road_id), Structure)
+        self.assertEqual('Road', state.get_edge(road_id).name)
+        self.assertEqual('Settlement', state.get_vertex(settlement_id).name)
+
+
+if __name__ == '__main__':
+    unittest.main()
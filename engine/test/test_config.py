@@ -0,0 +1,87 @@
+import copy
+import pickle
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.exceptions import NoConfigValueDefinedException
+from engine.src.lib.frozen_dict import FrozenDict
+
+
+class ConfigTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = copy.deepcopy(game_config)
+        Config.init()
+
+    def tearDown(self):
+        Config.config = game_config
+
+    def iter_paths(self, dct, prefix=''):
+        for key, value in dct.items():
+            if isinstance(key, str):
+                yield prefix + key
+
+                if type(value) is dict and value:
+                    for path in self.iter_paths(value, prefix + key + '.'):
+                        yield path
+
+    def test_matches_uncompiled_lookup(self):
+        for path in self.iter_paths(Config.config):
+            # Passing the config explicitly bypasses the compiled table.
+            self.assertEqual(Config.get(path, Config.config), Config.get(path))
+
+        self.assertTrue('default' not in Config.get('game.card.development'))
+        self.assertTrue('default' in
+                        Config.get('game.card')['development'])
+
+    def test_missing_path(self):
+        self.assertRaises(NoConfigValueDefinedException,
+                          Config.get, 'game.no_such_value')
+
+    def test_values_are_frozen(self):
+        structures = Config.get('game.structure.player_built')
+
+        self.assertIsInstance(structures, FrozenDict)
+        self.assertRaises(TypeError, structures.pop, 'road')
+        self.assertRaises(TypeError, structures['road']['cost'].update, {})
+
+        self.assertEqual(structures, pickle.loads(pickle.dumps(structures)))
+
+    def test_set_and_init_invalidate(self):
+        Config.set(12, 'game.points_to_win')
+        self.assertEqual(12, Config.get('game.points_to_win'))
+
+        Config.config['game']['points_to_win'] = 3
+        Config.init()
+        self.assertEqual(3, Config.get('game.points_to_win'))
+
+    def test_replaced_config(self):
+        self.assertEqual(10, Config.get('game.points_to_win'))
+
+        Config.config = copy.deepcopy(Config.config)
+        Config.config['game']['points_to_win'] = 7
+
+        self.assertEqual(7, Config.get('game.points_to_win'))
+
+    def test_hyphenated_keys(self):
+        Config.config['game']['board']['hex-size'] = 2
+        Config.invalidate()
+
+        self.assertEqual(2, Config.get('game.board.hex_size'))
+        self.assertEqual(2, Config.get('game.board.hex-size'))
+
+    def test_accessor(self):
+        accessor = Config.accessor('game.board')
+
+        board = accessor.get()
+        self.assertTrue(board is accessor.get())
+        self.assertEqual(19, accessor.get('tile_count'))
+
+        Config.set(37, 'game.board.tile_count')
+
+        self.assertEqual(37, accessor.get()['tile_count'])
+        self.assertEqual(37, accessor.get('tile_count'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import pickle
+import unittest
+
+from engine.src.board.board_state import BoardStorage
+from engine.src.board.legal_move_tracker import LegalMoveTracker
+from engine.src.board.production_tracker import ProductionTracker
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.game_snapshot import GameSnapshot
+from engine.src.longest_road_tracker import LongestRoadTracker
+from engine.src.simulation.headless_driver import HeadlessDriver
+
+
+class GameSnapshotTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.driver = HeadlessDriver()
+
+    def new_game(self, storage=BoardStorage.TILES, seed=1, turn_count=10,
+                 player_names=None):
+        game = self.driver.create_game(seed, storage, player_names)
+        game.initial_settlement_and_road_placement()
+        self.play(game, turn_count)
+
+        return game
+
+    def play(self, game, turn_count):
+        game.input_manager.game = game
+        self.driver.play_turns(game, turn_count)
+
+    def assertTrackersCurrent(self, board):
+        legal_move_tracker = LegalMoveTracker(board)
+
+        self.assertEqual(ProductionTracker(board).production,
+                         board.production_tracker.production)
+        self.assertEqual(LongestRoadTracker(board).lengths,
+                         board.longest_road_tracker.lengths)
+        self.assertEqual(legal_move_tracker.open_vertex_ids,
+                         board.legal_move_tracker.open_vertex_ids)
+        self.assertEqual(legal_move_tracker.road_edge_ids,
+                         board.legal_move_tracker.road_edge_ids)
+
+    def test_clone(self):
+        for storage in BoardStorage:
+            game = self.new_game(storage)
+            snapshot = game.snapshot()
+
+            clone = game.clone()
+
+            self.assertEqual(snapshot, clone.snapshot())
+            self.assertTrackersCurrent(clone.board)
+            self.assertTrue(clone.board.topology is game.board.topology)
+
+            for player, clone_player in zip(game.players, clone.players):
+                self.assertFalse(player is clone_player)
+
+            self.play(clone, 15)
+
+            self.assertNotEqual(snapshot, clone.snapshot())
+            self.assertEqual(snapshot, game.snapshot())
+
+    def test_restore(self):
+        for storage in BoardStorage:
+            game = self.new_game(storage)
+            players = list(game.players)
+            snapshot = game.snapshot()
+
+            # Few enough changes to update the trackers one by one...
+            self.play(game, 1)
+            game.restore(snapshot)
+
+            self.assertEqual(snapshot, game.snapshot())
+            self.assertTrackersCurrent(game.board)
+
+            # ...and enough to rebuild them.
+            self.play(game, 30)
+            game.restore(snapshot)
+
+            self.assertEqual(snapshot, game.snapshot())
+            self.assertTrackersCurrent(game.board)
+            self.assertEqual(players, game.players)
+            self.assertTrue(all(player is restored_player for
+                                player, restored_player in
+                                zip(players, game.players)))
+
+    def test_restore_into_new_game(self):
+        game = self.new_game()
+        snapshot = game.snapshot(include_rng=True)
+
+        new_game = self.new_game(seed=2, turn_count=0)
+        new_game.restore(snapshot)
+
+        self.assertEqual(snapshot, new_game.snapshot(include_rng=True))
+        self.assertTrackersCurrent(new_game.board)
+        self.assertEqual([game.dice.roll() for _ in range(10)],
+                         [new_game.dice.roll() for _ in range(10)])
+
+    def test_restore_into_game_with_other_players(self):
+        for storage in BoardStorage:
+            game = self.new_game(storage)
+            snapshot = game.snapshot()
+
+            # Whose structures all have to go.
+            other_game = self.new_game(storage, seed=2, turn_count=3,
+                                       player_names=['x', 'y', 'z'])
+            other_game.restore(snapshot)
+
+            self.assertEqual(snapshot, other_game.snapshot())
+            self.assertEqual(['p1', 'p2', 'p3'],
+                             [player.name for player in other_game.players])
+            self.assertTrackersCurrent(other_game.board)
+
+            for vertex_id in range(other_game.board.topology.vertex_count):
+                structure = other_game.board.get_vertex_by_id(vertex_id)
+                owner = getattr(structure, 'owning_player', None)
+
+                self.assertTrue(owner is None or owner in other_game.players)
+
+    def test_serialization(self):
+        snapshot = self.new_game().snapshot(include_rng=True)
+
+        self.assertEqual(snapshot, pickle.loads(pickle.dumps(snapshot)))
+        self.assertEqual(snapshot, GameSnapshot.from_dict(snapshot.to_dict()))
+
+        dct = snapshot.to_dict()
+        dct['version'] = GameSnapshot.VERSION + 1
+        self.assertRaises(ValueError, GameSnapshot.from_dict, dct)
+
+
+if __name__ == '__main__':
+    unittest.main()
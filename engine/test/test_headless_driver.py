@@ -0,0 +1,70 @@
+import __builtin__
+import sys
+import unittest
+from StringIO import StringIO
+
+from engine.src.config.config import Config
+from engine.src.simulation.game_result import GameResult
+from engine.src.simulation.headless_driver import HeadlessDriver
+
+
+class HeadlessDriverTests(unittest.TestCase):
+    def setUp(self):
+        self.driver = HeadlessDriver()
+
+    def test_game_is_played_to_completion(self):
+        result = self.driver.play(1)
+
+        self.assertIsInstance(result, GameResult)
+        self.assertEqual(['p1', 'p2', 'p3'], sorted(result.points))
+        self.assertTrue(result.winner in result.points)
+        self.assertGreaterEqual(result.points[result.winner],
+                                Config.get('game.points_to_win'))
+        self.assertGreater(result.turn_count, 0)
+
+        for resources in result.resources.values():
+            self.assertEqual(set(['grain', 'lumber', 'wool', 'ore', 'brick']),
+                             set(resources))
+
+    def test_same_seed_same_result(self):
+        self.assertEqual(self.driver.play(4), self.driver.play(4))
+        self.assertNotEqual(self.driver.play(4).to_dict(),
+                            self.driver.play(5).to_dict())
+
+    def test_turn_limit(self):
+        result = HeadlessDriver(max_turns=5).play(1)
+
+        self.assertEqual(None, result.winner)
+        self.assertEqual(5, result.turn_count)
+
+    def test_play_turns(self):
+        game = self.driver.create_game(1, player_names=['a', 'b'])
+        game.initial_settlement_and_road_placement()
+
+        self.driver.play_turns(game, 5)
+
+        self.assertEqual(5, game.turn_count)
+        self.assertEqual('a', game.current_player.name)
+
+    def test_no_terminal_io(self):
+        def raw_input(prompt=None):
+            raise AssertionError('Prompted for input: {0}'.format(prompt))
+
+        stdout = sys.stdout
+        original_raw_input = __builtin__.raw_input
+
+        sys.stdout = StringIO()
+        __builtin__.raw_input = raw_input
+
+        try:
+            self.driver.play(2)
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+            __builtin__.raw_input = original_raw_input
+
+        self.assertEqual('', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
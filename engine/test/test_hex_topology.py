@@ -0,0 +1,80 @@
+import unittest
+
+from engine.src.board.hex_board import HexBoard
+from engine.src.board.hex_topology import HexTopology
+from engine.src.direction.vertex_direction import VertexDirection
+from engine.src.direction.edge_direction import EdgeDirection
+
+
+class HexTopologyTests(unittest.TestCase):
+    def test_counts(self):
+        for radius in range(1, 6):
+            topology = HexTopology.for_radius(radius)
+
+            self.assertEqual(3 * radius * (radius - 1) + 1,
+                             topology.tile_count)
+            self.assertEqual(6 * radius ** 2, topology.vertex_count)
+            self.assertEqual(9 * radius ** 2 - 3 * radius,
+                             topology.edge_count)
+
+    def test_cached_per_radius(self):
+        self.assertIs(HexTopology.for_radius(3), HexTopology.for_radius(3))
+        self.assertIs(HexBoard(3).topology, HexBoard(3).topology)
+        self.assertIsNot(HexTopology.for_radius(3), HexTopology.for_radius(4))
+
+    def test_adjacency_symmetric(self):
+        topology = HexTopology.for_radius(3)
+
+        for vertex_id, neighbors in enumerate(topology.vertex_vertices):
+            self.assertIn(len(neighbors), (2, 3))
+
+            for neighbor_id in neighbors:
+                self.assertIn(vertex_id, topology.vertex_vertices[neighbor_id])
+
+        for edge_id, (start_id, end_id) in enumerate(topology.edge_vertices):
+            self.assertIn(edge_id, topology.vertex_edges[start_id])
+            self.assertIn(edge_id, topology.vertex_edges[end_id])
+
+            for adjacent_edge_id in topology.edge_edges[edge_id]:
+                self.assertIn(edge_id, topology.edge_edges[adjacent_edge_id])
+
+    def test_slots_name_same_vertex(self):
+        topology = HexTopology.for_radius(3)
+
+        for vertex_id, slots in enumerate(topology.vertex_slots):
+            self.assertEqual(len(slots), len(topology.vertex_tiles[vertex_id]))
+
+            for x, y, vertex_dir in slots:
+                self.assertEqual(vertex_id,
+                                 topology.get_vertex_id(x, y, vertex_dir))
+                self.assertIn(vertex_id, topology.tile_vertices[
+                    topology.tile_ids[(x, y)]])
+
+    def test_board_shares_vertices_and_edges(self):
+        board = HexBoard(3)
+        topology = board.topology
+
+        for slots in topology.vertex_slots:
+            vertices = set(id(board.get_vertex(x, y, vertex_dir))
+                           for x, y, vertex_dir in slots)
+            self.assertEqual(1, len(vertices))
+
+        for slots in topology.edge_slots:
+            edges = set(id(board.get_tile_with_coords(x, y).get_edge(edge_dir))
+                        for x, y, edge_dir in slots)
+            self.assertEqual(1, len(edges))
+
+    def test_perimeter_vertex_adjacency(self):
+        board = HexBoard(2)
+
+        # The westernmost tile's top left vertex borders only that tile.
+        self.assertEqual(1, len(board.get_adjacent_tiles_to_vertex(
+            -1, 0, VertexDirection.TOP_LEFT)))
+        self.assertEqual(2, len(board.get_adjacent_edges(
+            -1, 0, VertexDirection.TOP_LEFT)))
+        self.assertEqual(2, len(board.get_adjacent_vertices_for_vertex(
+            -1, 0, VertexDirection.TOP_LEFT)))
+
+        # The center tile's edges each touch four other edges.
+        for edge_dir in EdgeDirection:
+            self.assertEqual(4, len(board.get_adjacent_edges(0, 0, edge_dir)))
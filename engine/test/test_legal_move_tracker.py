@@ -0,0 +1,137 @@
+import random
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.board.game_board import GameBoard
+from engine.src.board.board_state import BoardStorage
+from engine.src.board.legal_move_tracker import LegalMoveTracker
+from engine.src.exceptions import *
+from engine.src.player import Player
+from engine.src.structure.structure import Structure
+from engine.src.edge import Edge
+from engine.src.vertex import Vertex
+
+
+class LegalMoveTrackerTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.players = [Player('Alice'), Player('Bob')]
+
+    def probe(self, board, player, structure_name, position_count, coords):
+        """Find legal placements by validating every candidate in turn."""
+
+        legal_ids = set()
+
+        for position_id in range(position_count):
+            x, y, direction = coords[position_id]
+            structure = player.get_structure(structure_name)
+            player.init_structure_counts()
+
+            if structure_name == 'Road':
+                old_value = board.get_edge_by_id(position_id)
+            else:
+                old_value = board.get_vertex_by_id(position_id)
+
+            try:
+                board.validate_structure_placement(
+                    x, y, old_value, structure, direction, True,
+                    None, None, None)
+                legal_ids.add(position_id)
+            except (BoardPositionOccupiedException,
+                    InvalidBaseStructureException,
+                    InvalidStructurePlacementException):
+                pass
+
+        return legal_ids
+
+    def assert_matches_probing(self, board):
+        topology = board.topology
+
+        for player in self.players:
+            self.assertEqual(
+                self.probe(board, player, 'Settlement', topology.vertex_count,
+                           topology.vertex_coords),
+                board.legal_settlement_spots(player))
+
+            self.assertEqual(
+                self.probe(board, player, 'Road', topology.edge_count,
+                           topology.edge_coords),
+                board.legal_road_edges(player))
+
+            self.assertEqual(
+                set(vertex_id for vertex_id in range(topology.vertex_count)
+                    if isinstance(board.get_vertex_by_id(vertex_id),
+                                  Structure) and
+                    board.get_vertex_by_id(vertex_id).name == 'Settlement' and
+                    board.get_vertex_by_id(vertex_id).owning_player == player),
+                board.legal_city_upgrades(player))
+
+        self.assertEqual(
+            set(vertex_id for vertex_id in range(topology.vertex_count)
+                if not any(isinstance(board.get_vertex_by_id(other_id),
+                                      Structure)
+                           for other_id in (vertex_id,) +
+                           topology.vertex_vertices[vertex_id])),
+            board.legal_settlement_spots(self.players[0], initial=True))
+
+    def test_empty_board(self):
+        board = GameBoard(3)
+
+        self.assertEqual(set(), board.legal_settlement_spots(self.players[0]))
+        self.assertEqual(set(), board.legal_road_edges(self.players[0]))
+        self.assertEqual(board.topology.vertex_count, len(
+            board.legal_settlement_spots(self.players[0], initial=True)))
+
+    def test_initial_road_edges(self):
+        board = GameBoard(3)
+        alice = self.players[0]
+        vertex_id = 10
+
+        board.update_vertex_by_id(vertex_id, alice.get_structure('Settlement'))
+        edge_ids = board.topology.vertex_edges[vertex_id]
+
+        self.assertEqual(set(edge_ids), board.legal_road_edges(alice, vertex_id))
+
+        board.update_edge_by_id(edge_ids[0], alice.get_structure('Road'))
+
+        self.assertEqual(set(edge_ids[1:]),
+                         board.legal_road_edges(alice, vertex_id))
+
+    def test_matches_probing(self):
+        rng = random.Random(5)
+
+        for storage in BoardStorage:
+            board = GameBoard(3, storage)
+            topology = board.topology
+
+            for _ in range(80):
+                player = rng.choice(self.players)
+
+                if rng.random() < 0.3:
+                    board.update_vertex_by_id(
+                        rng.randrange(topology.vertex_count),
+                        rng.choice([player.get_structure('Settlement'),
+                                    player.get_structure('City'), Vertex()]))
+                else:
+                    board.update_edge_by_id(
+                        rng.randrange(topology.edge_count),
+                        rng.choice([player.get_structure('Road')] * 3 +
+                                   [Edge()]))
+
+                player.init_structure_counts()
+
+            self.assert_matches_probing(board)
+
+            rebuilt = LegalMoveTracker(board)
+
+            for player in self.players:
+                self.assertEqual(rebuilt.get_settlement_vertex_ids(player),
+                                 board.legal_settlement_spots(player))
+                self.assertEqual(rebuilt.get_road_edge_ids(player),
+                                 board.legal_road_edges(player))
+
+
+if __name__ == '__main__':
+    unittest.main()
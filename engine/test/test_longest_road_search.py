@@ -0,0 +1,131 @@
+import random
+import threading
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.board.game_board import GameBoard
+from engine.src.board.hex_topology import HexTopology
+from engine.src.longest_road_search import LongestRoadSearch
+from engine.src.longest_road_search import LongestRoadSearchContext
+from engine.src.longest_road_search import LongestRoadSolver
+from engine.src.longest_road_search import find_longest_road_length
+from engine.src.player import Player
+
+
+class FindLongestRoadLengthTests(unittest.TestCase):
+    def setUp(self):
+        self.topology = HexTopology.for_radius(3)
+
+    def find_longest_road(self, edge_ids, blocked_vertex_ids):
+        """Exhaustively search every road, starting from every vertex."""
+
+        topology = self.topology
+
+        def extend(vertex_id, used):
+            lengths = [len(used)]
+
+            if used and vertex_id in blocked_vertex_ids:
+                return len(used)
+
+            for edge_id in topology.vertex_edges[vertex_id]:
+                if edge_id in edge_ids and edge_id not in used:
+                    start_id, end_id = topology.edge_vertices[edge_id]
+                    next_id = end_id if start_id == vertex_id else start_id
+                    lengths.append(extend(next_id, used | set([edge_id])))
+
+            return max(lengths)
+
+        return max(extend(vertex_id, set())
+                   for vertex_id in range(topology.vertex_count))
+
+    def test_empty(self):
+        self.assertEqual(0, find_longest_road_length(self.topology, []))
+
+    def test_loop(self):
+        edge_ids = self.topology.tile_edges[0]
+
+        self.assertEqual(6, find_longest_road_length(self.topology, edge_ids))
+
+        # A blocked vertex on a loop still lets the road run all the way
+        # around, starting and ending there.
+        blocked_vertex_ids = [self.topology.tile_vertices[0][0]]
+
+        self.assertEqual(6, find_longest_road_length(
+            self.topology, edge_ids, blocked_vertex_ids))
+
+    def test_matches_exhaustive_search(self):
+        rng = random.Random(3)
+
+        for _ in range(40):
+            edge_ids = set(rng.sample(range(self.topology.edge_count), 16))
+            blocked_vertex_ids = set(
+                rng.sample(range(self.topology.vertex_count), 4))
+
+            self.assertEqual(
+                self.find_longest_road(edge_ids, blocked_vertex_ids),
+                find_longest_road_length(self.topology, edge_ids,
+                                         blocked_vertex_ids))
+
+
+class LongestRoadSearchTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+    def test_solvers_agree_on_straight_roads(self):
+        board = GameBoard(3)
+        topology = board.topology
+        alice = Player('Alice')
+
+        # Claim a road running along the center tile's edges.
+        for edge_id in topology.tile_edges[0][:4]:
+            board.update_edge_by_id(edge_id, alice.get_structure('Road'))
+
+        meta_lengths = LongestRoadSearch(board, LongestRoadSolver.META).execute()
+        bitmask_lengths = LongestRoadSearch(board).execute()
+
+        self.assertEqual({alice: 4}, bitmask_lengths)
+        self.assertEqual(meta_lengths, bitmask_lengths)
+
+    def test_context_shared_per_topology(self):
+        self.assertIs(
+            LongestRoadSearchContext.for_topology(GameBoard(3).topology),
+            LongestRoadSearchContext.for_topology(GameBoard(3).topology))
+
+    def test_concurrent_searches(self):
+        rng = random.Random(5)
+        players = [Player('Alice'), Player('Bob')]
+        boards = []
+
+        for _ in range(4):
+            board = GameBoard(3)
+
+            for edge_id in rng.sample(range(board.topology.edge_count), 12):
+                player = rng.choice(players)
+                board.update_edge_by_id(edge_id, player.get_structure('Road'))
+                player.init_structure_counts()
+
+            boards.append(board)
+
+        expected = [LongestRoadSearch(board, LongestRoadSolver.META).execute()
+                    for board in boards]
+        results = [None] * len(boards)
+
+        def search(index):
+            results[index] = LongestRoadSearch(
+                boards[index], LongestRoadSolver.META).execute()
+
+        threads = [threading.Thread(target=search, args=(index,))
+                   for index in range(len(boards))]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(expected, results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import random
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.board.game_board import GameBoard
+from engine.src.board.board_state import BoardStorage
+from engine.src.longest_road_search import LongestRoadSearch
+from engine.src.longest_road_tracker import LongestRoadTracker
+from engine.src.player import Player
+from engine.src.structure.structure import Structure
+from engine.src.edge import Edge
+from engine.src.vertex import Vertex
+
+
+class LongestRoadTrackerTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.players = [Player('Alice'), Player('Bob')]
+
+    def build_road(self, board, player, vertex_ids):
+        """Claim the edges along the given path of vertices for player."""
+
+        topology = board.topology
+
+        for start_id, end_id in zip(vertex_ids, vertex_ids[1:]):
+            edge_id = next(edge_id for edge_id in topology.vertex_edges[start_id]
+                           if end_id in topology.edge_vertices[edge_id])
+
+            board.update_edge_by_id(edge_id, player.get_structure('Road'))
+
+    def walk(self, board, length):
+        """Get a path of length edges that never revisits a vertex."""
+
+        topology = board.topology
+        path = [0]
+
+        while len(path) <= length:
+            path.append(next(vertex_id for vertex_id in
+                             topology.vertex_vertices[path[-1]]
+                             if vertex_id not in path))
+
+        return path
+
+    def find_longest_road(self, board, player):
+        """Exhaustively find the longest road of player, ignoring blocking."""
+
+        topology = board.topology
+
+        roads = set(
+            edge_id for edge_id in range(topology.edge_count)
+            if isinstance(board.get_edge_by_id(edge_id), Structure) and
+            board.get_edge_by_id(edge_id).owning_player == player
+        )
+
+        def extend(vertex_id, used):
+            lengths = [len(used)]
+
+            for edge_id in topology.vertex_edges[vertex_id]:
+                if edge_id in roads and edge_id not in used:
+                    start_id, end_id = topology.edge_vertices[edge_id]
+                    next_id = end_id if start_id == vertex_id else start_id
+                    lengths.append(extend(next_id, used | set([edge_id])))
+
+            return max(lengths)
+
+        return max(extend(vertex_id, set())
+                   for vertex_id in range(topology.vertex_count))
+
+    def test_straight_road(self):
+        board = GameBoard(3)
+        alice = self.players[0]
+
+        self.build_road(board, alice, self.walk(board, 5))
+
+        self.assertEqual(5, board.longest_road_tracker.get_length(alice))
+        self.assertEqual(0, board.longest_road_tracker.get_length(
+            self.players[1]))
+
+    def test_opponent_settlement_cuts_road(self):
+        board = GameBoard(3, BoardStorage.ARRAYS)
+        alice, bob = self.players
+        path = self.walk(board, 6)
+
+        self.build_road(board, alice, path)
+        self.assertEqual(6, board.longest_road_tracker.get_length(alice))
+
+        board.update_vertex_by_id(path[2], bob.get_structure('Settlement'))
+        self.assertEqual(4, board.longest_road_tracker.get_length(alice))
+
+        # Alice's own settlements don't cut her road.
+        board.update_vertex_by_id(path[2], alice.get_structure('Settlement'))
+        self.assertEqual(6, board.longest_road_tracker.get_length(alice))
+
+        board.update_vertex_by_id(path[2], Vertex())
+        self.assertEqual(6, board.longest_road_tracker.get_length(alice))
+
+    def test_road_removal_splits_component(self):
+        board = GameBoard(3)
+        alice = self.players[0]
+        path = self.walk(board, 5)
+
+        self.build_road(board, alice, path)
+
+        edge_id = next(edge_id for edge_id in
+                       board.topology.vertex_edges[path[1]]
+                       if path[2] in board.topology.edge_vertices[edge_id])
+        board.update_edge_by_id(edge_id, Edge())
+
+        self.assertEqual(3, board.longest_road_tracker.get_length(alice))
+
+    def test_matches_exhaustive_search(self):
+        rng = random.Random(7)
+
+        for _ in range(10):
+            board = GameBoard(3)
+
+            for edge_id in rng.sample(range(board.topology.edge_count), 20):
+                player = rng.choice(self.players)
+                board.update_edge_by_id(edge_id, player.get_structure('Road'))
+                player.init_structure_counts()
+
+            for player in self.players:
+                self.assertEqual(self.find_longest_road(board, player),
+                                 board.longest_road_tracker.get_length(player))
+
+    def test_incremental_matches_rebuild(self):
+        rng = random.Random(11)
+        board = GameBoard(3, BoardStorage.ARRAYS)
+        topology = board.topology
+
+        for _ in range(60):
+            player = rng.choice(self.players)
+
+            if rng.random() < 0.2:
+                board.update_vertex_by_id(
+                    rng.randrange(topology.vertex_count),
+                    rng.choice([player.get_structure('Settlement'), Vertex()]))
+            else:
+                board.update_edge_by_id(
+                    rng.randrange(topology.edge_count),
+                    rng.choice([player.get_structure('Road')] * 3 + [Edge()]))
+
+            player.init_structure_counts()
+
+            self.assertEqual(LongestRoadTracker(board).get_lengths(),
+                             board.longest_road_tracker.get_lengths())
+            self.assertEqual(LongestRoadSearch(board).execute(),
+                             board.longest_road_tracker.get_lengths())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import random
+import unittest
+
+from engine.src.agent.heuristic_agent import HeuristicAgent
+from engine.src.agent.mcts_agent import MCTSAgent
+from engine.src.board.board_state import BoardStorage
+from engine.src.card.development_card import DevelopmentCard
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.resource_type import ResourceType
+from engine.src.simulation.game_result import GameResult
+from engine.src.simulation.headless_driver import HeadlessDriver
+
+
+class MCTSAgentTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+    def new_game(self, seed=1, turn_count=10, **kwargs):
+        driver = HeadlessDriver()
+        game = driver.create_game(seed, BoardStorage.ARRAYS)
+
+        game.input_manager.agents[game.players[0]] = MCTSAgent(
+            random.Random(seed), **kwargs)
+
+        game.initial_settlement_and_road_placement()
+        driver.play_turns(game, turn_count)
+
+        player = game.players[0]
+        game.begin_turn(player)
+
+        for resource_type in ResourceType.get_arable_types():
+            player.resources[resource_type] += 4
+
+        return game
+
+    def test_search(self):
+        game = self.new_game(iterations=30, playout_turns=3)
+        player = game.players[0]
+        agent = game.input_manager.agents[player]
+        snapshot = game.snapshot()
+
+        actions = agent.get_actions(game, player)
+        stats = agent.search(game, player)
+
+        self.assertEqual(MCTSAgent.END_TURN, actions[0])
+        self.assertEqual(30, sum(visit_count for visit_count, _ in
+                                 stats.values()))
+        self.assertTrue(set(stats) <= set(actions))
+        self.assertTrue(all(0 <= reward <= visit_count for
+                            visit_count, reward in stats.values()))
+
+        # Searching plays on a clone, leaving the game alone.
+        self.assertEqual(snapshot, game.snapshot())
+        self.assertFalse(agent.card_played)
+
+        # Every action applies cleanly.
+        for action in actions:
+            clone = game.clone()
+            clone_player = clone.players[0]
+
+            self.assertTrue(agent.apply_action(clone, clone_player, action))
+
+    def test_robber_actions(self):
+        game = self.new_game(iterations=10)
+        player = game.players[0]
+        agent = game.input_manager.agents[player]
+
+        knight = DevelopmentCard.from_config('knight')
+        player.development_cards.append(knight)
+
+        actions = agent.get_actions(game, player)
+        robber_actions = [action for action in actions
+                          if action[0] == 'robber']
+
+        self.assertNotIn(('play_card', knight.name), actions)
+        self.assertEqual(robber_actions,
+                         agent._get_robber_actions(game, player))
+
+        clone = game.clone()
+        self.assertEqual(robber_actions,
+                         agent._get_robber_actions(clone, clone.players[0]))
+
+        _, tile_id, victim_name = [action for action in robber_actions
+                                   if action[2] is not None][0]
+        victim = [game_player for game_player in game.players
+                  if game_player.name == victim_name][0]
+        knight_count = player.knights
+        resource_count = player.count_resources()
+        victim_resource_count = victim.count_resources()
+
+        self.assertTrue(agent.apply_action(
+            game, player, ('robber', tile_id, victim_name)))
+
+        x, y = game.board.topology.tile_coords[tile_id]
+        self.assertTrue(game.robber in game.board.tiles[x][y].calamities)
+        self.assertEqual(resource_count + 1, player.count_resources())
+        self.assertEqual(victim_resource_count - 1, victim.count_resources())
+        self.assertEqual(knight_count + 1, player.knights)
+        self.assertTrue(knight.played)
+
+        # A knight is a development card played this turn.
+        self.assertTrue(agent.card_played)
+        self.assertFalse([action for action in agent.get_actions(game, player)
+                          if action[0] == 'robber'])
+
+        # Nor can the same knight be played again.
+        agent.card_played = False
+        self.assertFalse([action for action in agent.get_actions(game, player)
+                          if action[0] == 'robber'])
+
+    def test_search_in_parallel(self):
+        game = self.new_game(iterations=10, playout_turns=2, processes=2)
+        player = game.players[0]
+        agent = game.input_manager.agents[player]
+
+        try:
+            stats = agent._search_in_parallel(game, player)
+        finally:
+            agent.close()
+
+        self.assertEqual(20, sum(visit_count for visit_count, _ in
+                                 stats.values()))
+
+    def test_play_game(self):
+        results = []
+
+        for _ in range(2):
+            driver = HeadlessDriver(agent_cls=HeuristicAgent, max_turns=30)
+            game = driver.create_game(2, BoardStorage.ARRAYS)
+            agents = game.input_manager.agents
+
+            agents[game.players[0]] = MCTSAgent(random.Random(2), iterations=5,
+                                                playout_turns=2)
+
+            winner = driver.play_game(game, agents)
+            results.append(GameResult.from_game(game, 2, winner))
+
+        # An iteration budget, unlike a time budget, keeps games
+        # reproducible.
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(30, results[0].turn_count)
+
+    def test_budget(self):
+        self.assertRaises(ValueError, MCTSAgent, random.Random(),
+                          iterations=None)
+
+        game = self.new_game(iterations=None, time_limit=0.05,
+                             playout_turns=2)
+        player = game.players[0]
+
+        stats = game.input_manager.agents[player].search(game, player)
+
+        self.assertTrue(stats)
+
+
+class HeuristicAgentTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+    def test_choose_tile(self):
+        game = HeadlessDriver(player_count=2).create_game(1)
+
+        agent = HeuristicAgent(random.Random(1))
+        robber_tile = game.board.find_tile_with_calamity(game.robber)
+
+        x, y = agent.choose_tile(game, game.players[0])
+
+        self.assertFalse(game.board.tiles[x][y] is robber_tile)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import random
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.dice import Dice, numpy
+from engine.src.resource_type import ResourceType
+from engine.src.simulation.headless_driver import HeadlessDriver
+from engine.src.simulation.production_simulator import ProductionSimulator
+
+
+@unittest.skipIf(numpy is None, 'needs numpy')
+class ProductionSimulatorTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+    def new_game(self, seed, player_count=3):
+        game = HeadlessDriver(player_count=player_count).create_game(seed)
+        game.initial_settlement_and_road_placement()
+
+        return game
+
+    def test_roll_batch(self):
+        dice = Dice(rng=random.Random(1))
+        rolls = dice.roll_batch((1000, 100))
+
+        self.assertEqual((1000, 100), rolls.shape)
+        self.assertEqual(2, rolls.min())
+        self.assertEqual(12, rolls.max())
+        self.assertAlmostEqual(7, rolls.mean(), places=1)
+
+        self.assertTrue((Dice(rng=random.Random(1)).roll_batch(10) ==
+                         Dice(rng=random.Random(1)).roll_batch(10)).all())
+
+    def test_simulate(self):
+        games = [self.new_game(seed) for seed in range(3)]
+        simulator = ProductionSimulator(Dice(rng=random.Random(1)))
+
+        distribution = simulator.simulate(games, 50, 2000, threshold=3)
+
+        self.assertEqual((3, 3, 5), distribution.expected_income.shape)
+
+        for game_index, game in enumerate(games):
+            for player_index, player in enumerate(game.players):
+                income = game.board.production_tracker.get_expected_income(
+                    player)
+
+                for type_index, resource_type in enumerate(
+                        ResourceType.get_arable_types()):
+                    expected_income = distribution.expected_income[
+                        game_index, player_index, type_index]
+                    probability = distribution.threshold_probability[
+                        game_index, player_index, type_index]
+                    turns = distribution.turns_to_threshold[
+                        game_index, player_index, type_index]
+
+                    self.assertAlmostEqual(
+                        50 * income.get(resource_type, 0), expected_income)
+
+                    if not expected_income:
+                        self.assertEqual(0, distribution.income_variance[
+                            game_index, player_index, type_index])
+                        self.assertEqual(0, probability)
+                        self.assertEqual(51, turns)
+                    elif expected_income > 10:
+                        self.assertGreater(probability, 0.9)
+                        self.assertLess(turns, 50)
+
+    def test_simulated_moments(self):
+        game = self.new_game(1)
+        simulator = ProductionSimulator(Dice(rng=random.Random(2)))
+
+        table = simulator.get_production_table(game)
+        distribution = simulator.simulate([game], 20)
+
+        income = table[simulator.dice.roll_batch((20000, 20))].sum(axis=1)
+
+        self.assertTrue(numpy.allclose(distribution.expected_income[0],
+                                       income.mean(axis=0), atol=0.1))
+        self.assertTrue(numpy.allclose(distribution.income_variance[0],
+                                       income.var(axis=0), rtol=0.1,
+                                       atol=0.1))
+
+    def test_large_totals(self):
+        game = self.new_game(1)
+        simulator = ProductionSimulator(Dice(rng=random.Random(3)))
+
+        # Past what int16 totals can hold.
+        table = simulator.get_production_table(game)
+        threshold = 2 ** 15 + 100
+        turn_count = int(1.5 * threshold /
+                         simulator.simulate([game], 1, 1).expected_income.max())
+
+        distribution = simulator.simulate([game], turn_count, 2, threshold)
+
+        rolls = Dice(rng=random.Random(3)).roll_batch((2, turn_count))
+        reached = table[rolls].cumsum(axis=1, dtype=numpy.int64) >= threshold
+
+        probability = reached.any(axis=1).mean(axis=0)
+
+        self.assertTrue(reached.any())
+        self.assertTrue(numpy.array_equal(
+            probability, distribution.threshold_probability[0]))
+
+    def test_player_counts(self):
+        simulator = ProductionSimulator()
+
+        self.assertRaises(ValueError, simulator.simulate,
+                          [self.new_game(1, 2), self.new_game(1, 3)], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
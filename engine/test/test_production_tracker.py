@@ -0,0 +1,132 @@
+import random
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.board.game_board import GameBoard
+from engine.src.board.board_state import BoardStorage
+from engine.src.board.production_tracker import ProductionTracker
+from engine.src.calamity.robber import Robber
+from engine.src.dice import Dice
+from engine.src.player import Player
+from engine.src.resource_type import ResourceType
+
+
+class ProductionTrackerTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.players = [Player('Alice'), Player('Bob')]
+
+    def find_production(self, board):
+        """Compute every roll's production by walking the whole board."""
+
+        production = {}
+
+        for tile in board.iter_arable_tiles():
+            if tile.calamities:
+                continue
+
+            for structure in tile.get_adjacent_vertex_structures():
+                resources = production.setdefault(tile.chit_value, {}) \
+                    .setdefault(structure.owning_player, {})
+
+                resources[tile.resource_type] = \
+                    resources.get(tile.resource_type, 0) + structure.base_yield
+
+        return production
+
+    def build_settlements(self, board, count, seed):
+        rng = random.Random(seed)
+        vertex_ids = rng.sample(range(board.topology.vertex_count), count)
+
+        for index, vertex_id in enumerate(vertex_ids):
+            player = self.players[index % len(self.players)]
+            board.update_vertex_by_id(vertex_id,
+                                      player.get_structure('Settlement'))
+            player.init_structure_counts()
+
+        return vertex_ids
+
+    def test_matches_board(self):
+        for storage in BoardStorage:
+            board = GameBoard(3, storage)
+            self.build_settlements(board, 8, 1)
+
+            self.assertEqual(self.find_production(board),
+                             board.production_tracker.production)
+
+    def test_upgrade_robber_and_tile_changes(self):
+        board = GameBoard(3)
+        vertex_ids = self.build_settlements(board, 8, 4)
+        alice = self.players[0]
+
+        board.update_vertex_by_id(vertex_ids[0], alice.get_structure('City'))
+        self.assertEqual(self.find_production(board),
+                         board.production_tracker.production)
+
+        x, y = board.topology.tile_coords[
+            board.topology.vertex_tiles[vertex_ids[0]][0]]
+        robber = Robber()
+
+        board.place_calamity(x, y, robber)
+        self.assertEqual(self.find_production(board),
+                         board.production_tracker.production)
+
+        board.tiles[x][y].remove_calamity(robber)
+        board.tiles[x][y].resource_type = ResourceType.ORE
+        board.tiles[x][y].chit_value = 11
+        self.assertEqual(self.find_production(board),
+                         board.production_tracker.production)
+
+        self.assertEqual(self.find_production(board),
+                         ProductionTracker(board).production)
+
+    def test_distribution_is_row_lookup(self):
+        board = GameBoard(3)
+        self.build_settlements(board, 6, 2)
+
+        for roll_value in range(2, 13):
+            expected = board.production_tracker.production.get(roll_value, {})
+            distributions = board.distribute_resources_for_roll(roll_value)
+
+            for player in self.players:
+                self.assertEqual(expected.get(player, {}), dict(
+                    (resource_type, count) for resource_type, count in
+                    distributions[player].items() if count))
+
+    def test_expected_income(self):
+        board = GameBoard(3)
+        self.build_settlements(board, 6, 3)
+        alice = self.players[0]
+
+        probabilities = Dice().get_roll_probabilities()
+        expected = {}
+
+        for roll_value, players in \
+                board.production_tracker.production.items():
+            for resource_type, count in players.get(alice, {}).items():
+                expected[resource_type] = expected.get(resource_type, 0) + \
+                    probabilities.get(roll_value, 0) * count
+
+        income = board.production_tracker.get_expected_income(alice)
+
+        self.assertEqual(set(expected), set(income))
+
+        for resource_type in expected:
+            self.assertAlmostEqual(expected[resource_type],
+                                   income[resource_type])
+
+
+class DiceTests(unittest.TestCase):
+    def test_roll_probabilities(self):
+        probabilities = Dice().get_roll_probabilities()
+
+        self.assertEqual(range(2, 13), sorted(probabilities))
+        self.assertAlmostEqual(1.0, sum(probabilities.values()))
+        self.assertAlmostEqual(6 / 36.0, probabilities[7])
+        self.assertAlmostEqual(1 / 36.0, probabilities[12])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import copy
+import pickle
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.card.development_card import DevelopmentCard
+from engine.src.player import Player
+from engine.src.structure.structure import Structure
+
+
+class PrototypeRegistryTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = copy.deepcopy(game_config)
+        Config.init()
+
+        self.player = Player('Alice')
+
+    def tearDown(self):
+        Config.config = game_config
+        Config.init()
+
+    def test_structures_match_constructor(self):
+        for key, structure_dict in \
+                Config.get('game.structure.player_built').iteritems():
+            structure = Structure.from_config(self.player, key)
+
+            self.assertIsInstance(structure, Structure)
+            self.assertEqual({'owning_player': self.player},
+                             structure.__dict__)
+            self.assertTrue(structure.owning_player is self.player)
+            self.assertTrue(type(structure) is
+                            type(Structure.from_config(self.player, key)))
+
+            expected = Structure(self.player, **structure_dict)
+
+            for name in vars(expected):
+                self.assertEqual(getattr(expected, name),
+                                 getattr(structure, name), name)
+
+    def test_cards_match_constructor(self):
+        for key, card_dict in Config.get('game.card.development').iteritems():
+            card = DevelopmentCard.from_config(key)
+            expected = DevelopmentCard(**card_dict)
+
+            self.assertEqual({'played': False, 'is_playable': True},
+                             card.__dict__)
+
+            for name in vars(expected):
+                value = getattr(expected, name)
+
+                if callable(value):
+                    self.assertTrue(callable(getattr(card, name)))
+                else:
+                    self.assertEqual(value, getattr(card, name), name)
+
+    def test_config_functions_are_methods(self):
+        calls = []
+
+        def play_card(card, game, player):
+            calls.append((card, game, player))
+
+        Config.config['game']['card']['development']['monopoly'] \
+            ['play_card'] = play_card
+        Config.invalidate()
+
+        card = DevelopmentCard.from_config('monopoly')
+        card.play_card('game', self.player)
+
+        self.assertEqual([(card, 'game', self.player)], calls)
+
+    def test_rebuilt_on_config_change(self):
+        road = Structure.from_config(self.player, 'road')
+
+        Config.set('Path', 'game.structure.player_built.road.name')
+
+        self.assertEqual('Path',
+                         Structure.from_config(self.player, 'road').name)
+        self.assertEqual('Road', road.name)
+
+    def test_copy_and_pickle(self):
+        road = Structure.from_config(self.player, 'road')
+        card = DevelopmentCard.from_config('knight')
+        card.played = True
+
+        for copied_road, copied_card in [
+                copy.deepcopy((road, card)),
+                pickle.loads(pickle.dumps((road, card), 2))]:
+            self.assertTrue(type(copied_road) is type(road))
+            self.assertEqual(self.player, copied_road.owning_player)
+
+            self.assertTrue(type(copied_card) is type(card))
+            self.assertTrue(copied_card.played)
+
+
+if __name__ == '__main__':
+    unittest.main()
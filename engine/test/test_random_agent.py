@@ -0,0 +1,40 @@
+import unittest
+
+from engine.src.card.development_card import DevelopmentCard
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.exceptions import NotEnoughResourcesException
+from engine.src.simulation.headless_driver import HeadlessDriver
+
+
+class RandomAgentTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.game = HeadlessDriver().create_game(1)
+        self.player = self.game.players[0]
+        self.agent = self.game.input_manager.agents[self.player]
+
+    def test_failed_card(self):
+        def play_card(dev_card, game, player):
+            raise NotEnoughResourcesException(game.board.bank, 'grain')
+
+        dev_card = DevelopmentCard(play_card=play_card)
+
+        self.assertFalse(self.agent._play_card(self.game, self.player,
+                                               dev_card))
+        self.assertEqual(1, self.agent.failed_card_count)
+
+    def test_broken_card(self):
+        def play_card(dev_card, game, player):
+            raise RuntimeError('Not a game rule')
+
+        dev_card = DevelopmentCard(play_card=play_card)
+
+        self.assertRaises(RuntimeError, self.agent._play_card, self.game,
+                          self.player, dev_card)
+        self.assertEqual(0, self.agent.failed_card_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import random
+import unittest
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.board.game_board import GameBoard
+from engine.src.board.board_state import BoardStorage
+from engine.src.board.tile_index_tracker import TileIndexTracker
+from engine.src.calamity.robber import Robber
+from engine.src.player import Player
+from engine.src.vertex import Vertex
+
+
+class TileIndexTrackerTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.player = Player('Alice')
+
+    def find_tile_ids(self, board, roll_value):
+        """Find the producing tiles of a roll by walking the whole board."""
+
+        return [board.topology.tile_ids[(tile.x, tile.y)]
+                for tile in board.iter_tiles()
+                if tile.chit_value == roll_value and not tile.calamities]
+
+    def test_chit_value_index(self):
+        board = GameBoard(3)
+
+        for roll_value in range(2, 13):
+            self.assertEqual(
+                sorted(self.find_tile_ids(board, roll_value)),
+                board.tile_index.get_producing_tile_ids(roll_value))
+
+    def test_chit_reassignment_and_robber(self):
+        board = GameBoard(3)
+        tile = board.tiles[0][0]
+        tile_id = board.topology.tile_ids[(0, 0)]
+
+        tile.chit_value = 12
+        self.assertIn(tile_id, board.tile_index.get_producing_tile_ids(12))
+
+        robber = Robber()
+        board.place_calamity(0, 0, robber)
+        self.assertNotIn(tile_id, board.tile_index.get_producing_tile_ids(12))
+
+        tile.remove_calamity(robber)
+        self.assertIn(tile_id, board.tile_index.get_producing_tile_ids(12))
+
+        tile.chit_value = 2
+        self.assertNotIn(tile_id, board.tile_index.get_producing_tile_ids(12))
+        self.assertIn(tile_id, board.tile_index.get_producing_tile_ids(2))
+
+    def test_structures_by_tile(self):
+        board = GameBoard(3, BoardStorage.ARRAYS)
+        topology = board.topology
+        vertex_id = topology.tile_vertices[0][0]
+
+        board.update_vertex_by_id(vertex_id,
+                                  self.player.get_structure('Settlement'))
+
+        for tile_id in range(topology.tile_count):
+            structures = board.tile_index.get_tile_structures(tile_id)
+
+            if tile_id in topology.vertex_tiles[vertex_id]:
+                self.assertEqual(['Settlement'],
+                                 [structure.name for structure in structures])
+            else:
+                self.assertEqual([], structures)
+
+        board.update_vertex_by_id(vertex_id, Vertex())
+
+        self.assertEqual([], board.tile_index.get_tile_structures(0))
+
+    def test_distribution(self):
+        board = GameBoard(3)
+        topology = board.topology
+        rng = random.Random(2)
+
+        for vertex_id in rng.sample(range(topology.vertex_count), 5):
+            board.update_vertex_by_id(vertex_id,
+                                      self.player.get_structure('Settlement'))
+
+        for roll_value in range(2, 13):
+            expected = {}
+
+            for tile_id in self.find_tile_ids(board, roll_value):
+                x, y = topology.tile_coords[tile_id]
+                tile = board.tiles[x][y]
+                count = len(tile.get_adjacent_vertex_structures())
+
+                if count:
+                    expected[tile.resource_type] = \
+                        expected.get(tile.resource_type, 0) + count
+
+            distributions = board.distribute_resources_for_roll(roll_value)
+
+            # Reading the nested dict leaves empty entries behind.
+            self.assertEqual(expected, dict(
+                (resource_type, count) for resource_type, count in
+                distributions[self.player].items() if count))
+
+    def test_rebuild_matches_incremental(self):
+        board = GameBoard(3)
+
+        board.update_vertex_by_id(0, self.player.get_structure('Settlement'))
+        board.tiles[0][0].chit_value = 3
+
+        tracker = TileIndexTracker(board)
+
+        self.assertEqual(tracker.chit_tile_ids, board.tile_index.chit_tile_ids)
+        self.assertEqual(tracker.tile_structures,
+                         board.tile_index.tile_structures)
+
+
+if __name__ == '__main__':
+    unittest.main()
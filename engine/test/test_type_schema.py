@@ -0,0 +1,96 @@
+import copy
+import unittest
+
+from enum import Enum
+
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.config.type_config import type_config
+from engine.src.config.type_mapping import type_mapping
+from engine.src.config.type_schema import TypeSchema
+from engine.src.lib.utils import noop
+
+
+class TypeSchemaTests(unittest.TestCase):
+    def tearDown(self):
+        Config.config = game_config
+        Config.init()
+
+    def uncoerce(self, value):
+        """Undo coercion, giving the config as written in a config file."""
+
+        if isinstance(value, Enum):
+            return value.value
+
+        if type(value) is dict:
+            return dict((self.uncoerce(k), self.uncoerce(v))
+                        for k, v in value.iteritems())
+
+        return value
+
+    def create_raw_config(self):
+        config = self.uncoerce(copy.deepcopy(game_config))
+
+        development = config['game']['card']['development']
+        structures = config['game']['structure']['player_built']
+
+        for index in range(40):
+            development['card_{0}'.format(index)] = {
+                'count': 1,
+                'name': 'Card {0}'.format(index),
+                'cost': {'ore': index % 3, 'wool': 1},
+                'draw_card': None,
+                'play_card': None,
+            }
+
+            structures['tower-{0}'.format(index)] = {
+                'name': 'Tower {0}'.format(index),
+                'cost': {'brick': 2},
+                'position_type': 'edge' if index % 2 else 'vertex',
+            }
+
+        return config
+
+    def test_matches_path_by_path_coercion(self):
+        raw_config = self.create_raw_config()
+
+        Config.config = copy.deepcopy(raw_config)
+        Config.coerce_recursive('')
+        expected = Config.config
+
+        Config.config = copy.deepcopy(raw_config)
+        Config.coerce_all()
+
+        self.assertEqual(expected, Config.config)
+
+        card_cost = Config.config['game']['card']['development']['card_4'] \
+            ['cost']
+        self.assertEqual(set(['ore', 'wool']), set(
+            resource_type.value for resource_type in card_cost))
+        self.assertTrue(Config.config['game']['card']['development']
+                        ['card_4']['draw_card'] is noop)
+
+    def test_idempotent(self):
+        config = self.create_raw_config()
+        schema = TypeSchema(type_config, type_mapping)
+
+        schema.coerce(config)
+        coerced = copy.deepcopy(config)
+
+        stats = schema.coerce(config)
+
+        self.assertEqual(coerced, config)
+        self.assertGreater(stats['node_count'], stats['coerced_count'])
+        self.assertGreater(stats['coerced_count'], 160)
+        self.assertGreaterEqual(stats['seconds'], 0)
+
+    def test_shared_nodes(self):
+        schema = TypeSchema(type_config, type_mapping)
+        schema.coerce(self.create_raw_config())
+
+        # All cards and structures share the nodes of their default.
+        self.assertLess(len(schema.nodes), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
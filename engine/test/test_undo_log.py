@@ -0,0 +1,142 @@
+import unittest
+
+from engine.src.board.board_state import BoardStorage
+from engine.src.board.production_tracker import ProductionTracker
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.exceptions import *
+from engine.src.longest_road_tracker import LongestRoadTracker
+from engine.src.move.move import BuildMove, TradeMove, RobberMove
+from engine.src.move.undo_log import UndoLog
+from engine.src.resource_type import ResourceType
+from engine.src.simulation.headless_driver import HeadlessDriver
+
+
+class UndoLogTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.game = HeadlessDriver().create_game(3, BoardStorage.ARRAYS)
+        self.game.initial_settlement_and_road_placement()
+
+        self.player = self.game.players[0]
+        self.log = UndoLog(self.game)
+
+    def give(self, player, count):
+        for resource_type in ResourceType.get_arable_types():
+            player.resources[resource_type] = count
+
+    def legal_moves(self, player):
+        board = self.game.board
+
+        moves = [BuildMove(player, 'Road', edge_id)
+                 for edge_id in sorted(board.legal_road_edges(player))]
+        moves.extend(BuildMove(player, 'Settlement', vertex_id)
+                     for vertex_id in sorted(board.legal_settlement_spots(player)))
+        moves.extend(BuildMove(player, 'City', vertex_id)
+                     for vertex_id in sorted(board.legal_city_upgrades(player)))
+
+        return moves
+
+    def assertUndone(self, snapshot):
+        board = self.game.board
+
+        self.assertEqual(snapshot, self.game.snapshot())
+        self.assertEqual(ProductionTracker(board).production,
+                         board.production_tracker.production)
+        self.assertEqual(LongestRoadTracker(board).lengths,
+                         board.longest_road_tracker.lengths)
+
+    def test_build(self):
+        self.give(self.player, 5)
+        snapshot = self.game.snapshot()
+        vertex_id = sorted(
+            self.game.board.legal_city_upgrades(self.player))[0]
+
+        token = self.log.apply(BuildMove(self.player, 'City', vertex_id))
+
+        self.assertEqual('City',
+                         self.game.board.get_vertex_by_id(vertex_id).name)
+        self.assertEqual(snapshot.players[0][3] + 1, self.player.points)
+        self.assertNotEqual(snapshot, self.game.snapshot())
+
+        self.log.undo(token)
+
+        self.assertUndone(snapshot)
+        self.assertEqual([], self.log.entries)
+
+    def test_illegal_move_changes_nothing(self):
+        self.give(self.player, 0)
+        snapshot = self.game.snapshot()
+        vertex_id = sorted(
+            self.game.board.legal_city_upgrades(self.player))[0]
+
+        self.assertRaises(NotEnoughResourcesException, self.log.apply,
+                          BuildMove(self.player, 'City', vertex_id))
+
+        self.assertUndone(snapshot)
+        self.assertRaises(InvalidBaseStructureException, self.log.apply,
+                          BuildMove(self.player, 'Settlement', vertex_id,
+                                    free_to_build=True))
+
+        self.assertUndone(snapshot)
+        self.assertEqual([], self.log.entries)
+
+    def test_trade_and_robber(self):
+        self.give(self.player, 4)
+        victim = self.game.players[1]
+        self.give(victim, 1)
+        snapshot = self.game.snapshot()
+
+        trade_token = self.log.apply(TradeMove(
+            self.player, {ResourceType.ORE: 4}, {ResourceType.WOOL: 1}))
+
+        self.assertEqual(0, self.player.resources[ResourceType.ORE])
+        self.assertEqual(5, self.player.resources[ResourceType.WOOL])
+
+        robber_tile = self.game.board.find_tile_with_calamity(self.game.robber)
+        tile_id = (self.game.board.topology.tile_ids[(robber_tile.x,
+                                                      robber_tile.y)] + 1) % 19
+
+        self.log.apply(RobberMove(self.player, tile_id, victim,
+                                  ResourceType.GRAIN))
+
+        self.assertEqual(5, self.player.resources[ResourceType.GRAIN])
+        self.assertRaises(InvalidRobberPlacementException, self.log.apply,
+                          RobberMove(self.player, tile_id))
+
+        # Undoing the first move undoes the ones after it too.
+        self.log.undo(trade_token)
+
+        self.assertUndone(snapshot)
+        self.assertRaises(ValueError, self.log.undo, trade_token + 1)
+
+    def test_search(self):
+        for player in self.game.players:
+            self.give(player, 10)
+
+        snapshot = self.game.snapshot()
+
+        def search(depth):
+            if not depth:
+                return 1
+
+            leaf_count = 0
+
+            for player in self.game.players:
+                for move in self.legal_moves(player)[:3]:
+                    before = self.game.snapshot()
+                    token = self.log.apply(move)
+                    leaf_count += search(depth - 1)
+                    self.log.undo(token)
+
+                    self.assertEqual(before, self.game.snapshot())
+
+            return leaf_count
+
+        self.assertGreater(search(2), 1)
+        self.assertUndone(snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import random
+import unittest
+
+from engine.src.board.board_balancer import BalancedBoardGenerator
+from engine.src.board.game_board import GameBoard
+from engine.src.board.vertex_yield_tracker import VertexYieldTracker
+from engine.src.calamity.robber import Robber
+from engine.src.config.config import Config
+from engine.src.config.game_config import game_config
+from engine.src.player import Player
+from engine.src.resource_type import ResourceType
+from engine.src.vertex import Vertex
+
+
+class VertexYieldTrackerTests(unittest.TestCase):
+    def setUp(self):
+        Config.config = game_config
+
+        self.player = Player('Alice')
+
+    def assertMatchesRebuild(self, board):
+        """Check the board's index against one built from scratch."""
+
+        index = board.vertex_yield_index
+        tracker = VertexYieldTracker(board)
+
+        self.assertEqual(tracker.resource_pips, index.resource_pips)
+        self.assertEqual(tracker.values, index.values)
+        self.assertEqual(tracker.ranking, index.ranking)
+        self.assertEqual(
+            [sorted(resource_types, key=str)
+             for resource_types in tracker.resource_types],
+            [sorted(resource_types, key=str)
+             for resource_types in index.resource_types])
+
+    def test_index(self):
+        board = GameBoard(3, rng=random.Random(1))
+        topology = board.topology
+        index = board.vertex_yield_index
+        pips = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
+
+        for vertex_id in range(topology.vertex_count):
+            tiles = [board.tiles[x][y] for x, y in
+                     (topology.tile_coords[tile_id] for tile_id in
+                      topology.vertex_tiles[vertex_id])]
+            arable_tiles = [tile for tile in tiles
+                            if tile.resource_type != ResourceType.FALLOW]
+
+            self.assertEqual(
+                sum(pips[tile.chit_value] for tile in arable_tiles
+                    if not tile.calamities),
+                index.pips[vertex_id])
+            self.assertEqual(
+                len(set(tile.resource_type for tile in arable_tiles
+                        if not tile.calamities)),
+                index.diversity[vertex_id])
+            self.assertEqual(len(arable_tiles),
+                             len(index.resource_types[vertex_id]))
+
+        best_vertex_ids = index.get_best_vertex_ids()
+
+        self.assertEqual(topology.vertex_count, len(best_vertex_ids))
+        self.assertEqual(
+            sorted(range(topology.vertex_count),
+                   key=lambda vertex_id: (-index.get_value(vertex_id),
+                                          vertex_id)),
+            best_vertex_ids)
+        self.assertEqual(best_vertex_ids[:3], index.get_best_vertex_ids(3))
+
+    def test_placements(self):
+        board = GameBoard(3, rng=random.Random(2))
+        index = board.vertex_yield_index
+
+        vertex_id = index.get_best_vertex_ids(1)[0]
+        settlement = self.player.get_structure('Settlement')
+
+        board.update_vertex_by_id(vertex_id, settlement)
+
+        # The settlement and the Distance Rule take its spot and its
+        # neighbors' out of the ranking.
+        self.assertEqual(board.legal_settlement_spots(self.player, True),
+                         set(index.get_best_vertex_ids()))
+        self.assertNotIn(vertex_id, index.get_best_vertex_ids())
+        self.assertMatchesRebuild(board)
+
+        board.update_vertex_by_id(vertex_id, Vertex())
+
+        self.assertEqual(vertex_id, index.get_best_vertex_ids(1)[0])
+        self.assertMatchesRebuild(board)
+
+    def test_robber_and_tile_changes(self):
+        board = GameBoard(3, rng=random.Random(3))
+        topology = board.topology
+        index = board.vertex_yield_index
+
+        tile_id = board.tile_index.get_tile_ids_with_chit_value(6)[0]
+        x, y = topology.tile_coords[tile_id]
+        vertex_id = topology.tile_vertices[tile_id][0]
+        pips = index.pips[vertex_id]
+
+        robber = Robber()
+        board.place_calamity(x, y, robber)
+
+        self.assertEqual(pips - 5, index.pips[vertex_id])
+        self.assertMatchesRebuild(board)
+
+        board.tiles[x][y].remove_calamity(robber)
+
+        self.assertEqual(pips, index.pips[vertex_id])
+        self.assertMatchesRebuild(board)
+
+        board.tiles[x][y].chit_value = 2
+
+        self.assertEqual(pips - 4, index.pips[vertex_id])
+        self.assertMatchesRebuild(board)
+
+        BalancedBoardGenerator.from_board(board).assign(board)
+
+        self.assertMatchesRebuild(board)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import errno
+import hashlib
+import imp
+import marshal
+import os
+import tempfile
+
+class FunctionCache(object):
+    """A content-addressed cache of the code compiled from Skit functions
+
+    Code objects are stored under a hash of the function source, the cache's version and the Python bytecode
+    version, in memory and, given a directory, on disk as marshalled files. Reloading a function whose source hasn't
+    changed then skips lexing, parsing and compiling it, even in a new process.
+    """
+
+    def __init__(self, directory=None, version=''):
+        """Creates a FunctionCache
+
+        Named Args:
+            directory (String): None -- A string representing the directory to store code objects in, or None to
+                only cache them in memory
+            version (String): '' -- A string identifying how code is generated from source, e.g. the grammar version
+
+        Returns:
+            FunctionCache. An empty cache, apart from any code objects already in the directory
+        """
+        self.directory = directory
+        self.version = version
+        self.code_objects = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source, *parts):
+        """Computes the key of the code compiled from the given source
+
+        Args:
+            source (String): The source code being compiled
+            *parts (String): Any further strings the compiled code depends on, e.g. a compilation mode
+
+        Returns:
+            String. A hex digest identifying the source, parts, this cache's version and the Python bytecode version
+        """
+        digest = hashlib.sha1()
+        for part in (imp.get_magic(), self.version, source) + parts:
+            if isinstance(part, unicode):
+                part = part.encode('utf-8')
+            digest.update('%d:%s' % (len(part), part))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Gets the code object stored under the given key
+
+        Args:
+            key (String): A key as returned by key()
+
+        Returns:
+            Code. The code object, or None if there isn't one or it can't be read
+        """
+        code = self.code_objects.get(key)
+        if code is None and self.directory:
+            code = self._load(key)
+            if code is not None:
+                self.code_objects[key] = code
+        if code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def set(self, key, code):
+        """Stores a code object under the given key
+
+        Args:
+            key (String): A key as returned by key()
+            code (Code): The code object to store
+        """
+        self.code_objects[key] = code
+        if self.directory:
+            self._store(key, code)
+
+    def clear(self):
+        """Removes every code object from memory, leaving any on disk
+        """
+        self.code_objects = {}
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.marshal')
+
+    def _load(self, key):
+        try:
+            with open(self.path(key), 'rb') as code_file:
+                return marshal.loads(code_file.read())
+        except (IOError, EOFError, ValueError, TypeError):
+            # Missing, truncated or corrupt files are misses; they are overwritten once recompiled.
+            return None
+
+    def _store(self, key, code):
+        try:
+            os.makedirs(self.directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                return
+
+        # Write to a temporary file first so concurrent readers never see a partial file
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as tmp_file:
+                marshal.dump(code, tmp_file)
+            os.rename(tmp_path, self.path(key))
+        except (IOError, OSError):
+            pass
@@ -0,0 +1,287 @@
+import ast
+
+from oracle import GameOracle
+
+# Compilation modes for injected names, i.e. the parameters of a top-level function, which are read from the ORACLE
+
+# Every read of an injected name calls ORACLE.get()
+DYNAMIC = 'dynamic'
+
+# Injected names are looked up once, into locals, at function entry, and looked up again only after a statement
+# containing a call, when the ORACLE's version changed. Same behavior as DYNAMIC.
+HOISTED = 'hoisted'
+
+# Injected names are bound to closure cells from a snapshot of the game state taken when the function is created,
+# so later changes to the state aren't seen by the function
+BOUND = 'bound'
+
+MODES = (DYNAMIC, HOISTED, BOUND)
+
+# Names of the generated variables
+LOCAL_PREFIX = '__injected_'
+MISSING_NAME = '__missing'
+VERSION_NAME = '__oracle_version'
+BINDER_NAME = '__bind'
+
+def injected_name(node):
+    """Gets the name read by an ORACLE.get('name') call, as generated by RewriteInjected
+
+    Args:
+        node (ast.AST): The node to check
+
+    Returns:
+        String. The injected name, or None if the node isn't such a call
+    """
+    if (isinstance(node, ast.Call) and
+            isinstance(node.func, ast.Attribute) and
+            node.func.attr == 'get' and
+            isinstance(node.func.value, ast.Name) and
+            node.func.value.id == 'ORACLE' and
+            len(node.args) == 1 and
+            isinstance(node.args[0], ast.Str) and
+            not (node.keywords or node.starargs or node.kwargs)):
+        return node.args[0].s
+    return None
+
+def local_name(name):
+    return LOCAL_PREFIX + name
+
+def contains_call(node):
+    """Checks if evaluating the node may call a function, other than reading an injected name
+
+    Args:
+        node (ast.AST): The node to check
+
+    Returns:
+        Bool. True if any node below it, not in a nested function, is a call
+    """
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.FunctionDef, ast.Lambda)):
+            continue
+        if isinstance(child, ast.Call) and injected_name(child) is None:
+            return True
+        if contains_call(child):
+            return True
+    return False
+
+def _load(name):
+    return ast.Name(name, ast.Load())
+
+def _store(name):
+    return ast.Name(name, ast.Store())
+
+def _oracle_call(method, *args):
+    return ast.Call(ast.Attribute(_load('ORACLE'), method, ast.Load()), list(args), [], None, None)
+
+class InjectedNames(ast.NodeVisitor):
+    def __init__(self):
+        """Creates a NodeVisitor object to collect the injected names read outside of nested functions
+
+        Returns:
+            An instance of InjectedNames whose names attribute is filled in by its visit method
+        """
+        super(InjectedNames, self).__init__()
+        self.names = set()
+
+    def visit_Call(self, node):
+        name = injected_name(node)
+        if name is None:
+            self.generic_visit(node)
+        else:
+            self.names.add(name)
+
+    def visit_FunctionDef(self, node):
+        pass
+
+    def visit_Lambda(self, node):
+        pass
+
+class ReadInjectedLocals(ast.NodeTransformer):
+    def __init__(self):
+        """Creates a NodeTransformer object to replace ORACLE.get('name') calls by reads of a local variable,
+        falling back to the call when the variable holds ORACLE.MISSING
+
+        Nested functions are left as they are, since they may run after the locals are stale.
+
+        Returns:
+            An instance of ReadInjectedLocals whose visit method will rewrite the calls
+        """
+        super(ReadInjectedLocals, self).__init__()
+
+    def read(self, name, node):
+        """Creates an expression reading an injected name from its local variable
+
+        Args:
+            name (String): The injected name
+            node (ast.Call): The ORACLE.get() call reading it
+
+        Returns:
+            ast.IfExp. The expression (local if local is not MISSING else ORACLE.get('name'))
+        """
+        local = local_name(name)
+        return ast.copy_location(ast.IfExp(
+            ast.Compare(_load(local), [ast.IsNot()], [_load(MISSING_NAME)]),
+            _load(local),
+            node
+        ), node)
+
+    def visit_Call(self, node):
+        name = injected_name(node)
+        if name is not None:
+            return self.read(name, node)
+        return self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        return node
+
+    def visit_Lambda(self, node):
+        return node
+
+class HoistInjected(ReadInjectedLocals):
+    def __init__(self, names):
+        """Creates a NodeTransformer object to compile a function body in HOISTED mode
+
+        Injected names are only read from locals until a call may have changed the ORACLE's state: within a
+        statement, reads evaluated after a call keep calling ORACLE.get(), and each statement containing a call is
+        followed by a refresh of the locals if the ORACLE's version changed.
+
+        Args:
+            names (Iterable): An iterable representing the injected names to hoist
+
+        Returns:
+            An instance of HoistInjected whose body method will rewrite a function body
+        """
+        super(HoistInjected, self).__init__()
+        self.names = sorted(names)
+        self.called = False
+
+    def lookups(self):
+        """Creates the statements storing the ORACLE's version and the injected names into locals
+
+        Returns:
+            List. The assignment statements
+        """
+        return [ast.Assign([_store(VERSION_NAME)], ast.Attribute(_load('ORACLE'), 'version', ast.Load()))] + [
+            ast.Assign([_store(local_name(name))], _oracle_call('peek', ast.Str(name)))
+            for name in self.names
+        ]
+
+    def prologue(self):
+        return [ast.Assign([_store(MISSING_NAME)], ast.Attribute(_load('ORACLE'), 'MISSING', ast.Load()))] + \
+            self.lookups()
+
+    def refresh(self):
+        return ast.If(
+            ast.Compare(ast.Attribute(_load('ORACLE'), 'version', ast.Load()), [ast.NotEq()], [_load(VERSION_NAME)]),
+            self.lookups(),
+            []
+        )
+
+    def body(self, stmts, refresh_first=False):
+        """Rewrites a list of statements
+
+        Args:
+            stmts (List): The statements to rewrite
+
+        Named Args:
+            refresh_first (Bool): False -- A boolean representing whether the locals may be stale on entry
+
+        Returns:
+            List. The rewritten statements
+        """
+        body = [self.refresh()] if refresh_first else []
+        for stmt in stmts:
+            called = contains_call(stmt)
+            self.called = False
+            body.append(self.visit(stmt))
+            if called:
+                body.append(self.refresh())
+        return body
+
+    def visit_Call(self, node):
+        name = injected_name(node)
+        if name is not None:
+            return node if self.called else self.read(name, node)
+
+        # The function, then the arguments, are evaluated before the call
+        node = self.generic_visit(node)
+        self.called = True
+        return node
+
+    def visit_Assign(self, node):
+        # The value is evaluated before the targets
+        node.value = self.visit(node.value)
+        node.targets = [self.visit(target) for target in node.targets]
+        return node
+
+    def visit_If(self, node):
+        node.test = self.visit(node.test)
+        called = self.called
+        node.body = self.body(node.body, called)
+        node.orelse = self.body(node.orelse, called) if node.orelse else []
+        return node
+
+    def visit_While(self, node):
+        # The test runs again after the body, whose last call is followed by a refresh
+        node.test = self.visit(node.test)
+        node.body = self.body(node.body, self.called)
+        node.orelse = self.body(node.orelse, self.called) if node.orelse else []
+        return node
+
+    def visit_For(self, node):
+        node.iter = self.visit(node.iter)
+        node.body = self.body(node.body, self.called)
+        node.orelse = self.body(node.orelse, self.called) if node.orelse else []
+        return node
+
+def compile_injected(module, mode):
+    """Rewrites the reads of injected names in a parsed top-level function for the given mode
+
+    Args:
+        module (ast.Module): The parse of a top-level function, with injected names read by ORACLE.get() calls
+        mode (String): One of MODES
+
+    Returns:
+        ast.Module. The rewritten module, which in BOUND mode defines a function BINDER_NAME taking ORACLE.MISSING
+        and the value of each injected name, in sorted order, and returning the top-level function
+    """
+    if mode not in MODES:
+        raise ValueError('Unknown compilation mode "%s"' % mode)
+
+    if mode == DYNAMIC:
+        return module
+
+    func = module.body[0]
+    names = InjectedNames()
+    for stmt in func.body:
+        names.visit(stmt)
+
+    if mode == HOISTED:
+        if names.names:
+            hoist = HoistInjected(names.names)
+            func.body = hoist.prologue() + hoist.body(func.body)
+        return module
+
+    func.body = [ReadInjectedLocals().visit(stmt) for stmt in func.body]
+    params = [ast.Name(name, ast.Param()) for name in
+              [MISSING_NAME] + [local_name(name) for name in sorted(names.names)]]
+    binder = ast.FunctionDef(BINDER_NAME, ast.arguments(params, None, None, []), [
+        func,
+        ast.Return(_load(func.name))
+    ], [])
+    return ast.Module([binder])
+
+def bind(binder, state):
+    """Creates a function compiled in BOUND mode from its binder and a state snapshot
+
+    Args:
+        binder (Func): The BINDER_NAME function defined by the compiled module
+        state (Dict): A dictionary from injected names to the values to bind them to
+
+    Returns:
+        Func. The top-level function, reading injected names missing from the state from the ORACLE
+    """
+    code = binder.func_code
+    params = code.co_varnames[1:code.co_argcount]
+    return binder(GameOracle.MISSING, *[state.get(param[len(LOCAL_PREFIX):], GameOracle.MISSING)
+                                        for param in params])
@@ -12,8 +12,14 @@ class StateNotFound(Exception):
 class GameOracle(object):
     """A wrapper object for the game state, providing a simple interface to isolate development of the imperative
     parser from the game engine
+
+    Functions compiled in hoisted mode look injected variables up once and keep them until the oracle's version
+    changes, so the state should only be changed through set().
     """
 
+    # Returned by peek() for variables not in the game state
+    MISSING = object()
+
     def __init__(self, state={}):
         """Creates an instance of a GameOracle
 
@@ -24,6 +30,7 @@ class GameOracle(object):
             GameOracle. An oracle which can access the provided state dictionary
         """
         self.game_state = state
+        self.version = 0
 
     def get(self, name):
         """Get a variable from the GameOracle's state
@@ -42,6 +49,19 @@ class GameOracle(object):
         except KeyError:
             raise StateNotFound("Variable \"%s\" not present in game state" % name)
 
+    def peek(self, name):
+        """Get a variable from the GameOracle's state, if present
+
+        Unlike get(), never fails and never adds the variable to the state.
+
+        Args:
+            name (String): A string representing the name of the variable to retrieve
+
+        Returns:
+            Any. The value of the variable being retrieved, or GameOracle.MISSING if it isn't present
+        """
+        return self.game_state.get(name, GameOracle.MISSING)
+
     def set(self, name, var):
         """Set a particular variable in the state dict to a particular value
 
@@ -50,6 +70,7 @@ class GameOracle(object):
             var (Any): The value to store for the variable
         """
         self.game_state[name] = var
+        self.version += 1
 
 # Access game state through the game oracle
 ORACLE = GameOracle(defaultdict(list))
\ No newline at end of file
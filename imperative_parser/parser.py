@@ -1,9 +1,14 @@
 import ast
+import os
+import sys
 from collections import defaultdict
+from types import FunctionType
 
 import ply.lex as lex
 import ply.yacc as yacc
 
+from function_cache import FunctionCache
+from injection import HOISTED, BOUND, BINDER_NAME, compile_injected, bind
 from grammar_utils import get_registry, trivial_from_registry, trivial, gen_grammar
 from utils import flatten, find_column
 
@@ -120,8 +125,8 @@ def t_NEWLINE(t):
 def t_error(t):
     print 'Illegal character "%s"' % t.value[0]
 
-# Build the lexer
-lexer = lex.lex()
+# The lexer is built on first use, see get_lexer()
+_lexer = None
 
 # Parsing rules
 precedence = (
@@ -424,8 +429,69 @@ def p_empty(p):
     """empty :"""
     pass
 
-test_parser = yacc.yacc(start='stmtlst', errorlog=yacc.NullLogger())
-parser = yacc.yacc(start='topfunc', errorlog=yacc.NullLogger())
+# Start symbols of the parsers, which each need their own tables: 'stmtlst' for testing, 'topfunc' for functions
+START_SYMBOLS = ('stmtlst', 'topfunc')
+
+# Parsers by start symbol, built on first use, see get_parser()
+_parsers = {}
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables')
+
+def table_module_name(start):
+    return start + '_parsetab'
+
+def get_lexer():
+    """Gets the lexer, building it on first use
+
+    Returns:
+        Lexer. The lexer shared by every parser
+    """
+    global _lexer
+    if _lexer is None:
+        _lexer = lex.lex(module=sys.modules[__name__])
+    return _lexer
+
+def get_parser(start):
+    """Gets the parser for the given start symbol, loading its prebuilt tables from tables/ on first use
+
+    PLY checks the tables' version and grammar signature. If they are missing or out of date, e.g. after a grammar
+    change without running write_tables(), the parser is built in memory instead. Nothing is ever written.
+
+    Args:
+        start (String): One of START_SYMBOLS
+
+    Returns:
+        LRParser. The parser
+    """
+    parser = _parsers.get(start)
+    if parser is None:
+        name = table_module_name(start)
+        try:
+            tables = __import__('tables.' + name, globals(), {}, [name])
+        except ImportError:
+            # yacc can't import this name either, so it builds the tables
+            tables = 'tables.' + name
+        parser = yacc.yacc(module=sys.modules[__name__], start=start, tabmodule=tables, debug=0, write_tables=0,
+                           errorlog=yacc.NullLogger())
+        _parsers[start] = parser
+    return parser
+
+def write_tables():
+    """Builds the tables of every parser into tables/, to be loaded by get_parser()
+
+    Run after changing the grammar, e.g. with make tables.
+    """
+    for start in START_SYMBOLS:
+        # The qualified name only imports the tables when they're current, otherwise they're rebuilt and written
+        yacc.yacc(module=sys.modules[__name__], start=start, tabmodule='tables.' + table_module_name(start), debug=0,
+                  outputdir=os.path.relpath(TABLES_DIR), errorlog=yacc.NullLogger())
+
+# Identifies the code generated from a given function source. Bump whenever the grammar or the ASTs built from it
+# change, so that FUNCTION_CACHE doesn't return code compiled by an older version.
+GRAMMAR_VERSION = '2'
+
+# Code compiled by parse_function, by source. Only kept in memory unless given a directory.
+FUNCTION_CACHE = FunctionCache(version=GRAMMAR_VERSION)
 
 class BadParseException(Exception):
     def __init__(self, *args, **kwargs):
@@ -445,22 +511,30 @@ def parse_string(s, debug=False, testing=False):
         ast.Module. The AST representation of the provided code string
     """
     if testing:
-        body = test_parser.parse(s.strip(), debug=debug, lexer=lexer)
+        body = get_parser('stmtlst').parse(s.strip(), debug=debug, lexer=get_lexer())
     else:
-        body = parser.parse(s.strip(), debug=debug, lexer=lexer)
+        body = get_parser('topfunc').parse(s.strip(), debug=debug, lexer=get_lexer())
     return ast.Module(body)
 
-def parse_function(func_str, name='top', debug=False, line_offset=1, col_offset=1):
+def parse_function(func_str, name='top', debug=False, line_offset=1, col_offset=1, cache=None, mode=HOISTED,
+                   state=None):
     """Parses a string representing a Skit function into a first-class Python function
 
+    The function's code is looked up in a FunctionCache first, and only lexed, parsed and compiled if it isn't there.
+    How the function reads its injected parameters from the ORACLE depends on the mode, see injection.py.
+
     Args:
         func_str (String): The string representing a Skit function to parse into a Python function
 
     Named Args:
         name (String): 'top' -- A string representing the name to give the function being parsed
-        debug (Bool): False -- A boolean representing whether to print debug info
+        debug (Bool): False -- A boolean representing whether to print debug info, which bypasses the cache
         line_offset (Int): 0 -- An int representing the line offset at which the function was found
         col_offset (Int): 0 -- An int representing the column offset at which the function was found
+        cache (FunctionCache): None -- The cache of compiled code to use, FUNCTION_CACHE if None
+        mode (String): HOISTED -- A string representing the compilation mode, one of injection.MODES
+        state (Dict): None -- A dictionary representing the game state to bind injected names to in BOUND mode, a
+            snapshot of the ORACLE's state if None
 
     Returns:
         Func. A first-class Python function that performs the actions of the Skit function provided
@@ -472,11 +546,45 @@ def parse_function(func_str, name='top', debug=False, line_offset=1, col_offset=
     COL_OFFSET = col_offset
     FUNC_STR = func_str
 
-    func_ast = ast.fix_missing_locations(parse_string(func_str, debug=debug))
+    if cache is None:
+        cache = FUNCTION_CACHE
+
+    key = cache.key(func_str, mode)
+    code = None if debug else cache.get(key)
+
+    if code is None:
+        func_ast = ast.fix_missing_locations(compile_injected(parse_string(func_str, debug=debug), mode))
+        code = compile(func_ast, filename='<ast>', mode='exec')
+        cache.set(key, code)
+
+    # Defined functions keep this module's globals, where ORACLE lives
+    namespace = {}
+    exec code in globals(), namespace
+    if mode == BOUND:
+        func = bind(namespace[BINDER_NAME], ORACLE.game_state if state is None else state)
+    else:
+        func = namespace['top']
+    func.__name__ = func.func_name = name
+    func.skit_source = func_str
+    return func
 
-    exec(compile(func_ast, filename='<ast>', mode='exec'))
-    locals()[name].__name__ = locals()[name].func_name = name
-    return locals()[name]
+def function_from_code(code, name='top', source=None):
+    """Recreates a function returned by parse_function from its code, e.g. after marshalling it between processes
+
+    Args:
+        code (Code): The func_code of the function
+
+    Named Args:
+        name (String): 'top' -- A string representing the name to give the function
+        source (String): None -- The Skit source of the function, if known
+
+    Returns:
+        Func. A function equivalent to the one the code was taken from, unless it was compiled in BOUND mode, whose
+        closure isn't part of its code
+    """
+    func = FunctionType(code, globals(), name)
+    func.skit_source = source
+    return func
 
 env = locals()
 
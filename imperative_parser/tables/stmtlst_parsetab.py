@@ -0,0 +1,100 @@
+
+# imperative_parser/tables/stmtlst_parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = '\xaf\xd0\xbc\xe1\xb9J\xbd{E\xd8\xa1\x0f\xa1\xd2\xf9\x0c'
+    
+_lr_action_items = {'NEWLINE':([1,2,5,7,10,11,12,13,16,17,18,19,22,24,28,29,30,32,33,34,35,36,37,38,39,44,46,68,71,72,82,83,84,89,90,92,93,94,95,96,97,98,99,100,104,105,116,118,123,124,128,130,133,134,138,140,141,142,145,146,147,152,153,154,],[-6,-34,-8,-2,-1,-17,-4,-19,-20,-7,-27,-29,-10,50,-30,-18,-3,-16,-9,-15,-5,-20,-33,-10,-9,-35,-70,102,-45,-32,102,-28,-31,-63,102,102,-43,-52,-66,-68,-67,-69,-64,-42,-44,102,-65,-39,102,102,-38,-50,102,-71,-46,-48,-51,-36,102,-37,102,-47,-71,-49,]),'RETURN':([0,50,51,82,92,102,108,114,123,124,131,132,133,137,145,147,148,149,],[2,2,-14,-71,-71,-13,2,2,-71,-71,2,2,-71,2,-71,-71,2,2,]),'WHILE':([0,50,51,82,92,102,108,114,123,124,131,132,133,137,145,147,148,149,],[6,6,-14,-71,-71,-13,6,6,-71,-71,6,6,-71,6,-71,-71,6,6,]),'PRINT':([0,50,51,82,92,102,108,114,123,124,131,132,133,137,145,147,148,149,],[8,8,-14,-71,-71,-13,8,8,-71,-71,8,8,-71,8,-71,-71,8,8,]),')':([1,5,7,10,12,17,18,19,30,35,36,38,39,42,45,46,51,52,55,56,57,58,68,71,78,79,80,81,83,87,88,89,90,93,94,95,96,97,98,99,100,101,102,104,105,111,112,113,115,116,117,118,119,126,128,129,],[-6,-8,-2,-1,-4,-7,-27,-29,-3,-5,-20,-10,-9,-71,83,-70,-14,-71,-12,-61,-20,-11,-71,-45,-54,106,-55,-57,-28,110,-71,-63,-71,-43,-52,-66,-68,-67,-69,-64,-42,-71,-13,-44,-71,125,-71,-62,128,-65,-71,-39,-56,-60,-38,-53,]),'(':([0,1,2,4,5,6,7,8,10,12,14,15,16,17,18,19,22,25,26,27,28,30,31,33,35,36,37,38,39,40,41,43,44,45,46,47,50,51,53,57,58,59,60,61,62,63,64,65,67,68,69,70,71,72,75,76,77,82,83,84,85,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,107,108,109,112,113,114,116,118,119,123,124,128,131,132,133,137,139,144,145,147,148,149,],[14,-6,14,42,-8,14,-2,14,-1,-4,14,14,-20,-7,-27,-29,-10,52,14,14,68,-3,14,-9,-5,-20,68,-10,-9,14,14,68,68,68,68,14,14,-14,88,-20,68,68,14,14,14,14,14,14,14,-71,14,14,68,68,-10,68,-9,-71,-28,68,14,-63,-71,14,-71,68,68,68,68,68,68,-64,68,14,-13,68,68,14,14,14,68,14,68,14,-65,68,68,-71,-71,-38,14,14,-71,14,14,68,-71,-71,14,14,]),'+':([1,5,7,10,12,16,17,18,19,22,28,30,33,35,36,37,38,39,43,44,45,46,57,58,59,71,72,75,76,77,83,84,89,93,94,95,96,97,98,99,100,103,104,109,113,116,118,119,128,144,],[-6,-8,-2,-1,-4,-20,-7,-27,-29,-10,62,-3,-9,-5,-20,62,-10,-9,62,62,62,-70,-20,62,62,-45,62,-10,62,-9,-28,62,-63,-43,-52,-66,-68,-67,-69,-64,-42,62,-44,62,62,-65,62,62,-38,62,]),'*':([1,5,7,10,12,16,17,18,19,22,28,30,33,35,36,37,38,39,43,44,45,46,57,58,59,71,72,75,76,77,83,84,89,93,94,95,96,97,98,99,100,103,104,109,113,116,118,119,128,144,],[-6,-8,-2,-1,-4,-20,-7,-27,-29,-10,63,-3,-9,-5,-20,63,-10,-9,63,63,63,-70,-20,63,63,-45,63,-10,63,-9,-28,63,-63,-43,-52,63,-68,63,-69,-64,-42,63,-44,63,63,-65,63,63,-38,63,]),'-':([0,1,2,5,6,7,8,10,12,14,15,16,17,18,19,22,26,27,28,30,31,33,35,36,37,38,39,40,41,43,44,45,46,47,50,51,57,58,59,60,61,62,63,64,65,67,68,69,70,71,72,75,76,77,82,83,84,85,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,107,108,109,112,113,114,116,118,119,123,124,128,131,132,133,137,139,144,145,147,148,149,],[15,-6,15,-8,15,-2,15,-1,-4,15,15,-20,-7,-27,-29,-10,15,15,64,-3,15,-9,-5,-20,64,-10,-9,15,15,64,64,64,-70,15,15,-14,-20,64,64,15,15,15,15,15,15,15,-71,15,15,-45,64,-10,64,-9,-71,-28,64,15,-63,-71,15,-71,-43,-52,-66,-68,-67,-69,-64,-42,15,-13,64,-44,15,15,15,64,15,64,15,-65,64,64,-71,-71,-38,15,15,-71,15,15,64,-71,-71,15,15,]),',':([1,3,5,7,10,12,16,17,18,19,22,26,30,33,35,36,38,39,42,46,51,52,55,56,57,58,68,71,73,75,77,78,80,81,83,88,89,90,93,94,95,96,97,98,99,100,101,102,104,105,112,113,116,117,118,119,128,],[-6,41,-8,-2,-1,-4,-21,-7,-27,-29,-26,-71,-3,-25,-5,-20,-10,-9,-71,-70,-14,-71,-12,90,-20,-11,-71,-45,41,-26,-25,105,-55,-57,-28,-71,-63,-71,-43,-52,-66,-68,-67,-69,-64,-42,-71,-13,-44,-71,-71,-62,-65,-71,-39,-56,-38,]),'/':([1,5,7,10,12,16,17,18,19,22,28,30,33,35,36,37,38,39,43,44,45,46,57,58,59,71,72,75,76,77,83,84,89,93,94,95,96,97,98,99,100,103,104,109,113,116,118,119,128,144,],[-6,-8,-2,-1,-4,-20,-7,-27,-29,-10,65,-3,-9,-5,-20,65,-10,-9,65,65,65,-70,-20,65,65,-45,65,-10,65,-9,-28,65,-63,-43,-52,65,-68,65,-69,-64,-42,65,-44,65,65,-65,65,65,-38,65,]),'.':([1,5,7,10,12,16,17,18,19,22,28,30,33,35,36,37,38,39,43,44,45,46,57,58,59,71,72,75,76,77,83,84,89,93,94,95,96,97,98,99,100,103,104,109,113,116,118,119,128,144,],[-6,-8,-2,-1,-4,-20,-7,-27,-29,-10,66,-3,-9,-5,-20,66,-10,-9,66,66,66,66,-20,66,66,66,66,-10,66,-9,-28,66,-63,66,66,66,66,66,66,-64,66,66,66,66,66,-65,66,66,-38,66,]),'TO':([1,5,7,10,12,16,17,18,19,22,28,30,33,35,36,37,38,39,43,44,45,46,57,58,59,71,72,75,76,77,83,84,89,93,94,95,96,97,98,99,100,103,104,109,113,116,118,119,128,144,],[-6,-8,-2,-1,-4,-20,-7,-27,-29,-10,61,-3,-9,-5,-20,61,-10,-9,61,61,61,-70,-20,61,61,-45,61,-10,61,-9,-28,61,-63,61,-52,61,61,61,61,-64,61,61,61,61,61,-65,61,61,-38,61,]),'NUM':([0,2,6,8,14,15,26,27,31,40,41,47,50,51,60,61,62,63,64,65,67,68,69,70,82,85,90,91,92,101,102,106,107,108,112,114,123,124,131,132,133,137,139,145,147,148,149,],[18,18,18,18,18,18,18,18,18,18,18,18,18,-14,18,18,18,18,18,18,18,-71,18,18,-71,18,-71,18,-71,18,-13,18,18,18,18,18,-71,-71,18,18,-71,18,18,-71,-71,18,18,]),'=':([3,16,20,21,22,33,57,73,74,75,77,80,99,116,],[-24,-21,-22,47,-26,-25,91,-24,-23,-26,-25,107,-64,-65,]),'$end':([1,2,5,7,9,10,11,12,13,16,17,18,19,22,24,28,29,30,32,33,34,35,36,37,38,39,44,46,49,50,51,71,72,83,84,86,89,93,94,95,96,97,98,99,100,104,116,118,128,130,134,138,140,141,142,146,152,153,154,],[-6,-34,-8,-2,0,-1,-17,-4,-19,-20,-7,-27,-29,-10,-71,-30,-18,-3,-16,-9,-15,-5,-20,-33,-10,-9,-35,-70,-59,-13,-14,-45,-32,-28,-31,-58,-63,-43,-52,-66,-68,-67,-69,-64,-42,-44,-65,-39,-38,-50,-71,-46,-48,-51,-36,-37,-47,-71,-49,]),'@':([0,2,6,8,14,15,26,27,31,40,41,47,50,51,60,61,62,63,64,65,67,68,69,70,82,85,90,91,92,101,102,106,107,108,112,114,123,124,131,132,133,137,139,145,147,148,149,],[4,4,4,4,4,4,4,4,4,4,4,4,4,-14,4,4,4,4,4,4,4,-71,4,4,-71,4,-71,4,-71,4,-13,4,4,4,4,4,-71,-71,4,4,-71,4,4,-71,-71,4,4,]),'STRING':([0,2,6,8,14,15,26,27,31,40,41,47,50,51,60,61,62,63,64,65,67,68,69,70,82,85,90,91,92,101,102,106,107,108,112,114,123,124,131,132,133,137,139,145,147,148,149,],[19,19,19,19,19,19,19,19,19,19,19,19,19,-14,19,19,19,19,19,19,19,-71,19,19,-71,19,-71,19,-71,19,-13,19,19,19,19,19,-71,-71,19,19,-71,19,19,-71,-71,19,19,]),'FOR':([0,50,51,82,92,102,108,114,123,124,131,132,133,137,145,147,148,149,],[23,23,-14,-71,-71,-13,23,23,-71,-71,23,23,-71,23,-71,-71,23,23,]),'AUGASSIGN':([3,16,22,33,99,116,],[40,-21,-26,-25,-64,-65,]),'ELSE':([134,153,],[139,139,]),'FUNC':([0,50,51,82,92,102,108,114,123,124,131,132,133,137,145,147,148,149,],[25,25,-14,-71,-71,-13,25,25,-71,-71,25,25,-71,25,-71,-71,25,25,]),'IN':([48,],[85,]),'[':([0,1,2,5,6,7,8,10,12,14,15,16,17,18,19,22,26,27,28,30,31,33,35,36,37,38,39,40,41,43,44,45,46,47,50,51,57,58,59,60,61,62,63,64,65,67,68,69,70,71,72,75,76,77,82,83,84,85,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,107,108,109,112,113,114,116,118,119,123,124,128,131,132,133,137,139,144,145,147,148,149,],[26,-6,26,-8,26,-2,26,-1,-4,26,26,-20,-7,-27,-29,-10,26,26,69,-3,26,-9,-5,-20,69,-10,-9,26,26,69,69,69,69,26,26,-14,-20,69,69,26,26,26,26,26,26,26,-71,26,26,69,69,-10,69,-9,-71,-28,69,26,-63,-71,26,-71,69,69,69,69,69,69,-64,69,26,-13,69,69,26,26,26,69,26,69,26,-65,69,69,-71,-71,-38,26,26,-71,26,26,69,-71,-71,26,26,]),']':([1,5,7,10,12,17,18,19,26,30,35,36,38,39,46,51,54,55,56,57,58,71,83,89,90,93,94,95,96,97,98,99,100,102,103,104,112,113,116,118,126,128,],[-6,-8,-2,-1,-4,-7,-27,-29,-71,-3,-5,-20,-10,-9,-70,-14,89,-12,-61,-20,-11,-45,-28,-63,-71,-43,-52,-66,-68,-67,-69,-64,-42,-13,116,-44,-71,-62,-65,-39,-60,-38,]),'ID':([0,2,6,8,14,15,23,25,26,27,31,40,41,42,47,50,51,52,60,61,62,63,64,65,66,67,68,69,70,82,85,88,90,91,92,101,102,105,106,107,108,112,114,117,123,124,131,132,133,137,139,145,147,148,149,],[16,36,36,36,36,36,48,53,57,36,36,36,16,80,36,16,-14,80,36,36,36,36,36,36,99,36,-71,36,36,-71,36,80,-71,36,-71,57,-13,-71,36,36,16,57,16,80,-71,-71,16,16,-71,16,36,-71,-71,16,16,]),'IF':([0,50,51,82,92,102,108,114,123,124,131,132,133,137,145,147,148,149,],[27,27,-14,-71,-71,-13,27,27,-71,-71,27,27,-71,27,-71,-71,27,27,]),'AND':([1,5,7,10,12,16,17,18,19,22,28,30,33,35,36,37,38,39,43,44,45,46,57,58,59,71,72,75,76,77,83,84,89,93,94,95,96,97,98,99,100,103,104,109,113,116,118,119,128,144,],[-6,-8,-2,-1,-4,-20,-7,-27,-29,-10,60,-3,-9,-5,-20,60,-10,-9,60,60,60,-70,-20,60,60,-45,60,-10,60,-9,-28,60,-63,-43,-52,60,60,60,60,-64,-42,60,60,60,60,-65,60,60,-38,60,]),'COMPOP':([1,5,7,10,12,16,17,18,19,22,28,30,33,35,36,37,38,39,43,44,45,46,57,58,59,71,72,75,76,77,83,84,89,93,94,95,96,97,98,99,100,103,104,109,113,116,118,119,128,144,],[-6,-8,-2,-1,-4,-20,-7,-27,-29,-10,67,-3,-9,-5,-20,67,-10,-9,67,67,67,-70,-20,67,67,-45,67,-10,67,-9,-28,67,-63,67,-52,67,67,67,67,-64,-42,67,67,67,67,-65,67,67,-38,67,]),'NOT':([0,2,6,8,14,15,26,27,31,40,41,47,50,51,60,61,62,63,64,65,67,68,69,70,82,85,90,91,92,101,102,106,107,108,112,114,123,124,131,132,133,137,139,145,147,148,149,],[31,31,31,31,31,31,31,31,31,31,31,31,31,-14,31,31,31,31,31,31,31,-71,31,31,-71,31,-71,31,-71,31,-13,31,31,31,31,31,-71,-71,31,31,-71,31,31,-71,-71,31,31,]),'{':([1,5,7,10,12,17,18,19,30,35,36,38,39,43,46,59,71,83,89,93,94,95,96,97,98,99,100,104,109,110,116,118,125,128,139,144,],[-6,-8,-2,-1,-4,-7,-27,-29,-3,-5,-20,-10,-9,82,-70,92,-45,-28,-63,-43,-52,-66,-68,-67,-69,-64,-42,-44,123,124,-65,-39,133,-38,145,147,]),'}':([1,2,5,7,10,11,12,13,16,17,18,19,22,24,28,29,30,32,33,34,35,36,37,38,39,44,46,49,50,51,71,72,82,83,84,86,89,92,93,94,95,96,97,98,99,100,102,104,108,114,116,118,120,121,122,123,124,127,128,130,131,132,133,134,135,136,137,138,140,141,142,143,145,146,147,148,149,150,151,152,153,154,],[-6,-34,-8,-2,-1,-17,-4,-19,-20,-7,-27,-29,-10,-71,-30,-18,-3,-16,-9,-15,-5,-20,-33,-10,-9,-35,-70,-59,-13,-14,-45,-32,-71,-28,-31,-58,-63,-71,-43,-52,-66,-68,-67,-69,-64,-42,-13,-44,-71,-71,-65,-39,-40,-41,130,-71,-71,134,-38,-50,-71,-71,-71,-71,141,142,-71,-46,-48,-51,-36,146,-71,-37,-71,-71,-71,152,153,-47,-71,-49,]),'OR':([1,5,7,10,12,16,17,18,19,22,28,30,33,35,36,37,38,39,43,44,45,46,57,58,59,71,72,75,76,77,83,84,89,93,94,95,96,97,98,99,100,103,104,109,113,116,118,119,128,144,],[-6,-8,-2,-1,-4,-20,-7,-27,-29,-10,70,-3,-9,-5,-20,70,-10,-9,70,70,70,-70,-20,70,70,-45,70,-10,70,-9,-28,70,-63,-43,-52,70,70,70,70,-64,-42,70,-44,70,70,-65,70,70,-38,70,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'compare':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,]),'store_id':([0,41,50,108,114,131,132,137,148,149,],[3,73,3,3,3,3,3,3,3,3,]),'expr_list':([26,101,112,],[54,115,126,]),'num':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'stmtlst':([0,50,108,114,131,132,137,148,149,],[9,86,120,120,120,120,120,120,120,]),'id':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'if':([0,50,108,114,131,132,137,148,149,],[11,11,11,11,11,11,11,11,11,]),'for':([0,50,108,114,131,132,137,148,149,],[13,13,13,13,13,13,13,13,13,]),'param':([42,52,88,117,],[78,78,78,78,]),'to':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'params':([42,52,88,117,],[79,87,111,129,]),'assign_lst':([0,41,50,108,114,131,132,137,148,149,],[20,74,20,20,20,20,20,20,20,20,]),'empty':([24,26,42,52,68,82,88,90,92,101,105,108,112,114,117,123,124,131,132,133,134,137,145,147,148,149,153,],[51,55,81,81,51,51,81,51,51,55,51,121,55,121,81,51,51,121,121,51,140,121,51,51,121,121,140,]),'body':([108,114,131,132,137,148,149,],[122,127,135,136,143,150,151,]),'opt_newline':([24,68,82,90,92,105,123,124,133,145,147,],[49,101,108,112,114,117,131,132,137,148,149,]),'assign_id':([0,50,108,114,131,132,137,148,149,],[21,21,21,21,21,21,21,21,21,]),'str':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'funccall':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'opt_else':([134,153,],[138,154,]),'stmt':([0,50,108,114,131,132,137,148,149,],[24,24,24,24,24,24,24,24,24,]),'opt_expr':([26,101,112,],[56,56,56,]),'func':([0,50,108,114,131,132,137,148,149,],[32,32,32,32,32,32,32,32,32,]),'expr':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[28,37,43,44,45,46,58,59,71,72,76,84,28,93,94,95,96,97,98,100,103,104,109,113,58,118,119,28,58,28,28,28,28,144,28,28,]),'list':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'while':([0,50,108,114,131,132,137,148,149,],[29,29,29,29,29,29,29,29,29,]),'getitem':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[22,38,38,38,38,38,38,38,38,38,75,38,22,38,38,38,38,38,38,38,38,38,38,38,38,38,38,22,38,22,22,22,22,38,22,22,]),'property':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[33,39,39,39,39,39,39,39,39,39,77,39,33,39,39,39,39,39,39,39,39,39,39,39,39,39,39,33,39,33,33,33,33,39,33,33,]),'topfunc':([0,50,108,114,131,132,137,148,149,],[34,34,34,34,34,34,34,34,34,]),'lambda':([0,2,6,8,14,15,26,27,31,40,41,47,50,60,61,62,63,64,65,67,69,70,85,91,101,106,107,108,112,114,131,132,137,139,148,149,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> stmtlst","S'",1,None,None,None),
+  ('expr -> id','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',50),
+  ('expr -> num','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',51),
+  ('expr -> str','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',52),
+  ('expr -> funccall','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',53),
+  ('expr -> lambda','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',54),
+  ('expr -> compare','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',55),
+  ('expr -> to','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',56),
+  ('expr -> list','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',57),
+  ('expr -> property','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',58),
+  ('expr -> getitem','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',59),
+  ('opt_expr -> expr','opt_expr',1,'p_opt_expr','imperative_parser/grammar_utils.py',50),
+  ('opt_expr -> empty','opt_expr',1,'p_opt_expr','imperative_parser/grammar_utils.py',51),
+  ('opt_newline -> NEWLINE','opt_newline',1,'p_opt_newline','imperative_parser/grammar_utils.py',50),
+  ('opt_newline -> empty','opt_newline',1,'p_opt_newline','imperative_parser/grammar_utils.py',51),
+  ('stmt -> topfunc','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',50),
+  ('stmt -> func','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',51),
+  ('stmt -> if','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',52),
+  ('stmt -> while','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',53),
+  ('stmt -> for','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',54),
+  ('id -> ID','id',1,'p_id','imperative_parser/parser.py',149),
+  ('store_id -> ID','store_id',1,'p_store_id','imperative_parser/parser.py',154),
+  ('assign_id -> assign_lst','assign_id',1,'p_assign_id','imperative_parser/parser.py',158),
+  ('assign_lst -> store_id , assign_lst','assign_lst',3,'p_assign_lst','imperative_parser/parser.py',162),
+  ('assign_lst -> store_id','assign_lst',1,'p_assign_lst','imperative_parser/parser.py',163),
+  ('store_id -> property','store_id',1,'p_store_property','imperative_parser/parser.py',167),
+  ('store_id -> getitem','store_id',1,'p_store_getitem','imperative_parser/parser.py',172),
+  ('num -> NUM','num',1,'p_num','imperative_parser/parser.py',177),
+  ('expr -> ( expr )','expr',3,'p_expr_group','imperative_parser/parser.py',184),
+  ('str -> STRING','str',1,'p_str','imperative_parser/parser.py',190),
+  ('stmt -> expr','stmt',1,'p_stmt_expr','imperative_parser/parser.py',197),
+  ('stmt -> assign_id = expr','stmt',3,'p_stmt_assignment','imperative_parser/parser.py',201),
+  ('stmt -> store_id AUGASSIGN expr','stmt',3,'p_stmt_aug_assignment','imperative_parser/parser.py',205),
+  ('stmt -> RETURN expr','stmt',2,'p_stmt_return','imperative_parser/parser.py',215),
+  ('stmt -> RETURN','stmt',1,'p_stmt_return','imperative_parser/parser.py',216),
+  ('stmt -> PRINT expr','stmt',2,'p_stmt_print','imperative_parser/parser.py',223),
+  ('topfunc -> FUNC ( params ) { opt_newline body }','topfunc',8,'p_top_func','imperative_parser/parser.py',229),
+  ('func -> FUNC ID ( params ) { opt_newline body }','func',9,'p_func','imperative_parser/parser.py',239),
+  ('funccall -> expr ( opt_newline expr_list )','funccall',5,'p_funccall','imperative_parser/parser.py',249),
+  ('lambda -> @ ( params ) expr','lambda',5,'p_lambda','imperative_parser/parser.py',256),
+  ('body -> stmtlst','body',1,'p_body','imperative_parser/parser.py',266),
+  ('body -> empty','body',1,'p_body','imperative_parser/parser.py',267),
+  ('compare -> expr COMPOP expr','compare',3,'p_compare','imperative_parser/parser.py',278),
+  ('expr -> expr AND expr','expr',3,'p_bool_expr','imperative_parser/parser.py',292),
+  ('expr -> expr OR expr','expr',3,'p_bool_expr','imperative_parser/parser.py',293),
+  ('expr -> NOT expr','expr',2,'p_expr_not','imperative_parser/parser.py',305),
+  ('if -> IF expr { opt_newline body } opt_else','if',7,'p_if','imperative_parser/parser.py',311),
+  ('opt_else -> ELSE { opt_newline body }','opt_else',5,'p_opt_else','imperative_parser/parser.py',316),
+  ('opt_else -> empty','opt_else',1,'p_opt_else','imperative_parser/parser.py',317),
+  ('opt_else -> ELSE expr { opt_newline body } opt_else','opt_else',7,'p_opt_elseif','imperative_parser/parser.py',324),
+  ('while -> WHILE expr { opt_newline body }','while',6,'p_while','imperative_parser/parser.py',329),
+  ('for -> FOR ID IN expr { opt_newline body }','for',8,'p_for','imperative_parser/parser.py',334),
+  ('to -> expr TO expr','to',3,'p_range','imperative_parser/parser.py',339),
+  ('params -> param , opt_newline params','params',4,'p_params','imperative_parser/parser.py',346),
+  ('params -> param','params',1,'p_params','imperative_parser/parser.py',347),
+  ('param -> ID','param',1,'p_param','imperative_parser/parser.py',351),
+  ('param -> ID = expr','param',3,'p_param','imperative_parser/parser.py',352),
+  ('param -> empty','param',1,'p_param','imperative_parser/parser.py',353),
+  ('stmtlst -> stmt NEWLINE stmtlst','stmtlst',3,'p_stmtlst','imperative_parser/parser.py',358),
+  ('stmtlst -> stmt opt_newline','stmtlst',2,'p_stmtlst','imperative_parser/parser.py',359),
+  ('expr_list -> opt_expr , opt_newline expr_list','expr_list',4,'p_in_params','imperative_parser/parser.py',363),
+  ('expr_list -> opt_expr','expr_list',1,'p_in_params','imperative_parser/parser.py',364),
+  ('opt_expr -> ID = expr','opt_expr',3,'p_opt_expr_default','imperative_parser/parser.py',370),
+  ('list -> [ expr_list ]','list',3,'p_list_braces','imperative_parser/parser.py',374),
+  ('property -> expr . ID','property',3,'p_expr_property','imperative_parser/parser.py',381),
+  ('getitem -> expr [ expr ]','getitem',4,'p_expr_getitem','imperative_parser/parser.py',387),
+  ('expr -> expr + expr','expr',3,'p_expr_binop','imperative_parser/parser.py',394),
+  ('expr -> expr - expr','expr',3,'p_expr_binop','imperative_parser/parser.py',395),
+  ('expr -> expr * expr','expr',3,'p_expr_binop','imperative_parser/parser.py',396),
+  ('expr -> expr / expr','expr',3,'p_expr_binop','imperative_parser/parser.py',397),
+  ('expr -> - expr','expr',2,'p_expr_uminus','imperative_parser/parser.py',404),
+  ('empty -> <empty>','empty',0,'p_empty','imperative_parser/parser.py',429),
+]
@@ -0,0 +1,100 @@
+
+# imperative_parser/tables/topfunc_parsetab.py
+# This file is automatically generated. Do not edit.
+_tabversion = '3.2'
+
+_lr_method = 'LALR'
+
+_lr_signature = '\xaf\xd0\xbc\xe1\xb9J\xbd{E\xd8\xa1\x0f\xa1\xd2\xf9\x0c'
+    
+_lr_action_items = {'*':([15,17,18,19,22,23,24,25,27,28,29,30,32,33,37,38,42,43,55,68,72,74,76,79,80,83,84,85,86,87,88,89,90,92,93,95,98,99,105,108,110,112,115,116,117,119,123,125,128,145,],[-6,-2,-1,-29,-7,-27,-3,-4,-20,47,-8,-10,-9,-5,47,-70,-20,47,-45,-10,-20,47,-9,-28,-63,-43,-52,47,-68,47,-69,-44,-42,47,-64,47,47,47,47,47,-65,47,-10,47,-9,47,47,-38,47,47,]),'RETURN':([12,13,14,35,104,118,122,127,129,132,134,136,138,146,148,149,150,],[-13,-14,-71,57,57,-71,-71,57,57,-71,-71,57,57,-71,-71,57,57,]),'WHILE':([12,13,14,35,104,118,122,127,129,132,134,136,138,146,148,149,150,],[-13,-14,-71,59,59,-71,-71,59,59,-71,-71,59,59,-71,-71,59,59,]),'PRINT':([12,13,14,35,104,118,122,127,129,132,134,136,138,146,148,149,150,],[-13,-14,-71,60,60,-71,-71,60,60,-71,-71,60,60,-71,-71,60,60,]),')':([3,4,5,6,7,8,11,12,13,15,17,18,19,22,23,24,25,27,28,29,30,32,33,34,36,37,38,40,41,42,43,52,55,78,79,80,81,83,84,85,86,87,88,89,90,91,93,107,108,109,110,111,123,124,125,126,],[-71,-54,9,-55,-57,-71,-71,-13,-14,-6,-2,-1,-29,-7,-27,-3,-4,-20,-56,-8,-10,-9,-5,-53,-71,79,-70,-12,-61,-20,-11,-71,-45,106,-28,-63,-71,-43,-52,-66,-68,-67,-69,-44,-42,-71,-64,-71,-62,125,-65,-71,-39,-60,-38,130,]),'(':([1,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,35,37,38,42,43,44,45,46,47,48,49,50,51,52,53,55,56,57,59,60,68,72,73,74,76,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,101,104,105,106,107,108,110,112,115,116,117,118,119,120,122,123,125,127,128,129,132,134,136,138,141,145,146,148,149,150,],[3,20,-13,-14,-71,-6,36,-2,-1,-29,20,20,-7,-27,-3,-4,20,-20,52,-8,-10,20,-9,-5,20,52,52,-20,52,20,20,20,20,20,20,20,20,-71,20,52,3,20,20,20,-10,-20,20,52,-9,-28,-63,-71,20,52,52,52,52,52,52,52,52,20,52,-64,111,52,20,20,52,52,20,20,52,20,20,52,-65,52,-10,52,-9,-71,52,20,-71,52,-38,20,52,20,-71,-71,20,20,20,52,-71,-71,20,20,]),'+':([15,17,18,19,22,23,24,25,27,28,29,30,32,33,37,38,42,43,55,68,72,74,76,79,80,83,84,85,86,87,88,89,90,92,93,95,98,99,105,108,110,112,115,116,117,119,123,125,128,145,],[-6,-2,-1,-29,-7,-27,-3,-4,-20,46,-8,-10,-9,-5,46,-70,-20,46,-45,-10,-20,46,-9,-28,-63,-43,-52,-66,-68,-67,-69,-44,-42,46,-64,46,46,46,46,46,-65,46,-10,46,-9,46,46,-38,46,46,]),'NEWLINE':([8,14,15,17,18,19,22,23,24,25,27,29,30,32,33,38,52,55,57,62,63,68,70,71,72,74,75,76,77,79,80,81,83,84,85,86,87,88,89,90,93,95,99,100,110,112,118,119,122,123,125,132,134,135,137,140,142,144,146,147,148,153,154,155,],[12,12,-6,-2,-1,-29,-7,-27,-3,-4,-20,-8,-10,-9,-5,-70,12,-45,-34,-17,-19,-10,104,-16,-20,-30,-18,-9,-15,-28,-63,12,-43,-52,-66,-68,-67,-69,-44,-42,-64,-33,-35,-36,-65,-32,12,-31,12,-39,-38,12,12,-50,-71,-46,-48,-51,12,-37,12,-47,-71,-49,]),'-':([10,12,13,14,15,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,35,37,38,42,43,44,45,46,47,48,49,50,51,52,53,55,57,59,60,68,72,73,74,76,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,96,97,98,99,101,104,105,106,107,108,110,112,115,116,117,118,119,120,122,123,125,127,128,129,132,134,136,138,141,145,146,148,149,150,],[21,-13,-14,-71,-6,-2,-1,-29,21,21,-7,-27,-3,-4,21,-20,48,-8,-10,21,-9,-5,21,48,-70,-20,48,21,21,21,21,21,21,21,21,-71,21,-45,21,21,21,-10,-20,21,48,-9,-28,-63,-71,21,-43,-52,-66,-68,-67,-69,-44,-42,21,48,-64,48,21,21,48,48,21,21,48,21,21,48,-65,48,-10,48,-9,-71,48,21,-71,48,-38,21,48,21,-71,-71,21,21,21,48,-71,-71,21,21,]),',':([3,4,6,7,8,11,12,13,15,17,18,19,22,23,24,25,26,27,28,29,30,32,33,36,38,40,41,42,43,52,55,58,68,72,76,79,80,81,83,84,85,86,87,88,89,90,91,93,107,108,110,111,113,115,117,123,125,],[-71,8,-55,-57,-71,-71,-13,-14,-6,-2,-1,-29,-7,-27,-3,-4,-71,-20,-56,-8,-10,-9,-5,-71,-70,-12,81,-20,-11,-71,-45,97,-26,-21,-25,-28,-63,-71,-43,-52,-66,-68,-67,-69,-44,-42,-71,-64,-71,-62,-65,-71,97,-26,-25,-39,-38,]),'/':([15,17,18,19,22,23,24,25,27,28,29,30,32,33,37,38,42,43,55,68,72,74,76,79,80,83,84,85,86,87,88,89,90,92,93,95,98,99,105,108,110,112,115,116,117,119,123,125,128,145,],[-6,-2,-1,-29,-7,-27,-3,-4,-20,49,-8,-10,-9,-5,49,-70,-20,49,-45,-10,-20,49,-9,-28,-63,-43,-52,49,-68,49,-69,-44,-42,49,-64,49,49,49,49,49,-65,49,-10,49,-9,49,49,-38,49,49,]),'.':([15,17,18,19,22,23,24,25,27,28,29,30,32,33,37,38,42,43,55,68,72,74,76,79,80,83,84,85,86,87,88,89,90,92,93,95,98,99,105,108,110,112,115,116,117,119,123,125,128,145,],[-6,-2,-1,-29,-7,-27,-3,-4,-20,54,-8,-10,-9,-5,54,54,-20,54,54,-10,-20,54,-9,-28,-63,54,54,54,54,54,54,54,54,54,-64,54,54,54,54,54,-65,54,-10,54,-9,54,54,-38,54,54,]),'TO':([15,17,18,19,22,23,24,25,27,28,29,30,32,33,37,38,42,43,55,68,72,74,76,79,80,83,84,85,86,87,88,89,90,92,93,95,98,99,105,108,110,112,115,116,117,119,123,125,128,145,],[-6,-2,-1,-29,-7,-27,-3,-4,-20,45,-8,-10,-9,-5,45,-70,-20,45,-45,-10,-20,45,-9,-28,-63,45,-52,45,45,45,45,45,45,45,-64,45,45,45,45,45,-65,45,-10,45,-9,45,45,-38,45,45,]),'NUM':([10,12,13,14,20,21,26,31,35,44,45,46,47,48,49,50,51,52,53,57,59,60,73,81,82,91,96,97,101,104,106,107,118,120,122,127,129,132,134,136,138,141,146,148,149,150,],[23,-13,-14,-71,23,23,23,23,23,23,23,23,23,23,23,23,23,-71,23,23,23,23,23,-71,23,23,23,23,23,23,23,23,-71,23,-71,23,23,-71,-71,23,23,23,-71,-71,23,23,]),'=':([6,42,58,64,67,68,72,76,93,110,113,114,115,117,],[10,82,-24,-22,101,-26,-21,-25,-64,-65,-24,-23,-26,-25,]),'$end':([2,100,],[0,-36,]),'@':([10,12,13,14,20,21,26,31,35,44,45,46,47,48,49,50,51,52,53,57,59,60,73,81,82,91,96,97,101,104,106,107,118,120,122,127,129,132,134,136,138,141,146,148,149,150,],[16,-13,-14,-71,16,16,16,16,16,16,16,16,16,16,16,16,16,-71,16,16,16,16,16,-71,16,16,16,16,16,16,16,16,-71,16,-71,16,16,-71,-71,16,16,16,-71,-71,16,16,]),'STRING':([10,12,13,14,20,21,26,31,35,44,45,46,47,48,49,50,51,52,53,57,59,60,73,81,82,91,96,97,101,104,106,107,118,120,122,127,129,132,134,136,138,141,146,148,149,150,],[19,-13,-14,-71,19,19,19,19,19,19,19,19,19,19,19,19,19,-71,19,19,19,19,19,-71,19,19,19,19,19,19,19,19,-71,19,-71,19,19,-71,-71,19,19,19,-71,-71,19,19,]),'FOR':([12,13,14,35,104,118,122,127,129,132,134,136,138,146,148,149,150,],[-13,-14,-71,69,69,-71,-71,69,69,-71,-71,69,69,-71,-71,69,69,]),'AUGASSIGN':([58,68,72,76,93,110,],[96,-26,-21,-25,-64,-65,]),'ELSE':([137,154,],[141,141,]),'FUNC':([0,12,13,14,35,104,118,122,127,129,132,134,136,138,146,148,149,150,],[1,-13,-14,-71,56,56,-71,-71,56,56,-71,-71,56,56,-71,-71,56,56,]),'IN':([102,],[120,]),'[':([10,12,13,14,15,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,35,37,38,42,43,44,45,46,47,48,49,50,51,52,53,55,57,59,60,68,72,73,74,76,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,95,96,97,98,99,101,104,105,106,107,108,110,112,115,116,117,118,119,120,122,123,125,127,128,129,132,134,136,138,141,145,146,148,149,150,],[26,-13,-14,-71,-6,-2,-1,-29,26,26,-7,-27,-3,-4,26,-20,53,-8,-10,26,-9,-5,26,53,53,-20,53,26,26,26,26,26,26,26,26,-71,26,53,26,26,26,-10,-20,26,53,-9,-28,-63,-71,26,53,53,53,53,53,53,53,53,26,53,-64,53,26,26,53,53,26,26,53,26,26,53,-65,53,-10,53,-9,-71,53,26,-71,53,-38,26,53,26,-71,-71,26,26,26,53,-71,-71,26,26,]),']':([12,13,15,17,18,19,22,23,24,25,26,27,29,30,32,33,38,39,40,41,42,43,55,79,80,81,83,84,85,86,87,88,89,90,92,93,107,108,110,123,124,125,],[-13,-14,-6,-2,-1,-29,-7,-27,-3,-4,-71,-20,-8,-10,-9,-5,-70,80,-12,-61,-20,-11,-45,-28,-63,-71,-43,-52,-66,-68,-67,-69,-44,-42,110,-64,-71,-62,-65,-39,-60,-38,]),'ID':([3,8,10,11,12,13,14,20,21,26,31,35,36,44,45,46,47,48,49,50,51,52,53,54,56,57,59,60,69,73,81,82,91,96,97,101,104,106,107,111,118,120,122,127,129,132,134,136,138,141,146,148,149,150,],[6,-71,27,6,-13,-14,-71,27,27,42,27,72,6,27,27,27,27,27,27,27,27,-71,27,93,94,27,27,27,102,27,-71,27,42,27,72,27,72,27,42,6,-71,27,-71,72,72,-71,-71,72,72,27,-71,-71,72,72,]),'IF':([12,13,14,35,104,118,122,127,129,132,134,136,138,146,148,149,150,],[-13,-14,-71,73,73,-71,-71,73,73,-71,-71,73,73,-71,-71,73,73,]),'AND':([15,17,18,19,22,23,24,25,27,28,29,30,32,33,37,38,42,43,55,68,72,74,76,79,80,83,84,85,86,87,88,89,90,92,93,95,98,99,105,108,110,112,115,116,117,119,123,125,128,145,],[-6,-2,-1,-29,-7,-27,-3,-4,-20,44,-8,-10,-9,-5,44,-70,-20,44,-45,-10,-20,44,-9,-28,-63,-43,-52,44,44,44,44,44,-42,44,-64,44,44,44,44,44,-65,44,-10,44,-9,44,44,-38,44,44,]),'COMPOP':([15,17,18,19,22,23,24,25,27,28,29,30,32,33,37,38,42,43,55,68,72,74,76,79,80,83,84,85,86,87,88,89,90,92,93,95,98,99,105,108,110,112,115,116,117,119,123,125,128,145,],[-6,-2,-1,-29,-7,-27,-3,-4,-20,51,-8,-10,-9,-5,51,-70,-20,51,-45,-10,-20,51,-9,-28,-63,51,-52,51,51,51,51,51,-42,51,-64,51,51,51,51,51,-65,51,-10,51,-9,51,51,-38,51,51,]),'NOT':([10,12,13,14,20,21,26,31,35,44,45,46,47,48,49,50,51,52,53,57,59,60,73,81,82,91,96,97,101,104,106,107,118,120,122,127,129,132,134,136,138,141,146,148,149,150,],[31,-13,-14,-71,31,31,31,31,31,31,31,31,31,31,31,31,31,-71,31,31,31,31,31,-71,31,31,31,31,31,31,31,31,-71,31,-71,31,31,-71,-71,31,31,31,-71,-71,31,31,]),'{':([9,15,17,18,19,22,23,24,25,27,29,30,32,33,38,55,79,80,83,84,85,86,87,88,89,90,93,98,105,110,123,125,128,130,141,145,],[14,-6,-2,-1,-29,-7,-27,-3,-4,-20,-8,-10,-9,-5,-70,-45,-28,-63,-43,-52,-66,-68,-67,-69,-44,-42,-64,118,122,-65,-39,-38,132,134,146,148,]),'}':([12,13,14,15,17,18,19,22,23,24,25,27,29,30,32,33,35,38,55,57,61,62,63,65,66,68,70,71,72,74,75,76,77,79,80,83,84,85,86,87,88,89,90,93,95,99,100,103,104,110,112,118,119,121,122,123,125,127,129,131,132,133,134,135,136,137,138,139,140,142,143,144,146,147,148,149,150,151,152,153,154,155,],[-13,-14,-71,-6,-2,-1,-29,-7,-27,-3,-4,-20,-8,-10,-9,-5,-71,-70,-45,-34,-40,-17,-19,-41,100,-10,-71,-16,-20,-30,-18,-9,-15,-28,-63,-43,-52,-66,-68,-67,-69,-44,-42,-64,-33,-35,-36,-59,-13,-65,-32,-71,-31,-58,-71,-39,-38,-71,-71,135,-71,137,-71,-50,-71,-71,-71,144,-46,-48,147,-51,-71,-37,-71,-71,-71,153,154,-47,-71,-49,]),'OR':([15,17,18,19,22,23,24,25,27,28,29,30,32,33,37,38,42,43,55,68,72,74,76,79,80,83,84,85,86,87,88,89,90,92,93,95,98,99,105,108,110,112,115,116,117,119,123,125,128,145,],[-6,-2,-1,-29,-7,-27,-3,-4,-20,50,-8,-10,-9,-5,50,-70,-20,50,-45,-10,-20,50,-9,-28,-63,-43,-52,50,50,50,50,-44,-42,50,-64,50,50,50,50,50,-65,50,-10,50,-9,50,50,-38,50,50,]),}
+
+_lr_action = { }
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = { }
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'compare':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'store_id':([35,97,104,127,129,136,138,149,150,],[58,113,58,58,58,58,58,58,58,]),'expr_list':([26,91,107,],[39,109,124,]),'num':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'stmtlst':([35,104,127,129,136,138,149,150,],[61,121,61,61,61,61,61,61,]),'id':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'if':([35,104,127,129,136,138,149,150,],[62,62,62,62,62,62,62,62,]),'for':([35,104,127,129,136,138,149,150,],[63,63,63,63,63,63,63,63,]),'param':([3,11,36,111,],[4,4,4,4,]),'to':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'params':([3,11,36,111,],[5,34,78,126,]),'assign_lst':([35,97,104,127,129,136,138,149,150,],[64,114,64,64,64,64,64,64,64,]),'empty':([3,8,11,14,26,35,36,52,70,81,91,107,111,118,122,127,129,132,134,136,137,138,146,148,149,150,154,],[7,13,7,13,40,65,7,13,13,13,40,40,7,13,13,65,65,13,13,65,142,65,13,13,65,65,142,]),'lambda':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'body':([35,127,129,136,138,149,150,],[66,131,133,139,143,151,152,]),'opt_newline':([8,14,52,70,81,118,122,132,134,146,148,],[11,35,91,103,107,127,129,136,138,149,150,]),'assign_id':([35,104,127,129,136,138,149,150,],[67,67,67,67,67,67,67,67,]),'str':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'funccall':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'stmt':([35,104,127,129,136,138,149,150,],[70,70,70,70,70,70,70,70,]),'opt_else':([137,154,],[140,155,]),'func':([35,104,127,129,136,138,149,150,],[71,71,71,71,71,71,71,71,]),'expr':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[28,37,38,43,55,74,83,84,85,86,87,88,89,90,92,95,98,99,105,108,43,112,116,119,74,123,43,128,74,74,74,74,145,74,74,]),'list':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'while':([35,104,127,129,136,138,149,150,],[75,75,75,75,75,75,75,75,]),'getitem':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[30,30,30,30,30,68,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,115,30,68,30,30,30,68,68,68,68,30,68,68,]),'property':([10,20,21,26,31,35,44,45,46,47,48,49,50,51,53,57,59,60,73,82,91,96,97,101,104,106,107,120,127,129,136,138,141,149,150,],[32,32,32,32,32,76,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,117,32,76,32,32,32,76,76,76,76,32,76,76,]),'topfunc':([0,35,104,127,129,136,138,149,150,],[2,77,77,77,77,77,77,77,77,]),'opt_expr':([26,91,107,],[41,41,41,]),}
+
+_lr_goto = { }
+for _k, _v in _lr_goto_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = { }
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> topfunc","S'",1,None,None,None),
+  ('expr -> id','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',50),
+  ('expr -> num','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',51),
+  ('expr -> str','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',52),
+  ('expr -> funccall','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',53),
+  ('expr -> lambda','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',54),
+  ('expr -> compare','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',55),
+  ('expr -> to','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',56),
+  ('expr -> list','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',57),
+  ('expr -> property','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',58),
+  ('expr -> getitem','expr',1,'p_expr_reg','imperative_parser/grammar_utils.py',59),
+  ('opt_expr -> expr','opt_expr',1,'p_opt_expr','imperative_parser/grammar_utils.py',50),
+  ('opt_expr -> empty','opt_expr',1,'p_opt_expr','imperative_parser/grammar_utils.py',51),
+  ('opt_newline -> NEWLINE','opt_newline',1,'p_opt_newline','imperative_parser/grammar_utils.py',50),
+  ('opt_newline -> empty','opt_newline',1,'p_opt_newline','imperative_parser/grammar_utils.py',51),
+  ('stmt -> topfunc','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',50),
+  ('stmt -> func','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',51),
+  ('stmt -> if','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',52),
+  ('stmt -> while','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',53),
+  ('stmt -> for','stmt',1,'p_stmt_reg','imperative_parser/grammar_utils.py',54),
+  ('id -> ID','id',1,'p_id','imperative_parser/parser.py',149),
+  ('store_id -> ID','store_id',1,'p_store_id','imperative_parser/parser.py',154),
+  ('assign_id -> assign_lst','assign_id',1,'p_assign_id','imperative_parser/parser.py',158),
+  ('assign_lst -> store_id , assign_lst','assign_lst',3,'p_assign_lst','imperative_parser/parser.py',162),
+  ('assign_lst -> store_id','assign_lst',1,'p_assign_lst','imperative_parser/parser.py',163),
+  ('store_id -> property','store_id',1,'p_store_property','imperative_parser/parser.py',167),
+  ('store_id -> getitem','store_id',1,'p_store_getitem','imperative_parser/parser.py',172),
+  ('num -> NUM','num',1,'p_num','imperative_parser/parser.py',177),
+  ('expr -> ( expr )','expr',3,'p_expr_group','imperative_parser/parser.py',184),
+  ('str -> STRING','str',1,'p_str','imperative_parser/parser.py',190),
+  ('stmt -> expr','stmt',1,'p_stmt_expr','imperative_parser/parser.py',197),
+  ('stmt -> assign_id = expr','stmt',3,'p_stmt_assignment','imperative_parser/parser.py',201),
+  ('stmt -> store_id AUGASSIGN expr','stmt',3,'p_stmt_aug_assignment','imperative_parser/parser.py',205),
+  ('stmt -> RETURN expr','stmt',2,'p_stmt_return','imperative_parser/parser.py',215),
+  ('stmt -> RETURN','stmt',1,'p_stmt_return','imperative_parser/parser.py',216),
+  ('stmt -> PRINT expr','stmt',2,'p_stmt_print','imperative_parser/parser.py',223),
+  ('topfunc -> FUNC ( params ) { opt_newline body }','topfunc',8,'p_top_func','imperative_parser/parser.py',229),
+  ('func -> FUNC ID ( params ) { opt_newline body }','func',9,'p_func','imperative_parser/parser.py',239),
+  ('funccall -> expr ( opt_newline expr_list )','funccall',5,'p_funccall','imperative_parser/parser.py',249),
+  ('lambda -> @ ( params ) expr','lambda',5,'p_lambda','imperative_parser/parser.py',256),
+  ('body -> stmtlst','body',1,'p_body','imperative_parser/parser.py',266),
+  ('body -> empty','body',1,'p_body','imperative_parser/parser.py',267),
+  ('compare -> expr COMPOP expr','compare',3,'p_compare','imperative_parser/parser.py',278),
+  ('expr -> expr AND expr','expr',3,'p_bool_expr','imperative_parser/parser.py',292),
+  ('expr -> expr OR expr','expr',3,'p_bool_expr','imperative_parser/parser.py',293),
+  ('expr -> NOT expr','expr',2,'p_expr_not','imperative_parser/parser.py',305),
+  ('if -> IF expr { opt_newline body } opt_else','if',7,'p_if','imperative_parser/parser.py',311),
+  ('opt_else -> ELSE { opt_newline body }','opt_else',5,'p_opt_else','imperative_parser/parser.py',316),
+  ('opt_else -> empty','opt_else',1,'p_opt_else','imperative_parser/parser.py',317),
+  ('opt_else -> ELSE expr { opt_newline body } opt_else','opt_else',7,'p_opt_elseif','imperative_parser/parser.py',324),
+  ('while -> WHILE expr { opt_newline body }','while',6,'p_while','imperative_parser/parser.py',329),
+  ('for -> FOR ID IN expr { opt_newline body }','for',8,'p_for','imperative_parser/parser.py',334),
+  ('to -> expr TO expr','to',3,'p_range','imperative_parser/parser.py',339),
+  ('params -> param , opt_newline params','params',4,'p_params','imperative_parser/parser.py',346),
+  ('params -> param','params',1,'p_params','imperative_parser/parser.py',347),
+  ('param -> ID','param',1,'p_param','imperative_parser/parser.py',351),
+  ('param -> ID = expr','param',3,'p_param','imperative_parser/parser.py',352),
+  ('param -> empty','param',1,'p_param','imperative_parser/parser.py',353),
+  ('stmtlst -> stmt NEWLINE stmtlst','stmtlst',3,'p_stmtlst','imperative_parser/parser.py',358),
+  ('stmtlst -> stmt opt_newline','stmtlst',2,'p_stmtlst','imperative_parser/parser.py',359),
+  ('expr_list -> opt_expr , opt_newline expr_list','expr_list',4,'p_in_params','imperative_parser/parser.py',363),
+  ('expr_list -> opt_expr','expr_list',1,'p_in_params','imperative_parser/parser.py',364),
+  ('opt_expr -> ID = expr','opt_expr',3,'p_opt_expr_default','imperative_parser/parser.py',370),
+  ('list -> [ expr_list ]','list',3,'p_list_braces','imperative_parser/parser.py',374),
+  ('property -> expr . ID','property',3,'p_expr_property','imperative_parser/parser.py',381),
+  ('getitem -> expr [ expr ]','getitem',4,'p_expr_getitem','imperative_parser/parser.py',387),
+  ('expr -> expr + expr','expr',3,'p_expr_binop','imperative_parser/parser.py',394),
+  ('expr -> expr - expr','expr',3,'p_expr_binop','imperative_parser/parser.py',395),
+  ('expr -> expr * expr','expr',3,'p_expr_binop','imperative_parser/parser.py',396),
+  ('expr -> expr / expr','expr',3,'p_expr_binop','imperative_parser/parser.py',397),
+  ('expr -> - expr','expr',2,'p_expr_uminus','imperative_parser/parser.py',404),
+  ('empty -> <empty>','empty',0,'p_empty','imperative_parser/parser.py',429),
+]
@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+#TODO fix relative import
+from .. import parser
+from ..function_cache import FunctionCache
+from ..oracle import ORACLE
+
+FUNC = "func(amount) { return amount + 1 }"
+
+class FunctionCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        ORACLE.set('amount', 2)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def new_cache(self, version=parser.GRAMMAR_VERSION):
+        return FunctionCache(self.directory, version)
+
+    def test_reload_skips_parsing(self):
+        func = parser.parse_function(FUNC, cache=self.new_cache())
+        self.assertEqual(3, func({}))
+
+        cache = self.new_cache()
+        parse_string = parser.parse_string
+        parser.parse_string = None
+        try:
+            func = parser.parse_function(FUNC, name='increment', cache=cache)
+        finally:
+            parser.parse_string = parse_string
+
+        self.assertEqual((1, 0), (cache.hits, cache.misses))
+        self.assertEqual('increment', func.__name__)
+        self.assertEqual(3, func({}))
+
+    def test_key(self):
+        cache = self.new_cache()
+
+        self.assertEqual(cache.key(FUNC), self.new_cache().key(FUNC))
+        self.assertNotEqual(cache.key(FUNC), cache.key(FUNC.replace('1', '2')))
+        self.assertNotEqual(cache.key(FUNC), self.new_cache('0').key(FUNC))
+        self.assertNotEqual(cache.key(FUNC, 'a', 'b'), cache.key(FUNC, 'ab'))
+
+    def test_new_version_recompiles(self):
+        parser.parse_function(FUNC, cache=self.new_cache())
+
+        cache = self.new_cache('0')
+        self.assertEqual(3, parser.parse_function(FUNC, cache=cache)({}))
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+
+    def test_corrupt_file(self):
+        cache = self.new_cache()
+        parser.parse_function(FUNC, cache=cache)
+
+        key, = cache.code_objects
+        with open(cache.path(key), 'wb') as code_file:
+            code_file.write('corrupt')
+
+        cache = self.new_cache()
+        self.assertEqual(3, parser.parse_function(FUNC, cache=cache)({}))
+        self.assertEqual((0, 1), (cache.hits, cache.misses))
+        self.assertIsNotNone(self.new_cache().get(key))
+
+    def test_memory_only(self):
+        cache = FunctionCache()
+
+        parser.parse_function(FUNC, cache=cache)
+        parser.parse_function(FUNC, cache=cache)
+
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        self.assertEqual([], os.listdir(self.directory))
@@ -0,0 +1,90 @@
+import unittest
+
+#TODO fix relative import
+from ..function_cache import FunctionCache
+from ..injection import DYNAMIC, HOISTED, BOUND
+from ..oracle import ORACLE
+from ..parser import parse_function
+
+LOOP = """func(value, setter) {
+    total = 0
+    for i := 0 to 3 {
+        total += value
+        if total > 1 {
+            setter(value * 10)
+        }
+    }
+    return [total, value]
+    }"""
+
+SAME_STATEMENT = """func(value, setter) {
+    return [value, setter(7), value]
+    }"""
+
+WHILE = """func(value, setter) {
+    count = 0
+    while value < 5 and count < 10 {
+        count += 1
+        setter(value + 1)
+    }
+    return count
+    }"""
+
+class InjectionTests(unittest.TestCase):
+    def setUp(self):
+        ORACLE.set('value', 1)
+        ORACLE.set('setter', lambda value: ORACLE.set('value', value))
+
+    def compile(self, func, mode, **kwargs):
+        return parse_function(func, cache=FunctionCache(), mode=mode, **kwargs)
+
+    def assertSameResult(self, func):
+        ORACLE.set('value', 1)
+        expected = self.compile(func, DYNAMIC)({})
+
+        ORACLE.set('value', 1)
+        self.assertEqual(expected, self.compile(func, HOISTED)({}))
+
+    def test_state_changes(self):
+        self.assertSameResult(LOOP)
+        self.assertSameResult(SAME_STATEMENT)
+        self.assertSameResult(WHILE)
+
+        ORACLE.set('value', 1)
+        self.assertEqual([1, None, 7], self.compile(SAME_STATEMENT, HOISTED)({}))
+
+    def test_hoisted_reads(self):
+        func = self.compile("""func(value) {
+            total = 0
+            for i := 0 to 100 {
+                total += value
+            }
+            return total
+        }""", HOISTED)
+
+        reads = []
+        get = ORACLE.get
+        ORACLE.get = lambda name: reads.append(name) or get(name)
+        try:
+            self.assertEqual(100, func({}))
+        finally:
+            del ORACLE.get
+
+        self.assertEqual([], reads)
+
+    def test_missing_name(self):
+        func = self.compile("func(unset_value) { return unset_value }", HOISTED)
+
+        self.assertEqual([], func({}))
+        self.assertTrue('unset_value' in ORACLE.game_state)
+
+    def test_bound(self):
+        func = self.compile("func(value) { return value }", BOUND)
+        ORACLE.set('value', 2)
+
+        self.assertEqual(1, func({}))
+        self.assertIsNotNone(func.func_closure)
+        self.assertEqual(3, self.compile("func(value) { return value }", BOUND, state={'value': 3})({}))
+
+    def test_unknown_mode(self):
+        self.assertRaises(ValueError, self.compile, "func(value) { return value }", 'eager')
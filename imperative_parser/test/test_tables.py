@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+import tempfile
+import shutil
+import unittest
+
+#TODO fix relative import
+from .. import parser
+from ..tables import stmtlst_parsetab, topfunc_parsetab
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class TablesTests(unittest.TestCase):
+    def test_prebuilt_tables_are_current(self):
+        for start, tables in [('stmtlst', stmtlst_parsetab), ('topfunc', topfunc_parsetab)]:
+            # Only tables matching the grammar are used as they are
+            self.assertTrue(parser.get_parser(start).action is tables._lr_action)
+
+    def test_import_builds_nothing(self):
+        directory = tempfile.mkdtemp()
+        try:
+            script = ('import imperative_parser.parser as parser, config_parser.config as config\n'
+                      'assert parser._lexer is None and not parser._parsers\n'
+                      'assert config._lexer is None and config._parser is None\n')
+            env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE='1')
+            subprocess.check_call([sys.executable, '-c', script], cwd=directory, env=env)
+
+            self.assertEqual([], os.listdir(directory))
+        finally:
+            shutil.rmtree(directory)